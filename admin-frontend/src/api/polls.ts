@@ -6,7 +6,7 @@ import type {
   UpdatePollStatusRequest,
   TemplateListResponse,
   AdminPollCreate,
-  BroadcastPollResponse,
+  PollBroadcastJob,
 } from '@/types/polls';
 
 export const pollsApi = {
@@ -53,11 +53,21 @@ export const pollsApi = {
   /**
    * Broadcast poll to circles (Admin)
    */
-  async broadcastPoll(data: AdminPollCreate): Promise<BroadcastPollResponse> {
-    const response = await apiClient.post<BroadcastPollResponse>(
+  async broadcastPoll(data: AdminPollCreate): Promise<PollBroadcastJob> {
+    const response = await apiClient.post<PollBroadcastJob>(
       '/polls/admin/broadcast',
       data
     );
     return response.data;
   },
+
+  /**
+   * Get broadcast job progress (Admin)
+   */
+  async getBroadcastJob(jobId: string): Promise<PollBroadcastJob> {
+    const response = await apiClient.get<PollBroadcastJob>(
+      `/polls/admin/broadcast/${jobId}`
+    );
+    return response.data;
+  },
 };
@@ -7,6 +7,7 @@ export const pollsKeys = {
   all: ['polls'] as const,
   list: (filters: PollFilters) => [...pollsKeys.all, 'list', filters] as const,
   templates: (category?: string) => [...pollsKeys.all, 'templates', category] as const,
+  broadcastJob: (jobId: string) => [...pollsKeys.all, 'broadcast', jobId] as const,
 };
 
 /**
@@ -53,11 +54,8 @@ export function useBroadcastPoll() {
 
   return useMutation({
     mutationFn: (data: AdminPollCreate) => pollsApi.broadcastPoll(data),
-    onSuccess: (data) => {
-      toast.success(`${data.created_count}개의 Circle에 투표가 생성되었습니다.`);
-      if (data.failed_count > 0) {
-        toast.warning(`${data.failed_count}개의 Circle에서 생성 실패`);
-      }
+    onSuccess: () => {
+      toast.success('투표 생성 작업이 시작되었습니다. 잠시 후 목록에 반영됩니다.');
       queryClient.invalidateQueries({ queryKey: pollsKeys.all });
     },
     onError: () => {
@@ -65,3 +63,18 @@ export function useBroadcastPoll() {
     },
   });
 }
+
+/**
+ * Hook to poll a broadcast job until it finishes
+ */
+export function useBroadcastJob(jobId: string | null) {
+  return useQuery({
+    queryKey: pollsKeys.broadcastJob(jobId ?? ''),
+    queryFn: () => pollsApi.getBroadcastJob(jobId as string),
+    enabled: !!jobId,
+    refetchInterval: (query) => {
+      const status = query.state.data?.status;
+      return status === 'COMPLETED' || status === 'FAILED' ? false : 2000;
+    },
+  });
+}
@@ -92,9 +92,20 @@ export interface AdminPollCreate {
   apply_to_all: boolean;
 }
 
-// Broadcast poll response
-export interface BroadcastPollResponse {
+// Broadcast poll job (polls are created in the background)
+export type PollBroadcastJobStatus = 'PENDING' | 'RUNNING' | 'COMPLETED' | 'FAILED';
+
+export interface PollBroadcastJob {
+  id: string;
+  status: PollBroadcastJobStatus;
+  template_id: string | null;
+  question_text: string;
+  ends_at: string;
+  apply_to_all: boolean;
   created_count: number;
   failed_count: number;
-  polls: Poll[];
+  failures: Record<string, string>[];
+  created_at: string;
+  updated_at: string;
+  finished_at: string | null;
 }
@@ -29,6 +29,30 @@ class Settings(BaseSettings):
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
+    redis_socket_timeout_seconds: float = 0.5
+
+    # Live vote tallies for ACTIVE polls (Redis, with Postgres fallback)
+    live_tallies_enabled: bool = False
+    live_tally_ttl_seconds: int = 60 * 60 * 48  # Outlives the longest poll duration
+
+    # Live results streams (SSE) fed by Redis pub/sub, one subscription per worker
+    live_results_enabled: bool = False
+    live_results_heartbeat_seconds: float = 15.0
+    live_results_max_pending: int = 256  # Coalesced deltas per stream before a resync
+    live_results_max_stream_seconds: int = 60 * 60  # Clients reconnect after this
+
+    # Coalesce "someone chose you" notifications per recipient (Redis + Celery)
+    vote_notification_coalescing_enabled: bool = False
+    vote_notification_window_seconds: int = 60
+
+    # Per-process poll template catalog, invalidated via a Redis version key
+    template_catalog_cache_enabled: bool = False
+    template_catalog_ttl_seconds: int = 300
+    template_catalog_version_check_seconds: float = 5.0
+
+    # Active vote session cursors in Redis, checkpointed to Postgres when idle
+    vote_session_cursors_enabled: bool = False
+    vote_session_idle_seconds: int = 900
 
     # JWT (Legacy - kept for backward compatibility)
     jwt_algorithm: str = "HS256"
@@ -40,6 +64,14 @@ class Settings(BaseSettings):
     supabase_service_role_key: str = ""
     supabase_jwt_secret: str = ""  # JWT Secret from Supabase Dashboard
     dev_auth_enabled: bool = False
+    supabase_auth_timeout_seconds: float = 10.0
+    supabase_auth_max_concurrency: int = 16  # Concurrent Supabase Auth calls per worker
+
+    # Auth caches (per worker process)
+    auth_token_cache_size: int = 10000
+    auth_token_cache_ttl_seconds: int = 300  # Never outlives the token's exp claim
+    auth_user_cache_size: int = 10000
+    auth_user_cache_ttl_seconds: int = 30
 
     # CORS - empty list means it must be configured in production
     cors_origins: list[str] = []
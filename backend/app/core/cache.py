@@ -0,0 +1,74 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded LRU cache whose entries expire after a per-entry TTL.
+
+    The cache is process-local and not thread-safe; it is meant to be used from
+    the event loop of a single worker. When the cache is full the least recently
+    used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Default time-to-live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return a live entry, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store an entry.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Optional TTL in seconds, capped at the cache default
+        """
+        if self.maxsize <= 0:
+            return
+
+        effective_ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if effective_ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + effective_ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry and return its value if it was present."""
+        entry = self._entries.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
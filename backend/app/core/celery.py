@@ -10,7 +10,15 @@ celery_app = Celery(
     "circly",
     broker=settings.redis_url,
     backend=settings.redis_url,
-    include=["app.tasks.notification_tasks"],
+    include=[
+        "app.tasks.counter_tasks",
+        "app.tasks.deadline_tasks",
+        "app.tasks.notification_tasks",
+        "app.tasks.outbox_tasks",
+        "app.tasks.poll_tasks",
+        "app.tasks.session_tasks",
+        "app.tasks.tally_tasks",
+    ],
 )
 
 celery_app.conf.update(
@@ -20,14 +28,43 @@ celery_app.conf.update(
     timezone="Asia/Seoul",
     enable_utc=True,
     task_routes={
-        "app.tasks.notification_tasks.send_poll_deadline_notification_1h": {
+        "app.tasks.deadline_tasks.sweep_poll_deadlines": {
             "queue": "notifications"
         },
-        "app.tasks.notification_tasks.send_poll_deadline_notification_10m": {
+        "app.tasks.notification_tasks.buffer_vote_received_notification": {
             "queue": "notifications"
         },
-        "app.tasks.notification_tasks.send_poll_result_notification": {
+        "app.tasks.notification_tasks.flush_vote_received_notifications": {
             "queue": "notifications"
         },
+        "app.tasks.outbox_tasks.relay_outbox_messages": {
+            "queue": "notifications"
+        },
+    },
+    beat_schedule={
+        "relay-outbox-messages": {
+            "task": "app.tasks.outbox_tasks.relay_outbox_messages",
+            "schedule": 2.0,
+        },
+        "sweep-poll-deadlines": {
+            "task": "app.tasks.deadline_tasks.sweep_poll_deadlines",
+            "schedule": 60.0,
+        },
+        "fold-counter-deltas": {
+            "task": "app.tasks.counter_tasks.fold_counter_deltas",
+            "schedule": 30.0,
+        },
+        "roll-up-coin-ledger": {
+            "task": "app.tasks.counter_tasks.roll_up_coin_ledger",
+            "schedule": 60.0,
+        },
+        "reconcile-live-tallies": {
+            "task": "app.tasks.tally_tasks.reconcile_live_tallies",
+            "schedule": 60.0,
+        },
+        "flush-idle-vote-sessions": {
+            "task": "app.tasks.session_tasks.flush_idle_vote_sessions",
+            "schedule": 60.0,
+        },
     },
 )
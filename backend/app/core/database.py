@@ -1,14 +1,22 @@
 """SQLAlchemy async database configuration."""
 
-from collections.abc import AsyncGenerator
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.util import await_only
 
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
+# Session.info key holding the callbacks to run once the session commits
+AFTER_COMMIT_KEY = "after_commit_callbacks"
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base class."""
@@ -49,5 +57,35 @@ async def get_db() -> AsyncGenerator[AsyncSession]:
             await session.close()
 
 
+def run_after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """Run a callback once the session's current transaction commits.
+
+    Callbacks are dropped if the transaction rolls back. They run inside
+    ``commit()`` (in the AsyncSession's greenlet), so ``commit()`` returns
+    only after they finish; keep them to a few Redis round trips. A failing
+    callback is logged and never fails the already committed transaction.
+    """
+    sync_session = session.sync_session
+    callbacks = sync_session.info.get(AFTER_COMMIT_KEY)
+    if callbacks is None:
+        callbacks = sync_session.info[AFTER_COMMIT_KEY] = []
+        if not event.contains(sync_session, "after_commit", _run_after_commit_callbacks):
+            event.listen(sync_session, "after_commit", _run_after_commit_callbacks)
+            event.listen(sync_session, "after_soft_rollback", _drop_after_commit_callbacks)
+    callbacks.append(callback)
+
+
+def _run_after_commit_callbacks(sync_session: Session) -> None:
+    for callback in sync_session.info.pop(AFTER_COMMIT_KEY, None) or []:
+        try:
+            await_only(callback())
+        except Exception:
+            logger.exception("After-commit callback failed")
+
+
+def _drop_after_commit_callbacks(sync_session: Session, previous_transaction: object) -> None:
+    sync_session.info.pop(AFTER_COMMIT_KEY, None)
+
+
 # Database session dependency
 DbSession = Annotated[AsyncSession, Depends(get_db)]
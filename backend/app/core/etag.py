@@ -0,0 +1,45 @@
+"""Entity tags for conditional GET requests."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Response, status
+
+# Bodies are per-user: never shared, always revalidated with If-None-Match
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(*parts: Any) -> str:
+    """Return a strong, quoted ETag hashing the string form of every part."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode())
+        digest.update(b"\x1f")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    ``W/`` prefix added by a proxy still matches.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach an ETag and its revalidation policy to a full response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Build the empty 304 response for a client whose copy is current."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL},
+    )
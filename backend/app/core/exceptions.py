@@ -139,6 +139,17 @@ class NotFoundException(CirclyError):
 
 
 # Domain-specific error codes
+class ServiceUnavailableError(CirclyError):
+    """Upstream service unavailable error."""
+
+    def __init__(self, message: str = "일시적으로 서비스를 이용할 수 없습니다") -> None:
+        super().__init__(
+            code="SERVICE_UNAVAILABLE",
+            message=message,
+            status_code=503,
+        )
+
+
 class CircleError(CirclyError):
     """Circle-related errors."""
 
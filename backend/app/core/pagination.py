@@ -0,0 +1,35 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+
+from app.core.exceptions import BadRequestException
+
+# Response header carrying the cursor of the next page, absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, item_id: uuid.UUID) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    payload = json.dumps([created_at.isoformat(), str(item_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises:
+        BadRequestException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), uuid.UUID(item_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise BadRequestException(
+            message="잘못된 페이지 커서입니다",
+            code="INVALID_CURSOR",
+        ) from e
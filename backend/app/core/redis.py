@@ -0,0 +1,29 @@
+"""Shared async Redis clients."""
+
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from app.config import get_settings
+
+
+def create_redis() -> "Redis[str]":
+    """Create a new async Redis client.
+
+    Short socket timeouts keep callers that have a database fallback from
+    stalling when Redis is down. Celery tasks, which run each invocation in a
+    fresh event loop, should create (and close) their own client.
+    """
+    settings = get_settings()
+    return Redis.from_url(
+        settings.redis_url,
+        decode_responses=True,
+        socket_timeout=settings.redis_socket_timeout_seconds,
+        socket_connect_timeout=settings.redis_socket_timeout_seconds,
+    )
+
+
+@lru_cache
+def get_redis() -> "Redis[str]":
+    """Get the cached per-process async Redis client for the API server."""
+    return create_redis()
@@ -1,5 +1,12 @@
 """Supabase client and JWT verification utilities."""
 
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Any
 
@@ -7,32 +14,110 @@ import jwt
 from supabase import Client, create_client
 
 from app.config import get_settings
+from app.core.cache import TTLCache
+from app.core.exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+# supabase-py clients keep the signed-in session on the client itself, so
+# clients are cached per thread instead of being shared by the auth executor
+_thread_clients = threading.local()
 
 
-@lru_cache
 def get_supabase_client() -> Client:
-    """Get cached Supabase client for user authentication.
+    """Get this thread's Supabase client for user authentication.
 
-    Uses anon key for user-facing auth operations (sign_up, sign_in).
+    Uses anon key for user-facing auth operations (sign_up, sign_in). Call it
+    inside the function passed to :func:`run_auth_call`, so the client is the
+    executor thread's own.
     """
-    settings = get_settings()
-    return create_client(settings.supabase_url, settings.supabase_anon_key)
+    client: Client | None = getattr(_thread_clients, "anon", None)
+    if client is None:
+        settings = get_settings()
+        client = create_client(settings.supabase_url, settings.supabase_anon_key)
+        _thread_clients.anon = client
+    return client
 
 
-@lru_cache
 def get_supabase_admin_client() -> Client:
-    """Get cached Supabase admin client.
+    """Get this thread's Supabase admin client.
 
     Uses service role key for admin operations (bypasses RLS).
     """
+    client: Client | None = getattr(_thread_clients, "admin", None)
+    if client is None:
+        settings = get_settings()
+        client = create_client(settings.supabase_url, settings.supabase_service_role_key)
+        _thread_clients.admin = client
+    return client
+
+
+@lru_cache
+def _get_auth_executor() -> ThreadPoolExecutor:
+    """Get the bounded executor that runs blocking Supabase Auth calls."""
+    settings = get_settings()
+    return ThreadPoolExecutor(
+        max_workers=settings.supabase_auth_max_concurrency,
+        thread_name_prefix="supabase-auth",
+    )
+
+
+async def run_auth_call(call: Callable[[], Any]) -> Any:
+    """Run a blocking supabase-py auth call without blocking the event loop.
+
+    Calls are executed on a dedicated executor, so at most
+    ``supabase_auth_max_concurrency`` requests are in flight against Supabase
+    and a burst of logins queues there instead of stalling other endpoints.
+    The timeout covers both queueing and the call itself; a call that is still
+    queued when it times out never reaches Supabase.
+
+    Args:
+        call: Function making the supabase-py call with the executor thread's
+            client, e.g. ``lambda: get_supabase_client().auth.sign_up(...)``
+
+    Returns:
+        The value returned by ``call``
+
+    Raises:
+        ServiceUnavailableError: If the call does not finish in time
+    """
+    settings = get_settings()
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_auth_executor(), call)
+
+    try:
+        return await asyncio.wait_for(future, timeout=settings.supabase_auth_timeout_seconds)
+    except TimeoutError as e:
+        logger.warning(
+            "Supabase auth call %s timed out after %ss",
+            getattr(call, "__name__", call),
+            settings.supabase_auth_timeout_seconds,
+        )
+        raise ServiceUnavailableError() from e
+
+
+def _token_digest(token: str) -> str:
+    """Return the cache key for a raw access token."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+@lru_cache
+def _get_token_cache() -> TTLCache[str, dict[str, Any]]:
+    """Get the per-process cache of verified token claims."""
     settings = get_settings()
-    return create_client(settings.supabase_url, settings.supabase_service_role_key)
+    return TTLCache(
+        maxsize=settings.auth_token_cache_size,
+        ttl=settings.auth_token_cache_ttl_seconds,
+    )
 
 
 def verify_supabase_token(token: str) -> dict[str, Any] | None:
     """Verify Supabase JWT token and return payload.
 
-    Uses HS256 algorithm with Supabase JWT secret.
+    Uses HS256 algorithm with Supabase JWT secret. Verified claims are cached
+    by token digest until the token's exp claim (or the configured TTL,
+    whichever comes first), so repeated requests with the same token skip
+    signature verification. Failed verifications are never cached.
 
     Args:
         token: JWT access token from Supabase
@@ -43,21 +128,17 @@ def verify_supabase_token(token: str) -> dict[str, Any] | None:
     settings = get_settings()
 
     if not settings.supabase_jwt_secret:
-        print("[JWT] Warning: supabase_jwt_secret not configured")
+        logger.warning("supabase_jwt_secret not configured")
         return None
 
-    # Debug: decode without verification to see token contents
-    try:
-        unverified = jwt.decode(token, options={"verify_signature": False})
-        expected_issuer = f"{settings.supabase_url}/auth/v1"
-        print(f"[JWT] Token issuer: {unverified.get('iss')}")
-        print(f"[JWT] Expected issuer: {expected_issuer}")
-        print(f"[JWT] Token audience: {unverified.get('aud')}")
-    except Exception as e:
-        print(f"[JWT] Failed to decode token for debugging: {e}")
+    token_cache = _get_token_cache()
+    digest = _token_digest(token)
+    cached = token_cache.get(digest)
+    if cached is not None:
+        return cached
 
     try:
-        payload = jwt.decode(
+        payload: dict[str, Any] = jwt.decode(
             token,
             settings.supabase_jwt_secret,
             algorithms=["HS256"],
@@ -65,24 +146,33 @@ def verify_supabase_token(token: str) -> dict[str, Any] | None:
             issuer=f"{settings.supabase_url}/auth/v1",
             leeway=60,  # Allow 60 seconds clock skew
         )
-        print("[JWT] Token verified successfully")
-        return payload
     except jwt.exceptions.ExpiredSignatureError:
-        print("[JWT] Token expired")
+        logger.debug("JWT expired")
         return None
     except jwt.exceptions.InvalidAudienceError as e:
-        print(f"[JWT] Invalid audience: {e}")
+        logger.info("JWT invalid audience: %s", e)
         return None
     except jwt.exceptions.InvalidIssuerError as e:
-        print(f"[JWT] Invalid issuer: {e}")
+        logger.info("JWT invalid issuer: %s", e)
         return None
     except jwt.exceptions.InvalidSignatureError:
-        print("[JWT] Invalid signature - check SUPABASE_JWT_SECRET")
+        logger.warning("JWT invalid signature - check SUPABASE_JWT_SECRET")
         return None
     except jwt.exceptions.PyJWTError as e:
-        print(f"[JWT] Verification failed: {e}")
+        logger.info("JWT verification failed: %s", e)
         return None
 
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        token_cache.set(digest, payload, ttl=exp - time.time())
+
+    return payload
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token claims (e.g. after rotating the JWT secret)."""
+    _get_token_cache().clear()
+
 
 def get_supabase_user_id_from_token(token: str) -> str | None:
     """Extract Supabase user ID from token.
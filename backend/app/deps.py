@@ -11,20 +11,27 @@ from app.config import Settings, get_settings
 from app.core.database import get_db
 from app.core.enums import UserRole
 from app.core.exceptions import AuthorizationError, UnauthorizedException
+from app.modules.auth.cache import get_user_cache
 from app.modules.auth.models import User
 from app.modules.auth.repository import UserRepository
 from app.modules.auth.service import AuthService
 from app.modules.circles.repository import CircleRepository, MembershipRepository
 from app.modules.circles.service import CircleService
-from app.modules.notifications.repository import NotificationRepository
+from app.modules.notifications.buffer import get_vote_received_buffer
+from app.modules.notifications.repository import NotificationRepository, OutboxRepository
 from app.modules.notifications.service import NotificationService
+from app.modules.polls.catalog import get_template_catalog
+from app.modules.polls.live_results import get_live_results_hub
 from app.modules.polls.repository import (
+    PollBroadcastJobRepository,
     PollRepository,
     TemplateRepository,
     VoteRepository,
     VoteSessionRepository,
 )
 from app.modules.polls.service import PollService
+from app.modules.polls.session_cursors import get_vote_session_cursor_store
+from app.modules.polls.tallies import get_live_tally_store
 from app.modules.reports.repository import ReportRepository
 from app.modules.reports.service import ReportService
 
@@ -69,7 +76,7 @@ async def get_current_user(
             raise UnauthorizedException("Invalid token") from exc
 
         repo = UserRepository(db)
-        user = await repo.find_by_id(user_id)
+        user = await repo.find_by_id(user_id, with_totals=True)
         if user is None:
             raise UnauthorizedException("Invalid token")
         if not user.is_active:
@@ -86,18 +93,23 @@ async def get_current_user(
     if not supabase_user_id:
         raise UnauthorizedException("Invalid token: missing user ID")
 
-    # Find user by Supabase ID
-    repo = UserRepository(db)
-    user = await repo.find_by_supabase_id(supabase_user_id)
-
-    # Auto-create local profile if not exists
+    # Resolve the local profile, from the per-process cache when possible
+    user_cache = get_user_cache()
+    user = user_cache.get(supabase_user_id)
     if user is None:
-        email = payload.get("email", "")
-        user = await repo.create_from_supabase(
-            supabase_user_id=supabase_user_id,
-            email=email,
-        )
-        await db.commit()
+        repo = UserRepository(db)
+        user = await repo.find_by_supabase_id(supabase_user_id, with_totals=True)
+
+        # Auto-create local profile if not exists
+        if user is None:
+            email = payload.get("email", "")
+            user = await repo.create_from_supabase(
+                supabase_user_id=supabase_user_id,
+                email=email,
+            )
+            await db.commit()
+
+        user_cache.set(user)
 
     if not user.is_active:
         raise UnauthorizedException("User account is inactive")
@@ -154,12 +166,22 @@ def get_poll_service(db: AsyncSession = Depends(get_db)) -> PollService:
         get_notification_service(db),
         VoteSessionRepository(db),
         UserRepository(db),
+        get_live_tally_store(),
+        get_template_catalog(),
+        get_vote_session_cursor_store(),
+        PollBroadcastJobRepository(db),
+        OutboxRepository(db),
+        get_live_results_hub(),
     )
 
 
 def get_notification_service(db: AsyncSession = Depends(get_db)) -> NotificationService:
     """Get NotificationService dependency."""
-    return NotificationService(NotificationRepository(db), UserRepository(db))
+    return NotificationService(
+        NotificationRepository(db),
+        UserRepository(db),
+        vote_received_buffer=get_vote_received_buffer(),
+    )
 
 
 def get_report_service(db: AsyncSession = Depends(get_db)) -> ReportService:
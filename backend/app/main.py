@@ -15,6 +15,7 @@ from starlette.requests import Request as StarletteRequest
 
 from app.config import get_settings
 from app.core.exceptions import CirclyError
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.core.rate_limit import limiter
 
 # Configure logging
@@ -65,6 +66,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
     # Exception handlers
@@ -0,0 +1,73 @@
+"""Short-lived per-process cache for resolving authenticated users.
+
+Entries are column snapshots rather than ORM instances, so a cached user is
+never bound to (or refreshed through) another request's session. Every
+UserRepository write invalidates the affected user; other workers converge
+within ``auth_user_cache_ttl_seconds``.
+"""
+
+import uuid
+from functools import lru_cache
+from typing import Any
+
+from app.config import get_settings
+from app.core.cache import TTLCache
+from app.modules.auth.models import User
+
+
+class UserCache:
+    """Cache of User column snapshots keyed by Supabase user ID."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize cache with size and TTL limits."""
+        self._entries: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._supabase_ids: dict[uuid.UUID, str] = {}
+
+    def get(self, supabase_user_id: str) -> User | None:
+        """Return a detached User built from the cached snapshot, if any."""
+        snapshot = self._entries.get(supabase_user_id)
+        if snapshot is None:
+            return None
+        return User(**snapshot)
+
+    def set(self, user: User) -> None:
+        """Cache a snapshot of the user's loaded columns."""
+        if user.supabase_user_id is None:
+            return
+
+        snapshot = {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs}
+        self._entries.set(user.supabase_user_id, snapshot)
+        self._supabase_ids[user.id] = user.supabase_user_id
+        if len(self._supabase_ids) > 2 * max(self._entries.maxsize, 1):
+            # Drop reverse-index entries whose snapshot was evicted or expired
+            self._supabase_ids = {
+                user_id: supabase_id
+                for user_id, supabase_id in self._supabase_ids.items()
+                if self._entries.get(supabase_id) is not None
+            }
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        """Drop the cached snapshot for a user."""
+        supabase_user_id = self._supabase_ids.pop(user_id, None)
+        if supabase_user_id is not None:
+            self._entries.pop(supabase_user_id)
+
+    def clear(self) -> None:
+        """Drop all cached users."""
+        self._entries.clear()
+        self._supabase_ids.clear()
+
+
+@lru_cache
+def get_user_cache() -> UserCache:
+    """Get the per-process user cache."""
+    settings = get_settings()
+    return UserCache(
+        maxsize=settings.auth_user_cache_size,
+        ttl=settings.auth_user_cache_ttl_seconds,
+    )
+
+
+def invalidate_cached_user(user_id: uuid.UUID) -> None:
+    """Invalidate a user's cached identity after a profile/status/role change."""
+    get_user_cache().invalidate(user_id)
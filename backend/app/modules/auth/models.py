@@ -1,14 +1,28 @@
-"""User model for authentication module."""
+"""User and coin ledger models for authentication module."""
 
-from datetime import datetime
+import uuid
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ENUM
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Boolean,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ENUM, UUID
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from app.core.enums import UserRole
-from app.core.models import BaseModel
+from app.core.models import Base, BaseModel, UUIDMixin
 
 if TYPE_CHECKING:
     from app.modules.circles.models import Circle, CircleMember
@@ -30,6 +44,11 @@ class User(BaseModel):
         role: User role (USER or ADMIN)
         is_active: Whether the user is active
         push_token: Expo push notification token
+        coin_balance: Coins rolled up from the coin ledger
+        streak_days: Daily voting streak as of last_reward_at
+        last_reward_at: Latest reward rolled up from the coin ledger
+        pending_coin_balance: Ledger coins not rolled up yet (deferred; undefer to render totals)
+        pending_reward_dates: Ledger reward dates not rolled up yet (deferred)
         is_orb_mode: Whether user has Orb Mode subscription
         created_at: Timestamp when created (from BaseModel)
         updated_at: Timestamp when last updated (from BaseModel)
@@ -196,5 +215,143 @@ class User(BaseModel):
         back_populates="reviewer",
     )
 
+    if TYPE_CHECKING:
+        # Mapped below CoinLedgerEntry
+        pending_coin_balance: Mapped[int]
+        pending_reward_dates: Mapped[list[date] | None]
+
+    @property
+    def total_coin_balance(self) -> int:
+        """Coin balance including ledger entries not rolled up yet."""
+        return self.coin_balance + (self.pending_coin_balance or 0)
+
+    @property
+    def total_streak_days(self) -> int:
+        """Daily voting streak including ledger entries not rolled up yet."""
+        return extend_streak(
+            self.streak_days,
+            reward_date(self.last_reward_at) if self.last_reward_at else None,
+            self.pending_reward_dates or [],
+        )
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, username={self.username})>"
+
+
+class CoinLedgerEntry(UUIDMixin, Base):
+    """Append-only record of coins granted to a user.
+
+    A vote inserts one entry instead of updating the voter's row. The rollup
+    task marks entries rolled up and folds them into ``users.coin_balance``,
+    ``streak_days`` and ``last_reward_at``; reads add what is still pending.
+
+    Attributes:
+        id: UUID primary key
+        user_id: Foreign key to users table
+        vote_id: Vote that earned the coins (null once the vote is deleted)
+        amount: Coins granted
+        reason: Why the coins were granted (e.g. VOTE)
+        reward_date: UTC date of the reward, used for the daily streak
+        rolled_up: Whether the entry is included in the users columns
+        created_at: Timestamp when granted
+    """
+
+    __tablename__ = "coin_ledger_entries"
+    __table_args__ = (
+        Index("ix_coin_ledger_entries_user_id_created_at", "user_id", "created_at"),
+        Index(
+            "ix_coin_ledger_entries_pending",
+            "user_id",
+            "created_at",
+            postgresql_where=text("NOT rolled_up"),
+        ),
+    )
+
+    REASON_VOTE = "VOTE"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    vote_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("votes.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    amount: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    reason: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    reward_date: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+    )
+    rolled_up: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+def reward_date(rewarded_at: datetime) -> date:
+    """Return the UTC date a reward counts toward for the daily streak."""
+    if rewarded_at.tzinfo is None:
+        rewarded_at = rewarded_at.replace(tzinfo=UTC)
+    return rewarded_at.astimezone(UTC).date()
+
+
+def extend_streak(
+    streak_days: int,
+    last_date: date | None,
+    reward_dates: Iterable[date],
+) -> int:
+    """Extend a daily streak with later reward dates.
+
+    A reward the day after the last one extends the streak, a reward on the
+    same (or an earlier) day leaves it unchanged, and a gap restarts it.
+
+    Args:
+        streak_days: Streak as of last_date
+        last_date: Date of the latest reward counted (None if never rewarded)
+        reward_dates: Dates of the rewards to add, in any order
+
+    Returns:
+        Streak after the rewards
+    """
+    for day in sorted(set(reward_dates)):
+        if last_date is not None and day <= last_date:
+            continue
+        if last_date is not None and day == last_date + timedelta(days=1):
+            streak_days += 1
+        else:
+            streak_days = 1
+        last_date = day
+    return streak_days
+
+
+# Deferred: most User loads (members, candidates, rollups) never render coin totals
+User.pending_coin_balance = column_property(
+    select(func.coalesce(func.sum(CoinLedgerEntry.amount), 0))
+    .where(CoinLedgerEntry.user_id == User.id, ~CoinLedgerEntry.rolled_up)
+    .correlate_except(CoinLedgerEntry)
+    .scalar_subquery(),
+    deferred=True,
+)
+User.pending_reward_dates = column_property(
+    select(func.array_agg(CoinLedgerEntry.reward_date.distinct()))
+    .where(CoinLedgerEntry.user_id == User.id, ~CoinLedgerEntry.rolled_up)
+    .correlate_except(CoinLedgerEntry)
+    .scalar_subquery(),
+    deferred=True,
+)
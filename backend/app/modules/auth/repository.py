@@ -1,15 +1,28 @@
 """Repository for user data access."""
 
 import uuid
-from datetime import UTC, datetime, timedelta
+from collections import defaultdict
+from datetime import UTC, date, datetime
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Date, DateTime, Row, func, insert, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.enums import UserRole
-from app.modules.auth.models import User
+from app.modules.auth.cache import invalidate_cached_user
+from app.modules.auth.models import CoinLedgerEntry, User, extend_streak, reward_date
 from app.modules.auth.schemas import UserCreate, UserUpdate
 
+# Deferred User columns that UserResponse renders through the total_* properties
+_PENDING_REWARD_ATTRIBUTES = ["pending_coin_balance", "pending_reward_dates"]
+
+
+def _undefer_totals() -> list[LoaderOption]:
+    """Loader options that load the pending reward totals with the row."""
+    return [undefer(User.pending_coin_balance), undefer(User.pending_reward_dates)]
+
 
 class UserRepository:
     """Repository for user CRUD operations."""
@@ -18,6 +31,11 @@ class UserRepository:
         """Initialize repository with database session."""
         self.session = session
 
+    async def _refresh_with_totals(self, user: User) -> None:
+        """Refresh a user, including the pending reward totals."""
+        await self.session.refresh(user)
+        await self.session.refresh(user, _PENDING_REWARD_ATTRIBUTES)
+
     async def create(self, user_data: UserCreate) -> User:
         """Create a new user.
 
@@ -34,19 +52,24 @@ class UserRepository:
         )
         self.session.add(user)
         await self.session.flush()
-        await self.session.refresh(user)
+        await self._refresh_with_totals(user)
         return user
 
-    async def find_by_supabase_id(self, supabase_user_id: str) -> User | None:
+    async def find_by_supabase_id(
+        self, supabase_user_id: str, with_totals: bool = False
+    ) -> User | None:
         """Find a user by Supabase user ID.
 
         Args:
             supabase_user_id: Supabase Auth user ID.
+            with_totals: Also load the pending reward totals UserResponse renders.
 
         Returns:
             User if found, None otherwise.
         """
         stmt = select(User).where(User.supabase_user_id == supabase_user_id)
+        if with_totals:
+            stmt = stmt.options(*_undefer_totals())
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -76,32 +99,38 @@ class UserRepository:
         )
         self.session.add(user)
         await self.session.flush()
-        await self.session.refresh(user)
+        await self._refresh_with_totals(user)
         return user
 
-    async def find_by_email(self, email: str) -> User | None:
+    async def find_by_email(self, email: str, with_totals: bool = False) -> User | None:
         """Find a user by email.
 
         Args:
             email: Email address to search for.
+            with_totals: Also load the pending reward totals UserResponse renders.
 
         Returns:
             User if found, None otherwise.
         """
         stmt = select(User).where(User.email == email)
+        if with_totals:
+            stmt = stmt.options(*_undefer_totals())
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def find_by_id(self, user_id: uuid.UUID) -> User | None:
+    async def find_by_id(self, user_id: uuid.UUID, with_totals: bool = False) -> User | None:
         """Find a user by ID.
 
         Args:
             user_id: UUID of the user.
+            with_totals: Also load the pending reward totals UserResponse renders.
 
         Returns:
             User if found, None otherwise.
         """
         stmt = select(User).where(User.id == user_id)
+        if with_totals:
+            stmt = stmt.options(*_undefer_totals())
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
@@ -150,7 +179,8 @@ class UserRepository:
             setattr(user, field, value)
 
         await self.session.flush()
-        await self.session.refresh(user)
+        await self._refresh_with_totals(user)
+        invalidate_cached_user(user_id)
         return user
 
     async def update_push_token(self, user_id: uuid.UUID, token: str) -> bool:
@@ -169,6 +199,7 @@ class UserRepository:
 
         user.push_token = token
         await self.session.flush()
+        invalidate_cached_user(user_id)
         return True
 
     async def update_next_session_at(
@@ -183,41 +214,117 @@ class UserRepository:
 
         user.next_session_at = next_session_at
         await self.session.flush()
+        invalidate_cached_user(user_id)
         return True
 
     async def apply_vote_reward(
         self,
         user_id: uuid.UUID,
         voted_at: datetime | None = None,
-    ) -> User | None:
-        """Grant a coin and update the user's daily voting streak."""
-        user = await self.find_by_id(user_id)
-        if user is None:
-            return None
+        vote_id: uuid.UUID | None = None,
+    ) -> bool:
+        """Append a one-coin vote reward to the user's coin ledger.
+
+        A single insert that never touches the ``users`` row; the balance and
+        streak include it on read and after the next rollup.
+
+        Args:
+            user_id: Rewarded user UUID
+            voted_at: Reward timestamp (defaults to now)
+            vote_id: Vote that earned the reward
 
+        Returns:
+            True if rewarded, False if user not found.
+        """
         now = voted_at or datetime.now(UTC)
-        user.coin_balance += 1
-
-        if user.last_reward_at is None:
-            user.streak_days = 1
-        else:
-            last_reward_at = user.last_reward_at
-            if last_reward_at.tzinfo is None:
-                last_reward_at = last_reward_at.replace(tzinfo=UTC)
-
-            last_date = last_reward_at.astimezone(UTC).date()
-            today = now.astimezone(UTC).date()
-            if last_date == today:
-                pass
-            elif last_date == today - timedelta(days=1):
-                user.streak_days += 1
-            else:
-                user.streak_days = 1
-
-        user.last_reward_at = now
+        result = await self.session.execute(
+            insert(CoinLedgerEntry)
+            .from_select(
+                ["id", "user_id", "vote_id", "amount", "reason", "reward_date", "created_at"],
+                select(
+                    func.gen_random_uuid(),
+                    User.id,
+                    literal(vote_id, UUID(as_uuid=True)),
+                    literal(1),
+                    literal(CoinLedgerEntry.REASON_VOTE),
+                    literal(reward_date(now), Date),
+                    literal(now, DateTime(timezone=True)),
+                ).where(User.id == user_id),
+            )
+            .returning(CoinLedgerEntry.id)
+        )
+        if result.first() is None:
+            return False
+
+        invalidate_cached_user(user_id)
+        return True
+
+    async def roll_up_rewards(self, limit: int = 1000) -> int:
+        """Fold a batch of pending coin ledger entries into the users columns.
+
+        Entries are claimed oldest first with ``FOR UPDATE SKIP LOCKED`` so
+        concurrent rollups split the work, and each user's streak is extended
+        with the claimed reward dates in order.
+
+        Args:
+            limit: Maximum ledger entries to fold
+
+        Returns:
+            Number of ledger entries folded
+        """
+        claimed = (
+            select(CoinLedgerEntry.id)
+            .where(~CoinLedgerEntry.rolled_up)
+            .order_by(CoinLedgerEntry.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(CoinLedgerEntry)
+            .where(CoinLedgerEntry.id.in_(claimed))
+            .values(rolled_up=True)
+            .returning(
+                CoinLedgerEntry.user_id,
+                CoinLedgerEntry.amount,
+                CoinLedgerEntry.reward_date,
+                CoinLedgerEntry.created_at,
+            )
+        )
+        entries = result.all()
+        if not entries:
+            return 0
+
+        entries_by_user: dict[uuid.UUID, list[Row[uuid.UUID, int, date, datetime]]]
+        entries_by_user = defaultdict(list)
+        for entry in entries:
+            entries_by_user[entry.user_id].append(entry)
+
+        # Lock in a fixed order so concurrent rollups cannot deadlock. FOR NO
+        # KEY UPDATE leaves the key-share locks taken by ledger and vote
+        # inserts referencing these users unblocked.
+        users = await self.session.execute(
+            select(User)
+            .where(User.id.in_(entries_by_user))
+            .order_by(User.id)
+            .with_for_update(key_share=True)
+            .execution_options(populate_existing=True)
+        )
+        for user in users.scalars():
+            user_entries = entries_by_user[user.id]
+            user.coin_balance += sum(entry.amount for entry in user_entries)
+            user.streak_days = extend_streak(
+                user.streak_days,
+                reward_date(user.last_reward_at) if user.last_reward_at else None,
+                (entry.reward_date for entry in user_entries),
+            )
+            latest = max(entry.created_at for entry in user_entries)
+            if user.last_reward_at is None or latest > user.last_reward_at:
+                user.last_reward_at = latest
+
         await self.session.flush()
-        await self.session.refresh(user)
-        return user
+        for user_id in entries_by_user:
+            invalidate_cached_user(user_id)
+        return len(entries)
 
     async def deactivate(self, user_id: uuid.UUID) -> bool:
         """Deactivate a user account.
@@ -234,6 +341,7 @@ class UserRepository:
 
         user.is_active = False
         await self.session.flush()
+        invalidate_cached_user(user_id)
         return True
 
     # ==================== Admin Methods ====================
@@ -258,7 +366,7 @@ class UserRepository:
         Returns:
             List of users matching the criteria
         """
-        stmt = select(User).order_by(User.created_at.desc())
+        stmt = select(User).options(*_undefer_totals()).order_by(User.created_at.desc())
 
         if search:
             search_term = f"%{search}%"
@@ -333,7 +441,8 @@ class UserRepository:
 
         user.is_active = is_active
         await self.session.flush()
-        await self.session.refresh(user)
+        await self._refresh_with_totals(user)
+        invalidate_cached_user(user_id)
         return user
 
     async def update_role(self, user_id: uuid.UUID, role: UserRole) -> User | None:
@@ -352,7 +461,8 @@ class UserRepository:
 
         user.role = role
         await self.session.flush()
-        await self.session.refresh(user)
+        await self._refresh_with_totals(user)
+        invalidate_cached_user(user_id)
         return user
 
     # ==================== Notification Settings ====================
@@ -372,6 +482,7 @@ class UserRepository:
 
         await self.session.delete(user)
         await self.session.commit()
+        invalidate_cached_user(user_id)
         return True
 
     async def update_notification_settings(
@@ -413,4 +524,5 @@ class UserRepository:
 
         await self.session.flush()
         await self.session.refresh(user)
+        invalidate_cached_user(user_id)
         return user
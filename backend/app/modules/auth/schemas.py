@@ -3,7 +3,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, EmailStr, Field
 
 from app.core.enums import UserRole
 
@@ -40,8 +40,9 @@ class UserResponse(BaseModel):
     gender: str
     age_group: str
     profile_emoji: str
-    coin_balance: int
-    streak_days: int
+    # Users are read with their coin ledger entries not rolled up yet included
+    coin_balance: int = Field(validation_alias=AliasChoices("total_coin_balance", "coin_balance"))
+    streak_days: int = Field(validation_alias=AliasChoices("total_streak_days", "streak_days"))
     role: str
     is_active: bool
     is_orb_mode: bool
@@ -6,8 +6,13 @@ import uuid
 from supabase_auth.errors import AuthApiError
 
 from app.core.enums import UserRole
-from app.core.exceptions import BadRequestException, NotFoundException, UnauthorizedException
-from app.core.supabase import get_supabase_admin_client, get_supabase_client
+from app.core.exceptions import (
+    BadRequestException,
+    NotFoundException,
+    ServiceUnavailableError,
+    UnauthorizedException,
+)
+from app.core.supabase import get_supabase_admin_client, get_supabase_client, run_auth_call
 from app.modules.auth.repository import UserRepository
 from app.modules.auth.schemas import (
     AuthResponse,
@@ -34,7 +39,7 @@ class AuthService:
         This is only exposed when DEV_AUTH_ENABLED=true and is intended for
         local app testing while Supabase Auth is unavailable.
         """
-        user = await self.repository.find_by_email(login_data.email)
+        user = await self.repository.find_by_email(login_data.email, with_totals=True)
 
         if user is None:
             user = await self.repository.create_from_supabase(
@@ -64,17 +69,20 @@ class AuthService:
 
         Raises:
             BadRequestException: If email is already registered.
+            ServiceUnavailableError: If Supabase Auth does not respond in time.
         """
-        supabase = get_supabase_client()
-
         try:
             # Create user in Supabase Auth
-            auth_response = supabase.auth.sign_up(
-                {
-                    "email": user_data.email,
-                    "password": user_data.password,
-                }
+            auth_response = await run_auth_call(
+                lambda: get_supabase_client().auth.sign_up(
+                    {
+                        "email": user_data.email,
+                        "password": user_data.password,
+                    }
+                )
             )
+        except ServiceUnavailableError:
+            raise
         except Exception as e:
             raise BadRequestException(str(e)) from e
 
@@ -119,16 +127,17 @@ class AuthService:
 
         Raises:
             UnauthorizedException: If credentials are invalid.
+            ServiceUnavailableError: If Supabase Auth does not respond in time.
         """
-        supabase = get_supabase_client()
-
         try:
             # Authenticate with Supabase
-            auth_response = supabase.auth.sign_in_with_password(
-                {
-                    "email": login_data.email,
-                    "password": login_data.password,
-                }
+            auth_response = await run_auth_call(
+                lambda: get_supabase_client().auth.sign_in_with_password(
+                    {
+                        "email": login_data.email,
+                        "password": login_data.password,
+                    }
+                )
             )
         except AuthApiError as e:
             raise UnauthorizedException("Invalid credentials") from e
@@ -137,7 +146,7 @@ class AuthService:
             raise UnauthorizedException("Invalid credentials")
 
         # Find or create local user profile
-        user = await self.repository.find_by_supabase_id(auth_response.user.id)
+        user = await self.repository.find_by_supabase_id(auth_response.user.id, with_totals=True)
 
         if user is None:
             # Auto-create local profile
@@ -195,8 +204,10 @@ class AuthService:
         # Delete from Supabase Auth (if linked)
         if user.supabase_user_id:
             try:
-                supabase_admin = get_supabase_admin_client()
-                supabase_admin.auth.admin.delete_user(user.supabase_user_id)
+                supabase_user_id = user.supabase_user_id
+                await run_auth_call(
+                    lambda: get_supabase_admin_client().auth.admin.delete_user(supabase_user_id)
+                )
                 logger.info(f"Deleted user from Supabase Auth: {user.supabase_user_id}")
             except Exception as e:
                 # Log but continue - DB deletion is more important
@@ -247,7 +258,7 @@ class AuthService:
         Raises:
             NotFoundException: If user not found
         """
-        user = await self.repository.find_by_id(user_id)
+        user = await self.repository.find_by_id(user_id, with_totals=True)
         if user is None:
             raise NotFoundException("User not found")
         return UserResponse.model_validate(user)
@@ -8,6 +8,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -136,7 +137,11 @@ class CircleMember(BaseModel):
     """
 
     __tablename__ = "circle_members"
-    __table_args__ = (UniqueConstraint("circle_id", "user_id", name="uq_circle_member"),)
+    __table_args__ = (
+        UniqueConstraint("circle_id", "user_id", name="uq_circle_member"),
+        # Serves the keyset-paginated member listing (circle detail)
+        Index("ix_circle_members_circle_id_joined_at", "circle_id", "joined_at", "id"),
+    )
 
     # Override created_at/updated_at - we only need joined_at
     created_at: Mapped[datetime] = mapped_column(
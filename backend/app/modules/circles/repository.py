@@ -2,14 +2,30 @@
 
 import uuid
 from datetime import datetime
+from typing import TypedDict
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import delete, func, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.enums import MemberRole
+from app.core.enums import MemberRole, PollStatus
+from app.modules.auth.models import User
 from app.modules.circles.models import Circle, CircleMember
 from app.modules.circles.schemas import CircleCreate, CircleUpdate
+from app.modules.polls.models import CircleReceivedCount, Poll
+
+
+class MemberRowDict(TypedDict):
+    """Type for a member listing row."""
+
+    id: uuid.UUID
+    user_id: uuid.UUID
+    role: MemberRole
+    nickname: str | None
+    joined_at: datetime
+    username: str | None
+    display_name: str | None
+    profile_emoji: str
 
 
 class CircleRepository:
@@ -96,22 +112,49 @@ class CircleRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
-    async def find_with_members(self, circle_id: uuid.UUID) -> Circle | None:
-        """Find a circle with its members loaded.
+    async def find_summaries_by_user_id(
+        self,
+        user_id: uuid.UUID,
+        circle_ids: list[uuid.UUID] | None = None,
+    ) -> list[tuple[Circle, int, MemberRole]]:
+        """Find a user's circles with their active poll counts and the user's role.
+
+        Counts come from one grouped subquery over the user's circles, so the
+        whole list is a single statement regardless of how many circles the
+        user belongs to.
 
         Args:
-            circle_id: UUID of the circle
+            user_id: UUID of the user
+            circle_ids: Optional subset of the user's circles to load
 
         Returns:
-            Circle with members if found, None otherwise
+            (circle, active poll count, user's role) tuples, newest circle first
         """
+        member_circle_ids = select(CircleMember.circle_id).where(CircleMember.user_id == user_id)
+        active_counts = (
+            select(Poll.circle_id, func.count().label("active_polls_count"))
+            .where(
+                Poll.circle_id.in_(member_circle_ids),
+                Poll.status == PollStatus.ACTIVE,
+            )
+            .group_by(Poll.circle_id)
+            .subquery()
+        )
         stmt = (
-            select(Circle)
-            .options(selectinload(Circle.members).selectinload(CircleMember.user))
-            .where(Circle.id == circle_id)
+            select(
+                Circle,
+                func.coalesce(active_counts.c.active_polls_count, 0),
+                CircleMember.role,
+            )
+            .join(CircleMember, CircleMember.circle_id == Circle.id)
+            .outerjoin(active_counts, active_counts.c.circle_id == Circle.id)
+            .where(CircleMember.user_id == user_id)
+            .order_by(Circle.created_at.desc())
         )
+        if circle_ids is not None:
+            stmt = stmt.where(Circle.id.in_(circle_ids))
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        return list(result.all())
 
     async def update(self, circle_id: uuid.UUID, circle_data: CircleUpdate) -> Circle | None:
         """Update a circle.
@@ -196,6 +239,31 @@ class CircleRepository:
             await self.session.flush()
         return True
 
+    async def find_ids(
+        self,
+        limit: int = 500,
+        after_id: uuid.UUID | None = None,
+        is_active: bool | None = None,
+    ) -> list[uuid.UUID]:
+        """Find circle IDs in ascending order (for batch jobs).
+
+        Args:
+            limit: Maximum number of circle IDs to return
+            after_id: Only return IDs greater than this (for batching)
+            is_active: Optional filter by active status
+
+        Returns:
+            Circle UUIDs in ascending order
+        """
+        stmt = select(Circle.id).order_by(Circle.id).limit(limit)
+        if after_id is not None:
+            stmt = stmt.where(Circle.id > after_id)
+        if is_active is not None:
+            stmt = stmt.where(Circle.is_active == is_active)
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     # ==================== Admin Methods ====================
 
     async def find_all(
@@ -356,6 +424,75 @@ class MembershipRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def find_member_page(
+        self,
+        circle_id: uuid.UUID,
+        limit: int = 50,
+        after: tuple[datetime, uuid.UUID] | None = None,
+    ) -> list[MemberRowDict]:
+        """Find a page of a circle's members, earliest joined first.
+
+        Only the listed columns are selected, so no User or CircleMember
+        objects are loaded.
+
+        Args:
+            circle_id: UUID of the circle
+            limit: Maximum number of rows
+            after: Optional (joined_at, membership id) keyset; only members
+                after it in listing order are returned
+
+        Returns:
+            Member rows ordered by join time
+        """
+        stmt = (
+            select(
+                CircleMember.id,
+                CircleMember.user_id,
+                CircleMember.role,
+                CircleMember.nickname,
+                CircleMember.joined_at,
+                User.username,
+                User.display_name,
+                User.profile_emoji,
+            )
+            .join(User, User.id == CircleMember.user_id)
+            .where(CircleMember.circle_id == circle_id)
+        )
+        if after is not None:
+            stmt = stmt.where(tuple_(CircleMember.joined_at, CircleMember.id) > tuple_(*after))
+        stmt = stmt.order_by(CircleMember.joined_at, CircleMember.id).limit(limit)
+
+        result = await self.session.execute(stmt)
+        return [
+            {
+                "id": row.id,
+                "user_id": row.user_id,
+                "role": row.role,
+                "nickname": row.nickname,
+                "joined_at": row.joined_at,
+                "username": row.username,
+                "display_name": row.display_name,
+                "profile_emoji": row.profile_emoji,
+            }
+            for row in result.all()
+        ]
+
+    async def count_by_role(self, circle_id: uuid.UUID) -> dict[MemberRole, int]:
+        """Count a circle's members per role.
+
+        Args:
+            circle_id: UUID of the circle
+
+        Returns:
+            Member count for every role present in the circle
+        """
+        result = await self.session.execute(
+            select(CircleMember.role, func.count())
+            .where(CircleMember.circle_id == circle_id)
+            .group_by(CircleMember.role)
+        )
+        return dict(result.all())
+
     async def find_membership(
         self, circle_id: uuid.UUID, user_id: uuid.UUID
     ) -> CircleMember | None:
@@ -423,5 +560,12 @@ class MembershipRepository:
             return False
 
         await self.session.delete(membership)
+        # Received counts only cover the current membership; a rejoin starts at zero
+        await self.session.execute(
+            delete(CircleReceivedCount).where(
+                CircleReceivedCount.circle_id == circle_id,
+                CircleReceivedCount.user_id == user_id,
+            )
+        )
         await self.session.flush()
         return True
@@ -2,8 +2,9 @@
 
 import uuid
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Query, Response, status
 
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.deps import AdminUserDep, CircleServiceDep, CurrentUserDep
 from app.modules.circles.schemas import (
     CircleCreate,
@@ -73,11 +74,30 @@ async def resolve_invite_link(
 )
 async def get_circle(
     circle_id: uuid.UUID,
+    response: Response,
     current_user: CurrentUserDep,
     service: CircleServiceDep,
+    members_limit: int = Query(100, ge=1, le=100, description="Max members included"),
+    members_cursor: str | None = Query(
+        None, description="Cursor from the previous page's X-Next-Cursor"
+    ),
+    members_summary: bool = Query(False, description="Return member counts instead of members"),
 ) -> CircleDetail:
-    """Get detailed circle information including members."""
-    return await service.get_circle_detail(circle_id, current_user.id)
+    """Get detailed circle information including the first page of members.
+
+    The next member page's cursor is returned in the X-Next-Cursor header;
+    further pages can also be read from GET /circles/{circle_id}/members.
+    """
+    circle_detail, next_cursor = await service.get_circle_detail(
+        circle_id,
+        current_user.id,
+        members_limit=members_limit,
+        members_cursor=members_cursor,
+        members_summary=members_summary,
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return circle_detail
 
 
 @router.get(
@@ -158,15 +178,23 @@ async def leave_circle(
 )
 async def get_members(
     circle_id: uuid.UUID,
+    response: Response,
     current_user: CurrentUserDep,
     service: CircleServiceDep,
+    limit: int = Query(100, ge=1, le=100, description="Max results"),
+    cursor: str | None = Query(None, description="Cursor from the previous page's X-Next-Cursor"),
 ) -> list[MemberInfo]:
-    """Get list of circle members.
+    """Get circle members, earliest joined first.
 
-    Returns member information including user details.
+    Returns member information including user details. The next page's
+    cursor is returned in the X-Next-Cursor header.
     """
-    circle_detail = await service.get_circle_detail(circle_id, current_user.id)
-    return circle_detail.members
+    members, next_cursor = await service.get_members(
+        circle_id, current_user.id, limit=limit, cursor=cursor
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return members
 
 
 @router.post(
@@ -216,11 +244,29 @@ async def get_all_circles(
 )
 async def get_circle_admin(
     circle_id: uuid.UUID,
+    response: Response,
     admin_user: AdminUserDep,
     service: CircleServiceDep,
+    # Circles are capped at 100 members, so admins get the full list by default
+    members_limit: int = Query(100, ge=1, le=100, description="Max members included"),
+    members_cursor: str | None = Query(
+        None, description="Cursor from the previous page's X-Next-Cursor"
+    ),
+    members_summary: bool = Query(False, description="Return member counts instead of members"),
 ) -> CircleDetail:
-    """Get detailed circle information including members (Admin only)."""
-    return await service.get_circle_detail_admin(circle_id)
+    """Get detailed circle information including members (Admin only).
+
+    The next member page's cursor is returned in the X-Next-Cursor header.
+    """
+    circle_detail, next_cursor = await service.get_circle_detail_admin(
+        circle_id,
+        members_limit=members_limit,
+        members_cursor=members_cursor,
+        members_summary=members_summary,
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return circle_detail
 
 
 @router.put(
@@ -61,6 +61,13 @@ class MemberInfo(BaseModel):
     profile_emoji: str = "👤"
 
 
+class MembersSummary(BaseModel):
+    """Schema for member counts returned instead of the member list."""
+
+    total: int
+    by_role: dict[MemberRole, int]
+
+
 class CircleDetail(BaseModel):
     """Schema for detailed circle information including members."""
 
@@ -80,8 +87,9 @@ class CircleDetail(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: datetime
-    # Members list
+    # Members list (one page) or, in summary mode, member counts only
     members: list[MemberInfo] = []
+    members_summary: MembersSummary | None = None
 
 
 class JoinByCodeRequest(BaseModel):
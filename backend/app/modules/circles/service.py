@@ -11,6 +11,7 @@ from app.core.exceptions import (
     CircleNotFoundError,
     InvalidInviteCodeError,
 )
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.security import generate_invite_code
 from app.modules.circles.models import Circle
 from app.modules.circles.repository import CircleRepository, MembershipRepository
@@ -19,6 +20,7 @@ from app.modules.circles.schemas import (
     CircleDetail,
     CircleResponse,
     MemberInfo,
+    MembersSummary,
     RegenerateInviteCodeResponse,
     ResolveInviteLinkResponse,
     ValidateInviteCodeResponse,
@@ -30,6 +32,8 @@ class CircleService:
     """Service for circle operations."""
 
     INVITE_CODE_TTL = timedelta(hours=24)
+    # Matches the max_members cap, so clients that ignore X-Next-Cursor get every member
+    MEMBER_PAGE_LIMIT = 100
 
     def __init__(
         self,
@@ -55,13 +59,35 @@ class CircleService:
     ) -> CircleResponse:
         """Convert Circle model to a response with active count and caller role."""
         active_polls_count = await self.poll_repo.count_active_by_circle_id(circle.id)
-        response = CircleResponse.model_validate(circle)
-        response.active_polls_count = active_polls_count
+        my_role = None
         if user_id is not None:
             membership = await self.membership_repo.find_membership(circle.id, user_id)
-            response.my_role = membership.role if membership else None
+            my_role = membership.role if membership else None
+        return self._build_circle_response(circle, active_polls_count, my_role)
+
+    @staticmethod
+    def _build_circle_response(
+        circle: Circle,
+        active_polls_count: int,
+        my_role: MemberRole | None,
+    ) -> CircleResponse:
+        """Build a circle response from already loaded counts and role."""
+        response = CircleResponse.model_validate(circle)
+        response.active_polls_count = active_polls_count
+        response.my_role = my_role
         return response
 
+    async def _to_member_circle_response(
+        self,
+        circle_id: uuid.UUID,
+        user_id: uuid.UUID,
+    ) -> CircleResponse:
+        """Load one of the user's circles as a response in a single query."""
+        summaries = await self.circle_repo.find_summaries_by_user_id(user_id, [circle_id])
+        if not summaries:
+            raise CircleNotFoundError(str(circle_id))
+        return self._build_circle_response(*summaries[0])
+
     async def create_circle(
         self,
         circle_data: CircleCreate,
@@ -79,7 +105,8 @@ class CircleService:
         invite_code = generate_invite_code()
         circle = await self.circle_repo.create(circle_data, owner_id, invite_code)
         await self.membership_repo.create(circle.id, owner_id, MemberRole.OWNER)
-        return await self._to_circle_response(circle, owner_id)
+        # A new circle has no polls yet and its creator is the owner
+        return self._build_circle_response(circle, 0, MemberRole.OWNER)
 
     async def join_by_code(
         self,
@@ -145,11 +172,7 @@ class CircleService:
         # Increment member count
         await self.circle_repo.increment_member_count(circle.id)
 
-        # Refresh circle data
-        updated_circle = await self.circle_repo.find_by_id(circle.id)
-        if updated_circle is None:
-            raise CircleNotFoundError(str(circle.id))
-        return await self._to_circle_response(updated_circle, user_id)
+        return await self._to_member_circle_response(circle.id, user_id)
 
     @staticmethod
     def _is_invite_code_expired(circle: Circle) -> bool:
@@ -168,54 +191,98 @@ class CircleService:
         Returns:
             List of CircleResponse
         """
-        circles = await self.circle_repo.find_by_user_id(user_id)
-        return [await self._to_circle_response(circle, user_id) for circle in circles]
+        summaries = await self.circle_repo.find_summaries_by_user_id(user_id)
+        return [self._build_circle_response(*summary) for summary in summaries]
 
     async def get_circle_detail(
         self,
         circle_id: uuid.UUID,
         user_id: uuid.UUID,
-    ) -> CircleDetail:
-        """Get detailed circle information with members.
+        members_limit: int = MEMBER_PAGE_LIMIT,
+        members_cursor: str | None = None,
+        members_summary: bool = False,
+    ) -> tuple[CircleDetail, str | None]:
+        """Get detailed circle information with a page of members.
 
         Args:
             circle_id: UUID of the circle
             user_id: UUID of the requesting user
+            members_limit: Maximum number of members to include
+            members_cursor: Opaque cursor from the previous member page
+            members_summary: Return member counts instead of the member list
 
         Returns:
-            CircleDetail with members list
+            Tuple of (CircleDetail, cursor of the next member page or None)
 
         Raises:
-            CircleNotFoundError: If circle not found
-            BadRequestException: If user is not a member
+            BadRequestException: If user is not a member or the cursor is malformed
         """
-        # Check if user is a member
-        is_member = await self.membership_repo.exists(circle_id, user_id)
-        if not is_member:
+        summaries = await self.circle_repo.find_summaries_by_user_id(user_id, [circle_id])
+        if not summaries:
             raise BadRequestException("You are not a member of this circle")
 
-        # Get circle with members
-        circle = await self.circle_repo.find_with_members(circle_id)
-        if circle is None:
-            raise CircleNotFoundError(str(circle_id))
+        circle_response = self._build_circle_response(*summaries[0])
+        return await self._to_circle_detail(
+            circle_response, members_limit, members_cursor, members_summary
+        )
 
-        # Build response with member info
-        circle_response = await self._to_circle_response(circle, user_id)
-        circle_dict = circle_response.model_dump()
+    async def get_members(
+        self,
+        circle_id: uuid.UUID,
+        user_id: uuid.UUID,
+        limit: int = MEMBER_PAGE_LIMIT,
+        cursor: str | None = None,
+    ) -> tuple[list[MemberInfo], str | None]:
+        """Get a page of a circle's members, earliest joined first.
 
-        # Add members with user info
-        members_info = []
-        for membership in circle.members:
-            member_info = MemberInfo.model_validate(membership)
-            # Add user info from relationship
-            if membership.user:
-                member_info.username = membership.user.username
-                member_info.display_name = membership.user.display_name
-                member_info.profile_emoji = membership.user.profile_emoji
-            members_info.append(member_info)
+        Args:
+            circle_id: UUID of the circle
+            user_id: UUID of the requesting user
+            limit: Maximum number of members
+            cursor: Opaque cursor from the previous page
 
-        circle_dict["members"] = members_info
-        return CircleDetail(**circle_dict)
+        Returns:
+            Tuple of (MemberInfo list, cursor of the next page or None)
+
+        Raises:
+            BadRequestException: If user is not a member or the cursor is malformed
+        """
+        if not await self.membership_repo.exists(circle_id, user_id):
+            raise BadRequestException("You are not a member of this circle")
+        return await self._get_member_page(circle_id, limit, cursor)
+
+    async def _get_member_page(
+        self,
+        circle_id: uuid.UUID,
+        limit: int,
+        cursor: str | None,
+    ) -> tuple[list[MemberInfo], str | None]:
+        """Load one keyset page of members as MemberInfo."""
+        after = decode_cursor(cursor) if cursor else None
+        rows = await self.membership_repo.find_member_page(circle_id, limit=limit + 1, after=after)
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["joined_at"], rows[-1]["id"])
+        return [MemberInfo(**row) for row in rows], next_cursor
+
+    async def _to_circle_detail(
+        self,
+        circle_response: CircleResponse,
+        members_limit: int,
+        members_cursor: str | None,
+        members_summary: bool,
+    ) -> tuple[CircleDetail, str | None]:
+        """Add a member page, or member counts in summary mode, to a circle."""
+        if members_summary:
+            by_role = await self.membership_repo.count_by_role(circle_response.id)
+            summary = MembersSummary(total=sum(by_role.values()), by_role=by_role)
+            return CircleDetail(**circle_response.model_dump(), members_summary=summary), None
+
+        members, next_cursor = await self._get_member_page(
+            circle_response.id, members_limit, members_cursor
+        )
+        return CircleDetail(**circle_response.model_dump(), members=members), next_cursor
 
     async def leave_circle(
         self,
@@ -396,39 +463,34 @@ class CircleService:
     async def get_circle_detail_admin(
         self,
         circle_id: uuid.UUID,
-    ) -> CircleDetail:
-        """Get detailed circle information with members (Admin only).
+        members_limit: int = MEMBER_PAGE_LIMIT,
+        members_cursor: str | None = None,
+        members_summary: bool = False,
+    ) -> tuple[CircleDetail, str | None]:
+        """Get detailed circle information with a page of members (Admin only).
 
         Args:
             circle_id: UUID of the circle
+            members_limit: Maximum number of members to include
+            members_cursor: Opaque cursor from the previous member page
+            members_summary: Return member counts instead of the member list
 
         Returns:
-            CircleDetail with members list
+            Tuple of (CircleDetail, cursor of the next member page or None)
 
         Raises:
             CircleNotFoundError: If circle not found
+            BadRequestException: If the cursor is malformed
         """
-        # Get circle with members (no membership check for admin)
-        circle = await self.circle_repo.find_with_members(circle_id)
+        # No membership check for admin
+        circle = await self.circle_repo.find_by_id(circle_id)
         if circle is None:
             raise CircleNotFoundError(str(circle_id))
 
-        # Build response with member info
         circle_response = await self._to_circle_response(circle)
-        circle_dict = circle_response.model_dump()
-
-        # Add members with user info
-        members_info = []
-        for membership in circle.members:
-            member_info = MemberInfo.model_validate(membership)
-            if membership.user:
-                member_info.username = membership.user.username
-                member_info.display_name = membership.user.display_name
-                member_info.profile_emoji = membership.user.profile_emoji
-            members_info.append(member_info)
-
-        circle_dict["members"] = members_info
-        return CircleDetail(**circle_dict)
+        return await self._to_circle_detail(
+            circle_response, members_limit, members_cursor, members_summary
+        )
 
     async def update_circle_status(
         self,
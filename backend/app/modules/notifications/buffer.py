@@ -0,0 +1,152 @@
+"""Redis buffer that coalesces vote-received notifications per recipient.
+
+Votes append an event to ``notify:vote_received:{user_id}``. The first event
+in a window also sets a ``...:scheduled`` marker and schedules one delayed
+flush, so a burst of hearts turns into a single notification row and push.
+If the flush cannot be scheduled the marker is cleared again, so the next
+event opens a new window. Events restored by a flush that ran out of
+retries are delivered with the recipient's next window.
+"""
+
+import asyncio
+import json
+import uuid
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from typing import TypedDict
+
+from redis.asyncio import Redis
+
+from app.config import get_settings
+from app.core.redis import create_redis, get_redis
+
+# Keep undelivered events for a day if every flush attempt fails
+EVENTS_TTL_SECONDS = 60 * 60 * 24
+
+
+class VoteReceivedEvent(TypedDict):
+    """A single buffered "someone chose you" event."""
+
+    poll_id: str
+    circle_id: str
+    question_text: str
+
+
+def events_key(user_id: uuid.UUID) -> str:
+    """Return the Redis list holding a recipient's pending events."""
+    return f"notify:vote_received:{user_id}"
+
+
+def scheduled_key(user_id: uuid.UUID) -> str:
+    """Return the Redis key marking that a flush is already scheduled."""
+    return f"notify:vote_received:{user_id}:scheduled"
+
+
+class VoteReceivedBuffer:
+    """Per-recipient buffer of vote-received events."""
+
+    def __init__(
+        self,
+        redis: "Redis[str]",
+        window_seconds: int,
+        schedule_flush: Callable[[uuid.UUID, int], Awaitable[None]],
+    ) -> None:
+        """Initialize buffer.
+
+        Args:
+            redis: Async Redis client
+            window_seconds: How long events are collected before a flush
+            schedule_flush: Schedules a flush for a recipient after a delay
+        """
+        self.redis = redis
+        self.window_seconds = window_seconds
+        self.schedule_flush = schedule_flush
+
+    async def add(self, user_id: uuid.UUID, event: VoteReceivedEvent) -> None:
+        """Buffer an event, scheduling a flush if none is pending.
+
+        Raises:
+            RedisError: If the event could not be buffered
+            Exception: Whatever ``schedule_flush`` raised; the event is then
+                taken back out of the buffer for the caller to deliver
+        """
+        raw_event = json.dumps(event)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(events_key(user_id), raw_event)
+            pipe.expire(events_key(user_id), EVENTS_TTL_SECONDS)
+            # Expires only if a scheduled flush is lost after being enqueued
+            pipe.set(scheduled_key(user_id), "1", nx=True, ex=self.window_seconds * 5)
+            _, _, is_first = await pipe.execute()
+
+        if not is_first:
+            return
+        try:
+            await self.schedule_flush(user_id, self.window_seconds)
+        except Exception:
+            # No flush is coming for this window, so reopen it
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.lrem(events_key(user_id), -1, raw_event)
+                pipe.delete(scheduled_key(user_id))
+                await pipe.execute()
+            raise
+
+    async def drain(self, user_id: uuid.UUID) -> list[VoteReceivedEvent]:
+        """Atomically take all pending events for a recipient.
+
+        Clearing the marker lets the next event open a new window.
+        """
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lrange(events_key(user_id), 0, -1)
+            pipe.delete(events_key(user_id))
+            pipe.delete(scheduled_key(user_id))
+            raw_events, _, _ = await pipe.execute()
+
+        return [json.loads(raw) for raw in raw_events]
+
+    async def restore(self, user_id: uuid.UUID, events: list[VoteReceivedEvent]) -> None:
+        """Put drained events back (oldest first) after a failed delivery."""
+        if not events:
+            return
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.lpush(events_key(user_id), *(json.dumps(event) for event in reversed(events)))
+            pipe.expire(events_key(user_id), EVENTS_TTL_SECONDS)
+            await pipe.execute()
+
+
+async def _schedule_flush_task(user_id: uuid.UUID, countdown: int) -> None:
+    """Schedule the Celery flush task without blocking the event loop."""
+    # Imported lazily: the task module depends on NotificationService
+    from app.tasks.notification_tasks import flush_vote_received_notifications
+
+    await asyncio.to_thread(
+        flush_vote_received_notifications.apply_async,
+        args=[str(user_id)],
+        countdown=countdown,
+    )
+
+
+@lru_cache
+def get_vote_received_buffer() -> VoteReceivedBuffer | None:
+    """Get the API server's buffer, or None when coalescing is disabled."""
+    settings = get_settings()
+    if not settings.vote_notification_coalescing_enabled:
+        return None
+    return VoteReceivedBuffer(
+        get_redis(),
+        settings.vote_notification_window_seconds,
+        _schedule_flush_task,
+    )
+
+
+def create_vote_received_buffer() -> VoteReceivedBuffer:
+    """Create a buffer with its own Redis client (for Celery tasks).
+
+    The caller owns the client and should ``await buffer.redis.aclose()``.
+    """
+    settings = get_settings()
+    return VoteReceivedBuffer(
+        create_redis(),
+        settings.vote_notification_window_seconds,
+        _schedule_flush_task,
+    )
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -131,3 +131,59 @@ class Notification(UUIDMixin, Base):
 
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, type={self.type}, is_read={self.is_read})>"
+
+
+class OutboxMessage(UUIDMixin, Base):
+    """Pending side effect written in the transaction that caused it.
+
+    Rows are drained by the outbox relay (app.tasks.outbox_tasks) after the
+    transaction commits, so pushes and Celery tasks never go out for work
+    that was rolled back, and requests never wait on Expo or the broker.
+
+    Attributes:
+        id: UUID primary key
+        kind: "push" (Expo push to users) or "task" (Celery task)
+        payload: Kind-specific payload, JSON-encoded (only read back whole)
+        attempts: Failed delivery attempts so far
+        available_at: Earliest time the next attempt may run
+        last_error: Error of the last failed attempt
+        created_at: Timestamp when created
+    """
+
+    __tablename__ = "outbox_messages"
+    __table_args__ = (Index("ix_outbox_messages_available_at", "available_at"),)
+
+    KIND_PUSH = "push"
+    KIND_TASK = "task"
+
+    kind: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
+    payload: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    last_error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<OutboxMessage(id={self.id}, kind={self.kind}, attempts={self.attempts})>"
@@ -1,13 +1,15 @@
 """Repository for notifications module."""
 
+import json
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import desc, func, select, update
+from sqlalchemy import delete, desc, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from app.modules.notifications.models import BroadcastLog, Notification
+from app.modules.notifications.models import BroadcastLog, Notification, OutboxMessage
 from app.modules.notifications.schemas import NotificationCreate
 
 
@@ -238,3 +240,93 @@ class NotificationRepository:
         logs = result.scalars().unique().all()
 
         return list(logs), total
+
+
+class OutboxRepository:
+    """Repository for OutboxMessage model."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session."""
+        self.session = session
+
+    def add_push(
+        self,
+        user_ids: list[uuid.UUID],
+        title: str,
+        body: str,
+        data: dict[str, Any],
+    ) -> None:
+        """Queue a push notification to users, committed with the session.
+
+        Args:
+            user_ids: Recipient user UUIDs (tokens are resolved on delivery)
+            title: Notification title
+            body: Notification body
+            data: Custom data payload for deep linking
+        """
+        self.session.add(
+            OutboxMessage(
+                kind=OutboxMessage.KIND_PUSH,
+                payload=json.dumps(
+                    {
+                        "user_ids": [str(user_id) for user_id in user_ids],
+                        "title": title,
+                        "body": body,
+                        "data": data,
+                    },
+                    ensure_ascii=False,
+                ),
+            )
+        )
+
+    def add_task(self, task_name: str, args: list[Any]) -> None:
+        """Queue a Celery task, committed with the session.
+
+        Args:
+            task_name: Registered Celery task name
+            args: JSON-serializable positional task arguments
+        """
+        self.session.add(
+            OutboxMessage(
+                kind=OutboxMessage.KIND_TASK,
+                payload=json.dumps({"task": task_name, "args": args}, ensure_ascii=False),
+            )
+        )
+
+    async def claim_batch(
+        self,
+        now: datetime,
+        limit: int,
+        max_attempts: int,
+    ) -> list[OutboxMessage]:
+        """Lock the oldest deliverable messages, skipping rows other relays hold.
+
+        Args:
+            now: Current time; messages backing off until later are skipped
+            limit: Maximum number of messages
+            max_attempts: Messages that failed this often are left for inspection
+
+        Returns:
+            Locked messages, oldest first
+        """
+        result = await self.session.execute(
+            select(OutboxMessage)
+            .where(
+                OutboxMessage.available_at <= now,
+                OutboxMessage.attempts < max_attempts,
+            )
+            .order_by(OutboxMessage.created_at, OutboxMessage.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result.scalars().all())
+
+    async def delete(self, message_ids: list[uuid.UUID]) -> None:
+        """Delete delivered messages.
+
+        Args:
+            message_ids: OutboxMessage UUIDs
+        """
+        if not message_ids:
+            return
+        await self.session.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(message_ids)))
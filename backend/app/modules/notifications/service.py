@@ -8,7 +8,8 @@ from app.core.enums import NotificationType
 from app.core.exceptions import AuthorizationError, NotFoundException
 from app.modules.auth.repository import UserRepository
 from app.modules.circles.models import Circle
-from app.modules.notifications.repository import NotificationRepository
+from app.modules.notifications.buffer import VoteReceivedBuffer, VoteReceivedEvent
+from app.modules.notifications.repository import NotificationRepository, OutboxRepository
 from app.modules.notifications.schemas import NotificationCreate, NotificationResponse
 from app.modules.polls.models import Poll
 from app.services.expo_push import ExpoPushClient, ExpoPushError, get_expo_push_client
@@ -31,11 +32,15 @@ class NotificationService:
         notification_repo: NotificationRepository,
         user_repo: UserRepository,
         expo_push_client: ExpoPushClient | None = None,
+        vote_received_buffer: VoteReceivedBuffer | None = None,
+        outbox_repo: OutboxRepository | None = None,
     ) -> None:
         """Initialize service with repositories."""
         self.notification_repo = notification_repo
         self.user_repo = user_repo
+        self.outbox_repo = outbox_repo or OutboxRepository(notification_repo.session)
         self.expo_push_client = expo_push_client or get_expo_push_client()
+        self.vote_received_buffer = vote_received_buffer
 
     async def _send_push_to_users(
         self,
@@ -44,7 +49,10 @@ class NotificationService:
         body: str,
         data: dict[str, Any],
     ) -> None:
-        """Send push notifications to users who have registered tokens.
+        """Queue push notifications to users in the caller's transaction.
+
+        The outbox relay (app.tasks.outbox_tasks) sends them to users with
+        registered tokens once the transaction commits.
 
         Args:
             user_ids: List of user UUIDs to notify
@@ -55,37 +63,7 @@ class NotificationService:
         if not user_ids:
             return
 
-        # Get users with push tokens
-        users = await self.user_repo.find_by_ids(user_ids)
-        messages = []
-
-        for user in users:
-            if user.push_token and user.push_token.strip():
-                messages.append(
-                    {
-                        "token": user.push_token,
-                        "title": title,
-                        "body": body,
-                        "data": data,
-                    }
-                )
-
-        if not messages:
-            logger.debug("No users with push tokens to notify")
-            return
-
-        try:
-            results = await self.expo_push_client.send_batch_push_notifications(
-                messages
-            )
-            success_count = sum(1 for r in results if r.get("status") == "ok")
-            logger.info(
-                "Push notifications sent: %d/%d succeeded",
-                success_count,
-                len(messages),
-            )
-        except ExpoPushError as e:
-            logger.error("Failed to send push notifications: %s", e)
+        self.outbox_repo.add_push(user_ids, title, body, data)
 
     async def get_notifications(
         self,
@@ -193,21 +171,102 @@ class NotificationService:
         # Send push notifications
         await self._send_push_to_users(recipient_ids, title, body, data)
 
-    async def send_vote_received(self, voted_for_id: uuid.UUID, poll: Poll) -> None:
+    async def send_vote_received(
+        self,
+        voted_for_id: uuid.UUID,
+        poll_id: uuid.UUID,
+        circle_id: uuid.UUID,
+        question_text: str,
+    ) -> None:
         """Send vote received notification (anonymous).
 
+        When a vote-received buffer is configured the event is queued in the
+        outbox, and the relay hands it to :meth:`buffer_vote_received` once
+        the vote commits. Otherwise the notification is written in the
+        caller's transaction.
+
         Args:
             voted_for_id: UUID of user who received the vote
-            poll: Poll instance
+            poll_id: UUID of the poll voted in
+            circle_id: UUID of the poll's Circle
+            question_text: Poll question, previewed in the notification
         """
-        question_preview = _truncate_text(poll.question_text, 30)
-        title = "🎊 누군가 당신을 선택했어요!"
-        body = f'"{question_preview}" 투표에서 선택받았어요'
+        event: VoteReceivedEvent = {
+            "poll_id": str(poll_id),
+            "circle_id": str(circle_id),
+            "question_text": question_text,
+        }
+
+        if self.vote_received_buffer is not None:
+            # Imported lazily: the task module depends on NotificationService
+            from app.tasks.notification_tasks import buffer_vote_received_notification
+
+            self.outbox_repo.add_task(
+                buffer_vote_received_notification.name, [str(voted_for_id), event]
+            )
+            return
+
+        await self.send_vote_received_batch(voted_for_id, [event])
+
+    async def buffer_vote_received(
+        self,
+        voted_for_id: uuid.UUID,
+        event: VoteReceivedEvent,
+    ) -> None:
+        """Buffer a committed vote's event for the recipient's next flush.
+
+        A delayed flush delivers every event in the window as one
+        notification. If buffering fails the notification is sent inline.
+
+        Args:
+            voted_for_id: UUID of user who received the vote
+            event: Event queued by :meth:`send_vote_received`
+        """
+        if self.vote_received_buffer is not None:
+            try:
+                await self.vote_received_buffer.add(voted_for_id, event)
+                return
+            except Exception as e:
+                # Redis is down or the flush could not be scheduled
+                logger.warning("Failed to buffer vote received event, sending inline: %s", e)
+
+        await self.send_vote_received_batch(voted_for_id, [event])
+
+    async def send_vote_received_batch(
+        self,
+        voted_for_id: uuid.UUID,
+        events: list[VoteReceivedEvent],
+    ) -> None:
+        """Send one notification covering one or more received votes.
+
+        Args:
+            voted_for_id: UUID of user who received the votes
+            events: Buffered vote-received events, oldest first
+        """
+        if not events:
+            return
+
+        latest = events[-1]
+        question_preview = _truncate_text(latest["question_text"], 30)
+        heart_count = len(events)
+        poll_count = len({event["poll_id"] for event in events})
+
+        if heart_count == 1:
+            title = "🎊 누군가 당신을 선택했어요!"
+            body = f'"{question_preview}" 투표에서 선택받았어요'
+        elif poll_count == 1:
+            title = f"🎊 하트를 {heart_count}개 받았어요!"
+            body = f'"{question_preview}" 투표에서 {heart_count}번 선택받았어요'
+        else:
+            title = f"🎊 하트를 {heart_count}개 받았어요!"
+            body = f'"{question_preview}" 외 {poll_count - 1}개 투표에서 선택받았어요'
+
         data = {
             "type": "vote_received",
-            "poll_id": str(poll.id),
-            "circle_id": str(poll.circle_id),
-            "action_url": f"circly://results/{poll.id}",
+            "poll_id": latest["poll_id"],
+            "circle_id": latest["circle_id"],
+            "action_url": f"circly://results/{latest['poll_id']}",
+            "count": heart_count,
         }
 
         notification = NotificationCreate(
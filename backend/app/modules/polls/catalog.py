@@ -0,0 +1,167 @@
+"""Process-local cache of the active poll template catalog.
+
+The catalog (active templates, per-category counts and pre-serialized
+template list payloads) changes only through the admin template endpoints.
+Each worker keeps a snapshot and, at most every ``version_check_seconds``,
+compares the version it was loaded at with the shared Redis counter
+``poll_templates:version``, which admin writes bump after committing. A
+snapshot is also reloaded after ``ttl_seconds`` regardless, so usage-count
+ordering stays fresh and a lost version bump cannot pin stale data.
+
+Redis failures are logged and treated as "unchanged"; the TTL still applies.
+"""
+
+import logging
+import time
+from collections import Counter
+from functools import lru_cache
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+from app.core.enums import TemplateCategory
+from app.core.redis import get_redis
+from app.modules.polls.repository import TemplateRepository
+from app.modules.polls.schemas import PollTemplateResponse
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "poll_templates:version"
+
+_template_list_adapter = TypeAdapter(list[PollTemplateResponse])
+
+
+class TemplateCatalogSnapshot:
+    """Immutable view of the active templates at one catalog version."""
+
+    def __init__(self, templates: list[PollTemplateResponse], round_order: list[int]) -> None:
+        """Build derived views.
+
+        Args:
+            templates: Active templates, most used first (TemplateRepository.find_all order)
+            round_order: Indexes into templates, least used (then oldest) first
+        """
+        self.templates = templates
+        self.round_candidates = [templates[index] for index in round_order]
+        self.category_counts: dict[TemplateCategory, int] = dict(
+            Counter(template.category for template in templates)
+        )
+        self._by_category: dict[TemplateCategory | None, list[PollTemplateResponse]] = {
+            None: templates
+        }
+        for category in TemplateCategory:
+            self._by_category[category] = [
+                template for template in templates if template.category == category
+            ]
+        self._payloads: dict[TemplateCategory | None, bytes] = {}
+
+    def get_templates(self, category: TemplateCategory | None = None) -> list[PollTemplateResponse]:
+        """Return active templates, optionally filtered by category."""
+        return self._by_category[category]
+
+    def get_templates_json(self, category: TemplateCategory | None = None) -> bytes:
+        """Return the JSON body of GET /polls/templates, serialized once per snapshot."""
+        payload = self._payloads.get(category)
+        if payload is None:
+            payload = _template_list_adapter.dump_json(self._by_category[category])
+            self._payloads[category] = payload
+        return payload
+
+
+class TemplateCatalog:
+    """Versioned, per-process cache of the active template catalog."""
+
+    def __init__(
+        self,
+        redis: "Redis[str] | None",
+        ttl_seconds: float,
+        version_check_seconds: float,
+    ) -> None:
+        """Initialize catalog.
+
+        Args:
+            redis: Async Redis client holding the shared version, or None for TTL only
+            ttl_seconds: Maximum age of a snapshot
+            version_check_seconds: Minimum interval between version reads
+        """
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self._snapshot: TemplateCatalogSnapshot | None = None
+        self._version: str | None = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+
+    async def get(self, template_repo: TemplateRepository) -> TemplateCatalogSnapshot:
+        """Return the current snapshot, reloading it from Postgres if stale."""
+        now = time.monotonic()
+        if self._snapshot is not None and now - self._loaded_at < self.ttl_seconds:
+            if now - self._checked_at < self.version_check_seconds:
+                return self._snapshot
+            version = await self._read_version()
+            self._checked_at = now
+            if version is None or version == self._version:
+                return self._snapshot
+        else:
+            version = await self._read_version()
+
+        # The version is read before loading, so a bump racing the load
+        # triggers another reload at the next check
+        templates = await template_repo.find_all()
+        round_order = sorted(
+            range(len(templates)),
+            key=lambda index: (templates[index].total_usage_count, templates[index].created_at),
+        )
+        snapshot = TemplateCatalogSnapshot(
+            [PollTemplateResponse.model_validate(template) for template in templates],
+            round_order,
+        )
+
+        self._snapshot = snapshot
+        self._version = version
+        self._loaded_at = self._checked_at = time.monotonic()
+        return snapshot
+
+    async def invalidate(self) -> None:
+        """Drop the local snapshot and bump the shared version for other workers.
+
+        Call after the template write has been committed.
+        """
+        self.clear()
+        if self.redis is None:
+            return
+        try:
+            await self.redis.incr(VERSION_KEY)
+        except (RedisError, OSError) as e:
+            logger.warning("Template catalog version bump failed: %s", e)
+
+    def clear(self) -> None:
+        """Drop the local snapshot."""
+        self._snapshot = None
+        self._version = None
+
+    async def _read_version(self) -> str | None:
+        if self.redis is None:
+            return None
+        try:
+            version = await self.redis.get(VERSION_KEY)
+        except (RedisError, OSError) as e:
+            logger.warning("Template catalog version read failed: %s", e)
+            return None
+        # A missing key is a valid version (nothing bumped yet)
+        return version or "0"
+
+
+@lru_cache
+def get_template_catalog() -> TemplateCatalog | None:
+    """Get the API server's template catalog, or None when caching is disabled."""
+    settings = get_settings()
+    if not settings.template_catalog_cache_enabled:
+        return None
+    return TemplateCatalog(
+        get_redis(),
+        settings.template_catalog_ttl_seconds,
+        settings.template_catalog_version_check_seconds,
+    )
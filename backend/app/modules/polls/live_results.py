@@ -0,0 +1,283 @@
+"""Live poll results streamed over server-sent events, fed by Redis pub/sub.
+
+After a transaction that cast votes commits, one message per circle is
+published on ``circle:{circle_id}:live`` listing the (poll_id, voted_for_id)
+of every vote. Each worker holds a single pub/sub connection and subscribes
+to a circle's channel while at least one stream is open for it, so one
+message fans out to every stream on the worker in memory.
+
+A stream never buffers messages: deltas are coalesced per (poll, user) into
+a dict bounded by ``max_pending`` keys, so a slow client gets fewer, larger
+batches instead of growing memory. When the bound is hit, or Redis drops the
+subscription, pending deltas are discarded and the client is told to
+``resync`` (refetch the poll, which is cheap with its ETag).
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+
+from app.config import get_settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding the votes to publish once the session commits
+PENDING_VOTES_KEY = "live_results_pending_votes"
+
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+def live_channel(circle_id: uuid.UUID | str) -> str:
+    """Return the Redis pub/sub channel carrying a circle's committed votes."""
+    return f"circle:{circle_id}:live"
+
+
+def format_event(event_name: str, data: Any) -> str:
+    """Format one server-sent event."""
+    return f"event: {event_name}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+class LiveResultsSubscriber:
+    """One stream's view of a circle channel, with coalesced pending deltas."""
+
+    def __init__(
+        self,
+        poll_ids: set[str] | None,
+        visible_poll_ids: set[str],
+        max_pending: int,
+    ) -> None:
+        """Initialize a subscriber.
+
+        Args:
+            poll_ids: Polls to stream (None for every poll of the circle)
+            visible_poll_ids: Polls whose recipients the user may see; other
+                polls only stream their vote count
+            max_pending: Coalesced deltas kept before asking for a resync
+        """
+        self.poll_ids = poll_ids
+        self.visible_poll_ids = visible_poll_ids
+        self.max_pending = max_pending
+        self.pending: dict[tuple[str, str | None], int] = {}
+        self.needs_resync = False
+        self.ready = asyncio.Event()
+
+    def push(self, votes: Iterable[tuple[str, str]]) -> None:
+        """Coalesce published votes into the pending deltas."""
+        for poll_id, user_id in votes:
+            if self.poll_ids is not None and poll_id not in self.poll_ids:
+                continue
+            key = (poll_id, user_id if poll_id in self.visible_poll_ids else None)
+            if key not in self.pending and len(self.pending) >= self.max_pending:
+                self.request_resync()
+                return
+            self.pending[key] = self.pending.get(key, 0) + 1
+            self.ready.set()
+
+    def request_resync(self) -> None:
+        """Drop pending deltas; the client must refetch before applying more."""
+        self.pending.clear()
+        self.needs_resync = True
+        self.ready.set()
+
+    def drain(self) -> str | None:
+        """Return the next event to send (None if nothing is pending)."""
+        self.ready.clear()
+        if self.needs_resync:
+            self.needs_resync = False
+            return format_event("resync", {})
+        if not self.pending:
+            return None
+
+        deltas = [
+            {"poll_id": poll_id, "user_id": user_id, "count": count}
+            for (poll_id, user_id), count in self.pending.items()
+        ]
+        self.pending = {}
+        return format_event("tally", {"deltas": deltas})
+
+
+class LiveResultsHub:
+    """Per-worker publisher and fan-out point for live results."""
+
+    def __init__(self, redis: "Redis[str]", max_pending: int, heartbeat_seconds: float) -> None:
+        """Initialize hub with Redis client and per-stream limits."""
+        self.redis = redis
+        self.max_pending = max_pending
+        self.heartbeat_seconds = heartbeat_seconds
+        self._subscribers: dict[str, set[LiveResultsSubscriber]] = {}
+        self._pubsub: Any = None
+        self._reader: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+
+    # ==================== Publishing ====================
+
+    def publish_after_commit(
+        self,
+        session: AsyncSession,
+        circle_id: uuid.UUID,
+        poll_id: uuid.UUID,
+        voted_for_id: uuid.UUID,
+    ) -> None:
+        """Queue a vote to be published once the session's transaction commits.
+
+        Nothing is published for a transaction that rolls back. The publish
+        runs inside ``commit()``, so the caller's commit (for requests, the
+        one in ``get_db``) returns only after it: one pipelined round trip
+        for every vote in the transaction, bounded by the Redis socket
+        timeout and logged rather than raised if it fails.
+        """
+        sync_session = session.sync_session
+        pending = sync_session.info.get(PENDING_VOTES_KEY)
+        if pending is None:
+            pending = sync_session.info[PENDING_VOTES_KEY] = {}
+            if not event.contains(sync_session, "after_commit", self._after_commit):
+                event.listen(sync_session, "after_commit", self._after_commit)
+                event.listen(sync_session, "after_soft_rollback", self._after_rollback)
+        pending.setdefault(str(circle_id), []).append((str(poll_id), str(voted_for_id)))
+
+    def _after_commit(self, sync_session: Session) -> None:
+        pending = sync_session.info.pop(PENDING_VOTES_KEY, None)
+        if pending:
+            # Runs inside the AsyncSession's greenlet, so the publish is awaited
+            # before commit() returns to the caller
+            await_only(self.publish(pending))
+
+    @staticmethod
+    def _after_rollback(sync_session: Session, previous_transaction: object) -> None:
+        sync_session.info.pop(PENDING_VOTES_KEY, None)
+
+    async def publish(self, votes_by_circle: dict[str, list[tuple[str, str]]]) -> None:
+        """Publish committed votes, one message per circle."""
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for circle_id, votes in votes_by_circle.items():
+                    pipe.publish(live_channel(circle_id), json.dumps(votes))
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning("Live results publish failed: %s", e)
+
+    # ==================== Subscribing ====================
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        circle_id: uuid.UUID,
+        poll_ids: set[str] | None,
+        visible_poll_ids: set[str],
+    ) -> AsyncIterator[LiveResultsSubscriber]:
+        """Receive a circle's committed votes for the duration of the block."""
+        channel = live_channel(circle_id)
+        subscriber = LiveResultsSubscriber(poll_ids, visible_poll_ids, self.max_pending)
+        async with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                if self._pubsub is None:
+                    self._pubsub = self.redis.pubsub()
+                await self._pubsub.subscribe(channel)
+                subscribers = self._subscribers[channel] = set()
+            subscribers.add(subscriber)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read())
+
+        try:
+            yield subscriber
+        finally:
+            async with self._lock:
+                subscribers.discard(subscriber)
+                if not subscribers and self._subscribers.get(channel) is subscribers:
+                    del self._subscribers[channel]
+                    try:
+                        await self._pubsub.unsubscribe(channel)
+                    except (RedisError, OSError) as e:
+                        logger.warning("Live results unsubscribe failed: %s", e)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of open streams on this worker."""
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    async def _read(self) -> None:
+        """Dispatch messages from the shared pub/sub connection until idle."""
+        while self._subscribers:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except (RedisError, OSError) as e:
+                # Messages may have been missed; every stream must resync
+                logger.warning("Live results subscription failed: %s", e)
+                for subscribers in self._subscribers.values():
+                    for subscriber in subscribers:
+                        subscriber.request_resync()
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                continue
+
+            if message is None or message.get("type") != "message":
+                continue
+            channel_subscribers = self._subscribers.get(message["channel"])
+            if not channel_subscribers:
+                continue
+            try:
+                votes = [(poll_id, user_id) for poll_id, user_id in json.loads(message["data"])]
+            except (TypeError, ValueError):
+                logger.warning("Ignoring malformed live results message")
+                continue
+            for subscriber in channel_subscribers:
+                subscriber.push(votes)
+
+    async def stream(
+        self,
+        subscriber: LiveResultsSubscriber,
+        deadline: float,
+    ) -> AsyncIterator[str]:
+        """Yield a subscriber's events, with heartbeats, until the deadline.
+
+        Args:
+            subscriber: Subscription opened with :meth:`subscribe`
+            deadline: ``time.monotonic()`` value at which the stream ends
+        """
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                yield format_event("end", {})
+                return
+            try:
+                await asyncio.wait_for(
+                    subscriber.ready.wait(), timeout=min(self.heartbeat_seconds, remaining)
+                )
+            except TimeoutError:
+                if deadline - time.monotonic() > 0:
+                    yield ": heartbeat\n\n"
+                continue
+
+            # While this yield waits on a slow client, new votes keep coalescing
+            chunk = subscriber.drain()
+            if chunk is not None:
+                yield chunk
+
+
+@lru_cache
+def get_live_results_hub() -> LiveResultsHub | None:
+    """Get the API server's live results hub, or None when disabled."""
+    settings = get_settings()
+    if not settings.live_results_enabled:
+        return None
+    return LiveResultsHub(
+        get_redis(),
+        max_pending=settings.live_results_max_pending,
+        heartbeat_seconds=settings.live_results_heartbeat_seconds,
+    )
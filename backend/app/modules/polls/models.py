@@ -10,15 +10,18 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     UniqueConstraint,
     func,
+    select,
+    text,
 )
 from sqlalchemy.dialects.postgresql import ENUM, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, column_property, mapped_column, relationship
 
 from app.core.enums import PollStatus, TemplateCategory
 from app.core.models import Base, BaseModel, UUIDMixin
@@ -37,7 +40,8 @@ class PollTemplate(UUIDMixin, Base):
         question_text: Template question text
         emoji: Emoji for the template
         is_active: Whether the template is active
-        usage_count: Number of times this template has been used
+        usage_count: Uses folded from TemplateUsageDelta
+        pending_usage_count: Uses not folded yet (deferred; undefer to render totals)
         created_at: Timestamp when created
     """
 
@@ -79,6 +83,15 @@ class PollTemplate(UUIDMixin, Base):
         back_populates="template",
     )
 
+    if TYPE_CHECKING:
+        # Mapped below TemplateUsageDelta
+        pending_usage_count: Mapped[int]
+
+    @property
+    def total_usage_count(self) -> int:
+        """Usage count including increments not folded yet."""
+        return self.usage_count + self.pending_usage_count
+
     def __repr__(self) -> str:
         return f"<PollTemplate(id={self.id}, category={self.category})>"
 
@@ -94,12 +107,25 @@ class Poll(BaseModel):
         question_text: Poll question text
         status: Poll status (ACTIVE, COMPLETED, CANCELLED)
         ends_at: Timestamp when poll ends
-        vote_count: Number of votes
+        vote_count: Votes folded from PollVoteDelta
+        pending_vote_count: Votes not folded yet (deferred; undefer to render totals)
+        last_reminder_minutes: Minutes-left of the latest deadline reminder sent
         created_at: Timestamp when created
         updated_at: Timestamp when last updated
     """
 
     __tablename__ = "polls"
+    __table_args__ = (
+        # Serves the keyset-paginated home feed (GET /polls/me)
+        Index(
+            "ix_polls_circle_status_created_at",
+            "circle_id",
+            "status",
+            text("created_at DESC"),
+        ),
+        # Serves the deadline sweeper (app.tasks.deadline_tasks)
+        Index("ix_polls_status_ends_at", "status", "ends_at"),
+    )
 
     circle_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -139,6 +165,10 @@ class Poll(BaseModel):
         default=0,
         server_default="0",
     )
+    last_reminder_minutes: Mapped[int | None] = mapped_column(
+        Integer,
+        nullable=True,
+    )
 
     # Relationships
     circle: Mapped["Circle"] = relationship(  # noqa: F821
@@ -164,6 +194,15 @@ class Poll(BaseModel):
         cascade="all, delete-orphan",
     )
 
+    if TYPE_CHECKING:
+        # Mapped below PollVoteDelta
+        pending_vote_count: Mapped[int]
+
+    @property
+    def total_vote_count(self) -> int:
+        """Vote count including votes not folded yet."""
+        return self.vote_count + self.pending_vote_count
+
     def __repr__(self) -> str:
         return f"<Poll(id={self.id}, status={self.status})>"
 
@@ -369,19 +408,39 @@ class VoteSession(BaseModel):
         return f"<VoteSession(id={self.id}, user_id={self.user_id}, status={self.status})>"
 
 
-class ReceivedHeartRead(UUIDMixin, Base):
-    """Read marker for a received heart inbox row."""
+class ReceivedHeart(UUIDMixin, Base):
+    """Received heart inbox row: votes a user received in one poll.
+
+    Maintained by the vote statement and by mark-as-read, so the inbox is a
+    keyset scan of one user's rows instead of an aggregate over votes.
+
+    Attributes:
+        id: UUID primary key
+        user_id: User who received the votes
+        poll_id: Poll the votes were cast in
+        circle_id: Circle of the poll
+        question_text: Poll question (copied for display)
+        emoji: Template emoji (copied for display)
+        received_count: Votes received in the poll
+        unread_count: Votes received since the row was last read
+        latest_received_at: When the latest vote was received
+    """
 
-    __tablename__ = "received_heart_reads"
+    __tablename__ = "received_hearts"
     __table_args__ = (
-        UniqueConstraint("user_id", "poll_id", name="uq_received_heart_read"),
+        UniqueConstraint("user_id", "poll_id", name="uq_received_heart"),
+        Index(
+            "ix_received_hearts_user_latest",
+            "user_id",
+            text("latest_received_at DESC"),
+            text("poll_id DESC"),
+        ),
     )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     poll_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -389,11 +448,300 @@ class ReceivedHeartRead(UUIDMixin, Base):
         nullable=False,
         index=True,
     )
-    read_at: Mapped[datetime] = mapped_column(
+    circle_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("circles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    question_text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+    emoji: Mapped[str | None] = mapped_column(
+        String(10),
+        nullable=True,
+    )
+    received_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    unread_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    latest_received_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         nullable=False,
     )
 
+    @property
+    def is_read(self) -> bool:
+        """Whether every received vote has been seen."""
+        return self.unread_count == 0
+
     def __repr__(self) -> str:
-        return f"<ReceivedHeartRead(user_id={self.user_id}, poll_id={self.poll_id})>"
+        return (
+            f"<ReceivedHeart(user_id={self.user_id}, poll_id={self.poll_id}, "
+            f"received_count={self.received_count}, unread_count={self.unread_count})>"
+        )
+
+
+class ReceivedHeartCounter(UUIDMixin, Base):
+    """Unread received hearts per user (sum of the user's inbox unread counts).
+
+    Attributes:
+        id: UUID primary key
+        user_id: Foreign key to users table
+        unread_count: Votes received and not yet read
+        updated_at: Timestamp when last updated
+    """
+
+    __tablename__ = "received_heart_counters"
+    __table_args__ = (
+        UniqueConstraint("user_id", name="uq_received_heart_counter"),
+    )
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    unread_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReceivedHeartCounter(user_id={self.user_id}, unread_count={self.unread_count})>"
+        )
+
+
+class CircleReceivedCount(UUIDMixin, Base):
+    """Votes a member has received in a circle since joining it.
+
+    Maintained by the vote statement and dropped when the member leaves, so
+    candidate selection reads one row per member instead of aggregating the
+    circle's vote history. A missing row means zero.
+
+    Attributes:
+        id: UUID primary key
+        circle_id: Foreign key to circles table
+        user_id: Foreign key to users table
+        received_count: Votes received in the circle's polls
+        updated_at: Timestamp when last updated
+    """
+
+    __tablename__ = "circle_received_counts"
+    __table_args__ = (
+        UniqueConstraint("circle_id", "user_id", name="uq_circle_received_count"),
+    )
+
+    circle_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("circles.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    received_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<CircleReceivedCount(circle_id={self.circle_id}, user_id={self.user_id}, "
+            f"received_count={self.received_count})>"
+        )
+
+
+class PollBroadcastJob(BaseModel):
+    """Admin poll broadcast, created in chunks by a background job.
+
+    Attributes:
+        admin_id: Admin who started the broadcast
+        template_id: Template used for the question, if any
+        question_text: Question of every created poll
+        ends_at: Shared end time of every created poll
+        circle_ids: Selected target circles, or None for all active circles
+        status: PENDING, RUNNING, COMPLETED or FAILED
+        last_circle_id: Last processed circle (targets are handled in ID order)
+        created_count: Polls created so far
+        failed_count: Target circles that did not get a poll
+        failures: Failed chunks with their error (most recent last, capped)
+        finished_at: When the job completed or failed
+    """
+
+    __tablename__ = "poll_broadcast_jobs"
+
+    admin_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    template_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("poll_templates.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    question_text: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+    )
+    ends_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    circle_ids: Mapped[list[str] | None] = mapped_column(
+        JSON,
+        nullable=True,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        default="PENDING",
+        server_default="PENDING",
+    )
+    last_circle_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+    )
+    created_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    failed_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    failures: Mapped[list[dict[str, str]]] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    @property
+    def apply_to_all(self) -> bool:
+        """Whether the job targets every active circle."""
+        return self.circle_ids is None
+
+    def __repr__(self) -> str:
+        return f"<PollBroadcastJob(id={self.id}, status={self.status})>"
+
+
+class PollVoteDelta(UUIDMixin, Base):
+    """Pending increment of a poll's vote_count.
+
+    Votes append a row here instead of updating the poll row, so concurrent
+    voters on one poll never wait on each other's row lock. The counter task
+    (app.tasks.counter_tasks) folds deltas into polls.vote_count; reads add
+    the deltas not folded yet.
+
+    Attributes:
+        id: UUID primary key
+        poll_id: Foreign key to polls table
+        delta: Votes to add
+        created_at: Timestamp when created
+    """
+
+    __tablename__ = "poll_vote_deltas"
+
+    poll_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("polls.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    delta: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+class TemplateUsageDelta(UUIDMixin, Base):
+    """Pending increment of a template's usage_count.
+
+    The template counterpart of PollVoteDelta, so polls created from one
+    template (e.g. by a broadcast) do not serialize on the template row.
+
+    Attributes:
+        id: UUID primary key
+        template_id: Foreign key to poll_templates table
+        delta: Uses to add
+        created_at: Timestamp when created
+    """
+
+    __tablename__ = "template_usage_deltas"
+
+    template_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("poll_templates.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    delta: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+# Deferred: only queries that render totals pay for the correlated SUM
+Poll.pending_vote_count = column_property(
+    select(func.coalesce(func.sum(PollVoteDelta.delta), 0))
+    .where(PollVoteDelta.poll_id == Poll.id)
+    .correlate_except(PollVoteDelta)
+    .scalar_subquery(),
+    deferred=True,
+)
+PollTemplate.pending_usage_count = column_property(
+    select(func.coalesce(func.sum(TemplateUsageDelta.delta), 0))
+    .where(TemplateUsageDelta.template_id == PollTemplate.id)
+    .correlate_except(TemplateUsageDelta)
+    .scalar_subquery(),
+    deferred=True,
+)
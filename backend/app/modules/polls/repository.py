@@ -2,24 +2,56 @@
 
 import uuid
 from datetime import UTC, datetime, timedelta
-from typing import TypedDict
-
-from sqlalchemy import and_, func, select, update
+from typing import TypedDict, TypeVarTuple
+
+from sqlalchemy import (
+    CTE,
+    Date,
+    DateTime,
+    FromClause,
+    Numeric,
+    Select,
+    String,
+    and_,
+    cast,
+    column,
+    delete,
+    exists,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, undefer
 
 from app.core.enums import PollStatus, TemplateCategory
-from app.modules.auth.models import User
+from app.modules.auth.cache import invalidate_cached_user
+from app.modules.auth.models import CoinLedgerEntry, User, reward_date
 from app.modules.circles.models import Circle, CircleMember
 from app.modules.polls.models import (
+    CircleReceivedCount,
     Poll,
+    PollBroadcastJob,
+    PollResult,
     PollTemplate,
-    ReceivedHeartRead,
+    PollVoteDelta,
+    ReceivedHeart,
+    ReceivedHeartCounter,
+    TemplateUsageDelta,
     Vote,
     VoteHint,
     VoteSession,
 )
 
+# Column types of a select() that a shared query helper passes through
+_Row = TypeVarTuple("_Row")
+
 
 class VoteResultDict(TypedDict):
     """Type for vote result dictionary."""
@@ -28,6 +60,37 @@ class VoteResultDict(TypedDict):
     vote_count: int
 
 
+class MaterializedResultDict(TypedDict):
+    """Type for a persisted final result row."""
+
+    user_id: uuid.UUID
+    vote_count: int
+    vote_percentage: float
+    rank: int
+
+
+class ReceivedCountDriftDict(TypedDict):
+    """Stored vs. recomputed received count for one circle member."""
+
+    circle_id: uuid.UUID
+    user_id: uuid.UUID
+    stored_count: int
+    actual_count: int
+
+
+class VoteCastDict(TypedDict):
+    """Type for the outcome of a single-statement vote commit."""
+
+    poll_id: uuid.UUID
+    circle_id: uuid.UUID
+    question_text: str
+    status: PollStatus
+    voter_is_member: bool
+    target_is_member: bool
+    vote_id: uuid.UUID | None
+    rewarded: bool
+
+
 class ReceivedHeartDict(TypedDict):
     """Type for received heart inbox row."""
 
@@ -37,8 +100,8 @@ class ReceivedHeartDict(TypedDict):
     question_text: str
     emoji: str | None
     received_count: int
+    unread_count: int
     latest_received_at: datetime
-    is_read: bool
 
 
 class CandidateOptionDict(TypedDict):
@@ -50,6 +113,49 @@ class CandidateOptionDict(TypedDict):
     received_count: int
 
 
+def _fold_deltas_statement(
+    delta_model: type[PollVoteDelta] | type[TemplateUsageDelta],
+    key: str,
+    target_model: type[Poll] | type[PollTemplate],
+    counter: str,
+    limit: int,
+    keys: list[uuid.UUID] | None,
+) -> Select[int]:
+    """Build a statement that folds up to ``limit`` delta rows into a counter.
+
+    The deltas are deleted and their per-row sums added to the counter
+    column in one statement, returning the number of folded deltas. Delta
+    rows locked by a concurrent fold are skipped, unless ``keys`` is given:
+    a fold for specific keys waits for them so none are left behind.
+    """
+    key_column = getattr(delta_model, key)
+    batch = select(delta_model.id).limit(limit)
+    if keys is not None:
+        batch = batch.where(key_column.in_(keys)).with_for_update()
+    else:
+        batch = batch.with_for_update(skip_locked=True)
+
+    folded = (
+        delete(delta_model)
+        .where(delta_model.id.in_(batch.scalar_subquery()))
+        .returning(key_column.label("key"), delta_model.delta)
+        .cte("folded_deltas")
+    )
+    totals = (
+        select(folded.c.key, func.sum(folded.c.delta).label("delta"))
+        .group_by(folded.c.key)
+        .cte("folded_totals")
+    )
+    applied = (
+        update(target_model)
+        .where(target_model.id == totals.c.key)
+        .values({counter: getattr(target_model, counter) + totals.c.delta})
+        .returning(target_model.id)
+        .cte("applied_counters")
+    )
+    return select(func.count()).select_from(folded).add_cte(applied)
+
+
 class TemplateRepository:
     """Repository for PollTemplate model."""
 
@@ -68,12 +174,19 @@ class TemplateRepository:
         Returns:
             List of active poll templates
         """
-        query = select(PollTemplate).where(PollTemplate.is_active == True)  # noqa: E712
+        query = (
+            select(PollTemplate)
+            .options(undefer(PollTemplate.pending_usage_count))
+            .where(PollTemplate.is_active == True)  # noqa: E712
+        )
 
         if category:
             query = query.where(PollTemplate.category == category)
 
-        query = query.order_by(PollTemplate.usage_count.desc(), PollTemplate.created_at)
+        query = query.order_by(
+            (PollTemplate.usage_count + PollTemplate.pending_usage_count).desc(),
+            PollTemplate.created_at,
+        )
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -92,24 +205,35 @@ class TemplateRepository:
         )
         return result.scalar_one_or_none()
 
-    async def find_round_candidates(
+    async def find_recent_template_ids(
         self,
         circle_id: uuid.UUID,
-        recent_limit: int = 10,
-    ) -> list[PollTemplate]:
-        """Return active templates, prioritizing questions not recently used here."""
-        recent_result = await self.session.execute(
+        limit: int = 10,
+    ) -> set[uuid.UUID]:
+        """Return IDs of the templates behind a circle's most recent polls."""
+        result = await self.session.execute(
             select(Poll.template_id)
             .where(Poll.circle_id == circle_id, Poll.template_id.is_not(None))
             .order_by(Poll.created_at.desc())
-            .limit(recent_limit)
+            .limit(limit)
         )
-        recent_template_ids = set(recent_result.scalars().all())
+        return set(result.scalars().all())
+
+    async def find_round_candidates(
+        self,
+        circle_id: uuid.UUID,
+        recent_limit: int = 10,
+    ) -> list[PollTemplate]:
+        """Return active templates, prioritizing questions not recently used here."""
+        recent_template_ids = await self.find_recent_template_ids(circle_id, recent_limit)
 
         result = await self.session.execute(
             select(PollTemplate)
             .where(PollTemplate.is_active == True)  # noqa: E712
-            .order_by(PollTemplate.usage_count.asc(), PollTemplate.created_at.asc())
+            .order_by(
+                (PollTemplate.usage_count + PollTemplate.pending_usage_count).asc(),
+                PollTemplate.created_at.asc(),
+            )
         )
         templates = list(result.scalars().all())
         return sorted(
@@ -117,18 +241,41 @@ class TemplateRepository:
             key=lambda template: template.id in recent_template_ids,
         )
 
-    async def increment_usage_count(self, template_id: uuid.UUID) -> None:
+    async def increment_usage_count(self, template_id: uuid.UUID, amount: int = 1) -> None:
         """Increment template usage count.
 
+        Appends a TemplateUsageDelta instead of updating the template row, so
+        concurrent poll creation does not contend on it. Unknown templates
+        are ignored.
+
         Args:
             template_id: Template UUID
+            amount: Number of new uses
         """
         await self.session.execute(
-            update(PollTemplate)
-            .where(PollTemplate.id == template_id)
-            .values(usage_count=PollTemplate.usage_count + 1)
+            insert(TemplateUsageDelta).from_select(
+                ["id", "template_id", "delta"],
+                select(func.gen_random_uuid(), PollTemplate.id, literal(amount)).where(
+                    PollTemplate.id == template_id
+                ),
+            )
         )
-        await self.session.flush()
+
+    async def fold_usage_deltas(self, limit: int = 1000) -> int:
+        """Fold pending usage increments into poll_templates.usage_count.
+
+        Args:
+            limit: Maximum number of delta rows to fold
+
+        Returns:
+            Number of delta rows folded
+        """
+        result = await self.session.execute(
+            _fold_deltas_statement(
+                TemplateUsageDelta, "template_id", PollTemplate, "usage_count", limit, None
+            )
+        )
+        return result.scalar_one()
 
     async def count_by_category(self) -> dict[TemplateCategory, int]:
         """Count active templates by category.
@@ -164,7 +311,11 @@ class TemplateRepository:
         Returns:
             List of poll templates
         """
-        query = select(PollTemplate).order_by(PollTemplate.created_at.desc())
+        query = (
+            select(PollTemplate)
+            .options(undefer(PollTemplate.pending_usage_count))
+            .order_by(PollTemplate.created_at.desc())
+        )
 
         if category:
             query = query.where(PollTemplate.category == category)
@@ -226,6 +377,7 @@ class TemplateRepository:
         self.session.add(template)
         await self.session.flush()
         await self.session.refresh(template)
+        await self.session.refresh(template, ["pending_usage_count"])
         return template
 
     async def update_template(
@@ -263,6 +415,7 @@ class TemplateRepository:
 
         await self.session.flush()
         await self.session.refresh(template)
+        await self.session.refresh(template, ["pending_usage_count"])
         return template
 
 
@@ -309,18 +462,66 @@ class PollRepository:
         self.session.add(poll)
         await self.session.flush()
         await self.session.refresh(poll)
+        await self.session.refresh(poll, ["pending_vote_count"])
         return poll
 
-    async def find_by_id(self, poll_id: uuid.UUID) -> Poll | None:
+    async def create_many(
+        self,
+        circle_ids: list[uuid.UUID],
+        template_id: uuid.UUID | None,
+        creator_id: uuid.UUID,
+        question_text: str,
+        ends_at: datetime,
+    ) -> list[uuid.UUID]:
+        """Create the same poll in many circles with one INSERT ... SELECT.
+
+        Circle IDs that do not exist are skipped.
+
+        Args:
+            circle_ids: Target circle UUIDs
+            template_id: Template UUID, if any
+            creator_id: Creator user UUID
+            question_text: Poll question text
+            ends_at: Poll end datetime
+
+        Returns:
+            IDs of the created polls
+        """
+        if not circle_ids:
+            return []
+
+        result = await self.session.execute(
+            insert(Poll)
+            .from_select(
+                ["id", "circle_id", "template_id", "creator_id", "question_text", "status", "ends_at"],
+                select(
+                    func.gen_random_uuid(),
+                    Circle.id,
+                    literal(template_id, UUID(as_uuid=True)),
+                    literal(creator_id, UUID(as_uuid=True)),
+                    literal(question_text),
+                    literal(PollStatus.ACTIVE, Poll.status.type),
+                    literal(ends_at, Poll.ends_at.type),
+                ).where(Circle.id.in_(circle_ids)),
+            )
+            .returning(Poll.id)
+        )
+        return list(result.scalars().all())
+
+    async def find_by_id(self, poll_id: uuid.UUID, with_totals: bool = False) -> Poll | None:
         """Find poll by ID.
 
         Args:
             poll_id: Poll UUID
+            with_totals: Also load pending_vote_count, for rendering total_vote_count
 
         Returns:
             Poll if found, None otherwise
         """
-        result = await self.session.execute(select(Poll).where(Poll.id == poll_id))
+        query = select(Poll).where(Poll.id == poll_id)
+        if with_totals:
+            query = query.options(undefer(Poll.pending_vote_count))
+        result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
     async def find_by_circle_id(
@@ -386,46 +587,263 @@ class PollRepository:
         await self.session.flush()
 
     async def increment_vote_count(self, poll_id: uuid.UUID) -> None:
-        """Increment poll vote count.
+        """Increment poll vote count by appending a PollVoteDelta.
 
         Args:
             poll_id: Poll UUID
         """
         await self.session.execute(
-            update(Poll)
-            .where(Poll.id == poll_id)
-            .values(vote_count=Poll.vote_count + 1)
+            insert(PollVoteDelta).from_select(
+                ["id", "poll_id", "delta"],
+                select(func.gen_random_uuid(), Poll.id, literal(1)).where(Poll.id == poll_id),
+            )
         )
-        await self.session.flush()
 
-    async def find_ending_soon(self, minutes: int) -> list[Poll]:
-        """Find active polls ending within specified minutes.
+    async def fold_vote_deltas(
+        self,
+        limit: int = 1000,
+        poll_ids: list[uuid.UUID] | None = None,
+    ) -> int:
+        """Fold pending vote increments into polls.vote_count.
+
+        Args:
+            limit: Maximum number of delta rows to fold per batch
+            poll_ids: Only fold these polls' deltas (e.g. a poll being closed);
+                batches are folded until none are left
+
+        Returns:
+            Number of delta rows folded
+        """
+        statement = _fold_deltas_statement(
+            PollVoteDelta, "poll_id", Poll, "vote_count", limit, poll_ids
+        )
+        total = 0
+        while True:
+            result = await self.session.execute(statement)
+            folded = result.scalar_one()
+            total += folded
+            if poll_ids is None or folded == 0:
+                return total
+
+    async def find_active_ids(self) -> list[uuid.UUID]:
+        """Find IDs of all ACTIVE polls.
+
+        Returns:
+            List of poll UUIDs
+        """
+        result = await self.session.execute(
+            select(Poll.id).where(Poll.status == PollStatus.ACTIVE)
+        )
+        return list(result.scalars().all())
+
+    async def find_circle_ids(self, poll_ids: list[uuid.UUID]) -> dict[uuid.UUID, uuid.UUID]:
+        """Map poll IDs to their circle IDs.
+
+        Args:
+            poll_ids: Poll UUIDs
+
+        Returns:
+            Circle UUID per existing poll
+        """
+        if not poll_ids:
+            return {}
+        result = await self.session.execute(
+            select(Poll.id, Poll.circle_id).where(Poll.id.in_(poll_ids))
+        )
+        return {row.id: row.circle_id for row in result.all()}
+
+    async def find_completed_without_results(
+        self,
+        limit: int = 500,
+        after_id: uuid.UUID | None = None,
+    ) -> list[uuid.UUID]:
+        """Find completed polls with votes but no materialized results.
 
         Args:
-            minutes: Minutes threshold
+            limit: Maximum number of poll IDs to return
+            after_id: Only return IDs greater than this (for batching)
 
         Returns:
-            List of polls ending soon
+            Poll UUIDs in ascending order
         """
-        threshold = datetime.now() + timedelta(minutes=minutes)
         query = (
-            select(Poll)
-            .where(Poll.status == PollStatus.ACTIVE)
-            .where(Poll.ends_at <= threshold)
-            .order_by(Poll.ends_at)
+            select(Poll.id)
+            .where(
+                Poll.status == PollStatus.COMPLETED,
+                Poll.vote_count > 0,
+                ~exists().where(PollResult.poll_id == Poll.id),
+            )
+            .order_by(Poll.id)
+            .limit(limit)
         )
+        if after_id is not None:
+            query = query.where(Poll.id > after_id)
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def find_due_for_reminder(
+        self,
+        minutes_left: int,
+        now: datetime,
+        limit: int = 100,
+        exclude_ids: list[uuid.UUID] | None = None,
+    ) -> list[Poll]:
+        """Lock ACTIVE polls whose ``minutes_left`` deadline reminder is due.
+
+        A reminder is due once the poll is within ``minutes_left`` of its end,
+        if the poll already existed at that point and no reminder at least as
+        close to the deadline has been sent. Rows locked by a concurrent sweep
+        are skipped.
+
+        Args:
+            minutes_left: Reminder offset before ends_at
+            now: Current time
+            limit: Maximum number of polls
+            exclude_ids: Polls to leave out (e.g. failed earlier in this sweep)
+
+        Returns:
+            Locked polls, soonest deadline first
+        """
+        reminder_at = Poll.ends_at - timedelta(minutes=minutes_left)
+        query = select(Poll).where(
+            Poll.status == PollStatus.ACTIVE,
+            Poll.ends_at > now,
+            Poll.ends_at <= now + timedelta(minutes=minutes_left),
+            Poll.created_at < reminder_at,
+            or_(
+                Poll.last_reminder_minutes.is_(None),
+                Poll.last_reminder_minutes > minutes_left,
+            ),
+        )
+        if exclude_ids:
+            query = query.where(Poll.id.not_in(exclude_ids))
+
+        result = await self.session.execute(
+            query.order_by(Poll.ends_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def mark_reminded(self, poll_ids: list[uuid.UUID], minutes_left: int) -> None:
+        """Record that the ``minutes_left`` reminder was sent for polls."""
+        if not poll_ids:
+            return
+        await self.session.execute(
+            update(Poll)
+            .where(Poll.id.in_(poll_ids))
+            .values(last_reminder_minutes=minutes_left)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def find_due_for_close(
+        self,
+        now: datetime,
+        limit: int = 100,
+        exclude_ids: list[uuid.UUID] | None = None,
+    ) -> list[Poll]:
+        """Lock ACTIVE polls whose end time has passed.
+
+        Args:
+            now: Current time
+            limit: Maximum number of polls
+            exclude_ids: Polls to leave out (e.g. failed earlier in this sweep)
+
+        Returns:
+            Locked polls, earliest deadline first
+        """
+        query = select(Poll).where(
+            Poll.status == PollStatus.ACTIVE,
+            Poll.ends_at <= now,
+        )
+        if exclude_ids:
+            query = query.where(Poll.id.not_in(exclude_ids))
+
+        result = await self.session.execute(
+            query.order_by(Poll.ends_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def find_session_queue(
+        self,
+        user_id: uuid.UUID,
+        limit: int,
+        circle_id: uuid.UUID | None = None,
+    ) -> list[uuid.UUID]:
+        """Build a vote session queue of open polls the user has not voted on.
+
+        Polls are interleaved round-robin across circles: each circle's
+        newest poll first (circles ordered by their newest poll), then each
+        circle's second newest, and so on. Membership, the has-voted
+        anti-join on the user's votes and the interleaving all run in one
+        statement.
+
+        Args:
+            user_id: Voter UUID
+            limit: Maximum queue length
+            circle_id: Optional circle to restrict the queue to (membership
+                is not checked here)
+
+        Returns:
+            Poll UUIDs in queue order
+        """
+        if circle_id is not None:
+            circle_filter = Poll.circle_id == circle_id
+        else:
+            circle_filter = Poll.circle_id.in_(
+                select(CircleMember.circle_id).where(CircleMember.user_id == user_id)
+            )
+
+        eligible = (
+            select(
+                Poll.id,
+                func.row_number()
+                .over(
+                    partition_by=Poll.circle_id,
+                    order_by=(Poll.created_at.desc(), Poll.id.desc()),
+                )
+                .label("circle_rank"),
+                func.max(Poll.created_at).over(partition_by=Poll.circle_id).label("circle_newest"),
+                Poll.circle_id,
+            )
+            .where(
+                circle_filter,
+                Poll.status == PollStatus.ACTIVE,
+                Poll.ends_at > func.now(),
+                ~exists().where(Vote.poll_id == Poll.id, Vote.voter_id == user_id),
+            )
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(eligible.c.id)
+            .order_by(
+                eligible.c.circle_rank,
+                eligible.c.circle_newest.desc(),
+                eligible.c.circle_id,
+            )
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     async def find_by_user_circles(
-        self, circle_ids: list[uuid.UUID], status: PollStatus | None = None
+        self,
+        circle_ids: list[uuid.UUID],
+        status: PollStatus | None = None,
+        limit: int | None = 50,
+        before: tuple[datetime, uuid.UUID] | None = None,
     ) -> list[Poll]:
-        """Find polls from user's circles.
+        """Find a page of polls from user's circles, newest first.
 
         Args:
             circle_ids: List of circle UUIDs the user belongs to
             status: Optional status filter
+            limit: Maximum number of results (None for all)
+            before: Optional (created_at, id) keyset; only older polls are returned
 
         Returns:
             List of polls from user's circles (with circle and template eager loaded)
@@ -433,22 +851,81 @@ class PollRepository:
         if not circle_ids:
             return []
 
-        query = (
-            select(Poll)
-            .options(
+        query = self._user_circles_page(
+            select(Poll).options(
                 selectinload(Poll.circle),
                 selectinload(Poll.template),
+                undefer(Poll.pending_vote_count),
+            ),
+            circle_ids,
+            status,
+            limit,
+            before,
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def find_feed_versions(
+        self,
+        circle_ids: list[uuid.UUID],
+        status: PollStatus | None = None,
+        limit: int | None = 50,
+        before: tuple[datetime, uuid.UUID] | None = None,
+    ) -> list[tuple[object, ...]]:
+        """Read the fields a feed page's ETag depends on, without loading polls.
+
+        Selects the same page as :meth:`find_by_user_circles` in one query.
+
+        Args:
+            circle_ids: List of circle UUIDs the user belongs to
+            status: Optional status filter
+            limit: Maximum number of results (None for all)
+            before: Optional (created_at, id) keyset; only older polls are returned
+
+        Returns:
+            (id, status, vote count including pending votes, circle name,
+            circle member count, template emoji) per poll, newest first
+        """
+        if not circle_ids:
+            return []
+
+        query = self._user_circles_page(
+            select(
+                Poll.id,
+                Poll.status,
+                Poll.vote_count + Poll.pending_vote_count,
+                Circle.name,
+                Circle.member_count,
+                PollTemplate.emoji,
             )
-            .where(Poll.circle_id.in_(circle_ids))
+            .join(Circle, Circle.id == Poll.circle_id)
+            .outerjoin(PollTemplate, PollTemplate.id == Poll.template_id),
+            circle_ids,
+            status,
+            limit,
+            before,
         )
+        result = await self.session.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    @staticmethod
+    def _user_circles_page(
+        query: Select[*_Row],
+        circle_ids: list[uuid.UUID],
+        status: PollStatus | None,
+        limit: int | None,
+        before: tuple[datetime, uuid.UUID] | None,
+    ) -> Select[*_Row]:
+        """Restrict a poll query to one newest-first page of the given circles."""
+        query = query.where(Poll.circle_id.in_(circle_ids))
 
         if status:
             query = query.where(Poll.status == status)
 
-        query = query.order_by(Poll.created_at.desc())
+        if before is not None:
+            query = query.where(tuple_(Poll.created_at, Poll.id) < tuple_(*before))
 
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return query.order_by(Poll.created_at.desc(), Poll.id.desc()).limit(limit)
 
     # ==================== Admin Methods ====================
 
@@ -470,7 +947,9 @@ class PollRepository:
         Returns:
             List of polls matching the criteria
         """
-        query = select(Poll).order_by(Poll.created_at.desc())
+        query = (
+            select(Poll).options(undefer(Poll.pending_vote_count)).order_by(Poll.created_at.desc())
+        )
 
         if status:
             query = query.where(Poll.status == status)
@@ -544,51 +1023,553 @@ class VoteRepository:
         await self.session.refresh(vote)
         return vote
 
-    async def exists_by_voter_hash(self, poll_id: uuid.UUID, voter_hash: str) -> bool:
-        """Check if vote exists by voter hash.
+    def _received_heart_ctes(self, new_votes: FromClause) -> tuple[CTE, CTE]:
+        """Build CTEs that add newly inserted votes to the recipients' inboxes.
+
+        One inbox row is upserted per vote (a voter has at most one vote per
+        poll, so the rows of one statement never collide) and each
+        recipient's unread counter grows by their number of new votes.
 
         Args:
-            poll_id: Poll UUID
-            voter_hash: Voter hash to check
+            new_votes: Inserted votes, with poll_id and voted_for_id columns
 
         Returns:
-            True if vote exists, False otherwise
+            (inbox, counters) CTEs to attach to the vote statement
         """
-        result = await self.session.execute(
-            select(Vote).where(Vote.poll_id == poll_id, Vote.voter_hash == voter_hash)
+        heart_rows = insert(ReceivedHeart).from_select(
+            [
+                "id",
+                "user_id",
+                "poll_id",
+                "circle_id",
+                "question_text",
+                "emoji",
+                "received_count",
+                "unread_count",
+                "latest_received_at",
+            ],
+            select(
+                func.gen_random_uuid(),
+                new_votes.c.voted_for_id,
+                Poll.id,
+                Poll.circle_id,
+                Poll.question_text,
+                PollTemplate.emoji,
+                literal(1),
+                literal(1),
+                func.now(),
+            )
+            .join_from(new_votes, Poll, Poll.id == new_votes.c.poll_id)
+            .outerjoin(PollTemplate, Poll.template_id == PollTemplate.id),
+        )
+        inbox = (
+            heart_rows.on_conflict_do_update(
+                constraint="uq_received_heart",
+                set_={
+                    "received_count": ReceivedHeart.received_count + 1,
+                    "unread_count": ReceivedHeart.unread_count + 1,
+                    "latest_received_at": heart_rows.excluded.latest_received_at,
+                },
+            )
+            .returning(ReceivedHeart.id)
+            .cte("received_hearts")
         )
-        return result.scalar_one_or_none() is not None
-
-    async def count_by_poll_id(self, poll_id: uuid.UUID) -> int:
-        """Count votes for a poll.
-
-        Args:
-            poll_id: Poll UUID
 
-        Returns:
-            Number of votes
-        """
-        result = await self.session.execute(
-            select(func.count()).select_from(Vote).where(Vote.poll_id == poll_id)
+        counter_rows = insert(ReceivedHeartCounter).from_select(
+            ["id", "user_id", "unread_count"],
+            select(
+                func.gen_random_uuid(),
+                new_votes.c.voted_for_id,
+                func.count(),
+            ).group_by(new_votes.c.voted_for_id),
         )
-        return result.scalar() or 0
+        counters = (
+            counter_rows.on_conflict_do_update(
+                constraint="uq_received_heart_counter",
+                set_={
+                    "unread_count": ReceivedHeartCounter.unread_count
+                    + counter_rows.excluded.unread_count,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(ReceivedHeartCounter.id)
+            .cte("received_heart_counters")
+        )
+        return inbox, counters
 
-    async def find_voter_ids_by_poll_id(self, poll_id: uuid.UUID) -> set[uuid.UUID]:
-        """Find user IDs that have already voted in a poll.
+    def _reward_ledger_cte(
+        self,
+        new_votes: FromClause,
+        voter_id: uuid.UUID,
+        rewarded_at: datetime,
+    ) -> CTE:
+        """Build a CTE that appends one coin ledger entry per inserted vote.
+
+        The voter's ``users`` row is only read, never updated, so votes by
+        one user do not serialize on it; a missing voter gets no entries.
 
         Args:
-            poll_id: Poll UUID
+            new_votes: Inserted votes, with an id column
+            voter_id: Rewarded voter UUID
+            rewarded_at: Reward timestamp
 
         Returns:
-            Set of voter user UUIDs
+            CTE returning the rewarded user ID per entry
         """
-        result = await self.session.execute(
-            select(Vote.voter_id).where(Vote.poll_id == poll_id)
+        return (
+            insert(CoinLedgerEntry)
+            .from_select(
+                ["id", "user_id", "vote_id", "amount", "reason", "reward_date", "created_at"],
+                select(
+                    func.gen_random_uuid(),
+                    User.id,
+                    new_votes.c.id,
+                    literal(1),
+                    literal(CoinLedgerEntry.REASON_VOTE),
+                    literal(reward_date(rewarded_at), Date),
+                    literal(rewarded_at, DateTime(timezone=True)),
+                ).join_from(new_votes, User, User.id == voter_id),
+            )
+            .returning(CoinLedgerEntry.user_id)
+            .cte("rewarded_user")
         )
-        return set(result.scalars().all())
 
-    async def get_results_by_poll_id(self, poll_id: uuid.UUID) -> list[VoteResultDict]:
-        """Get vote results for a poll.
+    async def cast_vote(
+        self,
+        poll_id: uuid.UUID,
+        voter_id: uuid.UUID,
+        voter_hash: str,
+        voted_for_id: uuid.UUID,
+        voted_at: datetime | None = None,
+    ) -> VoteCastDict | None:
+        """Validate and commit a vote in a single statement.
+
+        Membership checks, the insert (deduplicated by ``uq_poll_voter`` via
+        ``ON CONFLICT DO NOTHING``), the poll's vote count delta, the
+        recipient's circle received count and inbox row, and the voter's
+        coin ledger entry all run as CTEs of one statement. The
+        writes only happen when every check passes and the vote row was
+        actually inserted.
+
+        Args:
+            poll_id: Poll UUID
+            voter_id: Voter user UUID
+            voter_hash: SHA-256 hash of voter (for duplicate prevention)
+            voted_for_id: User UUID being voted for
+            voted_at: Reward timestamp (defaults to now)
+
+        Returns:
+            Check results and the new vote ID (None if nothing was inserted),
+            or None if the poll does not exist
+        """
+        now = voted_at or datetime.now(UTC)
+
+        target_poll = (
+            select(
+                Poll.id,
+                Poll.circle_id,
+                Poll.question_text,
+                Poll.status,
+                exists()
+                .where(
+                    CircleMember.circle_id == Poll.circle_id,
+                    CircleMember.user_id == voter_id,
+                )
+                .label("voter_is_member"),
+                exists()
+                .where(
+                    CircleMember.circle_id == Poll.circle_id,
+                    CircleMember.user_id == voted_for_id,
+                )
+                .label("target_is_member"),
+            )
+            .where(Poll.id == poll_id)
+            .cte("target_poll")
+        )
+
+        insert_conditions = [
+            target_poll.c.status == PollStatus.ACTIVE,
+            target_poll.c.voter_is_member,
+            target_poll.c.target_is_member,
+        ]
+        if voter_id == voted_for_id:
+            insert_conditions.append(false())
+
+        inserted = (
+            insert(Vote)
+            .from_select(
+                ["id", "poll_id", "voter_id", "voter_hash", "voted_for_id"],
+                select(
+                    literal(uuid.uuid4()),
+                    target_poll.c.id,
+                    literal(voter_id),
+                    literal(voter_hash),
+                    literal(voted_for_id),
+                ).where(*insert_conditions),
+            )
+            .on_conflict_do_nothing(constraint="uq_poll_voter")
+            .returning(Vote.id, Vote.poll_id, Vote.voted_for_id)
+            .cte("inserted_vote")
+        )
+        vote_was_inserted = exists(select(inserted.c.id))
+
+        counted = (
+            insert(PollVoteDelta)
+            .from_select(
+                ["id", "poll_id", "delta"],
+                select(func.gen_random_uuid(), inserted.c.poll_id, literal(1)),
+            )
+            .returning(PollVoteDelta.id)
+            .cte("counted_poll")
+        )
+
+        counted_member = (
+            insert(CircleReceivedCount)
+            .from_select(
+                ["id", "circle_id", "user_id", "received_count"],
+                select(
+                    func.gen_random_uuid(),
+                    target_poll.c.circle_id,
+                    literal(voted_for_id),
+                    literal(1),
+                ).where(vote_was_inserted),
+            )
+            .on_conflict_do_update(
+                constraint="uq_circle_received_count",
+                set_={
+                    "received_count": CircleReceivedCount.received_count + 1,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(CircleReceivedCount.id)
+            .cte("counted_member")
+        )
+        inbox, counted_hearts = self._received_heart_ctes(inserted)
+
+        rewarded = self._reward_ledger_cte(inserted, voter_id, now)
+
+        result = await self.session.execute(
+            select(
+                target_poll.c.id,
+                target_poll.c.circle_id,
+                target_poll.c.question_text,
+                target_poll.c.status,
+                target_poll.c.voter_is_member,
+                target_poll.c.target_is_member,
+                select(inserted.c.id).scalar_subquery().label("vote_id"),
+                exists(select(rewarded.c.user_id)).label("rewarded"),
+            ).add_cte(counted, counted_member, inbox, counted_hearts)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        if row.rewarded:
+            invalidate_cached_user(voter_id)
+
+        return {
+            "poll_id": row.id,
+            "circle_id": row.circle_id,
+            "question_text": row.question_text,
+            "status": row.status,
+            "voter_is_member": row.voter_is_member,
+            "target_is_member": row.target_is_member,
+            "vote_id": row.vote_id,
+            "rewarded": row.rewarded,
+        }
+
+    async def cast_votes(
+        self,
+        voter_id: uuid.UUID,
+        votes: list[tuple[uuid.UUID, uuid.UUID, str]],
+        voted_at: datetime | None = None,
+    ) -> list[VoteCastDict]:
+        """Validate and commit several votes by one voter in a single statement.
+
+        The multi-row form of :meth:`cast_vote`: every vote that passes its
+        checks is inserted by one ``INSERT ... SELECT``, poll vote count deltas,
+        circle received counts and inboxes are updated per inserted row, and
+        the voter gets one coin ledger entry per inserted vote.
+
+        Args:
+            voter_id: Voter user UUID
+            votes: (poll_id, voted_for_id, voter_hash) per vote, distinct poll IDs
+            voted_at: Reward timestamp (defaults to now)
+
+        Returns:
+            Check results and new vote ID for each existing poll, in no order
+        """
+        if not votes:
+            return []
+
+        now = voted_at or datetime.now(UTC)
+
+        batch = values(
+            column("poll_id", UUID(as_uuid=True)),
+            column("voted_for_id", UUID(as_uuid=True)),
+            column("voter_hash", String),
+            name="batch_votes",
+        ).data(votes)
+
+        target_polls = (
+            select(
+                Poll.id,
+                Poll.circle_id,
+                Poll.question_text,
+                Poll.status,
+                batch.c.voted_for_id,
+                batch.c.voter_hash,
+                exists()
+                .where(
+                    CircleMember.circle_id == Poll.circle_id,
+                    CircleMember.user_id == voter_id,
+                )
+                .label("voter_is_member"),
+                exists()
+                .where(
+                    CircleMember.circle_id == Poll.circle_id,
+                    CircleMember.user_id == batch.c.voted_for_id,
+                )
+                .label("target_is_member"),
+            )
+            .join_from(batch, Poll, Poll.id == batch.c.poll_id)
+            .cte("target_polls")
+        )
+
+        inserted = (
+            insert(Vote)
+            .from_select(
+                ["id", "poll_id", "voter_id", "voter_hash", "voted_for_id"],
+                select(
+                    func.gen_random_uuid(),
+                    target_polls.c.id,
+                    literal(voter_id),
+                    target_polls.c.voter_hash,
+                    target_polls.c.voted_for_id,
+                ).where(
+                    target_polls.c.status == PollStatus.ACTIVE,
+                    target_polls.c.voter_is_member,
+                    target_polls.c.target_is_member,
+                    target_polls.c.voted_for_id != voter_id,
+                ),
+            )
+            .on_conflict_do_nothing(constraint="uq_poll_voter")
+            .returning(Vote.id, Vote.poll_id, Vote.voted_for_id)
+            .cte("inserted_votes")
+        )
+
+        counted = (
+            insert(PollVoteDelta)
+            .from_select(
+                ["id", "poll_id", "delta"],
+                select(func.gen_random_uuid(), inserted.c.poll_id, func.count()).group_by(
+                    inserted.c.poll_id
+                ),
+            )
+            .returning(PollVoteDelta.id)
+            .cte("counted_polls")
+        )
+
+        received = insert(CircleReceivedCount).from_select(
+            ["id", "circle_id", "user_id", "received_count"],
+            select(
+                func.gen_random_uuid(),
+                target_polls.c.circle_id,
+                inserted.c.voted_for_id,
+                func.count(),
+            )
+            .join_from(inserted, target_polls, target_polls.c.id == inserted.c.poll_id)
+            .group_by(target_polls.c.circle_id, inserted.c.voted_for_id),
+        )
+        counted_members = (
+            received.on_conflict_do_update(
+                constraint="uq_circle_received_count",
+                set_={
+                    "received_count": CircleReceivedCount.received_count
+                    + received.excluded.received_count,
+                    "updated_at": func.now(),
+                },
+            )
+            .returning(CircleReceivedCount.id)
+            .cte("counted_members")
+        )
+        inbox, counted_hearts = self._received_heart_ctes(inserted)
+
+        rewarded = self._reward_ledger_cte(inserted, voter_id, now)
+
+        result = await self.session.execute(
+            select(
+                target_polls.c.id,
+                target_polls.c.circle_id,
+                target_polls.c.question_text,
+                target_polls.c.status,
+                target_polls.c.voter_is_member,
+                target_polls.c.target_is_member,
+                inserted.c.id.label("vote_id"),
+                exists(select(rewarded.c.user_id)).label("rewarded"),
+            )
+            .outerjoin_from(target_polls, inserted, inserted.c.poll_id == target_polls.c.id)
+            .add_cte(counted, counted_members, inbox, counted_hearts)
+        )
+        rows = result.all()
+
+        if any(row.rewarded for row in rows):
+            invalidate_cached_user(voter_id)
+
+        return [
+            {
+                "poll_id": row.id,
+                "circle_id": row.circle_id,
+                "question_text": row.question_text,
+                "status": row.status,
+                "voter_is_member": row.voter_is_member,
+                "target_is_member": row.target_is_member,
+                "vote_id": row.vote_id,
+                "rewarded": row.rewarded,
+            }
+            for row in rows
+        ]
+
+    async def exists_by_voter_hash(self, poll_id: uuid.UUID, voter_hash: str) -> bool:
+        """Check if vote exists by voter hash.
+
+        Args:
+            poll_id: Poll UUID
+            voter_hash: Voter hash to check
+
+        Returns:
+            True if vote exists, False otherwise
+        """
+        result = await self.session.execute(
+            select(Vote).where(Vote.poll_id == poll_id, Vote.voter_hash == voter_hash)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def find_voted_poll_ids(
+        self,
+        voter_hashes: list[tuple[uuid.UUID, str]],
+    ) -> set[uuid.UUID]:
+        """Resolve which polls already have a vote for the given voter hashes.
+
+        Args:
+            voter_hashes: (poll_id, voter_hash) pairs to check
+
+        Returns:
+            Set of poll UUIDs whose pair has a vote
+        """
+        if not voter_hashes:
+            return set()
+
+        result = await self.session.execute(
+            select(Vote.poll_id).where(
+                tuple_(Vote.poll_id, Vote.voter_hash).in_(voter_hashes)
+            )
+        )
+        return set(result.scalars().all())
+
+    async def get_top_results_by_poll_ids(
+        self,
+        poll_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, VoteResultDict]:
+        """Get the most-voted user for each of several polls.
+
+        Args:
+            poll_ids: Poll UUIDs
+
+        Returns:
+            Mapping of poll UUID to its top result; polls without votes are omitted
+        """
+        if not poll_ids:
+            return {}
+
+        vote_count = func.count(Vote.id)
+        ranked = (
+            select(
+                Vote.poll_id,
+                Vote.voted_for_id,
+                vote_count.label("vote_count"),
+                func.row_number()
+                .over(
+                    partition_by=Vote.poll_id,
+                    order_by=(vote_count.desc(), Vote.voted_for_id),
+                )
+                .label("rank"),
+            )
+            .where(Vote.poll_id.in_(poll_ids))
+            .group_by(Vote.poll_id, Vote.voted_for_id)
+            .subquery()
+        )
+        result = await self.session.execute(
+            select(ranked.c.poll_id, ranked.c.voted_for_id, ranked.c.vote_count).where(
+                ranked.c.rank == 1
+            )
+        )
+
+        return {
+            row.poll_id: {"user_id": row.voted_for_id, "vote_count": row.vote_count}
+            for row in result.all()
+        }
+
+    async def count_by_poll_id(self, poll_id: uuid.UUID) -> int:
+        """Count votes for a poll.
+
+        Args:
+            poll_id: Poll UUID
+
+        Returns:
+            Number of votes
+        """
+        result = await self.session.execute(
+            select(func.count()).select_from(Vote).where(Vote.poll_id == poll_id)
+        )
+        return result.scalar() or 0
+
+    async def find_voter_ids_by_poll_id(self, poll_id: uuid.UUID) -> set[uuid.UUID]:
+        """Find user IDs that have already voted in a poll.
+
+        Args:
+            poll_id: Poll UUID
+
+        Returns:
+            Set of voter user UUIDs
+        """
+        result = await self.session.execute(
+            select(Vote.voter_id).where(Vote.poll_id == poll_id)
+        )
+        return set(result.scalars().all())
+
+    async def find_non_voter_ids_by_poll_ids(
+        self, poll_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[uuid.UUID]]:
+        """Find circle members who have not voted, for several polls at once.
+
+        Args:
+            poll_ids: Poll UUIDs
+
+        Returns:
+            Non-voting member UUIDs per poll (polls without any are omitted)
+        """
+        if not poll_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(Poll.id, CircleMember.user_id)
+            .join(CircleMember, CircleMember.circle_id == Poll.circle_id)
+            .where(
+                Poll.id.in_(poll_ids),
+                ~exists().where(
+                    Vote.poll_id == Poll.id,
+                    Vote.voter_id == CircleMember.user_id,
+                ),
+            )
+        )
+        non_voters: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for row in result.all():
+            non_voters.setdefault(row.id, []).append(row.user_id)
+        return non_voters
+
+    async def get_results_by_poll_id(self, poll_id: uuid.UUID) -> list[VoteResultDict]:
+        """Get vote results for a poll.
 
         Args:
             poll_id: Poll UUID
@@ -608,6 +1589,133 @@ class VoteRepository:
             for row in result.all()
         ]
 
+    async def materialize_results(self, poll_id: uuid.UUID) -> int:
+        """Persist final rankings for a poll into poll_results.
+
+        Tallies, percentages and ranks are computed in the database and
+        upserted on ``uq_poll_result``, so re-running (e.g. from a backfill)
+        is idempotent.
+
+        Args:
+            poll_id: Poll UUID
+
+        Returns:
+            Number of result rows written
+        """
+        vote_count = func.count(Vote.id)
+        tallies = (
+            select(
+                func.gen_random_uuid().label("id"),
+                literal(poll_id).label("poll_id"),
+                Vote.voted_for_id.label("user_id"),
+                vote_count.label("vote_count"),
+                func.round(
+                    cast(vote_count * 100, Numeric) / func.sum(vote_count).over(), 2
+                ).label("vote_percentage"),
+                func.row_number()
+                .over(order_by=(vote_count.desc(), Vote.voted_for_id))
+                .label("rank"),
+            )
+            .where(Vote.poll_id == poll_id)
+            .group_by(Vote.voted_for_id)
+        )
+        stmt = insert(PollResult).from_select(
+            ["id", "poll_id", "user_id", "vote_count", "vote_percentage", "rank"],
+            tallies,
+        )
+        upsert = stmt.on_conflict_do_update(
+            constraint="uq_poll_result",
+            set_={
+                "vote_count": stmt.excluded.vote_count,
+                "vote_percentage": stmt.excluded.vote_percentage,
+                "rank": stmt.excluded.rank,
+            },
+        ).returning(PollResult.id)
+
+        result = await self.session.execute(upsert)
+        return len(result.all())
+
+    async def find_materialized_results(
+        self,
+        poll_id: uuid.UUID,
+    ) -> list[MaterializedResultDict]:
+        """Get persisted final results for a poll, best rank first.
+
+        Args:
+            poll_id: Poll UUID
+
+        Returns:
+            Result rows (empty if the poll has not been materialized)
+        """
+        result = await self.session.execute(
+            select(PollResult).where(PollResult.poll_id == poll_id).order_by(PollResult.rank)
+        )
+
+        return [
+            {
+                "user_id": row.user_id,
+                "vote_count": row.vote_count,
+                "vote_percentage": float(row.vote_percentage),
+                "rank": row.rank or index + 1,
+            }
+            for index, row in enumerate(result.scalars().all())
+        ]
+
+    async def find_materialized_winners(
+        self,
+        poll_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, VoteResultDict]:
+        """Get the persisted rank-1 result for each of several polls.
+
+        Args:
+            poll_ids: Poll UUIDs
+
+        Returns:
+            Mapping of poll UUID to its winner; unmaterialized polls are omitted
+        """
+        if not poll_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(PollResult.poll_id, PollResult.user_id, PollResult.vote_count).where(
+                PollResult.poll_id.in_(poll_ids),
+                PollResult.rank == 1,
+            )
+        )
+
+        return {
+            row.poll_id: {"user_id": row.user_id, "vote_count": row.vote_count}
+            for row in result.all()
+        }
+
+    async def get_results_by_poll_ids(
+        self,
+        poll_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, list[VoteResultDict]]:
+        """Get vote results for several polls in one query.
+
+        Args:
+            poll_ids: Poll UUIDs
+
+        Returns:
+            Mapping of poll UUID to its results (polls without votes map to [])
+        """
+        results: dict[uuid.UUID, list[VoteResultDict]] = {poll_id: [] for poll_id in poll_ids}
+        if not poll_ids:
+            return results
+
+        rows = await self.session.execute(
+            select(Vote.poll_id, Vote.voted_for_id, func.count(Vote.id).label("vote_count"))
+            .where(Vote.poll_id.in_(poll_ids))
+            .group_by(Vote.poll_id, Vote.voted_for_id)
+            .order_by(Vote.poll_id, func.count(Vote.id).desc())
+        )
+        for row in rows.all():
+            results[row.poll_id].append(
+                {"user_id": row.voted_for_id, "vote_count": row.vote_count}
+            )
+        return results
+
     async def find_candidate_options(
         self,
         circle_id: uuid.UUID,
@@ -622,42 +1730,173 @@ class VoteRepository:
         Returns:
             Candidate rows with exposure/fairness count
         """
-        received_counts = (
-            select(
-                Vote.voted_for_id.label("user_id"),
-                func.count(Vote.id).label("received_count"),
-            )
-            .join(Poll, Vote.poll_id == Poll.id)
-            .where(Poll.circle_id == circle_id)
-            .group_by(Vote.voted_for_id)
-            .subquery()
-        )
+        options = await self.find_candidate_options_by_circle_ids([circle_id], requester_id)
+        return options.get(circle_id, [])
+
+    async def find_candidate_options_by_circle_ids(
+        self,
+        circle_ids: list[uuid.UUID],
+        requester_id: uuid.UUID,
+    ) -> dict[uuid.UUID, list[CandidateOptionDict]]:
+        """Find eligible vote candidates for several circles in one query.
+
+        Args:
+            circle_ids: Circle UUIDs
+            requester_id: Current voter UUID
+
+        Returns:
+            Candidate rows per circle, least received votes first; circles
+            without candidates are omitted
+        """
+        if not circle_ids:
+            return {}
+
+        received_count = func.coalesce(CircleReceivedCount.received_count, 0)
         result = await self.session.execute(
             select(
+                CircleMember.circle_id,
                 CircleMember.user_id,
                 CircleMember.nickname,
                 User.profile_emoji,
-                func.coalesce(received_counts.c.received_count, 0).label("received_count"),
+                received_count.label("received_count"),
             )
             .join(User, CircleMember.user_id == User.id)
-            .outerjoin(received_counts, CircleMember.user_id == received_counts.c.user_id)
+            .outerjoin(
+                CircleReceivedCount,
+                and_(
+                    CircleReceivedCount.circle_id == CircleMember.circle_id,
+                    CircleReceivedCount.user_id == CircleMember.user_id,
+                ),
+            )
             .where(
-                CircleMember.circle_id == circle_id,
+                CircleMember.circle_id.in_(circle_ids),
                 CircleMember.user_id != requester_id,
                 User.is_active == True,  # noqa: E712
             )
             .order_by(
-                func.coalesce(received_counts.c.received_count, 0).asc(),
+                CircleMember.circle_id,
+                received_count.asc(),
                 CircleMember.joined_at.asc(),
             )
         )
 
+        options: dict[uuid.UUID, list[CandidateOptionDict]] = {}
+        for row in result.all():
+            options.setdefault(row.circle_id, []).append(
+                {
+                    "user_id": row.user_id,
+                    "nickname": row.nickname,
+                    "profile_emoji": row.profile_emoji,
+                    "received_count": int(row.received_count),
+                }
+            )
+        return options
+
+    @staticmethod
+    def _actual_received_counts(
+        circle_ids: list[uuid.UUID],
+    ) -> Select[uuid.UUID, uuid.UUID, int]:
+        """Aggregate received counts for circles from vote history.
+
+        Only votes cast since the member (last) joined are counted, which is
+        what the per-vote increments accumulate for a current member.
+        """
+        return (
+            select(
+                Poll.circle_id.label("circle_id"),
+                Vote.voted_for_id.label("user_id"),
+                func.count(Vote.id).label("received_count"),
+            )
+            .join(Poll, Vote.poll_id == Poll.id)
+            .join(
+                CircleMember,
+                and_(
+                    CircleMember.circle_id == Poll.circle_id,
+                    CircleMember.user_id == Vote.voted_for_id,
+                    Vote.created_at >= CircleMember.joined_at,
+                ),
+            )
+            .where(Poll.circle_id.in_(circle_ids))
+            .group_by(Poll.circle_id, Vote.voted_for_id)
+        )
+
+    async def rebuild_received_counts(self, circle_ids: list[uuid.UUID]) -> int:
+        """Recompute circle_received_counts for circles from vote history.
+
+        Args:
+            circle_ids: Circle UUIDs to rebuild
+
+        Returns:
+            Number of count rows written
+        """
+        if not circle_ids:
+            return 0
+
+        await self.session.execute(
+            delete(CircleReceivedCount).where(CircleReceivedCount.circle_id.in_(circle_ids))
+        )
+        actual = self._actual_received_counts(circle_ids).subquery()
+        result = await self.session.execute(
+            insert(CircleReceivedCount)
+            .from_select(
+                ["id", "circle_id", "user_id", "received_count"],
+                select(
+                    func.gen_random_uuid(),
+                    actual.c.circle_id,
+                    actual.c.user_id,
+                    actual.c.received_count,
+                ),
+            )
+            .returning(CircleReceivedCount.id)
+        )
+        return len(result.all())
+
+    async def find_received_count_drift(
+        self, circle_ids: list[uuid.UUID]
+    ) -> list[ReceivedCountDriftDict]:
+        """Find members whose stored received count disagrees with vote history.
+
+        Args:
+            circle_ids: Circle UUIDs to verify
+
+        Returns:
+            Drifted (circle, member) pairs with stored and actual counts
+        """
+        if not circle_ids:
+            return []
+
+        actual = self._actual_received_counts(circle_ids).subquery()
+        stored_count = func.coalesce(CircleReceivedCount.received_count, 0)
+        actual_count = func.coalesce(actual.c.received_count, 0)
+        result = await self.session.execute(
+            select(
+                func.coalesce(CircleReceivedCount.circle_id, actual.c.circle_id).label(
+                    "circle_id"
+                ),
+                func.coalesce(CircleReceivedCount.user_id, actual.c.user_id).label("user_id"),
+                stored_count.label("stored_count"),
+                actual_count.label("actual_count"),
+            )
+            .select_from(CircleReceivedCount)
+            .join(
+                actual,
+                and_(
+                    CircleReceivedCount.circle_id == actual.c.circle_id,
+                    CircleReceivedCount.user_id == actual.c.user_id,
+                ),
+                full=True,
+            )
+            .where(
+                func.coalesce(CircleReceivedCount.circle_id, actual.c.circle_id).in_(circle_ids),
+                stored_count != actual_count,
+            )
+        )
         return [
             {
+                "circle_id": row.circle_id,
                 "user_id": row.user_id,
-                "nickname": row.nickname,
-                "profile_emoji": row.profile_emoji,
-                "received_count": int(row.received_count),
+                "stored_count": int(row.stored_count),
+                "actual_count": int(row.actual_count),
             }
             for row in result.all()
         ]
@@ -697,80 +1936,74 @@ class VoteRepository:
         )
         return list(result.scalars().all())
 
-    async def create_vote_hint(
+    async def create_vote_hints(
         self,
-        *,
-        vote_id: uuid.UUID,
-        user_id: uuid.UUID,
-        tier: str,
-        hint_text: str,
-    ) -> VoteHint:
-        """Persist a generated safe vote hint."""
-        hint = VoteHint(
-            vote_id=vote_id,
-            user_id=user_id,
-            tier=tier,
-            hint_text=hint_text,
+        hints: list[dict[str, object]],
+    ) -> dict[tuple[uuid.UUID, str], str]:
+        """Persist generated safe vote hints in one statement.
+
+        Rows are inserted with a single multi-row INSERT; hints that already
+        exist (e.g. written by a concurrent request) are left untouched.
+
+        Args:
+            hints: Rows with vote_id, user_id, tier and hint_text
+
+        Returns:
+            Hint texts of the inserted rows keyed by (vote_id, tier)
+        """
+        if not hints:
+            return {}
+
+        result = await self.session.execute(
+            insert(VoteHint)
+            .values(hints)
+            .on_conflict_do_nothing(constraint="uq_vote_hint_tier")
+            .returning(VoteHint.vote_id, VoteHint.tier, VoteHint.hint_text)
         )
-        self.session.add(hint)
-        await self.session.flush()
-        await self.session.refresh(hint)
-        return hint
+        return {(row.vote_id, row.tier): row.hint_text for row in result.all()}
 
     async def find_received_hearts_for_user(
         self,
         user_id: uuid.UUID,
         limit: int = 50,
-        offset: int = 0,
+        before: tuple[datetime, uuid.UUID] | None = None,
     ) -> list[ReceivedHeartDict]:
-        """Find polls where the user received votes, grouped for inbox display.
+        """Find a page of the user's received heart inbox, latest first.
 
         Args:
             user_id: User UUID that received votes
             limit: Maximum number of rows
-            offset: Number of rows to skip
+            before: Optional (latest_received_at, poll_id) keyset; only rows
+                after it in inbox order are returned
 
         Returns:
             Received heart rows ordered by latest received vote
         """
-        received_count = func.count(Vote.id).label("received_count")
-        latest_received_at = func.max(Vote.created_at).label("latest_received_at")
-
-        result = await self.session.execute(
+        query = (
             select(
-                Poll.id.label("poll_id"),
-                Poll.circle_id.label("circle_id"),
+                ReceivedHeart.poll_id,
+                ReceivedHeart.circle_id,
                 Circle.name.label("circle_name"),
-                Poll.question_text.label("question_text"),
-                PollTemplate.emoji.label("emoji"),
-                received_count,
-                latest_received_at,
-                ReceivedHeartRead.id.label("read_id"),
-            )
-            .join(Poll, Vote.poll_id == Poll.id)
-            .join(Circle, Poll.circle_id == Circle.id)
-            .outerjoin(PollTemplate, Poll.template_id == PollTemplate.id)
-            .outerjoin(
-                ReceivedHeartRead,
-                and_(
-                    ReceivedHeartRead.poll_id == Poll.id,
-                    ReceivedHeartRead.user_id == user_id,
-                ),
-            )
-            .where(Vote.voted_for_id == user_id)
-            .group_by(
-                Poll.id,
-                Poll.circle_id,
-                Circle.name,
-                Poll.question_text,
-                PollTemplate.emoji,
-                ReceivedHeartRead.id,
+                ReceivedHeart.question_text,
+                ReceivedHeart.emoji,
+                ReceivedHeart.received_count,
+                ReceivedHeart.unread_count,
+                ReceivedHeart.latest_received_at,
             )
-            .order_by(latest_received_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .join(Circle, ReceivedHeart.circle_id == Circle.id)
+            .where(ReceivedHeart.user_id == user_id)
         )
+        if before is not None:
+            query = query.where(
+                tuple_(ReceivedHeart.latest_received_at, ReceivedHeart.poll_id)
+                < tuple_(*before)
+            )
+        query = query.order_by(
+            ReceivedHeart.latest_received_at.desc(),
+            ReceivedHeart.poll_id.desc(),
+        ).limit(limit)
 
+        result = await self.session.execute(query)
         return [
             {
                 "poll_id": row.poll_id,
@@ -779,40 +2012,65 @@ class VoteRepository:
                 "question_text": row.question_text,
                 "emoji": row.emoji,
                 "received_count": row.received_count,
+                "unread_count": row.unread_count,
                 "latest_received_at": row.latest_received_at,
-                "is_read": row.read_id is not None,
             }
             for row in result.all()
         ]
 
-    async def has_received_heart(self, user_id: uuid.UUID, poll_id: uuid.UUID) -> bool:
-        """Return whether user received at least one vote in a poll."""
+    async def count_unread_received_hearts(self, user_id: uuid.UUID) -> int:
+        """Return how many received votes the user has not read yet."""
         result = await self.session.execute(
-            select(func.count(Vote.id)).where(
-                Vote.poll_id == poll_id,
-                Vote.voted_for_id == user_id,
+            select(ReceivedHeartCounter.unread_count).where(
+                ReceivedHeartCounter.user_id == user_id
             )
         )
-        return (result.scalar() or 0) > 0
+        return result.scalar_one_or_none() or 0
 
     async def mark_received_heart_as_read(
         self, user_id: uuid.UUID, poll_id: uuid.UUID
     ) -> bool:
-        """Persist received heart read state if the user received a vote."""
-        if not await self.has_received_heart(user_id, poll_id):
-            return False
+        """Mark a received heart inbox row read in a single statement.
 
-        result = await self.session.execute(
-            select(ReceivedHeartRead).where(
-                ReceivedHeartRead.user_id == user_id,
-                ReceivedHeartRead.poll_id == poll_id,
+        The row is locked and its unread votes are subtracted from the user's
+        unread counter, so concurrent votes and reads keep the counter exact.
+
+        Returns:
+            False if the user received no votes in the poll
+        """
+        previous = (
+            select(ReceivedHeart.id, ReceivedHeart.unread_count)
+            .where(
+                ReceivedHeart.user_id == user_id,
+                ReceivedHeart.poll_id == poll_id,
+            )
+            .with_for_update()
+            .cte("previous_heart")
+        )
+        read = (
+            update(ReceivedHeart)
+            .where(ReceivedHeart.id == previous.c.id, previous.c.unread_count > 0)
+            .values(unread_count=0)
+            .returning(previous.c.unread_count)
+            .cte("read_heart")
+        )
+        uncounted = (
+            update(ReceivedHeartCounter)
+            .where(ReceivedHeartCounter.user_id == user_id, exists(select(read.c.unread_count)))
+            .values(
+                unread_count=func.greatest(
+                    ReceivedHeartCounter.unread_count
+                    - select(read.c.unread_count).scalar_subquery(),
+                    0,
+                ),
+                updated_at=func.now(),
             )
+            .returning(ReceivedHeartCounter.id)
+            .cte("uncounted_hearts")
         )
-        existing = result.scalar_one_or_none()
-        if existing is None:
-            self.session.add(ReceivedHeartRead(user_id=user_id, poll_id=poll_id))
-            await self.session.flush()
-        return True
+
+        result = await self.session.execute(select(previous.c.id).add_cte(uncounted))
+        return result.first() is not None
 
 
 class VoteSessionRepository:
@@ -860,3 +2118,121 @@ class VoteSessionRepository:
         await self.session.flush()
         await self.session.refresh(vote_session)
         return vote_session
+
+    async def save_cursor(
+        self,
+        session_id: uuid.UUID,
+        current_index: int,
+        skipped_poll_ids: list[str],
+        completed_at: datetime | None = None,
+    ) -> bool:
+        """Write a cursor kept outside Postgres back to an ACTIVE session.
+
+        Never moves the cursor backwards, so a stale checkpoint cannot
+        overwrite progress made on the row.
+
+        Args:
+            session_id: Vote session ID
+            current_index: Cursor position
+            skipped_poll_ids: Polls skipped so far
+            completed_at: Completion time, if the cursor reached the end
+
+        Returns:
+            True if the row was updated; False if it was already completed
+        """
+        changes: dict[str, object] = {
+            "current_index": current_index,
+            "skipped_poll_ids": skipped_poll_ids,
+            "updated_at": func.now(),
+        }
+        if completed_at is not None:
+            changes["status"] = "COMPLETED"
+            changes["completed_at"] = completed_at
+
+        result = await self.session.execute(
+            update(VoteSession)
+            .where(
+                VoteSession.id == session_id,
+                VoteSession.status == "ACTIVE",
+                VoteSession.current_index <= current_index,
+            )
+            .values(**changes)
+            .returning(VoteSession.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+
+class PollBroadcastJobRepository:
+    """Repository for admin poll broadcast jobs."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize repository with database session."""
+        self.session = session
+
+    async def create(
+        self,
+        admin_id: uuid.UUID,
+        template_id: uuid.UUID | None,
+        question_text: str,
+        ends_at: datetime,
+        circle_ids: list[uuid.UUID] | None,
+    ) -> PollBroadcastJob:
+        """Create a PENDING broadcast job.
+
+        The job is dispatched through the outbox in the same transaction, so
+        the worker only runs it once the row is committed.
+
+        Args:
+            admin_id: Admin user UUID
+            template_id: Template UUID, if any
+            question_text: Poll question text
+            ends_at: Poll end datetime
+            circle_ids: Selected circles, or None for all active circles
+
+        Returns:
+            Created PollBroadcastJob instance
+        """
+        job = PollBroadcastJob(
+            admin_id=admin_id,
+            template_id=template_id,
+            question_text=question_text,
+            ends_at=ends_at,
+            circle_ids=(
+                sorted({str(circle_id) for circle_id in circle_ids})
+                if circle_ids is not None
+                else None
+            ),
+            failures=[],
+        )
+        self.session.add(job)
+        await self.session.flush()
+        await self.session.refresh(job)
+        return job
+
+    async def find_by_id(
+        self,
+        job_id: uuid.UUID,
+        *,
+        for_update: bool = False,
+    ) -> PollBroadcastJob | None:
+        """Find a broadcast job by ID.
+
+        Args:
+            job_id: Job UUID
+            for_update: Lock the row and reload it, so concurrent runners of
+                the same job process each chunk only once
+
+        Returns:
+            PollBroadcastJob or None
+        """
+        stmt = select(PollBroadcastJob).where(PollBroadcastJob.id == job_id)
+        if for_update:
+            stmt = stmt.with_for_update().execution_options(populate_existing=True)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def save(self, job: PollBroadcastJob) -> PollBroadcastJob:
+        """Persist broadcast job progress."""
+        await self.session.flush()
+        await self.session.refresh(job)
+        return job
@@ -2,14 +2,17 @@
 
 import uuid
 
-from fastapi import APIRouter, Query, status
+from fastapi import APIRouter, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.core.enums import PollStatus, TemplateCategory
+from app.core.etag import not_modified, set_etag
+from app.core.pagination import NEXT_CURSOR_HEADER
 from app.deps import AdminUserDep, CurrentUserDep, PollServiceDep
 from app.modules.polls.schemas import (
     AdminPollCreate,
-    BroadcastPollResponse,
     CategoryInfo,
+    PollBroadcastJobResponse,
     PollCandidatesResponse,
     PollCreate,
     PollListResponse,
@@ -17,6 +20,7 @@ from app.modules.polls.schemas import (
     PollTemplateResponse,
     ReceivedHeartItem,
     ReceivedHeartReadResponse,
+    ReceivedHeartUnreadCountResponse,
     RoundCreate,
     RoundCreateResponse,
     TemplateCreate,
@@ -27,12 +31,17 @@ from app.modules.polls.schemas import (
     VoteRequest,
     VoteResponse,
     VoteSessionAvailabilityResponse,
+    VoteSessionBatchRequest,
+    VoteSessionBatchResponse,
     VoteSessionCreate,
     VoteSessionResponse,
 )
 
 router = APIRouter(prefix="/polls", tags=["Polls"])
 
+# Keep proxies from buffering or caching server-sent events
+LIVE_RESULTS_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 
 @router.get(
     "/me",
@@ -40,12 +49,33 @@ router = APIRouter(prefix="/polls", tags=["Polls"])
     summary="Get my polls",
 )
 async def get_my_polls(
+    response: Response,
     current_user: CurrentUserDep,
     service: PollServiceDep,
     status: PollStatus | None = Query(None, description="Filter by status (ACTIVE or COMPLETED)"),
-) -> list[PollResponse]:
-    """Get all polls from circles the current user belongs to."""
-    return await service.get_my_polls(current_user.id, status)
+    limit: int | None = Query(
+        None, ge=1, le=100, description="Max results (the whole feed when omitted)"
+    ),
+    cursor: str | None = Query(None, description="Cursor from the previous page's X-Next-Cursor"),
+    if_none_match: str | None = Header(None),
+) -> list[PollResponse] | Response:
+    """Get polls from circles the current user belongs to, newest first.
+
+    Without ``limit`` the whole feed is returned, as existing clients expect.
+    With it, the next page's cursor is returned in the X-Next-Cursor header. Pages
+    carry an ETag; sending it back as If-None-Match returns 304 while the
+    page is unchanged.
+    """
+    polls, next_cursor, etag = await service.get_my_polls_if_modified(
+        current_user.id, status, limit=limit, cursor=cursor, if_none_match=if_none_match
+    )
+    if polls is None:
+        return not_modified(etag)
+
+    set_etag(response, etag)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return polls
 
 
 @router.get(
@@ -54,13 +84,36 @@ async def get_my_polls(
     summary="Get hearts received by me",
 )
 async def get_received_hearts(
+    response: Response,
     current_user: CurrentUserDep,
     service: PollServiceDep,
     limit: int = Query(50, ge=1, le=100, description="Max results"),
-    offset: int = Query(0, ge=0, description="Skip results"),
+    cursor: str | None = Query(None, description="Cursor from the previous page's X-Next-Cursor"),
 ) -> list[ReceivedHeartItem]:
-    """Get polls where the current user received votes."""
-    return await service.get_received_hearts(current_user.id, limit=limit, offset=offset)
+    """Get polls where the current user received votes, latest first.
+
+    The next page's cursor is returned in the X-Next-Cursor header.
+    """
+    hearts, next_cursor = await service.get_received_hearts(
+        current_user.id, limit=limit, cursor=cursor
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return hearts
+
+
+@router.get(
+    "/me/received/unread-count",
+    response_model=ReceivedHeartUnreadCountResponse,
+    summary="Get my unread received heart count",
+)
+async def get_received_heart_unread_count(
+    current_user: CurrentUserDep,
+    service: PollServiceDep,
+) -> ReceivedHeartUnreadCountResponse:
+    """Get how many received votes the current user has not read yet."""
+    count = await service.get_received_heart_unread_count(current_user.id)
+    return ReceivedHeartUnreadCountResponse(count=count)
 
 
 @router.post(
@@ -85,9 +138,12 @@ async def mark_received_heart_as_read(
 async def get_templates(
     service: PollServiceDep,
     category: TemplateCategory | None = Query(None, description="Filter by category"),
-) -> list[PollTemplateResponse]:
+) -> Response:
     """Get all active poll templates, optionally filtered by category."""
-    return await service.get_templates(category)
+    return Response(
+        content=await service.get_templates_json(category),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -138,6 +194,26 @@ async def create_round(
     )
 
 
+@router.get(
+    "/circles/{circle_id}/live",
+    response_class=StreamingResponse,
+    summary="Stream live results of a circle's polls",
+)
+async def stream_circle_results(
+    circle_id: uuid.UUID,
+    current_user: CurrentUserDep,
+    service: PollServiceDep,
+    poll_id: list[uuid.UUID] | None = Query(None, description="Only stream these polls"),
+) -> StreamingResponse:
+    """Stream vote deltas for every poll of a circle as server-sent events.
+
+    Pass the poll IDs of a round as repeated ``poll_id`` parameters to follow
+    just that round. Events: ``ready``, ``tally`` and ``resync``.
+    """
+    events = await service.stream_circle_results(circle_id, current_user.id, poll_id)
+    return StreamingResponse(events, media_type="text/event-stream", headers=LIVE_RESULTS_HEADERS)
+
+
 @router.post(
     "/sessions",
     response_model=VoteSessionResponse,
@@ -153,6 +229,8 @@ async def start_vote_session(
     return await service.start_vote_session(
         current_user.id,
         circle_id=session_data.circle_id,
+        include_candidates=session_data.include_candidates,
+        shuffle_candidates=session_data.shuffle_candidates,
     )
 
 
@@ -197,6 +275,25 @@ async def advance_vote_session_poll(
     return await service.advance_vote_session_poll(session_id, current_user.id)
 
 
+@router.post(
+    "/sessions/{session_id}/votes",
+    response_model=VoteSessionBatchResponse,
+    summary="Submit votes and skips for a vote session",
+)
+async def submit_vote_session(
+    session_id: uuid.UUID,
+    batch: VoteSessionBatchRequest,
+    current_user: CurrentUserDep,
+    service: PollServiceDep,
+) -> VoteSessionBatchResponse:
+    """Vote on or skip the next polls of a session in one request.
+
+    Items continue the session queue from its current poll; an item without
+    voted_for_id is a skip. Invalid votes are reported per item.
+    """
+    return await service.submit_vote_session(session_id, current_user.id, batch.items)
+
+
 @router.get(
     "/{poll_id}",
     response_model=PollResponse,
@@ -204,11 +301,41 @@ async def advance_vote_session_poll(
 )
 async def get_poll(
     poll_id: uuid.UUID,
+    response: Response,
     current_user: CurrentUserDep,
     service: PollServiceDep,
-) -> PollResponse:
-    """Get a poll by ID. User must be a member of the poll's circle."""
-    return await service.get_poll(poll_id, current_user.id)
+    if_none_match: str | None = Header(None),
+) -> PollResponse | Response:
+    """Get a poll by ID. User must be a member of the poll's circle.
+
+    The response carries an ETag; sending it back as If-None-Match returns
+    304 until the poll's status or vote count (and so its results) change.
+    """
+    poll, etag = await service.get_poll_if_modified(poll_id, current_user.id, if_none_match)
+    if poll is None:
+        return not_modified(etag)
+
+    set_etag(response, etag)
+    return poll
+
+
+@router.get(
+    "/{poll_id}/live",
+    response_class=StreamingResponse,
+    summary="Stream live results of an active poll",
+)
+async def stream_poll_results(
+    poll_id: uuid.UUID,
+    current_user: CurrentUserDep,
+    service: PollServiceDep,
+) -> StreamingResponse:
+    """Stream an active poll's results as server-sent events.
+
+    Events: ``snapshot``, then ``tally`` deltas, ``resync`` when deltas were
+    dropped, and ``end`` when the poll ends.
+    """
+    events = await service.stream_poll_results(poll_id, current_user.id)
+    return StreamingResponse(events, media_type="text/event-stream", headers=LIVE_RESULTS_HEADERS)
 
 
 @router.post(
@@ -357,8 +484,8 @@ async def update_template(
 
 @router.post(
     "/admin/broadcast",
-    response_model=BroadcastPollResponse,
-    status_code=status.HTTP_201_CREATED,
+    response_model=PollBroadcastJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="[Admin] Broadcast poll to circles",
     tags=["Admin - Polls"],
 )
@@ -366,10 +493,27 @@ async def broadcast_poll(
     request: AdminPollCreate,
     admin_user: AdminUserDep,
     service: PollServiceDep,
-) -> BroadcastPollResponse:
+) -> PollBroadcastJobResponse:
     """Broadcast a poll to multiple circles (Admin only).
 
     Can apply to all active circles or selected circles.
     Supports both template-based and custom questions.
+    Polls are created by a background job; poll
+    GET /polls/admin/broadcast/{job_id} for progress.
     """
     return await service.broadcast_poll(admin_user.id, request)
+
+
+@router.get(
+    "/admin/broadcast/{job_id}",
+    response_model=PollBroadcastJobResponse,
+    summary="[Admin] Get poll broadcast progress",
+    tags=["Admin - Polls"],
+)
+async def get_broadcast_job(
+    job_id: uuid.UUID,
+    admin_user: AdminUserDep,
+    service: PollServiceDep,
+) -> PollBroadcastJobResponse:
+    """Get the progress and failures of a poll broadcast job (Admin only)."""
+    return await service.get_broadcast_job(job_id)
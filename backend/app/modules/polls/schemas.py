@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Literal
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 from app.core.enums import PollStatus, TemplateCategory
 
@@ -28,7 +28,8 @@ class PollTemplateResponse(BaseModel):
     category: TemplateCategory
     question_text: str
     emoji: str | None
-    usage_count: int
+    # Templates are read with their unfolded uses included
+    usage_count: int = Field(validation_alias=AliasChoices("total_usage_count", "usage_count"))
 
 
 class PollCreate(BaseModel):
@@ -112,6 +113,8 @@ class VoteSessionCreate(BaseModel):
     """투표 세션 시작 요청."""
 
     circle_id: uuid.UUID | None = None
+    include_candidates: bool = False
+    shuffle_candidates: bool = False
 
 
 class VoteSessionAvailabilityResponse(BaseModel):
@@ -138,6 +141,8 @@ class VoteSessionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     completed_at: datetime | None
+    # 세션 시작 시 include_candidates 요청에만 포함 (큐 순서)
+    candidates: list[PollCandidatesResponse] | None = None
 
 
 VoteHintTier = Literal["CIRCLE", "TIME", "INITIAL", "FULL"]
@@ -176,11 +181,18 @@ class ReceivedHeartItem(BaseModel):
     question_text: str
     emoji: str | None
     received_count: int
+    unread_count: int = 0
     latest_received_at: datetime
     is_read: bool = False
     free_hint: ReceivedHeartHint
 
 
+class ReceivedHeartUnreadCountResponse(BaseModel):
+    """읽지 않은 받은 하트 수 응답."""
+
+    count: int
+
+
 class ReceivedHeartReadResponse(BaseModel):
     """받은 하트 읽음 처리 응답."""
 
@@ -236,6 +248,38 @@ class VoteResponse(BaseModel):
     message: str
 
 
+class VoteSessionBatchItem(BaseModel):
+    """세션 일괄 제출 항목 - voted_for_id가 없으면 건너뛰기."""
+
+    poll_id: uuid.UUID
+    voted_for_id: uuid.UUID | None = None
+
+
+class VoteSessionBatchRequest(BaseModel):
+    """투표 세션 일괄 제출 요청 - 현재 질문부터 세션 큐 순서대로."""
+
+    items: list[VoteSessionBatchItem] = Field(..., min_length=1, max_length=12)
+
+
+VoteSessionBatchItemStatus = Literal["VOTED", "SKIPPED", "REJECTED"]
+
+
+class VoteSessionBatchItemResult(BaseModel):
+    """일괄 제출 항목별 처리 결과."""
+
+    poll_id: uuid.UUID
+    status: VoteSessionBatchItemStatus
+    vote_id: uuid.UUID | None = None
+    error_code: str | None = None
+
+
+class VoteSessionBatchResponse(BaseModel):
+    """일괄 제출 후 세션 상태와 항목별 결과."""
+
+    session: VoteSessionResponse
+    results: list[VoteSessionBatchItemResult]
+
+
 class CategoryInfo(BaseModel):
     """Schema for template category information."""
 
@@ -320,9 +364,20 @@ class AdminPollCreate(BaseModel):
     apply_to_all: bool = False  # True면 모든 Circle
 
 
-class BroadcastPollResponse(BaseModel):
-    """Schema for broadcast poll response."""
+class PollBroadcastJobResponse(BaseModel):
+    """Schema for an admin poll broadcast job and its progress."""
+
+    model_config = ConfigDict(from_attributes=True)
 
+    id: uuid.UUID
+    status: Literal["PENDING", "RUNNING", "COMPLETED", "FAILED"]
+    template_id: uuid.UUID | None
+    question_text: str
+    ends_at: datetime
+    apply_to_all: bool
     created_count: int
     failed_count: int
-    polls: list[PollResponse]
+    failures: list[dict[str, str]]
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None
@@ -4,32 +4,51 @@ from __future__ import annotations
 
 import logging
 import random
+import time
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING
 
+from pydantic import TypeAdapter
+
+from app.config import get_settings
+from app.core.database import run_after_commit
 from app.core.enums import MemberRole, PollStatus, TemplateCategory
+from app.core.etag import compute_etag, etag_matches
 from app.core.exceptions import (
     AuthorizationError,
     BadRequestException,
     CircleNotFoundError,
+    NotFoundError,
+    PollEndedError,
     PollNotFoundError,
+    ServiceUnavailableError,
 )
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.security import generate_voter_hash
 from app.modules.auth.repository import UserRepository
 from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.notifications.repository import OutboxRepository
+from app.modules.polls.live_results import format_event
+from app.modules.polls.models import Poll
 from app.modules.polls.repository import (
+    CandidateOptionDict,
+    PollBroadcastJobRepository,
     PollRepository,
     TemplateRepository,
+    VoteCastDict,
     VoteRepository,
+    VoteResultDict,
     VoteSessionRepository,
 )
 from app.modules.polls.schemas import (
     CATEGORY_METADATA,
     AdminPollCreate,
-    BroadcastPollResponse,
     CandidateOption,
     CategoryInfo,
+    PollBroadcastJobResponse,
     PollCandidatesResponse,
     PollCreate,
     PollDuration,
@@ -44,12 +63,19 @@ from app.modules.polls.schemas import (
     VoteHintResponse,
     VoteResponse,
     VoteSessionAvailabilityResponse,
+    VoteSessionBatchItem,
+    VoteSessionBatchItemResult,
+    VoteSessionBatchResponse,
     VoteSessionResponse,
 )
 
 if TYPE_CHECKING:
     from app.modules.notifications.service import NotificationService
-    from app.modules.polls.models import Poll, PollTemplate, Vote, VoteSession
+    from app.modules.polls.catalog import TemplateCatalog
+    from app.modules.polls.live_results import LiveResultsHub
+    from app.modules.polls.models import PollTemplate, Vote, VoteSession
+    from app.modules.polls.session_cursors import VoteSessionCursor, VoteSessionCursorStore
+    from app.modules.polls.tallies import LiveTallyStore
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +88,7 @@ class PollService:
     ROUND_MIN_MEMBERS = 5
     SESSION_LIMIT = 12
     SESSION_COOLDOWN = timedelta(hours=1)
+    HINT_TIERS = ("CIRCLE", "TIME", "INITIAL", "FULL")
     FREE_HINT_TIERS = {"CIRCLE", "TIME"}
     ORB_HINT_TIERS = {"CIRCLE", "TIME", "INITIAL", "FULL"}
 
@@ -75,6 +102,12 @@ class PollService:
         notification_service: NotificationService | None = None,
         vote_session_repo: VoteSessionRepository | None = None,
         user_repo: UserRepository | None = None,
+        tally_store: LiveTallyStore | None = None,
+        template_catalog: TemplateCatalog | None = None,
+        cursor_store: VoteSessionCursorStore | None = None,
+        broadcast_job_repo: PollBroadcastJobRepository | None = None,
+        outbox_repo: OutboxRepository | None = None,
+        live_results: LiveResultsHub | None = None,
     ) -> None:
         """Initialize service with repositories."""
         self.template_repo = template_repo
@@ -85,6 +118,12 @@ class PollService:
         self.notification_service = notification_service
         self.vote_session_repo = vote_session_repo
         self.user_repo = user_repo
+        self.tally_store = tally_store
+        self.template_catalog = template_catalog
+        self.cursor_store = cursor_store
+        self.broadcast_job_repo = broadcast_job_repo
+        self.outbox_repo = outbox_repo
+        self.live_results = live_results
 
     @staticmethod
     def _poll_to_response(
@@ -107,7 +146,7 @@ class PollService:
             question_text=poll.question_text,
             status=poll.status,
             ends_at=poll.ends_at,
-            vote_count=poll.vote_count,
+            vote_count=poll.total_vote_count,
             created_at=poll.created_at,
             updated_at=poll.updated_at,
             has_voted=has_voted,
@@ -149,42 +188,57 @@ class PollService:
             completed_at=vote_session.completed_at,
         )
 
+    @staticmethod
+    def _cursor_to_response(
+        cursor: VoteSessionCursor, completed_at: datetime | None
+    ) -> VoteSessionResponse:
+        """Convert a Redis vote session cursor to API response."""
+        poll_ids = [uuid.UUID(poll_id) for poll_id in cursor.poll_ids]
+        return VoteSessionResponse(
+            id=cursor.session_id,
+            user_id=cursor.user_id,
+            circle_id=cursor.circle_id,
+            status="COMPLETED" if cursor.is_complete else "ACTIVE",
+            poll_ids=poll_ids,
+            skipped_poll_ids=[uuid.UUID(poll_id) for poll_id in cursor.skipped_poll_ids],
+            current_index=cursor.current_index,
+            total_count=len(poll_ids),
+            current_poll_id=None if cursor.is_complete else poll_ids[cursor.current_index],
+            created_at=cursor.created_at,
+            updated_at=completed_at or datetime.now(UTC),
+            completed_at=completed_at,
+        )
+
     def _require_vote_session_repo(self) -> VoteSessionRepository:
         """Return vote session repository or fail fast when not wired."""
         if self.vote_session_repo is None:
             raise RuntimeError("VoteSessionRepository is not configured")
         return self.vote_session_repo
 
+    def _require_broadcast_job_repo(self) -> PollBroadcastJobRepository:
+        """Return broadcast job repository or fail fast when not wired."""
+        if self.broadcast_job_repo is None:
+            raise RuntimeError("PollBroadcastJobRepository is not configured")
+        return self.broadcast_job_repo
+
+    def _require_outbox_repo(self) -> OutboxRepository:
+        """Return outbox repository or fail fast when not wired."""
+        if self.outbox_repo is None:
+            raise RuntimeError("OutboxRepository is not configured")
+        return self.outbox_repo
+
+    def _require_live_results(self) -> LiveResultsHub:
+        """Return the live results hub, or fail when streaming is disabled."""
+        if self.live_results is None:
+            raise ServiceUnavailableError("실시간 결과를 사용할 수 없습니다")
+        return self.live_results
+
     def _require_user_repo(self) -> UserRepository:
         """Return user repository or fail fast when not wired."""
         if self.user_repo is None:
             raise RuntimeError("UserRepository is not configured")
         return self.user_repo
 
-    async def _apply_vote_reward(self, voter_id: uuid.UUID) -> None:
-        """Grant the per-vote coin and update the daily streak."""
-        user_repo = self._require_user_repo()
-        updated_user = await user_repo.apply_vote_reward(voter_id)
-        if updated_user is None:
-            raise BadRequestException("User not found")
-
-    @staticmethod
-    def _build_round_robin_queue(polls: list[Poll], limit: int) -> list[Poll]:
-        """Build a cross-circle round-robin queue preserving repository order."""
-        grouped: dict[uuid.UUID, list[Poll]] = {}
-        for poll in polls:
-            grouped.setdefault(poll.circle_id, []).append(poll)
-
-        queue: list[Poll] = []
-        groups = list(grouped.values())
-        while len(queue) < limit and any(groups):
-            for group in groups:
-                if len(queue) >= limit:
-                    break
-                if group:
-                    queue.append(group.pop(0))
-        return queue
-
     async def get_vote_session_availability(
         self,
         user_id: uuid.UUID,
@@ -242,8 +296,15 @@ class PollService:
         user_id: uuid.UUID,
         *,
         circle_id: uuid.UUID | None = None,
+        include_candidates: bool = False,
+        shuffle_candidates: bool = False,
     ) -> VoteSessionResponse:
-        """Create a server-side vote session queue."""
+        """Create a server-side vote session queue.
+
+        With ``include_candidates``, the response also carries each queued
+        poll's candidates (as from get_poll_candidates), computed once per
+        circle; ``shuffle_candidates`` shuffles them per poll.
+        """
         vote_session_repo = self._require_vote_session_repo()
         availability = await self.get_vote_session_availability(user_id)
         if not availability.can_start:
@@ -253,32 +314,121 @@ class PollService:
             is_member = await self.membership_repo.exists(circle_id, user_id)
             if not is_member:
                 raise BadRequestException("You are not a member of this circle")
-            circle_ids = [circle_id]
-        else:
-            memberships = await self.membership_repo.find_by_user_id(user_id)
-            circle_ids = [membership.circle_id for membership in memberships]
 
-        polls = await self.poll_repo.find_by_user_circles(circle_ids, PollStatus.ACTIVE)
-        now = datetime.now(UTC)
-        eligible_polls: list[Poll] = []
-        for poll in polls:
-            if poll.ends_at <= now:
-                continue
-            voter_hash = generate_voter_hash(user_id, poll.id, salt=str(poll.id))
-            has_voted = await self.vote_repo.exists_by_voter_hash(poll.id, voter_hash)
-            if not has_voted:
-                eligible_polls.append(poll)
-
-        queued_polls = self._build_round_robin_queue(
-            eligible_polls,
+        queued_poll_ids = await self.poll_repo.find_session_queue(
+            user_id,
             limit=self.SESSION_LIMIT,
+            circle_id=circle_id,
         )
         vote_session = await vote_session_repo.create(
             user_id=user_id,
             circle_id=circle_id,
-            poll_ids=[poll.id for poll in queued_polls],
+            poll_ids=queued_poll_ids,
         )
-        return self._vote_session_to_response(vote_session)
+        if self.cursor_store is not None and vote_session.status == "ACTIVE":
+            await self.cursor_store.create(vote_session)
+
+        response = self._vote_session_to_response(vote_session)
+        if include_candidates:
+            response.candidates = await self._prefetch_candidates(
+                queued_poll_ids,
+                user_id,
+                circle_id=circle_id,
+                shuffle=shuffle_candidates,
+            )
+        return response
+
+    async def _prefetch_candidates(
+        self,
+        poll_ids: list[uuid.UUID],
+        user_id: uuid.UUID,
+        *,
+        circle_id: uuid.UUID | None = None,
+        shuffle: bool = False,
+    ) -> list[PollCandidatesResponse]:
+        """Build candidates for queued polls with one aggregation per circle.
+
+        Queued polls come from the user's own circles, so no membership
+        check is repeated here.
+        """
+        if circle_id is not None:
+            circle_by_poll = dict.fromkeys(poll_ids, circle_id)
+        else:
+            circle_by_poll = await self.poll_repo.find_circle_ids(poll_ids)
+
+        rows_by_circle = await self.vote_repo.find_candidate_options_by_circle_ids(
+            list(set(circle_by_poll.values())),
+            user_id,
+        )
+        return [
+            self._build_candidates_response(
+                poll_id,
+                rows_by_circle.get(circle_by_poll[poll_id], []),
+                shuffle=shuffle,
+            )
+            for poll_id in poll_ids
+            if poll_id in circle_by_poll
+        ]
+
+    async def persist_vote_session_cursor(
+        self, cursor: VoteSessionCursor
+    ) -> datetime | None:
+        """Write a Redis cursor to its vote_sessions row.
+
+        A complete cursor completes the session and starts the cooldown;
+        otherwise the row is checkpointed and stays ACTIVE.
+
+        Args:
+            cursor: Cursor read from the cursor store
+
+        Returns:
+            Completion time if this call completed the session, else None
+        """
+        vote_session_repo = self._require_vote_session_repo()
+        now = datetime.now(UTC)
+        completed_at = now if cursor.is_complete else None
+        updated = await vote_session_repo.save_cursor(
+            cursor.session_id,
+            cursor.current_index,
+            cursor.skipped_poll_ids,
+            completed_at,
+        )
+        if not updated or completed_at is None:
+            return None
+
+        await self._require_user_repo().update_next_session_at(
+            cursor.user_id,
+            now + self.SESSION_COOLDOWN,
+        )
+        return completed_at
+
+    async def _step_cached_vote_session(
+        self,
+        session_id: uuid.UUID,
+        user_id: uuid.UUID,
+        *,
+        skip: bool,
+    ) -> VoteSessionResponse | None:
+        """Step a session held in the cursor store without touching its row.
+
+        Returns:
+            Session state, or None when the session must be stepped in Postgres
+        """
+        if self.cursor_store is None:
+            return None
+        cursor = await self.cursor_store.step(session_id, user_id, skip=skip)
+        if cursor is None:
+            return None
+        if not cursor.is_complete:
+            return self._cursor_to_response(cursor, None)
+
+        # Also retried by late taps, in case the completing request rolled back
+        completed_at = await self.persist_vote_session_cursor(cursor)
+        await self.cursor_store.mark_idle(session_id)
+        if completed_at is None:
+            # Already completed: the row is the source of truth
+            return None
+        return self._cursor_to_response(cursor, completed_at)
 
     async def skip_vote_session_poll(
         self,
@@ -286,6 +436,10 @@ class PollService:
         user_id: uuid.UUID,
     ) -> VoteSessionResponse:
         """Skip the current poll in a server-side vote session."""
+        cached = await self._step_cached_vote_session(session_id, user_id, skip=True)
+        if cached is not None:
+            return cached
+
         vote_session_repo = self._require_vote_session_repo()
         vote_session = await vote_session_repo.find_by_id_for_user(session_id, user_id)
         if vote_session is None:
@@ -316,6 +470,10 @@ class PollService:
         user_id: uuid.UUID,
     ) -> VoteSessionResponse:
         """Advance the current poll after a successful vote."""
+        cached = await self._step_cached_vote_session(session_id, user_id, skip=False)
+        if cached is not None:
+            return cached
+
         vote_session_repo = self._require_vote_session_repo()
         vote_session = await vote_session_repo.find_by_id_for_user(session_id, user_id)
         if vote_session is None:
@@ -332,6 +490,115 @@ class PollService:
         vote_session = await vote_session_repo.save(vote_session)
         return self._vote_session_to_response(vote_session)
 
+    async def submit_vote_session(
+        self,
+        session_id: uuid.UUID,
+        user_id: uuid.UUID,
+        items: list[VoteSessionBatchItem],
+    ) -> VoteSessionBatchResponse:
+        """Vote on or skip consecutive polls of a session in one call.
+
+        Items must continue the session queue from its current poll. All
+        votes are committed by one statement and the cursor is saved once.
+        A vote that fails validation does not fail the batch: the item is
+        reported as REJECTED and, like a skip, passed over.
+
+        Args:
+            session_id: Vote session ID
+            user_id: Session owner (the voter)
+            items: Ordered votes/skips
+
+        Returns:
+            Session state after the batch and a result per item
+
+        Raises:
+            BadRequestException: If the session is not found or completed,
+                or the items do not follow the queue
+        """
+        vote_session_repo = self._require_vote_session_repo()
+        vote_session = await vote_session_repo.find_by_id_for_user(session_id, user_id)
+        if vote_session is None:
+            raise BadRequestException("Vote session not found")
+
+        current_index = vote_session.current_index
+        skipped_poll_ids = list(vote_session.skipped_poll_ids)
+        cursor = None
+        if self.cursor_store is not None:
+            # Only read: a rejected batch must leave the Redis cursor in place
+            cursor = await self.cursor_store.peek(session_id)
+            if cursor is not None:
+                current_index = cursor.current_index
+                skipped_poll_ids = cursor.skipped_poll_ids
+
+        if vote_session.status == "COMPLETED" or current_index >= len(vote_session.poll_ids):
+            raise BadRequestException(
+                "Vote session already completed", code="VOTE_SESSION_COMPLETED"
+            )
+
+        expected_poll_ids = vote_session.poll_ids[current_index : current_index + len(items)]
+        if [str(item.poll_id) for item in items] != expected_poll_ids:
+            raise BadRequestException(
+                "Items must follow the session queue from the current poll",
+                code="INVALID_SESSION_ORDER",
+            )
+
+        outcomes = await self.vote_repo.cast_votes(
+            user_id,
+            [
+                (
+                    item.poll_id,
+                    item.voted_for_id,
+                    generate_voter_hash(user_id, item.poll_id, salt=str(item.poll_id)),
+                )
+                for item in items
+                if item.voted_for_id is not None
+            ],
+        )
+        outcome_by_poll = {outcome["poll_id"]: outcome for outcome in outcomes}
+
+        results: list[VoteSessionBatchItemResult] = []
+        for item in items:
+            if item.voted_for_id is None:
+                results.append(VoteSessionBatchItemResult(poll_id=item.poll_id, status="SKIPPED"))
+            else:
+                outcome = outcome_by_poll.get(item.poll_id)
+                error_code = self._vote_rejection_code(outcome, user_id, item.voted_for_id)
+                if outcome is not None and error_code is None:
+                    await self._after_vote_cast(outcome, item.voted_for_id)
+                    results.append(
+                        VoteSessionBatchItemResult(
+                            poll_id=item.poll_id,
+                            status="VOTED",
+                            vote_id=outcome["vote_id"],
+                        )
+                    )
+                    continue
+                results.append(
+                    VoteSessionBatchItemResult(
+                        poll_id=item.poll_id,
+                        status="REJECTED",
+                        error_code=error_code,
+                    )
+                )
+            if str(item.poll_id) not in skipped_poll_ids:
+                skipped_poll_ids.append(str(item.poll_id))
+
+        vote_session.current_index = current_index + len(items)
+        vote_session.skipped_poll_ids = skipped_poll_ids
+        if vote_session.current_index >= len(vote_session.poll_ids):
+            await self._complete_vote_session(vote_session, user_id)
+
+        vote_session = await vote_session_repo.save(vote_session)
+        if self.cursor_store is not None and cursor is not None:
+            # The row holds the cursor from now on; later steps run on it
+            run_after_commit(
+                vote_session_repo.session, partial(self.cursor_store.discard, session_id)
+            )
+        return VoteSessionBatchResponse(
+            session=self._vote_session_to_response(vote_session),
+            results=results,
+        )
+
     async def get_templates(
         self, category: TemplateCategory | None = None
     ) -> list[PollTemplateResponse]:
@@ -343,9 +610,32 @@ class PollService:
         Returns:
             List of PollTemplateResponse
         """
+        if self.template_catalog is not None:
+            snapshot = await self.template_catalog.get(self.template_repo)
+            return snapshot.get_templates(category)
+
         templates = await self.template_repo.find_all(category)
         return [PollTemplateResponse.model_validate(t) for t in templates]
 
+    async def get_templates_json(self, category: TemplateCategory | None = None) -> bytes:
+        """Get the serialized JSON body of get_templates.
+
+        With the template catalog enabled the payload is serialized once per
+        catalog version and served without touching Postgres.
+
+        Args:
+            category: Optional category filter
+
+        Returns:
+            JSON-encoded list of PollTemplateResponse
+        """
+        if self.template_catalog is not None:
+            snapshot = await self.template_catalog.get(self.template_repo)
+            return snapshot.get_templates_json(category)
+
+        templates = await self.get_templates(category)
+        return TypeAdapter(list[PollTemplateResponse]).dump_json(templates)
+
     async def get_poll(
         self,
         poll_id: uuid.UUID,
@@ -364,7 +654,42 @@ class PollService:
             PollNotFoundError: If poll not found
             BadRequestException: If user is not a member of the poll's circle
         """
-        poll = await self.poll_repo.find_by_id(poll_id)
+        poll = await self._get_member_poll(poll_id, user_id)
+        return await self._render_poll(poll, user_id)
+
+    async def get_poll_if_modified(
+        self,
+        poll_id: uuid.UUID,
+        user_id: uuid.UUID,
+        if_none_match: str | None = None,
+    ) -> tuple[PollResponse | None, str]:
+        """Get a poll by ID unless the client's copy is still current.
+
+        The ETag only depends on the poll row (status and vote count, which
+        also moves when the user votes), so a matching If-None-Match is
+        answered before has_voted and the results are computed.
+
+        Args:
+            poll_id: UUID of the poll
+            user_id: UUID of the requesting user (for membership check)
+            if_none_match: The request's If-None-Match header
+
+        Returns:
+            Tuple of (PollResponse, or None if the ETag matched; ETag)
+
+        Raises:
+            PollNotFoundError: If poll not found
+            BadRequestException: If user is not a member of the poll's circle
+        """
+        poll = await self._get_member_poll(poll_id, user_id)
+        etag = compute_etag(poll.id, user_id, poll.status, poll.total_vote_count)
+        if etag_matches(if_none_match, etag):
+            return None, etag
+        return await self._render_poll(poll, user_id), etag
+
+    async def _get_member_poll(self, poll_id: uuid.UUID, user_id: uuid.UUID) -> Poll:
+        """Load a poll, checking that the user belongs to its circle."""
+        poll = await self.poll_repo.find_by_id(poll_id, with_totals=True)
         if poll is None:
             raise PollNotFoundError()
 
@@ -372,37 +697,193 @@ class PollService:
         is_member = await self.membership_repo.exists(poll.circle_id, user_id)
         if not is_member:
             raise BadRequestException("You are not a member of this circle")
+        return poll
 
+    async def _render_poll(self, poll: Poll, user_id: uuid.UUID) -> PollResponse:
+        """Build a poll's response with the user's voted state and results."""
         # Check if user has voted
-        voter_hash = generate_voter_hash(user_id, poll_id, salt=str(poll_id))
-        has_voted = await self.vote_repo.exists_by_voter_hash(poll_id, voter_hash)
+        voter_hash = generate_voter_hash(user_id, poll.id, salt=str(poll.id))
+        has_voted = await self.vote_repo.exists_by_voter_hash(poll.id, voter_hash)
 
         # Get results if user has voted or poll is completed
         results = None
         if has_voted or poll.status == PollStatus.COMPLETED:
-            results = await self.get_results(poll_id)
+            results = await self.get_results(poll.id)
 
         # Build response with additional fields
         return self._poll_to_response(poll, has_voted=has_voted, results=results)
 
+    async def stream_poll_results(
+        self,
+        poll_id: uuid.UUID,
+        user_id: uuid.UUID,
+    ) -> AsyncIterator[str]:
+        """Open a server-sent events stream of an active poll's results.
+
+        The stream starts with a ``snapshot`` event, then sends coalesced
+        ``tally`` deltas of committed votes, heartbeats while idle, and
+        ``end`` when the poll ends. Recipients are only included once the
+        user has voted; before that only the vote count moves.
+
+        Args:
+            poll_id: UUID of the poll
+            user_id: UUID of the requesting user (for membership check)
+
+        Returns:
+            Async iterator of encoded events
+
+        Raises:
+            PollNotFoundError: If poll not found
+            BadRequestException: If user is not a member of the poll's circle
+            PollEndedError: If the poll is not active
+            ServiceUnavailableError: If live results are disabled
+        """
+        live_results = self._require_live_results()
+        poll = await self._get_member_poll(poll_id, user_id)
+        if poll.status != PollStatus.ACTIVE:
+            raise PollEndedError()
+
+        voter_hash = generate_voter_hash(user_id, poll_id, salt=str(poll_id))
+        visible = await self.vote_repo.exists_by_voter_hash(poll_id, voter_hash)
+        stream_seconds = min(
+            (poll.ends_at - datetime.now(UTC)).total_seconds(),
+            get_settings().live_results_max_stream_seconds,
+        )
+        return self._poll_results_events(
+            live_results, poll.circle_id, poll_id, visible, time.monotonic() + stream_seconds
+        )
+
+    async def _poll_results_events(
+        self,
+        live_results: LiveResultsHub,
+        circle_id: uuid.UUID,
+        poll_id: uuid.UUID,
+        visible: bool,
+        deadline: float,
+    ) -> AsyncIterator[str]:
+        poll_ids = {str(poll_id)}
+        async with live_results.subscribe(
+            circle_id, poll_ids, poll_ids if visible else set()
+        ) as subscriber:
+            # Read after subscribing, so votes committed meanwhile are not missed
+            results = None
+            if visible:
+                results = self._build_result_items(await self._get_live_results(poll_id))
+                vote_count = sum(result.vote_count for result in results)
+            else:
+                vote_count = await self.vote_repo.count_by_poll_id(poll_id)
+            # End the read transaction so no connection is held while streaming
+            await self.vote_repo.session.commit()
+
+            yield format_event(
+                "snapshot",
+                {
+                    "poll_id": str(poll_id),
+                    "vote_count": vote_count,
+                    "results": (
+                        [result.model_dump(mode="json") for result in results]
+                        if results is not None
+                        else None
+                    ),
+                },
+            )
+            async for chunk in live_results.stream(subscriber, deadline):
+                yield chunk
+
+    async def stream_circle_results(
+        self,
+        circle_id: uuid.UUID,
+        user_id: uuid.UUID,
+        poll_ids: list[uuid.UUID] | None = None,
+    ) -> AsyncIterator[str]:
+        """Open a server-sent events stream of a circle's (or round's) results.
+
+        Sends ``ready`` once subscribed (clients fetch current results after
+        it), then coalesced ``tally`` deltas for every poll of the circle, or
+        only ``poll_ids``. Recipients are only included for polls the user
+        had voted in when the stream opened.
+
+        Args:
+            circle_id: UUID of the circle
+            user_id: UUID of the requesting user (for membership check)
+            poll_ids: Optional polls to stream, e.g. one round
+
+        Returns:
+            Async iterator of encoded events
+
+        Raises:
+            BadRequestException: If user is not a member of the circle
+            ServiceUnavailableError: If live results are disabled
+        """
+        live_results = self._require_live_results()
+        if not await self.membership_repo.exists(circle_id, user_id):
+            raise BadRequestException("You are not a member of this circle")
+
+        active_polls = await self.poll_repo.find_active_by_circle_id(circle_id)
+        voted_poll_ids = await self.vote_repo.find_voted_poll_ids(
+            [
+                (poll.id, generate_voter_hash(user_id, poll.id, salt=str(poll.id)))
+                for poll in active_polls
+            ]
+        )
+        # End the read transaction so no connection is held while streaming
+        await self.vote_repo.session.commit()
+
+        return self._circle_results_events(
+            live_results,
+            circle_id,
+            {str(poll_id) for poll_id in poll_ids} if poll_ids else None,
+            {str(poll_id) for poll_id in voted_poll_ids},
+            time.monotonic() + get_settings().live_results_max_stream_seconds,
+        )
+
+    @staticmethod
+    async def _circle_results_events(
+        live_results: LiveResultsHub,
+        circle_id: uuid.UUID,
+        poll_ids: set[str] | None,
+        visible_poll_ids: set[str],
+        deadline: float,
+    ) -> AsyncIterator[str]:
+        async with live_results.subscribe(circle_id, poll_ids, visible_poll_ids) as subscriber:
+            yield format_event("ready", {"circle_id": str(circle_id)})
+            async for chunk in live_results.stream(subscriber, deadline):
+                yield chunk
+
     async def get_received_hearts(
         self,
         user_id: uuid.UUID,
         limit: int = 50,
-        offset: int = 0,
-    ) -> list[ReceivedHeartItem]:
-        """Get polls where the current user received votes.
+        cursor: str | None = None,
+    ) -> tuple[list[ReceivedHeartItem], str | None]:
+        """Get a page of polls where the current user received votes.
+
+        This powers the first-class Inbox/받은 하트 surface, served from the
+        user's received_hearts rows that votes and read marks keep current.
 
-        This powers the first-class Inbox/받은 하트 surface. Read state is
-        persisted per user and poll in received_heart_reads.
+        Args:
+            user_id: UUID of the user
+            limit: Maximum number of results
+            cursor: Opaque cursor from the previous page
+
+        Returns:
+            Tuple of (ReceivedHeartItem list, cursor of the next page or None)
+
+        Raises:
+            BadRequestException: If the cursor is malformed
         """
+        before = decode_cursor(cursor) if cursor else None
         rows = await self.vote_repo.find_received_hearts_for_user(
             user_id,
-            limit=limit,
-            offset=offset,
+            limit=limit + 1,
+            before=before,
         )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["latest_received_at"], rows[-1]["poll_id"])
 
-        return [
+        hearts = [
             ReceivedHeartItem(
                 poll_id=row["poll_id"],
                 circle_id=row["circle_id"],
@@ -410,8 +891,9 @@ class PollService:
                 question_text=row["question_text"],
                 emoji=row["emoji"],
                 received_count=row["received_count"],
+                unread_count=row["unread_count"],
                 latest_received_at=row["latest_received_at"],
-                is_read=row["is_read"],
+                is_read=row["unread_count"] == 0,
                 free_hint=ReceivedHeartHint(
                     circle_name=row["circle_name"],
                     time_label="최근",
@@ -419,6 +901,11 @@ class PollService:
             )
             for row in rows
         ]
+        return hearts, next_cursor
+
+    async def get_received_heart_unread_count(self, user_id: uuid.UUID) -> int:
+        """Get how many received votes the user has not read yet."""
+        return await self.vote_repo.count_unread_received_hearts(user_id)
 
     async def mark_received_heart_as_read(
         self,
@@ -451,8 +938,19 @@ class PollService:
             circle_id=poll.circle_id,
             requester_id=user_id,
         )
+        return self._build_candidates_response(poll.id, rows, shuffle=shuffle)
 
+    def _build_candidates_response(
+        self,
+        poll_id: uuid.UUID,
+        rows: list[CandidateOptionDict],
+        *,
+        shuffle: bool = False,
+    ) -> PollCandidatesResponse:
+        """Select a poll's candidates from its circle's candidate rows."""
         if shuffle:
+            # Rows may be shared by every poll of the circle
+            rows = list(rows)
             random.SystemRandom().shuffle(rows)
 
         selected_rows = rows[: self.CANDIDATE_COUNT]
@@ -463,7 +961,7 @@ class PollService:
         )
 
         return PollCandidatesResponse(
-            poll_id=poll.id,
+            poll_id=poll_id,
             status=status,
             required_count=self.CANDIDATE_COUNT,
             candidates=[
@@ -515,7 +1013,16 @@ class PollService:
                 code="ROUND_ALREADY_ACTIVE",
             )
 
-        candidates = await self.template_repo.find_round_candidates(circle_id)
+        candidates: Sequence[PollTemplate | PollTemplateResponse]
+        if self.template_catalog is not None:
+            snapshot = await self.template_catalog.get(self.template_repo)
+            recent_template_ids = await self.template_repo.find_recent_template_ids(circle_id)
+            candidates = sorted(
+                snapshot.round_candidates,
+                key=lambda template: template.id in recent_template_ids,
+            )
+        else:
+            candidates = await self.template_repo.find_round_candidates(circle_id)
         selected_templates = self._select_round_templates(candidates)
         if len(selected_templates) < self.ROUND_POLL_COUNT:
             raise BadRequestException(
@@ -540,14 +1047,6 @@ class PollService:
             await self.template_repo.increment_usage_count(template.id)
             polls.append(poll)
 
-        try:
-            from app.tasks.notification_tasks import schedule_poll_deadline_notifications
-
-            for poll in polls:
-                schedule_poll_deadline_notifications(str(poll.id), poll.ends_at)
-        except Exception as error:
-            logger.error("Failed to schedule round deadline notifications: %s", error)
-
         if self.notification_service and polls:
             try:
                 members = await self.membership_repo.find_by_circle_id(circle_id)
@@ -567,16 +1066,16 @@ class PollService:
 
     def _select_round_templates(
         self,
-        templates: list[PollTemplate],
-    ) -> list[PollTemplate]:
+        templates: Sequence[PollTemplate | PollTemplateResponse],
+    ) -> list[PollTemplate | PollTemplateResponse]:
         """Select templates round-robin by category while preserving repo priority."""
-        buckets: dict[TemplateCategory, list[PollTemplate]] = {
+        buckets: dict[TemplateCategory, list[PollTemplate | PollTemplateResponse]] = {
             category: [] for category in TemplateCategory
         }
         for template in templates:
             buckets[template.category].append(template)
 
-        selected: list[PollTemplate] = []
+        selected: list[PollTemplate | PollTemplateResponse] = []
         while len(selected) < self.ROUND_POLL_COUNT and any(buckets.values()):
             for category in TemplateCategory:
                 if buckets[category]:
@@ -629,15 +1128,10 @@ class PollService:
         # Increment template usage count
         await self.template_repo.increment_usage_count(poll_data.template_id)
 
-        # Schedule deadline reminders and result notification.
-        try:
-            from app.tasks.notification_tasks import schedule_poll_deadline_notifications
-
-            schedule_poll_deadline_notifications(str(poll.id), poll.ends_at)
-        except Exception as e:
-            logger.error("Failed to schedule poll deadline notifications: %s", e)
+        # Deadline reminders and closing are handled by app.tasks.deadline_tasks
 
-        # 🔔 Send poll started notification (excluding creator)
+        # 🔔 Send poll started notification (excluding creator); the push is
+        # queued in the outbox and sent after the request commits
         if self.notification_service:
             try:
                 members = await self.membership_repo.find_by_circle_id(circle_id)
@@ -692,57 +1186,65 @@ class PollService:
             AuthorizationError: If voter is not a member of the poll's Circle
             BadRequestException: If poll ended, self-vote, or already voted
         """
-        # Verify poll exists and is active
-        poll = await self.poll_repo.find_by_id(poll_id)
-        if poll is None:
+        # Generate anonymous voter hash (using poll_id as salt for consistency)
+        voter_hash = generate_voter_hash(voter_id, poll_id, salt=str(poll_id))
+
+        # Validate, insert, count and reward in a single round trip
+        outcome = await self.vote_repo.cast_vote(
+            poll_id=poll_id,
+            voter_id=voter_id,
+            voter_hash=voter_hash,
+            voted_for_id=voted_for_id,
+        )
+        if outcome is None:
             raise PollNotFoundError(str(poll_id))
 
-        is_member = await self.membership_repo.exists(poll.circle_id, voter_id)
-        if not is_member:
+        if not outcome["voter_is_member"]:
             raise AuthorizationError("You must be a Circle member to vote")
 
-        is_valid_target = await self.membership_repo.exists(poll.circle_id, voted_for_id)
-        if not is_valid_target:
+        if not outcome["target_is_member"]:
             raise BadRequestException(
                 "Vote target must be a member of the poll's Circle",
                 code="INVALID_VOTE_TARGET",
             )
 
-        if poll.status != PollStatus.ACTIVE:
+        if outcome["status"] != PollStatus.ACTIVE:
             raise BadRequestException("Poll has ended")
 
         # Prevent self-voting
         if voter_id == voted_for_id:
             raise BadRequestException("You cannot vote for yourself")
 
-        # Generate anonymous voter hash (using poll_id as salt for consistency)
-        voter_hash = generate_voter_hash(voter_id, poll_id, salt=str(poll_id))
-
-        # Check for duplicate vote
-        has_voted = await self.vote_repo.exists_by_voter_hash(poll_id, voter_hash)
-        if has_voted:
+        # Nothing inserted means uq_poll_voter already had this voter
+        if outcome["vote_id"] is None:
             raise BadRequestException("You have already voted in this poll")
 
-        # Create vote (with voter_id for Orb Mode feature)
-        await self.vote_repo.create(
-            poll_id=poll_id,
-            voter_id=voter_id,
-            voter_hash=voter_hash,
-            voted_for_id=voted_for_id,
-        )
+        if not outcome["rewarded"]:
+            raise BadRequestException("User not found")
+
+        await self._after_vote_cast(outcome, voted_for_id)
+
+        # The poll is known to exist, so skip get_results' re-read
+        vote_results = await self._get_live_results(poll_id, uncommitted_vote_for=voted_for_id)
 
-        # Increment poll vote count
-        await self.poll_repo.increment_vote_count(poll_id)
+        return VoteResponse(
+            success=True,
+            results=self._build_result_items(vote_results),
+            message="Vote recorded successfully",
+        )
 
-        # Grant a coin and update the daily streak
-        await self._apply_vote_reward(voter_id)
+    async def _after_vote_cast(self, outcome: VoteCastDict, voted_for_id: uuid.UUID) -> None:
+        """Notify the recipient, bump the live tally and stream a cast vote."""
+        poll_id = outcome["poll_id"]
 
         # 🔔 Send "someone chose you" notification
         if self.notification_service:
             try:
                 await self.notification_service.send_vote_received(
-                    poll=poll,
-                    voted_for_id=voted_for_id,
+                    voted_for_id,
+                    poll_id,
+                    outcome["circle_id"],
+                    outcome["question_text"],
                 )
                 logger.info(
                     "Vote received notification sent: poll_id=%s, voted_for=%s",
@@ -752,14 +1254,37 @@ class PollService:
             except Exception as e:
                 logger.error("Failed to send vote received notification: %s", e)
 
-        # Get results
-        results = await self.get_results(poll_id)
+        if self.tally_store:
+            run_after_commit(
+                self.vote_repo.session,
+                partial(self.tally_store.increment, poll_id, voted_for_id),
+            )
+
+        if self.live_results:
+            self.live_results.publish_after_commit(
+                self.vote_repo.session, outcome["circle_id"], poll_id, voted_for_id
+            )
 
-        return VoteResponse(
-            success=True,
-            results=results,
-            message="Vote recorded successfully",
-        )
+    @staticmethod
+    def _vote_rejection_code(
+        outcome: VoteCastDict | None,
+        voter_id: uuid.UUID,
+        voted_for_id: uuid.UUID,
+    ) -> str | None:
+        """Return why a batched vote was not recorded, checked in vote()'s order."""
+        if outcome is None:
+            return "POLL_NOT_FOUND"
+        if not outcome["voter_is_member"]:
+            return "NOT_CIRCLE_MEMBER"
+        if not outcome["target_is_member"]:
+            return "INVALID_VOTE_TARGET"
+        if outcome["status"] != PollStatus.ACTIVE:
+            return "POLL_ENDED"
+        if voter_id == voted_for_id:
+            return "SELF_VOTE"
+        if outcome["vote_id"] is None:
+            return "ALREADY_VOTED"
+        return None
 
     async def get_results(self, poll_id: uuid.UUID) -> list[PollResultItem]:
         """Get poll results.
@@ -778,9 +1303,72 @@ class PollService:
         if poll is None:
             raise PollNotFoundError(str(poll_id))
 
+        # Completed polls are final: read the snapshot written by close_poll
+        if poll.status == PollStatus.COMPLETED:
+            snapshot = await self.vote_repo.find_materialized_results(poll_id)
+            if snapshot or poll.vote_count == 0:
+                return [
+                    PollResultItem(
+                        user_id=row["user_id"],
+                        nickname=None,
+                        profile_emoji="",
+                        vote_count=row["vote_count"],
+                        vote_percentage=row["vote_percentage"],
+                        rank=row["rank"],
+                    )
+                    for row in snapshot
+                ]
+
+        vote_results = await self._get_live_results(poll_id)
+        return self._build_result_items(vote_results)
+
+    async def _get_live_results(
+        self,
+        poll_id: uuid.UUID,
+        uncommitted_vote_for: uuid.UUID | None = None,
+    ) -> list[VoteResultDict]:
+        """Get current tallies, from Redis when available, else from Postgres.
+
+        Args:
+            poll_id: UUID of the poll
+            uncommitted_vote_for: Recipient of a vote this transaction cast but
+                has not committed; Redis only counts it after the commit, so it
+                is added to cached results and left out of the seed
+        """
+        if self.tally_store:
+            cached = await self.tally_store.get(poll_id)
+            if cached is not None:
+                if uncommitted_vote_for is None:
+                    return cached
+                return self._add_vote(cached, uncommitted_vote_for, 1)
+
         # Get vote results from repository
         vote_results = await self.vote_repo.get_results_by_poll_id(poll_id)
+        if self.tally_store:
+            committed = vote_results
+            if uncommitted_vote_for is not None:
+                committed = self._add_vote(vote_results, uncommitted_vote_for, -1)
+            await self.tally_store.seed(poll_id, committed)
+        return vote_results
 
+    @staticmethod
+    def _add_vote(
+        vote_results: list[VoteResultDict], voted_for_id: uuid.UUID, amount: int
+    ) -> list[VoteResultDict]:
+        """Return tallies with ``amount`` votes added for a user, re-ordered."""
+        counts = {row["user_id"]: row["vote_count"] for row in vote_results}
+        counts[voted_for_id] = counts.get(voted_for_id, 0) + amount
+        results: list[VoteResultDict] = [
+            {"user_id": user_id, "vote_count": count}
+            for user_id, count in counts.items()
+            if count > 0
+        ]
+        results.sort(key=lambda row: (-row["vote_count"], str(row["user_id"])))
+        return results
+
+    @staticmethod
+    def _build_result_items(vote_results: list[VoteResultDict]) -> list[PollResultItem]:
+        """Build ranked result items with percentages from aggregated votes."""
         # Calculate total votes
         total_votes = sum(result["vote_count"] for result in vote_results)
 
@@ -818,8 +1406,13 @@ class PollService:
         if poll is None:
             raise PollNotFoundError(str(poll_id))
 
-        # Update poll status to COMPLETED
+        # Update poll status to COMPLETED, settle its vote count and snapshot
+        # the final rankings
         await self.poll_repo.update_status(poll_id, PollStatus.COMPLETED)
+        await self.poll_repo.fold_vote_deltas(poll_ids=[poll_id])
+        await self.vote_repo.materialize_results(poll_id)
+        if self.tally_store:
+            await self.tally_store.discard(poll_id)
 
         # 🔔 Send poll ended notification to all circle members
         if self.notification_service:
@@ -843,7 +1436,11 @@ class PollService:
             List of CategoryInfo with category metadata and question counts
         """
         # Get template counts by category
-        category_counts = await self.template_repo.count_by_category()
+        if self.template_catalog is not None:
+            snapshot = await self.template_catalog.get(self.template_repo)
+            category_counts = snapshot.category_counts
+        else:
+            category_counts = await self.template_repo.count_by_category()
 
         # Build category info list
         categories = []
@@ -865,33 +1462,129 @@ class PollService:
         return categories
 
     async def get_my_polls(
-        self, user_id: uuid.UUID, status: PollStatus | None = None
-    ) -> list[PollResponse]:
-        """Get all polls from circles the user belongs to.
+        self,
+        user_id: uuid.UUID,
+        status: PollStatus | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+    ) -> tuple[list[PollResponse], str | None]:
+        """Get a page of polls from circles the user belongs to, newest first.
 
         Args:
             user_id: UUID of the user
             status: Optional status filter (ACTIVE or COMPLETED)
+            limit: Maximum number of results (None for the whole feed)
+            cursor: Opaque cursor from the previous page
 
         Returns:
-            List of PollResponse from user's circles
+            Tuple of (PollResponse list, cursor of the next page or None)
+
+        Raises:
+            BadRequestException: If the cursor is malformed
         """
+        polls, next_cursor, _ = await self.get_my_polls_if_modified(
+            user_id, status, limit=limit, cursor=cursor
+        )
+        return polls or [], next_cursor
+
+    async def get_my_polls_if_modified(
+        self,
+        user_id: uuid.UUID,
+        status: PollStatus | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        if_none_match: str | None = None,
+    ) -> tuple[list[PollResponse] | None, str | None, str]:
+        """Get a page of the user's poll feed unless the client's copy is current.
+
+        The ETag is the user's feed version: a hash of the page's polls as
+        the user sees them (status, vote count, circle and template fields).
+        When the request carries If-None-Match, the version is read first
+        with one light query, so a match skips loading the polls, voted
+        state and winners and serializing the page.
+
+        Args:
+            user_id: UUID of the user
+            status: Optional status filter (ACTIVE or COMPLETED)
+            limit: Maximum number of results (None for the whole feed)
+            cursor: Opaque cursor from the previous page
+            if_none_match: The request's If-None-Match header
+
+        Returns:
+            Tuple of (PollResponse list, or None if the ETag matched;
+            cursor of the next page or None; ETag)
+
+        Raises:
+            BadRequestException: If the cursor is malformed
+        """
+        before = decode_cursor(cursor) if cursor else None
+        # One extra row tells whether another page exists
+        fetch_limit = None if limit is None else limit + 1
+
         # Get all circle IDs the user belongs to
         memberships = await self.membership_repo.find_by_user_id(user_id)
         circle_ids = [m.circle_id for m in memberships]
 
         if not circle_ids:
-            return []
+            etag = self._feed_etag(user_id, [], has_more=False)
+            return (None if etag_matches(if_none_match, etag) else []), None, etag
+
+        if if_none_match:
+            versions = await self.poll_repo.find_feed_versions(
+                circle_ids, status, limit=fetch_limit, before=before
+            )
+            has_more = limit is not None and len(versions) > limit
+            etag = self._feed_etag(user_id, versions[:limit], has_more=has_more)
+            if etag_matches(if_none_match, etag):
+                return None, None, etag
 
         # Get polls from user's circles (with circle and template eager loaded)
-        polls = await self.poll_repo.find_by_user_circles(circle_ids, status)
+        polls = await self.poll_repo.find_by_user_circles(
+            circle_ids, status, limit=fetch_limit, before=before
+        )
+        next_cursor = None
+        if limit is not None and len(polls) > limit:
+            polls = polls[:limit]
+            next_cursor = encode_cursor(polls[-1].created_at, polls[-1].id)
+
+        etag = self._feed_etag(
+            user_id,
+            [
+                (
+                    poll.id,
+                    poll.status,
+                    poll.total_vote_count,
+                    poll.circle.name if poll.circle else None,
+                    poll.circle.member_count if poll.circle else None,
+                    poll.template.emoji if poll.template else None,
+                )
+                for poll in polls
+            ],
+            has_more=next_cursor is not None,
+        )
+
+        # Resolve voted status and winners for all polls in bulk
+        voted_poll_ids = await self.vote_repo.find_voted_poll_ids(
+            [(poll.id, generate_voter_hash(user_id, poll.id, salt=str(poll.id))) for poll in polls]
+        )
+        completed_polls = [poll for poll in polls if poll.status == PollStatus.COMPLETED]
+        top_results = await self.vote_repo.find_materialized_winners(
+            [poll.id for poll in completed_polls]
+        )
+        # Polls closed before results were materialized fall back to live tallies
+        unmaterialized_ids = [
+            poll.id
+            for poll in completed_polls
+            if poll.id not in top_results and poll.vote_count > 0
+        ]
+        if unmaterialized_ids:
+            top_results.update(
+                await self.vote_repo.get_top_results_by_poll_ids(unmaterialized_ids)
+            )
 
         # Build responses with extended fields for each poll
         responses = []
         for poll in polls:
-            voter_hash = generate_voter_hash(user_id, poll.id, salt=str(poll.id))
-            has_voted = await self.vote_repo.exists_by_voter_hash(poll.id, voter_hash)
-
             # Extract circle info (eager loaded)
             circle_name = poll.circle.name if poll.circle else None
             total_members = poll.circle.member_count if poll.circle else None
@@ -902,22 +1595,16 @@ class PollService:
             # Get winner info for completed polls
             winner_name = None
             winner_vote_count = None
-            if poll.status == PollStatus.COMPLETED:
-                results = await self.get_results(poll.id)
-                if results:
-                    # Find the winner (rank 1 or highest vote count)
-                    winner = next(
-                        (r for r in results if r.rank == 1),
-                        max(results, key=lambda r: r.vote_count) if results else None,
-                    )
-                    if winner:
-                        winner_name = winner.nickname or "알 수 없음"
-                        winner_vote_count = winner.vote_count
+            winner = top_results.get(poll.id)
+            if winner is not None:
+                # Results are anonymous, so the winner's nickname is not resolved here
+                winner_name = "알 수 없음"
+                winner_vote_count = winner["vote_count"]
 
             responses.append(
                 self._poll_to_response(
                     poll,
-                    has_voted=has_voted,
+                    has_voted=poll.id in voted_poll_ids,
                     circle_name=circle_name,
                     emoji=emoji,
                     total_members=total_members,
@@ -926,7 +1613,21 @@ class PollService:
                 )
             )
 
-        return responses
+        return responses, next_cursor, etag
+
+    @staticmethod
+    def _feed_etag(
+        user_id: uuid.UUID,
+        versions: list[tuple[object, ...]],
+        *,
+        has_more: bool,
+    ) -> str:
+        """Hash a feed page's poll versions into the user's feed ETag.
+
+        A user's own vote moves the poll's vote count, so has_voted needs no
+        part of its own; winners only change with the status.
+        """
+        return compute_etag(user_id, has_more, *versions)
 
     # ==================== Admin Methods ====================
 
@@ -969,14 +1670,19 @@ class PollService:
         Raises:
             PollNotFoundError: If poll not found
         """
-        poll = await self.poll_repo.find_by_id(poll_id)
+        poll = await self.poll_repo.find_by_id(poll_id, with_totals=True)
         if poll is None:
             raise PollNotFoundError(str(poll_id))
 
         await self.poll_repo.update_status(poll_id, status)
+        if status == PollStatus.COMPLETED:
+            await self.poll_repo.fold_vote_deltas(poll_ids=[poll_id])
+            await self.vote_repo.materialize_results(poll_id)
+            if self.tally_store:
+                await self.tally_store.discard(poll_id)
 
         # Refresh poll data
-        updated_poll = await self.poll_repo.find_by_id(poll_id)
+        updated_poll = await self.poll_repo.find_by_id(poll_id, with_totals=True)
         return self._poll_to_response(updated_poll)
 
     async def get_all_templates(
@@ -1022,6 +1728,9 @@ class PollService:
         template = await self.template_repo.create_template(
             category, question_text, emoji
         )
+        if self.template_catalog is not None:
+            # Other workers must not reload before the write is visible
+            run_after_commit(self.template_repo.session, self.template_catalog.invalidate)
         return PollTemplateResponse.model_validate(template)
 
     async def update_template(
@@ -1052,6 +1761,9 @@ class PollService:
         )
         if template is None:
             raise BadRequestException("Template not found")
+        if self.template_catalog is not None:
+            # Other workers must not reload before the write is visible
+            run_after_commit(self.template_repo.session, self.template_catalog.invalidate)
         return PollTemplateResponse.model_validate(template)
 
     @staticmethod
@@ -1108,34 +1820,44 @@ class PollService:
             [vote.id for vote in votes]
         )
         hint_map = {
-            (hint.vote_id, hint.tier): hint
+            (hint.vote_id, hint.tier): hint.hint_text
             for hint in existing_hints
         }
-        unlocked_tiers = self.ORB_HINT_TIERS if is_orb_mode else self.FREE_HINT_TIERS
 
-        response_hints: list[VoteHintItem] = []
-        for vote in votes:
-            tier_texts = self._build_hint_texts(vote, circle_name)
-            for tier in ("CIRCLE", "TIME", "INITIAL", "FULL"):
-                hint = hint_map.get((vote.id, tier))
-                if hint is None:
-                    hint = await self.vote_repo.create_vote_hint(
-                        vote_id=vote.id,
-                        user_id=user_id,
-                        tier=tier,
-                        hint_text=tier_texts[tier],
-                    )
-                    hint_map[(vote.id, tier)] = hint
-
-                unlocked = tier in unlocked_tiers
-                response_hints.append(
-                    VoteHintItem(
-                        vote_id=vote.id,
-                        tier=tier,  # type: ignore[arg-type]
-                        text=hint.hint_text if unlocked else "Orb Mode에서 열 수 있어요",
-                        unlocked=unlocked,
+        # Materialize all missing hints with one insert on first open
+        missing = [
+            {"vote_id": vote.id, "user_id": user_id, "tier": tier, "hint_text": text}
+            for vote in votes
+            if any((vote.id, tier) not in hint_map for tier in self.HINT_TIERS)
+            for tier, text in self._build_hint_texts(vote, circle_name).items()
+            if (vote.id, tier) not in hint_map
+        ]
+        if missing:
+            hint_map.update(await self.vote_repo.create_vote_hints(missing))
+            if any((row["vote_id"], row["tier"]) not in hint_map for row in missing):
+                # Lost a race with a concurrent first open; read its rows
+                hint_map = {
+                    (hint.vote_id, hint.tier): hint.hint_text
+                    for hint in await self.vote_repo.find_vote_hints_for_votes(
+                        [vote.id for vote in votes]
                     )
-                )
+                }
+
+        unlocked_tiers = self.ORB_HINT_TIERS if is_orb_mode else self.FREE_HINT_TIERS
+        response_hints = [
+            VoteHintItem(
+                vote_id=vote.id,
+                tier=tier,  # type: ignore[arg-type]
+                text=(
+                    hint_map[(vote.id, tier)]
+                    if tier in unlocked_tiers
+                    else "Orb Mode에서 열 수 있어요"
+                ),
+                unlocked=tier in unlocked_tiers,
+            )
+            for vote in votes
+            for tier in self.HINT_TIERS
+        ]
 
         return VoteHintResponse(
             poll_id=poll_id,
@@ -1147,19 +1869,24 @@ class PollService:
         self,
         admin_id: uuid.UUID,
         data: AdminPollCreate,
-    ) -> BroadcastPollResponse:
-        """Broadcast a poll to multiple circles (Admin only).
+    ) -> PollBroadcastJobResponse:
+        """Start broadcasting a poll to multiple circles (Admin only).
+
+        Polls are created by a background job (app.tasks.poll_tasks); poll
+        its progress with get_broadcast_job.
 
         Args:
             admin_id: UUID of the admin user
             data: Admin poll creation data
 
         Returns:
-            BroadcastPollResponse with created polls
+            PollBroadcastJobResponse for the PENDING job
 
         Raises:
             BadRequestException: If no question provided or no circles selected
         """
+        broadcast_job_repo = self._require_broadcast_job_repo()
+
         # 1. 질문 텍스트 결정
         question_text: str | None = None
         template_id: uuid.UUID | None = None
@@ -1175,48 +1902,41 @@ class PollService:
         else:
             raise BadRequestException("Either template_id or custom_question is required")
 
-        # 2. 대상 Circle 결정
-        circle_ids: list[uuid.UUID] = []
+        # 2. 대상 Circle 결정 (None이면 모든 활성 Circle)
+        circle_ids: list[uuid.UUID] | None = None
 
         if data.apply_to_all:
-            if self.circle_repo is None:
-                raise BadRequestException("Circle repository not available")
-            circles = await self.circle_repo.find_all(is_active=True, limit=1000)
-            circle_ids = [c.id for c in circles]
+            circle_ids = None
         elif data.circle_ids:
             circle_ids = data.circle_ids
         else:
             raise BadRequestException("Either apply_to_all or circle_ids is required")
 
-        if not circle_ids:
-            raise BadRequestException("No circles to broadcast to")
-
         # 3. 투표 종료 시간 계산
         ends_at = self._calculate_end_time(data.duration)
 
-        # 4. 각 Circle에 투표 생성
-        created_polls: list[PollResponse] = []
-        failed_count = 0
-
-        for circle_id in circle_ids:
-            try:
-                poll = await self.poll_repo.create(
-                    circle_id=circle_id,
-                    template_id=template_id,
-                    creator_id=admin_id,
-                    question_text=question_text,
-                    ends_at=ends_at,
-                )
-                created_polls.append(self._poll_to_response(poll))
-
-                # 템플릿 사용 시 usage count 증가
-                if template_id:
-                    await self.template_repo.increment_usage_count(template_id)
-            except Exception:
-                failed_count += 1
-
-        return BroadcastPollResponse(
-            created_count=len(created_polls),
-            failed_count=failed_count,
-            polls=created_polls,
+        # 4. 작업 생성 후 백그라운드 실행
+        job = await broadcast_job_repo.create(
+            admin_id=admin_id,
+            template_id=template_id,
+            question_text=question_text,
+            ends_at=ends_at,
+            circle_ids=circle_ids,
         )
+        # Dispatched by the outbox relay once the job row is committed
+        from app.tasks.poll_tasks import run_poll_broadcast_job
+
+        self._require_outbox_repo().add_task(run_poll_broadcast_job.name, [str(job.id)])
+
+        return PollBroadcastJobResponse.model_validate(job)
+
+    async def get_broadcast_job(self, job_id: uuid.UUID) -> PollBroadcastJobResponse:
+        """Get an admin poll broadcast job's progress.
+
+        Raises:
+            NotFoundError: If the job does not exist
+        """
+        job = await self._require_broadcast_job_repo().find_by_id(job_id)
+        if job is None:
+            raise NotFoundError("Broadcast job", str(job_id))
+        return PollBroadcastJobResponse.model_validate(job)
@@ -0,0 +1,259 @@
+"""Redis-backed cursors for active vote sessions.
+
+A started session keeps its immutable queue in ``vote_session:{id}`` (hash)
+and its progress in ``vote_session:{id}:steps`` (list), one ``a`` (advance)
+or ``s`` (skip) entry per answered question. A step is a single RPUSH in a
+MULTI, so concurrent steps never lose an update; the list length is the
+cursor and the ``s`` entries give the skipped polls.
+
+The vote_sessions row is only written when a step completes the session,
+or by the idle sweeper (``app.tasks.session_tasks``), which checkpoints
+sessions that have not moved for ``idle_seconds`` and then drops their keys.
+Keys live for twice the idle window, so a sweeper that is briefly down
+loses nothing. If Redis state is lost anyway, the step falls back to the
+row's last persisted cursor.
+"""
+
+import json
+import logging
+import time
+import uuid
+from datetime import datetime
+from functools import lru_cache
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+from app.core.redis import create_redis, get_redis
+from app.modules.polls.models import VoteSession
+
+logger = logging.getLogger(__name__)
+
+# Sorted set of active session IDs scored by when they become idle
+IDLE_KEY = "vote_sessions:idle"
+
+ADVANCE = "a"
+SKIP = "s"
+
+# KEYS: session hash, steps list, idle set; ARGV: session ID, now
+RELEASE_IF_IDLE_SCRIPT = """
+local score = redis.call('ZSCORE', KEYS[3], ARGV[1])
+if score and tonumber(score) > tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('ZREM', KEYS[3], ARGV[1])
+return 1
+"""
+
+
+def session_key(session_id: uuid.UUID | str) -> str:
+    """Return the Redis hash holding a session's queue."""
+    return f"vote_session:{session_id}"
+
+
+def steps_key(session_id: uuid.UUID | str) -> str:
+    """Return the Redis list holding a session's steps."""
+    return f"vote_session:{session_id}:steps"
+
+
+class VoteSessionCursor:
+    """Snapshot of a session's queue and progress read from Redis."""
+
+    def __init__(
+        self,
+        session_id: uuid.UUID,
+        meta: dict[str, str],
+        steps: list[str],
+    ) -> None:
+        """Decode a session from its Redis hash and step list."""
+        self.session_id = session_id
+        self.user_id = uuid.UUID(meta["user_id"])
+        self.circle_id = uuid.UUID(meta["circle_id"]) if meta.get("circle_id") else None
+        self.poll_ids: list[str] = json.loads(meta["poll_ids"])
+        self.created_at = datetime.fromisoformat(meta["created_at"])
+        # Steps past the end of the queue (late double taps) are ignored
+        self.steps = steps[: len(self.poll_ids)]
+
+    @property
+    def current_index(self) -> int:
+        """Index of the current poll (the queue length once complete)."""
+        return len(self.steps)
+
+    @property
+    def skipped_poll_ids(self) -> list[str]:
+        """Polls skipped so far, in queue order."""
+        return [
+            poll_id
+            for poll_id, step in zip(self.poll_ids, self.steps, strict=False)
+            if step == SKIP
+        ]
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every poll in the queue has been answered or skipped."""
+        return self.current_index >= len(self.poll_ids)
+
+
+class VoteSessionCursorStore:
+    """Active vote session cursors stored in Redis."""
+
+    def __init__(self, redis: "Redis[str]", idle_seconds: int) -> None:
+        """Initialize store.
+
+        Args:
+            redis: Async Redis client
+            idle_seconds: Inactivity after which the sweeper checkpoints a session
+        """
+        self.redis = redis
+        self.idle_seconds = idle_seconds
+        self._release_if_idle = redis.register_script(RELEASE_IF_IDLE_SCRIPT)
+
+    @property
+    def key_ttl_seconds(self) -> int:
+        """TTL of session keys; outlives the idle window so the sweeper can flush."""
+        return self.idle_seconds * 2
+
+    async def create(self, vote_session: VoteSession) -> bool:
+        """Start tracking an ACTIVE session in Redis.
+
+        Returns:
+            True if stored; False on Redis errors (the session then runs on Postgres)
+        """
+        meta: dict[str | bytes, str] = {
+            "user_id": str(vote_session.user_id),
+            "circle_id": str(vote_session.circle_id) if vote_session.circle_id else "",
+            "poll_ids": json.dumps(vote_session.poll_ids),
+            "created_at": vote_session.created_at.isoformat(),
+        }
+        key = session_key(vote_session.id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=meta)
+                pipe.expire(key, self.key_ttl_seconds)
+                pipe.zadd(IDLE_KEY, {str(vote_session.id): time.time() + self.idle_seconds})
+                await pipe.execute()
+        except (RedisError, OSError) as e:
+            logger.warning("Vote session cursor create failed for %s: %s", vote_session.id, e)
+            return False
+        return True
+
+    async def step(
+        self,
+        session_id: uuid.UUID,
+        user_id: uuid.UUID,
+        *,
+        skip: bool,
+    ) -> VoteSessionCursor | None:
+        """Atomically advance (or skip) the current poll.
+
+        Returns:
+            Cursor after the step, or None if the session is not in Redis,
+            belongs to another user, or Redis failed; the caller then uses
+            the Postgres row
+        """
+        key = session_key(session_id)
+        try:
+            meta = await self.redis.hgetall(key)
+            if not meta or meta.get("user_id") != str(user_id):
+                return None
+
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.exists(key)
+                pipe.rpush(steps_key(session_id), SKIP if skip else ADVANCE)
+                pipe.lrange(steps_key(session_id), 0, -1)
+                pipe.expire(key, self.key_ttl_seconds)
+                pipe.expire(steps_key(session_id), self.key_ttl_seconds)
+                pipe.zadd(IDLE_KEY, {str(session_id): time.time() + self.idle_seconds})
+                still_exists, _, steps, *_ = await pipe.execute()
+
+            if not still_exists:
+                # Flushed by the sweeper between the read and the step
+                await self.discard(session_id)
+                return None
+        except (RedisError, OSError) as e:
+            logger.warning("Vote session cursor step failed for %s: %s", session_id, e)
+            return None
+
+        return VoteSessionCursor(session_id, meta, steps)
+
+    async def get(self, session_id: uuid.UUID) -> VoteSessionCursor | None:
+        """Read a session's cursor, or None if it is not in Redis."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hgetall(session_key(session_id))
+            pipe.lrange(steps_key(session_id), 0, -1)
+            meta, steps = await pipe.execute()
+        if not meta:
+            return None
+        return VoteSessionCursor(session_id, meta, steps)
+
+    async def peek(self, session_id: uuid.UUID) -> VoteSessionCursor | None:
+        """Read a session's cursor without changing it.
+
+        Used when the caller is about to write the cursor to Postgres itself;
+        it drops the keys once that write commits.
+
+        Returns:
+            Cursor, or None if the session is not in Redis or Redis failed
+        """
+        try:
+            return await self.get(session_id)
+        except (RedisError, OSError) as e:
+            logger.warning("Vote session cursor read failed for %s: %s", session_id, e)
+            return None
+
+    async def find_idle(self, limit: int = 100) -> list[uuid.UUID]:
+        """Return sessions that have not moved for the idle window."""
+        session_ids = await self.redis.zrangebyscore(
+            IDLE_KEY, "-inf", time.time(), start=0, num=limit
+        )
+        return [uuid.UUID(session_id) for session_id in session_ids]
+
+    async def mark_idle(self, session_id: uuid.UUID) -> None:
+        """Make a finished session eligible for the next sweep."""
+        try:
+            await self.redis.zadd(IDLE_KEY, {str(session_id): 0})
+        except (RedisError, OSError) as e:
+            logger.warning("Vote session cursor mark failed for %s: %s", session_id, e)
+
+    async def release_if_idle(self, session_id: uuid.UUID) -> bool:
+        """Drop a checkpointed session unless it moved since it became idle.
+
+        The score check and the delete run as one script, and a step bumps
+        the score in the same transaction as its RPUSH, so a step taken after
+        the checkpoint always keeps the session in Redis.
+        """
+        released = await self._release_if_idle(
+            keys=[session_key(session_id), steps_key(session_id), IDLE_KEY],
+            args=[str(session_id), time.time()],
+        )
+        return bool(released)
+
+    async def discard(self, session_id: uuid.UUID) -> None:
+        """Drop a session's keys."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(session_key(session_id))
+            pipe.delete(steps_key(session_id))
+            pipe.zrem(IDLE_KEY, str(session_id))
+            await pipe.execute()
+
+
+@lru_cache
+def get_vote_session_cursor_store() -> VoteSessionCursorStore | None:
+    """Get the API server's cursor store, or None when the mode is disabled."""
+    settings = get_settings()
+    if not settings.vote_session_cursors_enabled:
+        return None
+    return VoteSessionCursorStore(get_redis(), settings.vote_session_idle_seconds)
+
+
+def create_vote_session_cursor_store() -> VoteSessionCursorStore | None:
+    """Create a cursor store with its own client (for Celery tasks).
+
+    The caller owns the client and should ``await store.redis.aclose()``.
+    """
+    settings = get_settings()
+    if not settings.vote_session_cursors_enabled:
+        return None
+    return VoteSessionCursorStore(create_redis(), settings.vote_session_idle_seconds)
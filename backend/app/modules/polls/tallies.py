@@ -0,0 +1,163 @@
+"""Redis-backed live vote tallies for ACTIVE polls.
+
+Each poll has a hash ``poll:{poll_id}:tally`` mapping voted-for user IDs to
+vote counts, plus a ``_seeded`` marker. A hash without the marker is treated
+as a miss: the caller aggregates from Postgres and seeds it.
+
+Both writes are Lua scripts, so each is atomic against the other. A seed only
+writes a hash that has no marker, so a late seed never overwrites counts that
+were seeded and incremented meanwhile. Increments (run once the vote's
+transaction commits) and repairs only touch seeded hashes, so a rolled-back
+vote is never counted and a repair keeps votes counted while it ran.
+
+Every Redis failure is logged and reported as a miss, so callers always have
+the Postgres aggregate to fall back on. Drift (e.g. a vote committed between
+a seed's Postgres read and its write) is repaired by the reconciliation task.
+"""
+
+import logging
+import uuid
+from functools import lru_cache
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import get_settings
+from app.core.redis import create_redis, get_redis
+from app.modules.polls.repository import VoteResultDict
+
+logger = logging.getLogger(__name__)
+
+SEEDED_FIELD = "_seeded"
+
+# KEYS[1] tally; ARGV: marker, TTL, then (field, delta) pairs
+APPLY_DELTAS_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+for i = 3, #ARGV, 2 do
+    redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+# KEYS[1] tally; ARGV: marker, TTL, then (field, count) pairs
+SEED_IF_ABSENT_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 1 then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], ARGV[1], 1)
+for i = 3, #ARGV, 2 do
+    redis.call('HSET', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+def tally_key(poll_id: uuid.UUID) -> str:
+    """Return the Redis key holding a poll's live tally."""
+    return f"poll:{poll_id}:tally"
+
+
+class LiveTallyStore:
+    """Live per-poll vote counts stored in Redis hashes."""
+
+    def __init__(self, redis: "Redis[str]", ttl_seconds: int) -> None:
+        """Initialize store with Redis client and key TTL."""
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self._apply_deltas = redis.register_script(APPLY_DELTAS_SCRIPT)
+        self._seed_if_absent = redis.register_script(SEED_IF_ABSENT_SCRIPT)
+
+    async def increment(self, poll_id: uuid.UUID, voted_for_id: uuid.UUID) -> None:
+        """Record one committed vote for a user in a poll's seeded tally."""
+        try:
+            await self._apply_deltas(
+                keys=[tally_key(poll_id)],
+                args=[SEEDED_FIELD, self.ttl_seconds, str(voted_for_id), 1],
+            )
+        except (RedisError, OSError) as e:
+            logger.warning("Live tally increment failed for poll %s: %s", poll_id, e)
+
+    async def get(self, poll_id: uuid.UUID) -> list[VoteResultDict] | None:
+        """Get a poll's tally ordered by vote count, or None on a miss."""
+        try:
+            raw = await self.redis.hgetall(tally_key(poll_id))
+        except (RedisError, OSError) as e:
+            logger.warning("Live tally read failed for poll %s: %s", poll_id, e)
+            return None
+
+        if SEEDED_FIELD not in raw:
+            return None
+
+        results: list[VoteResultDict] = [
+            {"user_id": uuid.UUID(field), "vote_count": int(count)}
+            for field, count in raw.items()
+            if field != SEEDED_FIELD and int(count) > 0
+        ]
+        results.sort(key=lambda row: (-row["vote_count"], str(row["user_id"])))
+        return results
+
+    async def seed(self, poll_id: uuid.UUID, results: list[VoteResultDict]) -> None:
+        """Store a committed tally (from Postgres) unless one is already seeded."""
+        args: list[str | int] = [SEEDED_FIELD, self.ttl_seconds]
+        for row in results:
+            args += [str(row["user_id"]), row["vote_count"]]
+        try:
+            await self._seed_if_absent(keys=[tally_key(poll_id)], args=args)
+        except (RedisError, OSError) as e:
+            logger.warning("Live tally seed failed for poll %s: %s", poll_id, e)
+
+    async def repair(
+        self,
+        poll_id: uuid.UUID,
+        cached: list[VoteResultDict],
+        actual: list[VoteResultDict],
+    ) -> None:
+        """Shift a seeded tally from the counts read from it to the Postgres ones.
+
+        Only the differences are applied, so increments that landed after
+        ``cached`` was read are kept.
+        """
+        deltas = {row["user_id"]: row["vote_count"] for row in actual}
+        for row in cached:
+            deltas[row["user_id"]] = deltas.get(row["user_id"], 0) - row["vote_count"]
+
+        args: list[str | int] = [SEEDED_FIELD, self.ttl_seconds]
+        for user_id, delta in deltas.items():
+            if delta:
+                args += [str(user_id), delta]
+        try:
+            await self._apply_deltas(keys=[tally_key(poll_id)], args=args)
+        except (RedisError, OSError) as e:
+            logger.warning("Live tally repair failed for poll %s: %s", poll_id, e)
+
+    async def discard(self, poll_id: uuid.UUID) -> None:
+        """Drop a poll's tally (e.g. once its results are materialized)."""
+        try:
+            await self.redis.delete(tally_key(poll_id))
+        except (RedisError, OSError) as e:
+            logger.warning("Live tally discard failed for poll %s: %s", poll_id, e)
+
+
+@lru_cache
+def get_live_tally_store() -> LiveTallyStore | None:
+    """Get the API server's live tally store, or None when disabled."""
+    settings = get_settings()
+    if not settings.live_tallies_enabled:
+        return None
+    return LiveTallyStore(get_redis(), settings.live_tally_ttl_seconds)
+
+
+def create_live_tally_store() -> LiveTallyStore | None:
+    """Create a live tally store with its own client (for Celery tasks).
+
+    The caller owns the client and should ``await store.redis.aclose()``.
+    """
+    settings = get_settings()
+    if not settings.live_tallies_enabled:
+        return None
+    return LiveTallyStore(create_redis(), settings.live_tally_ttl_seconds)
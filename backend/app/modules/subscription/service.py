@@ -6,6 +6,7 @@ import uuid
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.modules.auth.cache import invalidate_cached_user
 from app.modules.auth.models import User
 from app.modules.subscription.repository import WebhookEventRepository
 from app.modules.subscription.schemas import (
@@ -134,6 +135,7 @@ class SubscriptionService:
         # Direct update using SQLAlchemy
         stmt = update(User).where(User.id == user_uuid).values(is_orb_mode=enabled)
         result = await self.session.execute(stmt)
+        invalidate_cached_user(user_uuid)
 
         if result.rowcount == 0:
             logger.warning("User not found for Orb Mode update: %s", app_user_id)
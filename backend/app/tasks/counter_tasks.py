@@ -0,0 +1,98 @@
+"""Celery tasks for folding contention-free counter deltas.
+
+Votes and poll creation append rows to ``poll_vote_deltas``,
+``template_usage_deltas`` and ``coin_ledger_entries`` instead of updating
+the hot counter rows. These tasks fold them into ``polls.vote_count``,
+``poll_templates.usage_count`` and the users' coin and streak columns in
+committed batches; reads add whatever is still pending.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.celery import celery_app
+from app.core.database import async_session_maker
+from app.modules.auth.repository import UserRepository
+from app.modules.polls.repository import PollRepository, TemplateRepository
+
+logger = logging.getLogger(__name__)
+
+FOLD_BATCH_SIZE = 1000
+
+
+async def _fold_all(
+    session: AsyncSession,
+    fold: Callable[[int], Awaitable[int]],
+    batch_size: int,
+) -> int:
+    """Run a fold method in committed batches until nothing is left."""
+    total = 0
+    while True:
+        folded = await fold(batch_size)
+        await session.commit()
+        total += folded
+        if folded < batch_size:
+            return total
+
+
+async def fold_counters(
+    session: AsyncSession,
+    batch_size: int = FOLD_BATCH_SIZE,
+) -> tuple[int, int]:
+    """Fold every pending vote and template usage delta.
+
+    Args:
+        session: Database session
+        batch_size: Delta rows folded per transaction
+
+    Returns:
+        Tuple of (vote deltas folded, usage deltas folded)
+    """
+    votes = await _fold_all(session, PollRepository(session).fold_vote_deltas, batch_size)
+    usages = await _fold_all(session, TemplateRepository(session).fold_usage_deltas, batch_size)
+
+    if votes or usages:
+        logger.info("Folded %d vote deltas and %d usage deltas", votes, usages)
+    return votes, usages
+
+
+async def roll_up_rewards(session: AsyncSession, batch_size: int = FOLD_BATCH_SIZE) -> int:
+    """Roll every pending coin ledger entry into the users columns.
+
+    Args:
+        session: Database session
+        batch_size: Ledger entries rolled up per transaction
+
+    Returns:
+        Number of ledger entries rolled up
+    """
+    rewards = await _fold_all(session, UserRepository(session).roll_up_rewards, batch_size)
+
+    if rewards:
+        logger.info("Rolled up %d coin ledger entries", rewards)
+    return rewards
+
+
+async def _fold_counter_deltas() -> tuple[int, int]:
+    async with async_session_maker() as session:
+        return await fold_counters(session)
+
+
+@celery_app.task  # type: ignore[untyped-decorator]
+def fold_counter_deltas() -> tuple[int, int]:
+    """Fold pending poll vote and template usage increments."""
+    return asyncio.run(_fold_counter_deltas())
+
+
+async def _roll_up_coin_ledger() -> int:
+    async with async_session_maker() as session:
+        return await roll_up_rewards(session)
+
+
+@celery_app.task  # type: ignore[untyped-decorator]
+def roll_up_coin_ledger() -> int:
+    """Roll pending vote rewards into user coin balances and streaks."""
+    return asyncio.run(_roll_up_coin_ledger())
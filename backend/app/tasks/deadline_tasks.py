@@ -0,0 +1,171 @@
+"""Periodic sweep of poll deadlines: reminders and closing.
+
+Instead of ETA tasks per poll, a beat task scans ``polls(status, ends_at)``
+every minute for polls that are due for a reminder or past their end, in
+batches. Each batch locks its polls (``FOR UPDATE SKIP LOCKED``) and commits
+the sent marker (``last_reminder_minutes``, or the COMPLETED status) with the
+notifications, so concurrent or repeated sweeps handle every deadline
+exactly once. Polls closed manually are no longer ACTIVE and drop out.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.celery import celery_app
+from app.core.database import async_session_maker
+from app.modules.auth.repository import UserRepository
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.notifications.repository import NotificationRepository
+from app.modules.notifications.service import NotificationService
+from app.modules.polls.repository import (
+    PollRepository,
+    TemplateRepository,
+    VoteRepository,
+    VoteSessionRepository,
+)
+from app.modules.polls.service import PollService
+from app.modules.polls.tallies import LiveTallyStore, create_live_tally_store
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_BATCH_SIZE = 100
+
+# Closest first, so a poll already inside its 10-minute window skips the 1-hour one
+REMINDER_MINUTES = (10, 60)
+
+
+async def _send_due_reminders(
+    session: AsyncSession,
+    notification_service: NotificationService,
+    minutes_left: int,
+    now: datetime,
+    batch_size: int,
+) -> int:
+    """Send every due ``minutes_left`` reminder, one committed batch at a time."""
+    poll_repo = PollRepository(session)
+    vote_repo = VoteRepository(session)
+    failed: list[uuid.UUID] = []
+    sent = 0
+
+    while True:
+        polls = await poll_repo.find_due_for_reminder(
+            minutes_left, now, limit=batch_size, exclude_ids=failed
+        )
+        if not polls:
+            return sent
+
+        non_voters = await vote_repo.find_non_voter_ids_by_poll_ids([poll.id for poll in polls])
+        reminded: list[uuid.UUID] = []
+        for poll in polls:
+            try:
+                async with session.begin_nested():
+                    await notification_service.send_poll_reminder(
+                        poll,
+                        non_voters.get(poll.id, []),
+                        minutes_left=minutes_left,
+                    )
+            except Exception:
+                # Left unmarked; the next sweep retries it while it is still due
+                logger.exception("%dm deadline reminder failed for poll %s", minutes_left, poll.id)
+                failed.append(poll.id)
+            else:
+                reminded.append(poll.id)
+
+        await poll_repo.mark_reminded(reminded, minutes_left)
+        await session.commit()
+        sent += len(reminded)
+
+
+async def _close_due_polls(
+    session: AsyncSession,
+    poll_service: PollService,
+    now: datetime,
+    batch_size: int,
+) -> int:
+    """Close every poll past its end, one committed batch at a time."""
+    poll_repo = PollRepository(session)
+    failed: list[uuid.UUID] = []
+    closed = 0
+
+    while True:
+        polls = await poll_repo.find_due_for_close(now, limit=batch_size, exclude_ids=failed)
+        if not polls:
+            return closed
+
+        for poll in polls:
+            try:
+                async with session.begin_nested():
+                    await poll_service.close_poll(poll.id)
+            except Exception:
+                logger.exception("Closing poll %s failed", poll.id)
+                failed.append(poll.id)
+            else:
+                closed += 1
+
+        await session.commit()
+
+
+async def sweep_deadlines(
+    session: AsyncSession,
+    tally_store: LiveTallyStore | None = None,
+    now: datetime | None = None,
+    batch_size: int = DEADLINE_BATCH_SIZE,
+) -> tuple[int, int]:
+    """Send due deadline reminders and close polls that have ended.
+
+    Args:
+        session: Database session
+        tally_store: Live tally store to clear for closed polls
+        now: Sweep time (defaults to now)
+        batch_size: Polls locked and committed together
+
+    Returns:
+        Tuple of (reminders sent, polls closed)
+    """
+    now = now or datetime.now(UTC)
+    notification_service = NotificationService(
+        NotificationRepository(session),
+        UserRepository(session),
+    )
+    poll_service = PollService(
+        TemplateRepository(session),
+        PollRepository(session),
+        VoteRepository(session),
+        MembershipRepository(session),
+        CircleRepository(session),
+        notification_service,
+        VoteSessionRepository(session),
+        UserRepository(session),
+        tally_store,
+    )
+
+    reminded = 0
+    for minutes_left in REMINDER_MINUTES:
+        reminded += await _send_due_reminders(
+            session, notification_service, minutes_left, now, batch_size
+        )
+    closed = await _close_due_polls(session, poll_service, now, batch_size)
+
+    if reminded or closed:
+        logger.info("Deadline sweep: %d reminders sent, %d polls closed", reminded, closed)
+    return reminded, closed
+
+
+async def _sweep_poll_deadlines() -> tuple[int, int]:
+    tally_store = create_live_tally_store()
+    try:
+        async with async_session_maker() as session:
+            return await sweep_deadlines(session, tally_store)
+    finally:
+        if tally_store is not None:
+            await tally_store.redis.aclose()  # type: ignore[attr-defined]  # types-redis predates aclose
+
+
+@celery_app.task  # type: ignore[untyped-decorator]
+def sweep_poll_deadlines() -> tuple[int, int]:
+    """Send due poll deadline reminders and close ended polls."""
+    return asyncio.run(_sweep_poll_deadlines())
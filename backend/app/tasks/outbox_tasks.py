@@ -0,0 +1,145 @@
+"""Relay of the transactional outbox to Expo and Celery.
+
+Services write pushes and task dispatches to ``outbox_messages`` in the same
+transaction as the change that caused them. This beat task drains committed
+messages in batches: each batch is locked (``FOR UPDATE SKIP LOCKED``) so
+concurrent relays split the work, delivered, and deleted in one commit.
+Delivery is at least once; a relay that dies mid-batch leaves the batch to
+be sent again. Failed messages back off and are retried up to
+``OUTBOX_MAX_ATTEMPTS`` times, then kept for inspection.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.celery import celery_app
+from app.core.database import async_session_maker
+from app.modules.auth.repository import UserRepository
+from app.modules.notifications.models import OutboxMessage
+from app.modules.notifications.repository import OutboxRepository
+from app.services.expo_push import ExpoPushClient, get_expo_push_client
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 100
+OUTBOX_MAX_ATTEMPTS = 5
+OUTBOX_RETRY_DELAY = timedelta(seconds=30)
+
+
+async def _push_tokens(
+    session: AsyncSession,
+    messages: list[tuple[OutboxMessage, dict[str, Any]]],
+) -> dict[str, str]:
+    """Return registered push tokens of every push recipient in the batch."""
+    user_ids = {
+        uuid.UUID(user_id)
+        for message, payload in messages
+        if message.kind == OutboxMessage.KIND_PUSH
+        for user_id in payload["user_ids"]
+    }
+    if not user_ids:
+        return {}
+
+    users = await UserRepository(session).find_by_ids(list(user_ids))
+    return {
+        str(user.id): user.push_token
+        for user in users
+        if user.push_token and user.push_token.strip()
+    }
+
+
+async def _deliver(
+    message: OutboxMessage,
+    payload: dict[str, Any],
+    tokens: dict[str, str],
+    expo_push_client: ExpoPushClient,
+) -> None:
+    """Send one outbox message; raises if it should be retried."""
+    if message.kind == OutboxMessage.KIND_TASK:
+        celery_app.send_task(payload["task"], args=payload["args"])
+        return
+
+    if message.kind != OutboxMessage.KIND_PUSH:
+        raise ValueError(f"Unknown outbox message kind: {message.kind}")
+
+    pushes = [
+        {
+            "token": tokens[user_id],
+            "title": payload["title"],
+            "body": payload["body"],
+            "data": payload["data"],
+        }
+        for user_id in payload["user_ids"]
+        if user_id in tokens
+    ]
+    if not pushes:
+        logger.debug("No users with push tokens to notify")
+        return
+
+    results = await expo_push_client.send_batch_push_notifications(pushes)
+    success_count = sum(1 for r in results if r.get("status") == "ok")
+    logger.info("Push notifications sent: %d/%d succeeded", success_count, len(pushes))
+
+
+async def relay_outbox(
+    session: AsyncSession,
+    expo_push_client: ExpoPushClient | None = None,
+    now: datetime | None = None,
+    batch_size: int = OUTBOX_BATCH_SIZE,
+) -> int:
+    """Deliver every committed outbox message that is due.
+
+    Args:
+        session: Database session
+        expo_push_client: Expo client (defaults to the shared client)
+        now: Relay time (defaults to now)
+        batch_size: Messages locked and committed together
+
+    Returns:
+        Number of messages delivered
+    """
+    now = now or datetime.now(UTC)
+    expo_push_client = expo_push_client or get_expo_push_client()
+    outbox_repo = OutboxRepository(session)
+    delivered = 0
+
+    while True:
+        messages = await outbox_repo.claim_batch(now, batch_size, OUTBOX_MAX_ATTEMPTS)
+        if not messages:
+            return delivered
+
+        decoded = [(message, json.loads(message.payload)) for message in messages]
+        tokens = await _push_tokens(session, decoded)
+        sent: list[uuid.UUID] = []
+        for message, payload in decoded:
+            try:
+                await _deliver(message, payload, tokens, expo_push_client)
+            except Exception as error:
+                logger.exception("Outbox message %s delivery failed", message.id)
+                # Backs off past this run, so the loop does not claim it again
+                message.attempts += 1
+                message.last_error = str(error)
+                message.available_at = now + OUTBOX_RETRY_DELAY * 2 ** (message.attempts - 1)
+            else:
+                sent.append(message.id)
+
+        await outbox_repo.delete(sent)
+        await session.commit()
+        delivered += len(sent)
+
+
+async def _relay_outbox_messages() -> int:
+    async with async_session_maker() as session:
+        return await relay_outbox(session)
+
+
+@celery_app.task  # type: ignore[untyped-decorator]
+def relay_outbox_messages() -> int:
+    """Deliver pending outbox pushes and Celery tasks."""
+    return asyncio.run(_relay_outbox_messages())
@@ -0,0 +1,162 @@
+"""Celery tasks for admin poll broadcasts."""
+
+import asyncio
+import logging
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.celery import celery_app
+from app.core.database import async_session_maker
+from app.modules.circles.repository import CircleRepository
+from app.modules.polls.models import PollBroadcastJob
+from app.modules.polls.repository import (
+    PollBroadcastJobRepository,
+    PollRepository,
+    TemplateRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHUNK_SIZE = 500
+MAX_RECORDED_FAILURES = 50
+
+
+def _record_failure(job: PollBroadcastJob, chunk: list[uuid.UUID], count: int, error: str) -> None:
+    """Count failed circles and keep the most recent failure details."""
+    job.failed_count += count
+    job.failures = [
+        *job.failures,
+        {"first_circle_id": str(chunk[0]), "last_circle_id": str(chunk[-1]), "error": error},
+    ][-MAX_RECORDED_FAILURES:]
+
+
+async def _next_chunk(
+    circle_repo: CircleRepository,
+    job: PollBroadcastJob,
+    chunk_size: int,
+) -> list[uuid.UUID]:
+    """Return the next target circles after the job's last processed circle."""
+    if job.circle_ids is None:
+        return await circle_repo.find_ids(
+            limit=chunk_size,
+            after_id=job.last_circle_id,
+            is_active=True,
+        )
+
+    # circle_ids is stored sorted, which matches UUID order
+    after = str(job.last_circle_id) if job.last_circle_id else ""
+    return [uuid.UUID(circle_id) for circle_id in job.circle_ids if circle_id > after][:chunk_size]
+
+
+async def run_poll_broadcast(
+    session: AsyncSession,
+    job_id: uuid.UUID,
+    chunk_size: int = BROADCAST_CHUNK_SIZE,
+) -> PollBroadcastJob | None:
+    """Create a broadcast job's polls in chunks, resuming after its last chunk.
+
+    Target circles are walked in ID order with keyset pagination. Each chunk
+    (one multi-row poll insert and the job's progress) commits as one
+    transaction under a lock on the job row, so a retried or duplicated run
+    continues exactly where the last one stopped. A chunk that fails is
+    recorded on the job and skipped. Deadlines of the created polls are
+    picked up by the deadline sweeper.
+
+    Args:
+        session: Database session
+        job_id: Broadcast job ID
+        chunk_size: Circles per chunk
+
+    Returns:
+        The job after the run, or None if it does not exist
+    """
+    job_repo = PollBroadcastJobRepository(session)
+    poll_repo = PollRepository(session)
+    circle_repo = CircleRepository(session)
+
+    while True:
+        job = await job_repo.find_by_id(job_id, for_update=True)
+        if job is None or job.status in ("COMPLETED", "FAILED"):
+            await session.commit()
+            return job
+
+        if job.admin_id is None:
+            job.status = "FAILED"
+            job.finished_at = datetime.now(UTC)
+            job.failures = [*job.failures, {"error": "Admin no longer exists"}]
+            await session.commit()
+            return job
+
+        job.status = "RUNNING"
+        chunk = await _next_chunk(circle_repo, job, chunk_size)
+        if not chunk:
+            break
+
+        try:
+            async with session.begin_nested():
+                poll_ids = await poll_repo.create_many(
+                    chunk,
+                    job.template_id,
+                    job.admin_id,
+                    job.question_text,
+                    job.ends_at,
+                )
+        except Exception as error:
+            logger.error("Poll broadcast %s chunk failed: %s", job_id, error)
+            _record_failure(job, chunk, len(chunk), str(error))
+        else:
+            job.created_count += len(poll_ids)
+            missing = len(chunk) - len(poll_ids)
+            if missing:
+                _record_failure(job, chunk, missing, f"{missing} circles not found")
+
+        job.last_circle_id = chunk[-1]
+        await session.commit()
+
+    if job.template_id is not None and job.created_count:
+        await TemplateRepository(session).increment_usage_count(job.template_id, job.created_count)
+    job.status = "COMPLETED"
+    job.finished_at = datetime.now(UTC)
+    await session.commit()
+    logger.info(
+        "Poll broadcast %s completed: %d created, %d failed",
+        job_id,
+        job.created_count,
+        job.failed_count,
+    )
+    return job
+
+
+async def _run_poll_broadcast_job(job_id: str) -> int:
+    async with async_session_maker() as session:
+        job = await run_poll_broadcast(session, uuid.UUID(job_id))
+        return job.created_count if job is not None else 0
+
+
+async def _fail_poll_broadcast_job(job_id: str, error: str) -> None:
+    async with async_session_maker() as session:
+        job = await PollBroadcastJobRepository(session).find_by_id(
+            uuid.UUID(job_id), for_update=True
+        )
+        if job is None or job.status == "COMPLETED":
+            return
+        job.status = "FAILED"
+        job.finished_at = datetime.now(UTC)
+        job.failures = [*job.failures, {"error": error}][-MAX_RECORDED_FAILURES:]
+        await session.commit()
+
+
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=60)  # type: ignore[untyped-decorator]
+def run_poll_broadcast_job(self: Any, job_id: str) -> int:
+    """Create the polls of an admin broadcast job, resuming on retry."""
+    try:
+        return asyncio.run(_run_poll_broadcast_job(job_id))
+    except Exception as exc:
+        logger.exception("Poll broadcast job %s failed", job_id)
+        if self.request.retries >= self.max_retries:
+            asyncio.run(_fail_poll_broadcast_job(job_id, str(exc)))
+            raise
+        raise self.retry(exc=exc) from exc
@@ -0,0 +1,83 @@
+"""Celery tasks for checkpointing Redis vote session cursors."""
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.celery import celery_app
+from app.core.database import async_session_maker
+from app.modules.auth.repository import UserRepository
+from app.modules.circles.repository import MembershipRepository
+from app.modules.polls.repository import (
+    PollRepository,
+    TemplateRepository,
+    VoteRepository,
+    VoteSessionRepository,
+)
+from app.modules.polls.service import PollService
+from app.modules.polls.session_cursors import (
+    VoteSessionCursorStore,
+    create_vote_session_cursor_store,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def flush_idle_sessions(
+    session: AsyncSession,
+    store: VoteSessionCursorStore,
+    limit: int = 100,
+) -> int:
+    """Checkpoint idle session cursors to Postgres and drop them from Redis.
+
+    Each cursor is committed before its keys are dropped, so a crash between
+    the two only repeats the (idempotent) checkpoint on the next run.
+
+    Args:
+        session: Database session
+        store: Vote session cursor store
+        limit: Maximum sessions to flush per run
+
+    Returns:
+        Number of sessions released from Redis
+    """
+    poll_service = PollService(
+        TemplateRepository(session),
+        PollRepository(session),
+        VoteRepository(session),
+        MembershipRepository(session),
+        vote_session_repo=VoteSessionRepository(session),
+        user_repo=UserRepository(session),
+    )
+
+    released = 0
+    for session_id in await store.find_idle(limit):
+        cursor = await store.get(session_id)
+        if cursor is not None:
+            await poll_service.persist_vote_session_cursor(cursor)
+            await session.commit()
+        if await store.release_if_idle(session_id):
+            released += 1
+
+    if released:
+        logger.info("Flushed %d idle vote sessions", released)
+    return released
+
+
+async def _flush_idle_vote_sessions() -> int:
+    store = create_vote_session_cursor_store()
+    if store is None:
+        return 0
+
+    try:
+        async with async_session_maker() as session:
+            return await flush_idle_sessions(session, store)
+    finally:
+        await store.redis.aclose()  # type: ignore[attr-defined]  # types-redis predates aclose
+
+
+@celery_app.task  # type: ignore[untyped-decorator]
+def flush_idle_vote_sessions() -> int:
+    """Persist and release vote session cursors that stopped moving."""
+    return asyncio.run(_flush_idle_vote_sessions())
@@ -0,0 +1,62 @@
+"""Celery tasks for maintaining Redis live vote tallies."""
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.celery import celery_app
+from app.core.database import async_session_maker
+from app.modules.polls.repository import PollRepository, VoteRepository
+from app.modules.polls.tallies import LiveTallyStore, create_live_tally_store
+
+logger = logging.getLogger(__name__)
+
+
+async def reconcile_tallies(session: AsyncSession, store: LiveTallyStore) -> int:
+    """Repair live tallies of ACTIVE polls that drifted from Postgres.
+
+    Only seeded tallies are checked; unseeded polls are seeded from Postgres
+    on their next read anyway.
+
+    Args:
+        session: Database session
+        store: Live tally store
+
+    Returns:
+        Number of polls whose tally was repaired
+    """
+    poll_ids = await PollRepository(session).find_active_ids()
+    actual_by_poll = await VoteRepository(session).get_results_by_poll_ids(poll_ids)
+
+    repaired = 0
+    for poll_id, actual in actual_by_poll.items():
+        cached = await store.get(poll_id)
+        if cached is None:
+            continue
+
+        expected = {row["user_id"]: row["vote_count"] for row in actual}
+        if {row["user_id"]: row["vote_count"] for row in cached} != expected:
+            logger.info("Repairing live tally drift for poll %s", poll_id)
+            await store.repair(poll_id, cached, actual)
+            repaired += 1
+
+    return repaired
+
+
+async def _reconcile_live_tallies() -> int:
+    store = create_live_tally_store()
+    if store is None:
+        return 0
+
+    try:
+        async with async_session_maker() as session:
+            return await reconcile_tallies(session, store)
+    finally:
+        await store.redis.aclose()  # type: ignore[attr-defined]  # types-redis predates aclose
+
+
+@celery_app.task  # type: ignore[untyped-decorator]  # celery ships no type hints
+def reconcile_live_tallies() -> int:
+    """Repair drift between Redis live tallies and Postgres votes."""
+    return asyncio.run(_reconcile_live_tallies())
@@ -19,7 +19,8 @@ from app.modules.polls.models import (  # noqa: F401
     Poll,
     PollResult,
     PollTemplate,
-    ReceivedHeartRead,
+    ReceivedHeart,
+    ReceivedHeartCounter,
     Vote,
     VoteSession,
 )
@@ -0,0 +1,43 @@
+"""add polls feed index
+
+Revision ID: a2b3c4d5e6f7
+Revises: f1a2b3c4d5e6
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a2b3c4d5e6f7"
+down_revision: str | Sequence[str] | None = "f1a2b3c4d5e6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index polls for the keyset-paginated home feed."""
+    # Built concurrently so writes to polls are not blocked during the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_polls_circle_status_created_at",
+            "polls",
+            ["circle_id", "status", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the home feed index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_polls_circle_status_created_at",
+            table_name="polls",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,83 @@
+"""create poll vote and template usage counter deltas
+
+Revision ID: a8b9c0d1e2f4
+Revises: f7a8b9c0d1e3
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a8b9c0d1e2f4"
+down_revision: str | Sequence[str] | None = "f7a8b9c0d1e3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the append-only delta tables behind vote and usage counts."""
+    op.create_table(
+        "poll_vote_deltas",
+        sa.Column("poll_id", sa.UUID(), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_poll_vote_deltas_poll_id"), "poll_vote_deltas", ["poll_id"], unique=False
+    )
+    op.create_table(
+        "template_usage_deltas",
+        sa.Column("template_id", sa.UUID(), nullable=False),
+        sa.Column("delta", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["template_id"], ["poll_templates.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_template_usage_deltas_template_id"),
+        "template_usage_deltas",
+        ["template_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Fold pending deltas into their counters and drop the delta tables."""
+    op.execute(
+        """
+        UPDATE polls SET vote_count = polls.vote_count + pending.delta
+        FROM (SELECT poll_id, sum(delta) AS delta FROM poll_vote_deltas GROUP BY poll_id) AS pending
+        WHERE polls.id = pending.poll_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE poll_templates SET usage_count = poll_templates.usage_count + pending.delta
+        FROM (
+            SELECT template_id, sum(delta) AS delta FROM template_usage_deltas GROUP BY template_id
+        ) AS pending
+        WHERE poll_templates.id = pending.template_id
+        """
+    )
+    op.drop_index(op.f("ix_template_usage_deltas_template_id"), table_name="template_usage_deltas")
+    op.drop_table("template_usage_deltas")
+    op.drop_index(op.f("ix_poll_vote_deltas_poll_id"), table_name="poll_vote_deltas")
+    op.drop_table("poll_vote_deltas")
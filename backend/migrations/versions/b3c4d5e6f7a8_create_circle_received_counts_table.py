@@ -0,0 +1,65 @@
+"""create circle received counts table
+
+Revision ID: b3c4d5e6f7a8
+Revises: a2b3c4d5e6f7
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3c4d5e6f7a8"
+down_revision: str | Sequence[str] | None = "a2b3c4d5e6f7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create per-circle received counts and fill them from vote history."""
+    op.create_table(
+        "circle_received_counts",
+        sa.Column("circle_id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("received_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["circle_id"], ["circles.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("circle_id", "user_id", name="uq_circle_received_count"),
+    )
+    op.create_index(
+        op.f("ix_circle_received_counts_user_id"),
+        "circle_received_counts",
+        ["user_id"],
+        unique=False,
+    )
+    # Same definition as VoteRepository.rebuild_received_counts
+    op.execute(
+        """
+        INSERT INTO circle_received_counts (id, circle_id, user_id, received_count)
+        SELECT gen_random_uuid(), polls.circle_id, votes.voted_for_id, count(votes.id)
+        FROM votes
+        JOIN polls ON votes.poll_id = polls.id
+        JOIN circle_members
+          ON circle_members.circle_id = polls.circle_id
+         AND circle_members.user_id = votes.voted_for_id
+         AND votes.created_at >= circle_members.joined_at
+        GROUP BY polls.circle_id, votes.voted_for_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop per-circle received counts."""
+    op.drop_index(op.f("ix_circle_received_counts_user_id"), table_name="circle_received_counts")
+    op.drop_table("circle_received_counts")
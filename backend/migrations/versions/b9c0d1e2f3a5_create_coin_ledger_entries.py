@@ -0,0 +1,79 @@
+"""create coin ledger entries
+
+Revision ID: b9c0d1e2f3a5
+Revises: a8b9c0d1e2f4
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9c0d1e2f3a5"
+down_revision: str | Sequence[str] | None = "a8b9c0d1e2f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the append-only ledger behind coin balances and streaks."""
+    op.create_table(
+        "coin_ledger_entries",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("vote_id", sa.UUID(), nullable=True),
+        sa.Column("amount", sa.Integer(), nullable=False),
+        sa.Column("reason", sa.String(length=20), nullable=False),
+        sa.Column("reward_date", sa.Date(), nullable=False),
+        sa.Column("rolled_up", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["vote_id"], ["votes.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_coin_ledger_entries_user_id_created_at",
+        "coin_ledger_entries",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_coin_ledger_entries_pending",
+        "coin_ledger_entries",
+        ["user_id", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("NOT rolled_up"),
+    )
+
+
+def downgrade() -> None:
+    """Roll pending coins into the users columns and drop the ledger.
+
+    Streaks are not re-derived from pending entries; they catch up on the
+    user's next vote.
+    """
+    op.execute(
+        """
+        UPDATE users SET
+            coin_balance = users.coin_balance + pending.amount,
+            last_reward_at = greatest(users.last_reward_at, pending.latest)
+        FROM (
+            SELECT user_id, sum(amount) AS amount, max(created_at) AS latest
+            FROM coin_ledger_entries
+            WHERE NOT rolled_up
+            GROUP BY user_id
+        ) AS pending
+        WHERE users.id = pending.user_id
+        """
+    )
+    op.drop_index("ix_coin_ledger_entries_pending", table_name="coin_ledger_entries")
+    op.drop_index("ix_coin_ledger_entries_user_id_created_at", table_name="coin_ledger_entries")
+    op.drop_table("coin_ledger_entries")
@@ -0,0 +1,42 @@
+"""add circle members joined_at index
+
+Revision ID: c0d1e2f3a4b6
+Revises: b9c0d1e2f3a5
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c0d1e2f3a4b6"
+down_revision: str | Sequence[str] | None = "b9c0d1e2f3a5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index circle members for the keyset-paginated member listing."""
+    # Built concurrently so joins and leaves are not blocked during the build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_circle_members_circle_id_joined_at",
+            "circle_members",
+            ["circle_id", "joined_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the member listing index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_circle_members_circle_id_joined_at",
+            table_name="circle_members",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,61 @@
+"""create poll broadcast jobs table
+
+Revision ID: c4d5e6f7a8b9
+Revises: b3c4d5e6f7a8
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d5e6f7a8b9"
+down_revision: str | Sequence[str] | None = "b3c4d5e6f7a8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the admin poll broadcast job table."""
+    op.create_table(
+        "poll_broadcast_jobs",
+        sa.Column("admin_id", sa.UUID(), nullable=True),
+        sa.Column("template_id", sa.UUID(), nullable=True),
+        sa.Column("question_text", sa.Text(), nullable=False),
+        sa.Column("ends_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("circle_ids", sa.JSON(), nullable=True),
+        sa.Column("status", sa.String(length=20), server_default="PENDING", nullable=False),
+        sa.Column("last_circle_id", sa.UUID(), nullable=True),
+        sa.Column("created_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("failed_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("failures", sa.JSON(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["admin_id"], ["users.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["template_id"], ["poll_templates.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_poll_broadcast_jobs_admin_id"), "poll_broadcast_jobs", ["admin_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop the admin poll broadcast job table."""
+    op.drop_index(op.f("ix_poll_broadcast_jobs_admin_id"), table_name="poll_broadcast_jobs")
+    op.drop_table("poll_broadcast_jobs")
@@ -0,0 +1,140 @@
+"""create received hearts inbox
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5e6f7a8b9c0"
+down_revision: str | Sequence[str] | None = "c4d5e6f7a8b9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the received heart inbox and unread counters from vote history.
+
+    Polls marked read in received_heart_reads start with no unread votes;
+    the read markers are then dropped.
+    """
+    op.create_table(
+        "received_hearts",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("poll_id", sa.UUID(), nullable=False),
+        sa.Column("circle_id", sa.UUID(), nullable=False),
+        sa.Column("question_text", sa.Text(), nullable=False),
+        sa.Column("emoji", sa.String(length=10), nullable=True),
+        sa.Column("received_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("unread_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "latest_received_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["circle_id"], ["circles.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "poll_id", name="uq_received_heart"),
+    )
+    op.create_index(
+        op.f("ix_received_hearts_poll_id"), "received_hearts", ["poll_id"], unique=False
+    )
+    op.create_index(
+        "ix_received_hearts_user_latest",
+        "received_hearts",
+        ["user_id", sa.text("latest_received_at DESC"), sa.text("poll_id DESC")],
+        unique=False,
+    )
+    op.create_table(
+        "received_heart_counters",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("unread_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", name="uq_received_heart_counter"),
+    )
+
+    op.execute(
+        """
+        INSERT INTO received_hearts (
+            id, user_id, poll_id, circle_id, question_text, emoji,
+            received_count, unread_count, latest_received_at
+        )
+        SELECT gen_random_uuid(), votes.voted_for_id, polls.id, polls.circle_id,
+               polls.question_text, poll_templates.emoji, count(votes.id),
+               CASE WHEN received_heart_reads.id IS NULL THEN count(votes.id) ELSE 0 END,
+               max(votes.created_at)
+        FROM votes
+        JOIN polls ON votes.poll_id = polls.id
+        LEFT JOIN poll_templates ON polls.template_id = poll_templates.id
+        LEFT JOIN received_heart_reads
+          ON received_heart_reads.poll_id = polls.id
+         AND received_heart_reads.user_id = votes.voted_for_id
+        GROUP BY votes.voted_for_id, polls.id, poll_templates.emoji, received_heart_reads.id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO received_heart_counters (id, user_id, unread_count)
+        SELECT gen_random_uuid(), user_id, sum(unread_count)
+        FROM received_hearts
+        GROUP BY user_id
+        """
+    )
+
+    op.drop_index(op.f("ix_received_heart_reads_user_id"), table_name="received_heart_reads")
+    op.drop_index(op.f("ix_received_heart_reads_poll_id"), table_name="received_heart_reads")
+    op.drop_table("received_heart_reads")
+
+
+def downgrade() -> None:
+    """Restore read markers for fully read inbox rows and drop the inbox."""
+    op.create_table(
+        "received_heart_reads",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("poll_id", sa.UUID(), nullable=False),
+        sa.Column(
+            "read_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "poll_id", name="uq_received_heart_read"),
+    )
+    op.create_index(
+        op.f("ix_received_heart_reads_poll_id"), "received_heart_reads", ["poll_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_received_heart_reads_user_id"), "received_heart_reads", ["user_id"], unique=False
+    )
+    op.execute(
+        """
+        INSERT INTO received_heart_reads (id, user_id, poll_id)
+        SELECT gen_random_uuid(), user_id, poll_id
+        FROM received_hearts
+        WHERE unread_count = 0
+        """
+    )
+
+    op.drop_table("received_heart_counters")
+    op.drop_index("ix_received_hearts_user_latest", table_name="received_hearts")
+    op.drop_index(op.f("ix_received_hearts_poll_id"), table_name="received_hearts")
+    op.drop_table("received_hearts")
@@ -0,0 +1,30 @@
+"""add poll deadline sweep marker and index
+
+Revision ID: e6f7a8b9c0d2
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e6f7a8b9c0d2"
+down_revision: str | Sequence[str] | None = "d5e6f7a8b9c0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the reminder marker and the (status, ends_at) index for the sweeper."""
+    op.add_column("polls", sa.Column("last_reminder_minutes", sa.Integer(), nullable=True))
+    op.create_index("ix_polls_status_ends_at", "polls", ["status", "ends_at"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the deadline sweep marker and index."""
+    op.drop_index("ix_polls_status_ends_at", table_name="polls")
+    op.drop_column("polls", "last_reminder_minutes")
@@ -0,0 +1,52 @@
+"""create outbox messages
+
+Revision ID: f7a8b9c0d1e3
+Revises: e6f7a8b9c0d2
+Create Date: 2026-10-17
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f7a8b9c0d1e3"
+down_revision: str | Sequence[str] | None = "e6f7a8b9c0d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the transactional outbox drained by the outbox relay."""
+    op.create_table(
+        "outbox_messages",
+        sa.Column("kind", sa.String(length=20), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "available_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_outbox_messages_available_at", "outbox_messages", ["available_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop the transactional outbox."""
+    op.drop_index("ix_outbox_messages_available_at", table_name="outbox_messages")
+    op.drop_table("outbox_messages")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Backfill materialized results for polls completed before snapshots existed.
+
+Finds COMPLETED polls that have votes but no poll_results rows and writes
+their final rankings in batches. Safe to re-run: each poll is upserted.
+
+Run with: uv run python scripts/backfill_poll_results.py [--batch-size 500] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import get_settings
+
+# Import all models to ensure SQLAlchemy relationships are resolved
+from app.modules.auth.models import User  # noqa: F401
+from app.modules.circles.models import Circle, CircleMember  # noqa: F401
+from app.modules.notifications.models import Notification  # noqa: F401
+from app.modules.polls.models import Poll, PollResult, PollTemplate, Vote  # noqa: F401
+from app.modules.polls.repository import PollRepository, VoteRepository
+from app.modules.reports.models import Report  # noqa: F401
+
+
+async def backfill(batch_size: int, dry_run: bool) -> None:
+    """Materialize results for every completed poll missing a snapshot."""
+    settings = get_settings()
+
+    print("🧮 Backfilling poll results...")
+    print(f"📌 Database: {settings.database_url.split('@')[-1]}")
+
+    engine = create_async_engine(settings.database_url, echo=False)
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    polls_done = 0
+    rows_written = 0
+    after_id = None
+    async with session_maker() as session:
+        poll_repo = PollRepository(session)
+        vote_repo = VoteRepository(session)
+
+        while True:
+            poll_ids = await poll_repo.find_completed_without_results(
+                limit=batch_size,
+                after_id=after_id,
+            )
+            if not poll_ids:
+                break
+
+            for poll_id in poll_ids:
+                rows_written += await vote_repo.materialize_results(poll_id)
+
+            if dry_run:
+                await session.rollback()
+            else:
+                await session.commit()
+
+            polls_done += len(poll_ids)
+            after_id = poll_ids[-1]
+            print(f"  ✅ {polls_done} polls, {rows_written} result rows")
+
+    await engine.dispose()
+    suffix = " (dry run, rolled back)" if dry_run else ""
+    print(f"\n✅ Backfill complete: {polls_done} polls{suffix}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(backfill(args.batch_size, args.dry_run))
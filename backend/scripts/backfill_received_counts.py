@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Backfill or verify per-circle received counts used for candidate selection.
+
+Rebuilds circle_received_counts from vote history in batches of circles, or
+with --verify only reports members whose stored count has drifted. Safe to
+re-run; best run during low traffic since a vote landing mid-batch can be
+counted twice or missed (a later --verify will report it).
+
+Run with: uv run python scripts/backfill_received_counts.py [--batch-size 200] [--verify] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import get_settings
+
+# Import all models to ensure SQLAlchemy relationships are resolved
+from app.modules.auth.models import User  # noqa: F401
+from app.modules.circles.models import Circle, CircleMember  # noqa: F401
+from app.modules.circles.repository import CircleRepository
+from app.modules.notifications.models import Notification  # noqa: F401
+from app.modules.polls.models import Poll, PollTemplate, Vote  # noqa: F401
+from app.modules.polls.repository import VoteRepository
+from app.modules.reports.models import Report  # noqa: F401
+
+
+async def run(batch_size: int, verify: bool, dry_run: bool) -> int:
+    """Rebuild (or verify) received counts for every circle.
+
+    Returns:
+        Process exit code (1 if --verify found drift)
+    """
+    settings = get_settings()
+
+    print("🔎 Verifying received counts..." if verify else "🧮 Backfilling received counts...")
+    print(f"📌 Database: {settings.database_url.split('@')[-1]}")
+
+    engine = create_async_engine(settings.database_url, echo=False)
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    circles_done = 0
+    rows = 0
+    after_id = None
+    async with session_maker() as session:
+        circle_repo = CircleRepository(session)
+        vote_repo = VoteRepository(session)
+
+        while True:
+            circle_ids = await circle_repo.find_ids(limit=batch_size, after_id=after_id)
+            if not circle_ids:
+                break
+
+            if verify:
+                drift = await vote_repo.find_received_count_drift(circle_ids)
+                for item in drift:
+                    print(
+                        f"  ⚠️  circle {item['circle_id']} member {item['user_id']}: "
+                        f"stored {item['stored_count']}, actual {item['actual_count']}"
+                    )
+                rows += len(drift)
+                await session.rollback()
+            else:
+                rows += await vote_repo.rebuild_received_counts(circle_ids)
+                if dry_run:
+                    await session.rollback()
+                else:
+                    await session.commit()
+
+            circles_done += len(circle_ids)
+            after_id = circle_ids[-1]
+            if not verify:
+                print(f"  ✅ {circles_done} circles, {rows} count rows")
+
+    await engine.dispose()
+    if verify:
+        status = "✅ No drift" if rows == 0 else f"❌ {rows} drifted members"
+        print(f"\n{status} across {circles_done} circles")
+        return 1 if rows else 0
+
+    suffix = " (dry run, rolled back)" if dry_run else ""
+    print(f"\n✅ Backfill complete: {circles_done} circles{suffix}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--verify", action="store_true", help="Report drift without writing")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.batch_size, args.verify, args.dry_run)))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Benchmark: event-loop health during a Supabase login storm.
+
+Starts a local stub of the Supabase Auth API that answers every password
+login after a fixed delay, fires a storm of concurrent ``AuthService.login``
+calls at it, and meanwhile measures the latency of an unrelated endpoint
+(``GET /health``) served by the same event loop.
+
+The storm runs twice: once calling the blocking supabase-py client directly
+from the coroutine (the old behaviour) and once through ``run_auth_call``.
+With the gateway, /health p99 should stay close to the idle baseline.
+
+Run with: uv run python scripts/bench_auth_gateway.py [--logins 200] [--delay 0.05]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from httpx import ASGITransport, AsyncClient
+from supabase import Client, ClientOptions, create_client
+
+from app.config import Settings
+from app.core import supabase as supabase_module
+from app.main import create_app
+from app.modules.auth.models import User
+from app.modules.auth.schemas import LoginRequest
+from app.modules.auth.service import AuthService
+
+STUB_ANON_KEY = "stub-anon-key"
+
+
+def make_handler(delay: float) -> type[BaseHTTPRequestHandler]:
+    """Build a request handler that mimics Supabase's password grant."""
+
+    class StubAuthHandler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            time.sleep(delay)
+
+            now = datetime.now(UTC).isoformat()
+            payload = {
+                "access_token": "stub-access-token",
+                "token_type": "bearer",
+                "expires_in": 3600,
+                "expires_at": int(time.time()) + 3600,
+                "refresh_token": "stub-refresh-token",
+                "user": {
+                    "id": str(uuid.uuid5(uuid.NAMESPACE_URL, body.get("email", ""))),
+                    "email": body.get("email"),
+                    "aud": "authenticated",
+                    "role": "authenticated",
+                    "app_metadata": {},
+                    "user_metadata": {},
+                    "created_at": now,
+                },
+            }
+            data = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return StubAuthHandler
+
+
+class StubUserRepository:
+    """In-memory stand-in for UserRepository so the benchmark needs no database."""
+
+    async def find_by_supabase_id(self, supabase_user_id: str) -> User:
+        return User(
+            id=uuid.uuid4(),
+            email="bench@example.com",
+            supabase_user_id=supabase_user_id,
+            username=None,
+            display_name=None,
+            gender="UNSPECIFIED",
+            age_group="UNSPECIFIED",
+            profile_emoji="😊",
+            coin_balance=0,
+            streak_days=0,
+            role="USER",
+            is_active=True,
+            is_orb_mode=False,
+            created_at=datetime.now(UTC),
+        )
+
+
+async def blocking_call(call: Callable[[], Any]) -> Any:
+    """Old behaviour: call supabase-py directly on the event loop."""
+    return call()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def probe_health(client: AsyncClient, stop: asyncio.Event, interval: float) -> list[float]:
+    """Poll /health on a fixed schedule until stopped; return latencies in ms.
+
+    Latency is measured from each request's scheduled send time, and slots
+    missed while the loop was stalled are recorded too, so a blocked loop
+    shows up in the tail instead of as a handful of fast samples.
+    """
+    latencies: list[float] = []
+    next_at = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+        response = await client.get("/health")
+        response.raise_for_status()
+        finished = time.perf_counter()
+        while next_at <= finished:
+            latencies.append((finished - next_at) * 1000)
+            next_at += interval
+    return latencies
+
+
+async def run_scenario(
+    name: str,
+    service: AuthService,
+    client: AsyncClient,
+    logins: int,
+    storm: bool,
+) -> None:
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_health(client, stop, interval=0.005))
+    started = time.perf_counter()
+
+    if storm:
+        await asyncio.gather(
+            *(
+                service.login(LoginRequest(email=f"user{i}@example.com", password="pw"))
+                for i in range(logins)
+            )
+        )
+    else:
+        await asyncio.sleep(1.0)
+
+    elapsed = time.perf_counter() - started
+    stop.set()
+    latencies = await probe
+
+    print(
+        f"{name:<10} elapsed={elapsed:6.2f}s  health n={len(latencies):4d}  "
+        f"p50={statistics.median(latencies):7.2f}ms  p99={percentile(latencies, 99):8.2f}ms  "
+        f"max={max(latencies):8.2f}ms"
+    )
+
+
+async def main(logins: int, delay: float, concurrency: int) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(delay))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stub_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    settings = Settings(
+        supabase_url=stub_url,
+        supabase_anon_key=STUB_ANON_KEY,
+        supabase_auth_max_concurrency=concurrency,
+    )
+    stub_clients = threading.local()
+
+    def stub_client() -> Client:
+        """One client per thread, like get_supabase_client, without token refresh."""
+        if not hasattr(stub_clients, "client"):
+            stub_clients.client = create_client(
+                stub_url, STUB_ANON_KEY, options=ClientOptions(auto_refresh_token=False)
+            )
+        client: Client = stub_clients.client
+        return client
+
+    service = AuthService(StubUserRepository())  # type: ignore[arg-type]
+
+    with (
+        patch("app.core.supabase.get_settings", return_value=settings),
+        patch("app.modules.auth.service.get_supabase_client", side_effect=stub_client),
+    ):
+        supabase_module._get_auth_executor.cache_clear()
+        transport = ASGITransport(app=create_app())
+        async with AsyncClient(transport=transport, base_url="http://bench") as client:
+            print(f"{logins} logins, stub delay {delay * 1000:.0f}ms, concurrency {concurrency}")
+            await run_scenario("idle", service, client, logins, storm=False)
+
+            with patch("app.modules.auth.service.run_auth_call", blocking_call):
+                await run_scenario("blocking", service, client, logins, storm=True)
+
+            await run_scenario("gateway", service, client, logins, storm=True)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.05, help="stub latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    asyncio.run(main(args.logins, args.delay, args.concurrency))
@@ -1,13 +1,14 @@
 """Pytest configuration and fixtures."""
 
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import update
+from sqlalchemy import event, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import Settings
@@ -22,7 +23,8 @@ from app.modules.polls.models import (  # noqa: F401
     Poll,
     PollResult,
     PollTemplate,
-    ReceivedHeartRead,
+    ReceivedHeart,
+    ReceivedHeartCounter,
     Vote,
     VoteSession,
 )
@@ -143,3 +145,40 @@ def enable_orb_mode_for_user(app: FastAPI):
             break
 
     return _enable
+
+
+@pytest.fixture
+def count_queries(db_session: AsyncSession):
+    """Factory fixture that records SQL statements issued through db_session.
+
+    Usage:
+        with count_queries() as statements:
+            await service.vote(...)
+        assert len(statements) == 2
+    """
+
+    @contextmanager
+    def _count() -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+
+    return _count
+
+
+@pytest.fixture(autouse=True)
+def clear_auth_caches() -> None:
+    """Reset per-process auth caches so cached identities never leak between tests."""
+    from app.core.supabase import clear_token_cache
+    from app.modules.auth.cache import get_user_cache
+
+    clear_token_cache()
+    get_user_cache().clear()
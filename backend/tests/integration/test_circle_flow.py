@@ -128,6 +128,33 @@ class TestCircleFlow:
         assert members_list.status_code == status.HTTP_200_OK
         members_data = members_list.json()
         assert len(members_data) == 2
+        assert "X-Next-Cursor" not in members_list.headers
+
+        # Step 7b: Page through members, owner first, and read member counts
+        first_page = await client.get(
+            f"/circles/{circle_id}",
+            params={"members_limit": 1},
+            headers={"Authorization": f"Bearer {owner_token}"},
+        )
+        assert [member["role"] for member in first_page.json()["members"]] == ["OWNER"]
+        second_page = await client.get(
+            f"/circles/{circle_id}/members",
+            params={"limit": 1, "cursor": first_page.headers["X-Next-Cursor"]},
+            headers={"Authorization": f"Bearer {owner_token}"},
+        )
+        assert [member["role"] for member in second_page.json()] == ["MEMBER"]
+        assert "X-Next-Cursor" not in second_page.headers
+
+        summary = await client.get(
+            f"/circles/{circle_id}",
+            params={"members_summary": True},
+            headers={"Authorization": f"Bearer {owner_token}"},
+        )
+        assert summary.json()["members"] == []
+        assert summary.json()["members_summary"] == {
+            "total": 2,
+            "by_role": {"OWNER": 1, "MEMBER": 1},
+        }
 
         # Step 8: Member leaves circle
         leave_circle = await client.post(
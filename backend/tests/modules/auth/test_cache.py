@@ -0,0 +1,140 @@
+"""Tests for the verified-token and current-user caches."""
+
+import time
+import uuid
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import Settings
+from app.core.exceptions import UnauthorizedException
+from app.core.supabase import verify_supabase_token
+from app.deps import get_current_user
+from app.modules.auth.models import UserRole
+from app.modules.auth.repository import UserRepository
+
+JWT_SECRET = "test-jwt-secret-with-at-least-32-bytes"
+SUPABASE_URL = "https://example.supabase.co"
+
+
+def make_token(sub: str, *, expires_in: int = 3600, secret: str = JWT_SECRET) -> str:
+    """Mint a Supabase-style access token."""
+    now = int(time.time())
+    return jwt.encode(
+        {
+            "sub": sub,
+            "email": f"{sub[:8]}@example.com",
+            "aud": "authenticated",
+            "iss": f"{SUPABASE_URL}/auth/v1",
+            "iat": now,
+            "exp": now + expires_in,
+        },
+        secret,
+        algorithm="HS256",
+    )
+
+
+@pytest.fixture
+def supabase_settings():
+    settings = Settings(supabase_url=SUPABASE_URL, supabase_jwt_secret=JWT_SECRET)
+    with patch("app.core.supabase.get_settings", return_value=settings):
+        yield settings
+
+
+class TestVerifiedTokenCache:
+    """Tests for verify_supabase_token caching."""
+
+    def test_repeat_verification_skips_decode(self, supabase_settings: Settings) -> None:
+        token = make_token(str(uuid.uuid4()))
+
+        first = verify_supabase_token(token)
+        with patch("app.core.supabase.jwt.decode") as decode:
+            second = verify_supabase_token(token)
+
+        assert first is not None
+        assert second == first
+        decode.assert_not_called()
+
+    def test_invalid_token_is_not_cached(self, supabase_settings: Settings) -> None:
+        token = make_token(str(uuid.uuid4()), secret="another-secret-with-at-least-32-bytes")
+
+        assert verify_supabase_token(token) is None
+        with patch("app.core.supabase.jwt.decode", side_effect=jwt.InvalidTokenError) as decode:
+            assert verify_supabase_token(token) is None
+
+        decode.assert_called_once()
+
+    def test_cached_claims_expire_with_token(self, supabase_settings: Settings) -> None:
+        token = make_token(str(uuid.uuid4()), expires_in=1)
+
+        assert verify_supabase_token(token) is not None
+        with (
+            patch("app.core.cache.time.monotonic", return_value=time.monotonic() + 5),
+            patch("app.core.supabase.jwt.decode", side_effect=jwt.ExpiredSignatureError) as decode,
+        ):
+            assert verify_supabase_token(token) is None
+
+        decode.assert_called_once()
+
+
+class TestCurrentUserCache:
+    """Tests for get_current_user identity caching."""
+
+    @pytest.mark.asyncio
+    async def test_cached_user_skips_database(self, db_session: AsyncSession) -> None:
+        supabase_user_id = str(uuid.uuid4())
+        user = await UserRepository(db_session).create_from_supabase(
+            supabase_user_id, "cached@example.com"
+        )
+        await db_session.commit()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+        with patch(
+            "app.core.supabase.verify_supabase_token", return_value={"sub": supabase_user_id}
+        ):
+            first = await get_current_user(credentials=credentials, db=db_session)
+            unused_db = MagicMock()
+            second = await get_current_user(credentials=credentials, db=unused_db)
+
+        assert first.id == user.id
+        assert second.id == user.id
+        assert second.email == "cached@example.com"
+        assert not unused_db.method_calls
+
+    @pytest.mark.asyncio
+    async def test_repository_write_invalidates_cached_user(self, db_session: AsyncSession) -> None:
+        supabase_user_id = str(uuid.uuid4())
+        repo = UserRepository(db_session)
+        user = await repo.create_from_supabase(supabase_user_id, "role@example.com")
+        await db_session.commit()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+        with patch(
+            "app.core.supabase.verify_supabase_token", return_value={"sub": supabase_user_id}
+        ):
+            await get_current_user(credentials=credentials, db=db_session)
+            await repo.update_role(user.id, UserRole.ADMIN)
+            await db_session.commit()
+            reloaded = await get_current_user(credentials=credentials, db=db_session)
+
+        assert reloaded.role == UserRole.ADMIN
+
+    @pytest.mark.asyncio
+    async def test_deactivated_user_is_rejected(self, db_session: AsyncSession) -> None:
+        supabase_user_id = str(uuid.uuid4())
+        repo = UserRepository(db_session)
+        user = await repo.create_from_supabase(supabase_user_id, "inactive@example.com")
+        await db_session.commit()
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+        with patch(
+            "app.core.supabase.verify_supabase_token", return_value={"sub": supabase_user_id}
+        ):
+            await get_current_user(credentials=credentials, db=db_session)
+            await repo.deactivate(user.id)
+            await db_session.commit()
+            with pytest.raises(UnauthorizedException):
+                await get_current_user(credentials=credentials, db=db_session)
@@ -1,5 +1,8 @@
 """Tests for UserRepository."""
 
+import uuid
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -165,3 +168,45 @@ class TestUserRepositoryUpdate:
         updated_user = await repo.update(uuid.uuid4(), update_data)
 
         assert updated_user is None
+
+
+class TestUserRepositoryVoteRewards:
+    """Tests for the coin ledger behind vote rewards."""
+
+    @pytest.mark.asyncio
+    async def test_streak_follows_ledger_dates(self, db_session: AsyncSession) -> None:
+        """Same-day rewards keep the streak, next-day ones extend it, gaps reset it."""
+        repo = UserRepository(db_session)
+        user = await repo.create(UserCreate(email="ledger@example.com", password="password123"))
+        day = datetime(2026, 10, 1, 12, tzinfo=UTC)
+
+        for voted_at in [day, day + timedelta(hours=3), day + timedelta(days=1)]:
+            assert await repo.apply_vote_reward(user.id, voted_at) is True
+        await db_session.refresh(user)
+        await db_session.refresh(user, ["pending_coin_balance", "pending_reward_dates"])
+        assert (user.coin_balance, user.streak_days) == (0, 0)
+        assert (user.total_coin_balance, user.total_streak_days) == (3, 2)
+
+        assert await repo.roll_up_rewards() == 3
+        await db_session.refresh(user)
+        await db_session.refresh(user, ["pending_coin_balance", "pending_reward_dates"])
+        assert (user.coin_balance, user.streak_days) == (3, 2)
+        assert user.pending_coin_balance == 0
+        assert user.last_reward_at == day + timedelta(days=1)
+
+        # Pending entries extend the rolled-up streak, until a gap resets it
+        await repo.apply_vote_reward(user.id, day + timedelta(days=2))
+        await db_session.refresh(user)
+        await db_session.refresh(user, ["pending_coin_balance", "pending_reward_dates"])
+        assert (user.total_coin_balance, user.total_streak_days) == (4, 3)
+        await repo.apply_vote_reward(user.id, day + timedelta(days=5))
+        await db_session.refresh(user)
+        await db_session.refresh(user, ["pending_coin_balance", "pending_reward_dates"])
+        assert (user.total_coin_balance, user.total_streak_days) == (5, 1)
+
+    @pytest.mark.asyncio
+    async def test_reward_for_unknown_user(self, db_session: AsyncSession) -> None:
+        repo = UserRepository(db_session)
+
+        assert await repo.apply_vote_reward(uuid.uuid4()) is False
+        assert await repo.roll_up_rewards() == 0
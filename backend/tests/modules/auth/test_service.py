@@ -1,5 +1,8 @@
 """Tests for the current Supabase-backed AuthService."""
 
+import asyncio
+import threading
+import time
 import uuid
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -8,7 +11,14 @@ import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 from supabase_auth.errors import AuthApiError
 
-from app.core.exceptions import BadRequestException, UnauthorizedException
+from app.config import Settings
+from app.core import supabase as supabase_module
+from app.core.exceptions import (
+    BadRequestException,
+    ServiceUnavailableError,
+    UnauthorizedException,
+)
+from app.core.supabase import get_supabase_client, run_auth_call
 from app.modules.auth.repository import UserRepository
 from app.modules.auth.schemas import DevLoginRequest, LoginRequest, UserCreate, UserUpdate
 from app.modules.auth.service import AuthService
@@ -158,6 +168,69 @@ class TestAuthServiceLogin:
         ):
             await service.login(LoginRequest(email="inactive@example.com", password="password123"))
 
+    @pytest.mark.asyncio
+    async def test_login_does_not_block_event_loop(self, db_session: AsyncSession) -> None:
+        service = AuthService(UserRepository(db_session))
+        supabase = MagicMock()
+
+        def slow_sign_in(credentials: dict[str, str]) -> SimpleNamespace:
+            time.sleep(0.2)
+            return supabase_auth_response(str(uuid.uuid4()))
+
+        supabase.auth.sign_in_with_password.side_effect = slow_sign_in
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker_task = asyncio.create_task(ticker())
+        with patch("app.modules.auth.service.get_supabase_client", return_value=supabase):
+            await service.login(LoginRequest(email="slow@example.com", password="password123"))
+        ticker_task.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_concurrent_logins_use_a_client_per_thread(self) -> None:
+        settings = Settings(supabase_auth_max_concurrency=4)
+        barrier = threading.Barrier(4)
+
+        def client_in_thread() -> int:
+            barrier.wait(timeout=5)
+            return id(get_supabase_client())
+
+        with (
+            patch("app.core.supabase.get_settings", return_value=settings),
+            patch("app.core.supabase.create_client", side_effect=lambda *args: MagicMock()),
+        ):
+            supabase_module._get_auth_executor.cache_clear()
+            try:
+                client_ids = await asyncio.gather(
+                    *(run_auth_call(client_in_thread) for _ in range(4))
+                )
+            finally:
+                supabase_module._get_auth_executor().shutdown()
+                supabase_module._get_auth_executor.cache_clear()
+
+        assert len(set(client_ids)) == 4
+
+    @pytest.mark.asyncio
+    async def test_login_timeout(self, db_session: AsyncSession) -> None:
+        service = AuthService(UserRepository(db_session))
+        supabase = MagicMock()
+        supabase.auth.sign_in_with_password.side_effect = lambda credentials: time.sleep(0.5)
+        settings = Settings(supabase_auth_timeout_seconds=0.05)
+
+        with (
+            patch("app.modules.auth.service.get_supabase_client", return_value=supabase),
+            patch("app.core.supabase.get_settings", return_value=settings),
+            pytest.raises(ServiceUnavailableError),
+        ):
+            await service.login(LoginRequest(email="timeout@example.com", password="password123"))
+
 
 class TestAuthServiceDevLogin:
     """Tests for local development authentication."""
@@ -1,14 +1,17 @@
 """Tests for Circle and Membership repositories."""
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.enums import MemberRole
+from app.core.enums import MemberRole, PollStatus
 from app.core.security import generate_invite_code
 from app.modules.auth.repository import UserRepository
 from app.modules.auth.schemas import UserCreate
 from app.modules.circles.repository import CircleRepository, MembershipRepository
 from app.modules.circles.schemas import CircleCreate
+from app.modules.polls.models import Poll
 
 
 class TestCircleRepository:
@@ -95,6 +98,55 @@ class TestCircleRepository:
         assert len(circles) == 1
         assert circles[0].name == "User's Circle"
 
+    @pytest.mark.asyncio
+    async def test_find_summaries_by_user_id(self, db_session: AsyncSession) -> None:
+        """Test loading a user's circles with active poll counts and roles."""
+        user_repo = UserRepository(db_session)
+        owner = await user_repo.create(
+            UserCreate(email="summary-owner@example.com", password="password123")
+        )
+        member = await user_repo.create(
+            UserCreate(email="summary-member@example.com", password="password123")
+        )
+
+        circle_repo = CircleRepository(db_session)
+        membership_repo = MembershipRepository(db_session)
+        owned = await circle_repo.create(
+            CircleCreate(name="Owned"), member.id, generate_invite_code()
+        )
+        joined = await circle_repo.create(
+            CircleCreate(name="Joined"), owner.id, generate_invite_code()
+        )
+        await membership_repo.create(owned.id, member.id, MemberRole.OWNER)
+        await membership_repo.create(joined.id, owner.id, MemberRole.OWNER)
+        await membership_repo.create(joined.id, member.id, MemberRole.MEMBER)
+
+        ends_at = datetime.now(UTC) + timedelta(hours=1)
+        db_session.add_all(
+            Poll(
+                circle_id=joined.id,
+                creator_id=owner.id,
+                question_text=f"Question {index}?",
+                status=status,
+                ends_at=ends_at,
+            )
+            for index, status in enumerate(
+                [PollStatus.ACTIVE, PollStatus.ACTIVE, PollStatus.COMPLETED]
+            )
+        )
+        await db_session.flush()
+
+        summaries = await circle_repo.find_summaries_by_user_id(member.id)
+        assert {circle.name: (count, role) for circle, count, role in summaries} == {
+            "Owned": (0, MemberRole.OWNER),
+            "Joined": (2, MemberRole.MEMBER),
+        }
+
+        subset = await circle_repo.find_summaries_by_user_id(owner.id, [joined.id, owned.id])
+        assert [(circle.id, count, role) for circle, count, role in subset] == [
+            (joined.id, 2, MemberRole.OWNER)
+        ]
+
 
 class TestMembershipRepository:
     """Tests for MembershipRepository."""
@@ -0,0 +1,96 @@
+"""Tests for CircleService."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import MemberRole
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.circles.service import CircleService
+
+
+class TestCircleServiceListing:
+    """Tests for batched circle responses and member listing."""
+
+    @pytest.mark.asyncio
+    async def test_user_circles_load_in_one_query(
+        self, db_session: AsyncSession, count_queries
+    ) -> None:
+        """Listing circles costs one statement however many circles there are."""
+        user_repo = UserRepository(db_session)
+        owner = await user_repo.create(
+            UserCreate(email="list-owner@example.com", password="password123")
+        )
+        member = await user_repo.create(
+            UserCreate(email="list-member@example.com", password="password123")
+        )
+        service = CircleService(CircleRepository(db_session), MembershipRepository(db_session))
+
+        with count_queries() as statements:
+            created = [
+                await service.create_circle(CircleCreate(name=f"Circle {index}"), owner.id)
+                for index in range(5)
+            ]
+        assert all(circle.my_role == "OWNER" for circle in created)
+        assert all(circle.active_polls_count == 0 for circle in created)
+        assert not any("count(" in statement for statement in statements)
+
+        for circle in created:
+            joined = await service.join_by_code(circle.invite_code, member.id)
+            assert joined.my_role == "MEMBER"
+            assert joined.member_count == 2
+
+        with count_queries() as statements:
+            circles = await service.get_user_circles(member.id)
+
+        assert len(statements) == 1
+        assert {circle.id for circle in circles} == {circle.id for circle in created}
+        assert all(circle.my_role == "MEMBER" for circle in circles)
+
+    @pytest.mark.asyncio
+    async def test_circle_detail_cost_does_not_grow_with_members(
+        self, db_session: AsyncSession, count_queries
+    ) -> None:
+        """Circle detail is two statements and pages members by join time."""
+        user_repo = UserRepository(db_session)
+        users = [
+            await user_repo.create(
+                UserCreate(email=f"detail{index}@example.com", password="password123")
+            )
+            for index in range(7)
+        ]
+        service = CircleService(CircleRepository(db_session), MembershipRepository(db_session))
+        circle = await service.create_circle(CircleCreate(name="Detail Circle"), users[0].id)
+        for user in users[1:]:
+            await service.join_by_code(circle.invite_code, user.id)
+
+        with count_queries() as statements:
+            detail, cursor = await service.get_circle_detail(
+                circle.id, users[1].id, members_limit=3
+            )
+        assert len(statements) == 2
+        assert detail.my_role == "MEMBER"
+        assert detail.member_count == 7
+        assert detail.members_summary is None
+
+        member_ids = [member.user_id for member in detail.members]
+        while cursor is not None:
+            members, cursor = await service.get_members(
+                circle.id, users[1].id, limit=3, cursor=cursor
+            )
+            member_ids += [member.user_id for member in members]
+        assert sorted(member_ids) == sorted(user.id for user in users)
+        assert len(set(member_ids)) == 7
+
+        with count_queries() as statements:
+            summary, cursor = await service.get_circle_detail(
+                circle.id, users[1].id, members_summary=True
+            )
+        assert len(statements) == 2
+        assert cursor is None
+        assert summary.members == []
+        assert summary.members_summary is not None
+        assert summary.members_summary.total == 7
+        assert summary.members_summary.by_role == {MemberRole.OWNER: 1, MemberRole.MEMBER: 6}
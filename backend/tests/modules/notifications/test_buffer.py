@@ -0,0 +1,341 @@
+"""Tests for coalesced vote-received notifications."""
+
+import json
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import NotificationType
+from app.core.security import generate_invite_code
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.repository import CircleRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.notifications.buffer import (
+    VoteReceivedBuffer,
+    VoteReceivedEvent,
+    events_key,
+    scheduled_key,
+)
+from app.modules.notifications.models import OutboxMessage
+from app.modules.notifications.repository import NotificationRepository
+from app.modules.notifications.service import NotificationService
+from app.modules.polls.models import Poll
+from app.tasks.notification_tasks import buffer_vote_received_notification, flush_vote_received
+
+
+class FakePipeline:
+    """Buffered subset of redis.asyncio pipeline commands."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.ops: list[tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def rpush(self, key: str, *values: str) -> None:
+        self.ops.append(("rpush", key, values))
+
+    def lpush(self, key: str, *values: str) -> None:
+        self.ops.append(("lpush", key, values))
+
+    def lrange(self, key: str, start: int, end: int) -> None:
+        self.ops.append(("lrange", key))
+
+    def expire(self, key: str, seconds: int) -> None:
+        self.ops.append(("expire", key))
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> None:
+        self.ops.append(("set", key, value, nx))
+
+    def delete(self, key: str) -> None:
+        self.ops.append(("delete", key))
+
+    def lrem(self, key: str, count: int, value: str) -> None:
+        self.ops.append(("lrem", key, value))
+
+    async def execute(self) -> list[Any]:
+        self.redis.check()
+        results: list[Any] = []
+        for op, key, *args in self.ops:
+            if op == "rpush":
+                self.redis.lists.setdefault(key, []).extend(args[0])
+                results.append(len(self.redis.lists[key]))
+            elif op == "lpush":
+                for value in args[0]:
+                    self.redis.lists.setdefault(key, []).insert(0, value)
+                results.append(len(self.redis.lists[key]))
+            elif op == "lrange":
+                results.append(list(self.redis.lists.get(key, [])))
+            elif op == "set":
+                value, nx = args
+                if nx and key in self.redis.strings:
+                    results.append(None)
+                else:
+                    self.redis.strings[key] = value
+                    results.append(True)
+            elif op == "lrem":
+                values = self.redis.lists.get(key, [])
+                if args[0] in values:
+                    del values[len(values) - 1 - values[::-1].index(args[0])]
+                    results.append(1)
+                else:
+                    results.append(0)
+            elif op == "delete":
+                existed = key in self.redis.lists or key in self.redis.strings
+                self.redis.lists.pop(key, None)
+                self.redis.strings.pop(key, None)
+                results.append(int(existed))
+            else:
+                results.append(True)
+        return results
+
+
+class FakeRedis:
+    """In-memory stand-in for the list/string commands VoteReceivedBuffer uses."""
+
+    def __init__(self) -> None:
+        self.lists: dict[str, list[str]] = {}
+        self.strings: dict[str, str] = {}
+        self.available = True
+
+    def check(self) -> None:
+        if not self.available:
+            raise RedisConnectionError("redis is down")
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def scheduled() -> list[tuple[uuid.UUID, int]]:
+    return []
+
+
+@pytest.fixture
+def buffer(fake_redis: FakeRedis, scheduled: list[tuple[uuid.UUID, int]]) -> VoteReceivedBuffer:
+    async def schedule_flush(user_id: uuid.UUID, countdown: int) -> None:
+        scheduled.append((user_id, countdown))
+
+    return VoteReceivedBuffer(fake_redis, window_seconds=60, schedule_flush=schedule_flush)  # type: ignore[arg-type]
+
+
+def make_event(poll_id: uuid.UUID, question: str = "Who is the best?") -> VoteReceivedEvent:
+    return VoteReceivedEvent(
+        poll_id=str(poll_id),
+        circle_id=str(uuid.uuid4()),
+        question_text=question,
+    )
+
+
+def poll_event(poll: Poll) -> VoteReceivedEvent:
+    return VoteReceivedEvent(
+        poll_id=str(poll.id),
+        circle_id=str(poll.circle_id),
+        question_text=poll.question_text,
+    )
+
+
+async def create_poll(db_session: AsyncSession) -> tuple[uuid.UUID, Poll]:
+    """Create a recipient and a poll in a circle; return (recipient_id, poll)."""
+    user_repo = UserRepository(db_session)
+    creator = await user_repo.create(
+        UserCreate(email="creator@example.com", password="password123")
+    )
+    recipient = await user_repo.create(
+        UserCreate(email="voted@example.com", password="password123")
+    )
+    circle = await CircleRepository(db_session).create(
+        CircleCreate(name="Test Circle"), creator.id, generate_invite_code()
+    )
+    poll = Poll(
+        circle_id=circle.id,
+        creator_id=creator.id,
+        question_text="Who is the best?",
+        ends_at=datetime.now(UTC) + timedelta(hours=3),
+    )
+    db_session.add(poll)
+    await db_session.commit()
+    return recipient.id, poll
+
+
+class TestVoteReceivedBuffer:
+    """Tests for VoteReceivedBuffer."""
+
+    @pytest.mark.asyncio
+    async def test_only_first_event_in_window_schedules_flush(
+        self,
+        buffer: VoteReceivedBuffer,
+        scheduled: list[tuple[uuid.UUID, int]],
+    ) -> None:
+        """A burst of events schedules exactly one delayed flush."""
+        user_id = uuid.uuid4()
+
+        for _ in range(5):
+            await buffer.add(user_id, make_event(uuid.uuid4()))
+
+        assert scheduled == [(user_id, 60)]
+
+    @pytest.mark.asyncio
+    async def test_drain_returns_events_and_reopens_window(
+        self,
+        buffer: VoteReceivedBuffer,
+        fake_redis: FakeRedis,
+        scheduled: list[tuple[uuid.UUID, int]],
+    ) -> None:
+        """Draining empties the buffer so the next event schedules a new flush."""
+        user_id = uuid.uuid4()
+        events = [make_event(uuid.uuid4()) for _ in range(3)]
+        for event in events:
+            await buffer.add(user_id, event)
+
+        assert await buffer.drain(user_id) == events
+        assert await buffer.drain(user_id) == []
+
+        await buffer.add(user_id, events[0])
+        assert len(scheduled) == 2
+        assert fake_redis.lists[events_key(user_id)] == [json.dumps(events[0])]
+
+    @pytest.mark.asyncio
+    async def test_failed_schedule_reopens_the_window(
+        self,
+        fake_redis: FakeRedis,
+        scheduled: list[tuple[uuid.UUID, int]],
+    ) -> None:
+        """An event whose flush could not be scheduled is handed back."""
+        broker_up = False
+
+        async def schedule_flush(user_id: uuid.UUID, countdown: int) -> None:
+            if not broker_up:
+                raise ConnectionRefusedError("broker is down")
+            scheduled.append((user_id, countdown))
+
+        buffer = VoteReceivedBuffer(fake_redis, window_seconds=60, schedule_flush=schedule_flush)  # type: ignore[arg-type]
+        user_id = uuid.uuid4()
+
+        with pytest.raises(ConnectionRefusedError):
+            await buffer.add(user_id, make_event(uuid.uuid4()))
+        assert fake_redis.lists[events_key(user_id)] == []
+        assert scheduled_key(user_id) not in fake_redis.strings
+
+        broker_up = True
+        await buffer.add(user_id, make_event(uuid.uuid4()))
+        assert scheduled == [(user_id, 60)]
+
+    @pytest.mark.asyncio
+    async def test_restore_puts_events_back_in_order(
+        self, buffer: VoteReceivedBuffer, fake_redis: FakeRedis
+    ) -> None:
+        """Restored events precede ones buffered after the drain."""
+        user_id = uuid.uuid4()
+        drained = [make_event(uuid.uuid4()) for _ in range(2)]
+        newer = make_event(uuid.uuid4())
+        await buffer.add(user_id, newer)
+
+        await buffer.restore(user_id, drained)
+
+        assert await buffer.drain(user_id) == [*drained, newer]
+
+
+class TestCoalescedVoteReceived:
+    """Tests for NotificationService with a vote-received buffer."""
+
+    @pytest.mark.asyncio
+    async def test_send_vote_received_queues_the_event_in_the_outbox(
+        self, db_session: AsyncSession, buffer: VoteReceivedBuffer, fake_redis: FakeRedis
+    ) -> None:
+        """With a buffer, the vote path only writes an outbox task."""
+        recipient_id, poll = await create_poll(db_session)
+        notification_repo = NotificationRepository(db_session)
+        service = NotificationService(
+            notification_repo, UserRepository(db_session), vote_received_buffer=buffer
+        )
+
+        await service.send_vote_received(recipient_id, poll.id, poll.circle_id, poll.question_text)
+        await db_session.flush()
+
+        assert await notification_repo.find_by_user_id(recipient_id) == []
+        assert fake_redis.lists == {}
+        message = (await db_session.execute(select(OutboxMessage))).scalar_one()
+        assert message.kind == OutboxMessage.KIND_TASK
+        assert json.loads(message.payload) == {
+            "task": buffer_vote_received_notification.name,
+            "args": [str(recipient_id), poll_event(poll)],
+        }
+
+    @pytest.mark.asyncio
+    async def test_buffer_vote_received_falls_back_when_redis_is_down(
+        self, db_session: AsyncSession, buffer: VoteReceivedBuffer, fake_redis: FakeRedis
+    ) -> None:
+        """A Redis failure delivers the notification inline instead."""
+        recipient_id, poll = await create_poll(db_session)
+        fake_redis.available = False
+        notification_repo = NotificationRepository(db_session)
+        service = NotificationService(
+            notification_repo, UserRepository(db_session), vote_received_buffer=buffer
+        )
+
+        await service.buffer_vote_received(recipient_id, poll_event(poll))
+
+        notifications = await notification_repo.find_by_user_id(recipient_id)
+        assert len(notifications) == 1
+        assert notifications[0].data["poll_id"] == str(poll.id)
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_one_notification_per_burst(
+        self, db_session: AsyncSession, buffer: VoteReceivedBuffer
+    ) -> None:
+        """Five hearts on one poll become a single counted notification."""
+        recipient_id, poll = await create_poll(db_session)
+        service = NotificationService(
+            NotificationRepository(db_session),
+            UserRepository(db_session),
+            vote_received_buffer=buffer,
+        )
+        for _ in range(5):
+            await service.buffer_vote_received(recipient_id, poll_event(poll))
+
+        delivered = await flush_vote_received(db_session, buffer, recipient_id)
+
+        notifications = await NotificationRepository(db_session).find_by_user_id(recipient_id)
+        assert delivered == 5
+        assert len(notifications) == 1
+        assert notifications[0].type == NotificationType.VOTE_RECEIVED
+        assert notifications[0].title == "🎊 하트를 5개 받았어요!"
+        assert notifications[0].data["count"] == 5
+        assert await flush_vote_received(db_session, buffer, recipient_id) == 0
+
+    @pytest.mark.asyncio
+    async def test_send_vote_received_batch_summarizes_multiple_polls(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Events across polls name the latest question and the rest by count."""
+        recipient_id, _ = await create_poll(db_session)
+        notification_repo = NotificationRepository(db_session)
+        service = NotificationService(notification_repo, UserRepository(db_session))
+        events = [
+            make_event(uuid.uuid4(), "Q1?"),
+            make_event(uuid.uuid4(), "Q2?"),
+            make_event(uuid.uuid4(), "Q3?"),
+        ]
+
+        await service.send_vote_received_batch(recipient_id, events)
+
+        notifications = await notification_repo.find_by_user_id(recipient_id)
+        assert len(notifications) == 1
+        assert notifications[0].data["count"] == 3
+        assert "외 2개" in notifications[0].body
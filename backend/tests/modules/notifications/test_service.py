@@ -16,6 +16,7 @@ from app.modules.notifications.models import Notification
 from app.modules.notifications.repository import NotificationRepository
 from app.modules.notifications.service import NotificationService
 from app.modules.polls.models import Poll
+from app.tasks.outbox_tasks import relay_outbox
 
 
 class TestNotificationService:
@@ -255,7 +256,7 @@ class TestNotificationService:
     async def test_send_poll_started_pushes_to_registered_tokens(
         self, db_session: AsyncSession
     ) -> None:
-        """Test sending push payloads only to members with registered tokens."""
+        """Test pushes are sent after commit, only to members with registered tokens."""
         user_repo = UserRepository(db_session)
         creator = await user_repo.create(
             UserCreate(email="creator@example.com", password="password123")
@@ -299,6 +300,11 @@ class TestNotificationService:
             poll, [creator.id, member_with_token.id, member_without_token.id]
         )
 
+        # Nothing is pushed until the outbox relay runs after commit
+        expo_push_client.send_batch_push_notifications.assert_not_awaited()
+        await db_session.commit()
+        assert await relay_outbox(db_session, expo_push_client) == 1
+
         expo_push_client.send_batch_push_notifications.assert_awaited_once()
         messages = expo_push_client.send_batch_push_notifications.await_args.args[0]
         assert messages == [
@@ -348,7 +354,7 @@ class TestNotificationService:
         service = NotificationService(notification_repo, user_repo)
 
         # Test: Send vote received notification
-        await service.send_vote_received(voted_for.id, poll)
+        await service.send_vote_received(voted_for.id, poll.id, poll.circle_id, poll.question_text)
 
         # Verify notification created
         notifications = await notification_repo.find_by_user_id(voted_for.id)
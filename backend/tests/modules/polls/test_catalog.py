@@ -0,0 +1,173 @@
+"""Tests for the cached poll template catalog."""
+
+import json
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import MemberRole, TemplateCategory
+from app.core.security import generate_invite_code
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.polls.catalog import VERSION_KEY, TemplateCatalog
+from app.modules.polls.models import PollTemplate
+from app.modules.polls.repository import PollRepository, TemplateRepository, VoteRepository
+from app.modules.polls.service import PollService
+
+
+class FakeRedis:
+    """In-memory stand-in for the string commands TemplateCatalog uses."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+        self.available = True
+
+    def check(self) -> None:
+        if not self.available:
+            raise RedisConnectionError("redis is down")
+
+    async def get(self, key: str) -> str | None:
+        self.check()
+        value = self.values.get(key)
+        return None if value is None else str(value)
+
+    async def incr(self, key: str) -> int:
+        self.check()
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+async def templates(db_session: AsyncSession) -> list[PollTemplate]:
+    """Create active templates in every category plus one inactive template."""
+    items = [
+        PollTemplate(category=category, question_text=f"{category.value} {index}?", emoji="✨")
+        for category in TemplateCategory
+        for index in range(2)
+    ]
+    items.append(
+        PollTemplate(
+            category=TemplateCategory.TALENT,
+            question_text="Retired?",
+            is_active=False,
+        )
+    )
+    db_session.add_all(items)
+    await db_session.commit()
+    return items
+
+
+def make_service(db_session: AsyncSession, catalog: TemplateCatalog) -> PollService:
+    return PollService(
+        template_repo=TemplateRepository(db_session),
+        poll_repo=PollRepository(db_session),
+        vote_repo=VoteRepository(db_session),
+        membership_repo=MembershipRepository(db_session),
+        circle_repo=CircleRepository(db_session),
+        template_catalog=catalog,
+    )
+
+
+class TestTemplateCatalog:
+    """Tests for TemplateCatalog-backed template endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_warm_catalog_serves_templates_without_queries(
+        self,
+        db_session: AsyncSession,
+        templates: list[PollTemplate],
+        fake_redis: FakeRedis,
+        count_queries,
+    ) -> None:
+        catalog = TemplateCatalog(fake_redis, ttl_seconds=300, version_check_seconds=300)  # type: ignore[arg-type]
+        service = make_service(db_session, catalog)
+        expected = await service.get_templates()
+
+        with count_queries() as statements:
+            all_templates = await service.get_templates()
+            talent = await service.get_templates(TemplateCategory.TALENT)
+            payload = await service.get_templates_json(TemplateCategory.TALENT)
+            categories = await service.get_categories()
+
+        assert statements == []
+        assert all_templates == expected
+        assert len(all_templates) == 2 * len(TemplateCategory)
+        assert [t.category for t in talent] == [TemplateCategory.TALENT] * 2
+        assert [item["id"] for item in json.loads(payload)] == [str(t.id) for t in talent]
+        assert {c.category: c.question_count for c in categories} == dict.fromkeys(
+            TemplateCategory, 2
+        )
+
+    @pytest.mark.asyncio
+    async def test_admin_update_is_seen_by_other_workers(
+        self,
+        db_session: AsyncSession,
+        templates: list[PollTemplate],
+        fake_redis: FakeRedis,
+    ) -> None:
+        """A template write bumps the shared version and other workers reload."""
+        writer = TemplateCatalog(fake_redis, ttl_seconds=300, version_check_seconds=0)  # type: ignore[arg-type]
+        reader = TemplateCatalog(fake_redis, ttl_seconds=300, version_check_seconds=0)  # type: ignore[arg-type]
+        writer_service = make_service(db_session, writer)
+        reader_service = make_service(db_session, reader)
+        assert len(await reader_service.get_templates()) == 8
+
+        await writer_service.update_template(templates[0].id, is_active=False)
+        assert VERSION_KEY not in fake_redis.values
+
+        await db_session.commit()
+        assert fake_redis.values[VERSION_KEY] == 1
+        assert len(await reader_service.get_templates()) == 7
+        assert len(await writer_service.get_templates()) == 7
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_keeps_serving_snapshot(
+        self,
+        db_session: AsyncSession,
+        templates: list[PollTemplate],
+        fake_redis: FakeRedis,
+        count_queries,
+    ) -> None:
+        catalog = TemplateCatalog(fake_redis, ttl_seconds=300, version_check_seconds=0)  # type: ignore[arg-type]
+        service = make_service(db_session, catalog)
+        await service.get_templates()
+        fake_redis.available = False
+
+        with count_queries() as statements:
+            cached = await service.get_templates()
+
+        assert statements == []
+        assert len(cached) == 8
+
+    @pytest.mark.asyncio
+    async def test_create_round_uses_catalog_candidates(
+        self,
+        db_session: AsyncSession,
+        templates: list[PollTemplate],
+        fake_redis: FakeRedis,
+    ) -> None:
+        """Rounds draw active templates from the catalog snapshot."""
+        user_repo = UserRepository(db_session)
+        owner = await user_repo.create(UserCreate(email="owner@example.com", password="pw123456"))
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Round Circle"), owner.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, owner.id, MemberRole.OWNER)
+        circle.member_count = 5
+        await db_session.commit()
+        catalog = TemplateCatalog(fake_redis, ttl_seconds=300, version_check_seconds=300)  # type: ignore[arg-type]
+
+        round_response = await make_service(db_session, catalog).create_round(circle.id, owner.id)
+
+        active_ids = {t.id for t in templates if t.is_active}
+        assert len(round_response.polls) == 5
+        assert {poll.template_id for poll in round_response.polls} <= active_ids
@@ -0,0 +1,307 @@
+"""Tests for live results streamed over Redis pub/sub."""
+
+import asyncio
+import json
+import time
+import uuid
+from contextlib import AsyncExitStack
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import MemberRole
+from app.core.security import generate_invite_code
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.polls.live_results import LiveResultsHub, live_channel
+from app.modules.polls.models import Poll
+from app.modules.polls.repository import PollRepository, TemplateRepository, VoteRepository
+from app.modules.polls.service import PollService
+
+
+class FakePipeline:
+    """Buffered subset of redis.asyncio pipeline commands."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.ops: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def publish(self, channel: str, message: str) -> None:
+        self.ops.append((channel, message))
+
+    async def execute(self) -> None:
+        self.redis.check()
+        for channel, message in self.ops:
+            self.redis.published.append((channel, message))
+            if channel in self.redis.pubsub_connection.channels:
+                self.redis.pubsub_connection.deliver(
+                    {"type": "message", "channel": channel, "data": message}
+                )
+
+
+class FakePubSub:
+    """In-memory stand-in for one redis.asyncio pub/sub connection."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.channels: set[str] = set()
+        self.subscribe_calls = 0
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    def deliver(self, message: dict[str, Any]) -> None:
+        self.messages.put_nowait(message)
+
+    async def subscribe(self, channel: str) -> None:
+        self.redis.check()
+        self.subscribe_calls += 1
+        self.channels.add(channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        self.channels.discard(channel)
+        self.deliver({"type": "unsubscribe", "channel": channel, "data": 0})
+
+    async def get_message(
+        self,
+        ignore_subscribe_messages: bool = False,
+        timeout: float = 0.0,  # noqa: ASYNC109 - mirrors redis-py's PubSub.get_message
+    ) -> dict[str, Any] | None:
+        self.redis.check()
+        try:
+            message = await asyncio.wait_for(self.messages.get(), timeout)
+        except TimeoutError:
+            return None
+        self.redis.check()
+        if ignore_subscribe_messages and message["type"] != "message":
+            return None
+        return message
+
+
+class FakeRedis:
+    """In-memory stand-in for the pub/sub commands LiveResultsHub uses."""
+
+    def __init__(self) -> None:
+        self.published: list[tuple[str, str]] = []
+        self.pubsub_connection = FakePubSub(self)
+        self.pubsub_calls = 0
+        self.available = True
+
+    def check(self) -> None:
+        if not self.available:
+            raise RedisConnectionError("redis is down")
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def pubsub(self) -> FakePubSub:
+        self.pubsub_calls += 1
+        return self.pubsub_connection
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def hub(fake_redis: FakeRedis) -> LiveResultsHub:
+    return LiveResultsHub(fake_redis, max_pending=4, heartbeat_seconds=0.01)  # type: ignore[arg-type]
+
+
+async def wait_until_idle(hub: LiveResultsHub) -> None:
+    """Let the reader task dispatch queued messages."""
+    for _ in range(100):
+        await asyncio.sleep(0)
+
+
+async def stop_reader(hub: LiveResultsHub) -> None:
+    """Wait for the reader task to notice every stream closed."""
+    if hub._reader is not None:
+        await asyncio.wait_for(hub._reader, timeout=1)
+
+
+class TestLiveResultsHub:
+    """Tests for LiveResultsHub fan-out and per-stream bounds."""
+
+    @pytest.mark.asyncio
+    async def test_thousands_of_idle_streams_share_one_subscription(
+        self, hub: LiveResultsHub, fake_redis: FakeRedis
+    ) -> None:
+        circle_id, poll_id, user_id = uuid.uuid4(), str(uuid.uuid4()), str(uuid.uuid4())
+
+        async with AsyncExitStack() as stack:
+            subscribers = [
+                await stack.enter_async_context(hub.subscribe(circle_id, None, {poll_id}))
+                for _ in range(5000)
+            ]
+            assert hub.subscriber_count == 5000
+            assert fake_redis.pubsub_calls == 1
+            assert fake_redis.pubsub_connection.subscribe_calls == 1
+
+            await hub.publish({str(circle_id): [(poll_id, user_id)]})
+            await wait_until_idle(hub)
+
+            assert all(subscriber.ready.is_set() for subscriber in subscribers)
+            assert all(subscriber.pending == {(poll_id, user_id): 1} for subscriber in subscribers)
+
+        assert hub.subscriber_count == 0
+        assert live_channel(circle_id) not in fake_redis.pubsub_connection.channels
+        await stop_reader(hub)
+
+    @pytest.mark.asyncio
+    async def test_deltas_coalesce_up_to_the_bound_then_resync(self, hub: LiveResultsHub) -> None:
+        circle_id, poll_id = uuid.uuid4(), str(uuid.uuid4())
+        first = str(uuid.uuid4())
+
+        async with hub.subscribe(circle_id, None, {poll_id}) as subscriber:
+            subscriber.push([(poll_id, first)] * 100)
+            assert subscriber.pending == {(poll_id, first): 100}
+
+            subscriber.push([(poll_id, str(uuid.uuid4())) for _ in range(4)])
+
+            assert subscriber.pending == {}
+            assert subscriber.drain() == "event: resync\ndata: {}\n\n"
+            assert subscriber.drain() is None
+        await stop_reader(hub)
+
+    @pytest.mark.asyncio
+    async def test_unvoted_polls_stream_counts_only(self, hub: LiveResultsHub) -> None:
+        circle_id = uuid.uuid4()
+        voted, unvoted, other = (str(uuid.uuid4()) for _ in range(3))
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+
+        async with hub.subscribe(circle_id, {voted, unvoted}, {voted}) as subscriber:
+            subscriber.push([(voted, first), (unvoted, first), (unvoted, second), (other, first)])
+            chunk = subscriber.drain()
+
+        assert chunk is not None
+        event, data = chunk.strip().split("\n")
+        assert event == "event: tally"
+        assert json.loads(data.removeprefix("data: "))["deltas"] == [
+            {"poll_id": voted, "user_id": first, "count": 1},
+            {"poll_id": unvoted, "user_id": None, "count": 2},
+        ]
+        await stop_reader(hub)
+
+    @pytest.mark.asyncio
+    async def test_stream_sends_heartbeats_and_ends(self, hub: LiveResultsHub) -> None:
+        async with hub.subscribe(uuid.uuid4(), None, set()) as subscriber:
+            chunks = [chunk async for chunk in hub.stream(subscriber, time.monotonic() + 0.05)]
+
+        assert ": heartbeat\n\n" in chunks
+        assert chunks[-1] == "event: end\ndata: {}\n\n"
+        await stop_reader(hub)
+
+    @pytest.mark.asyncio
+    async def test_lost_subscription_asks_every_stream_to_resync(
+        self, hub: LiveResultsHub, fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("app.modules.polls.live_results.RECONNECT_DELAY_SECONDS", 0)
+        async with hub.subscribe(uuid.uuid4(), None, set()) as subscriber:
+            fake_redis.available = False
+            fake_redis.pubsub_connection.deliver({"type": "message"})
+            await asyncio.wait_for(subscriber.ready.wait(), timeout=1)
+            fake_redis.available = True
+
+            assert subscriber.drain() == "event: resync\ndata: {}\n\n"
+        await stop_reader(hub)
+
+
+class TestPollServiceLiveResults:
+    """Tests for PollService publishing and streaming live results."""
+
+    @staticmethod
+    async def build_context(
+        db_session: AsyncSession, hub: LiveResultsHub
+    ) -> tuple[PollService, Poll, list[uuid.UUID]]:
+        user_repo = UserRepository(db_session)
+        users = [
+            await user_repo.create(
+                UserCreate(email=f"live{index}@example.com", password="password123")
+            )
+            for index in range(3)
+        ]
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Live Circle"), users[0].id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, users[0].id, MemberRole.OWNER)
+        for user in users[1:]:
+            await membership_repo.create(circle.id, user.id)
+
+        poll = Poll(
+            circle_id=circle.id,
+            creator_id=users[0].id,
+            question_text="Who is the fastest?",
+            ends_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        db_session.add(poll)
+        await db_session.commit()
+
+        service = PollService(
+            template_repo=TemplateRepository(db_session),
+            poll_repo=PollRepository(db_session),
+            vote_repo=VoteRepository(db_session),
+            membership_repo=membership_repo,
+            user_repo=user_repo,
+            live_results=hub,
+        )
+        return service, poll, [user.id for user in users]
+
+    @pytest.mark.asyncio
+    async def test_votes_are_published_only_after_commit(
+        self, db_session: AsyncSession, hub: LiveResultsHub, fake_redis: FakeRedis
+    ) -> None:
+        service, poll, (owner_id, voter_id, other_id) = await self.build_context(db_session, hub)
+
+        await service.vote(poll.id, voter_id, owner_id)
+        assert fake_redis.published == []
+
+        await db_session.commit()
+        assert fake_redis.published == [
+            (live_channel(poll.circle_id), json.dumps([[str(poll.id), str(owner_id)]]))
+        ]
+
+        await service.vote(poll.id, other_id, owner_id)
+        await db_session.rollback()
+        await db_session.commit()
+        assert len(fake_redis.published) == 1
+
+    @pytest.mark.asyncio
+    async def test_poll_stream_sends_snapshot_then_deltas(
+        self, db_session: AsyncSession, hub: LiveResultsHub
+    ) -> None:
+        service, poll, (owner_id, voter_id, other_id) = await self.build_context(db_session, hub)
+        await service.vote(poll.id, voter_id, owner_id)
+        await db_session.commit()
+
+        events = await service.stream_poll_results(poll.id, voter_id)
+        snapshot = await anext(events)
+        assert snapshot.startswith("event: snapshot\n")
+        data = json.loads(snapshot.split("data: ", 1)[1])
+        assert data["vote_count"] == 1
+        assert data["results"][0]["user_id"] == str(owner_id)
+        assert hub.subscriber_count == 1
+
+        await service.vote(poll.id, other_id, owner_id)
+        await db_session.commit()
+        delta = await asyncio.wait_for(anext(events), timeout=1)
+        while delta == ": heartbeat\n\n":
+            delta = await asyncio.wait_for(anext(events), timeout=1)
+        assert json.loads(delta.split("data: ", 1)[1]) == {
+            "deltas": [{"poll_id": str(poll.id), "user_id": str(owner_id), "count": 1}]
+        }
+
+        await events.aclose()
+        assert hub.subscriber_count == 0
+        await stop_reader(hub)
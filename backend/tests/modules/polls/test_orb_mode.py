@@ -210,6 +210,40 @@ class TestOrbModeHintsEndpoint:
         full_hint = next(hint for hint in hints if hint["tier"] == "FULL")
         assert "seoyeon" in full_hint["text"]
 
+    @pytest.mark.asyncio
+    async def test_get_vote_hints_materializes_hints_in_one_insert(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        set_current_user,
+        templates_fixture: list[PollTemplate],
+        count_queries,
+    ) -> None:
+        """First open inserts every missing hint at once; later opens only read."""
+        owner = await create_user(db_session, "bulk-hint-owner@test.com", "owner")
+        target = await create_user(db_session, "bulk-hint-target@test.com", "target")
+        voters = [
+            await create_user(db_session, f"bulk-hint-voter{i}@test.com", f"voter{i}")
+            for i in range(3)
+        ]
+        circle = await create_circle_with_members(db_session, owner, [target, *voters])
+        poll = await create_poll(db_session, circle, templates_fixture[0], owner)
+        for voter in voters:
+            await cast_vote(db_session, poll, voter, target)
+
+        set_current_user(target)
+        with count_queries() as first_open:
+            first = await client.get(f"/polls/{poll.id}/hints")
+        with count_queries() as second_open:
+            second = await client.get(f"/polls/{poll.id}/hints")
+
+        assert first.status_code == status.HTTP_200_OK
+        assert len(first.json()["hints"]) == 12
+        hint_inserts = [s for s in first_open if s.startswith("INSERT INTO vote_hints")]
+        assert len(hint_inserts) == 1
+        assert not any(s.startswith("INSERT") for s in second_open)
+        assert second.json()["hints"] == first.json()["hints"]
+
     @pytest.mark.asyncio
     async def test_legacy_voters_endpoint_removed(
         self,
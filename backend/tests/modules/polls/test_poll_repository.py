@@ -1,19 +1,19 @@
 """Tests for Poll Repository."""
 
 import uuid
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.enums import PollStatus, TemplateCategory
-from app.core.security import generate_invite_code
+from app.core.enums import MemberRole, PollStatus, TemplateCategory
+from app.core.security import generate_invite_code, generate_voter_hash
 from app.modules.auth.repository import UserRepository
 from app.modules.auth.schemas import UserCreate
-from app.modules.circles.repository import CircleRepository
+from app.modules.circles.repository import CircleRepository, MembershipRepository
 from app.modules.circles.schemas import CircleCreate
-from app.modules.polls.models import Poll, PollTemplate
-from app.modules.polls.repository import PollRepository
+from app.modules.polls.models import Poll, PollTemplate, Vote
+from app.modules.polls.repository import PollRepository, VoteRepository
 
 
 class TestPollRepository:
@@ -267,13 +267,26 @@ class TestPollRepository:
         # Test
         repo = PollRepository(db_session)
         await repo.increment_vote_count(poll.id)
+        await repo.increment_vote_count(poll.id)
 
-        await db_session.refresh(poll)
-        assert poll.vote_count == 6
+        # The increments stay pending until folded, but reads include them
+        await db_session.refresh(poll, ["vote_count", "pending_vote_count"])
+        assert (poll.vote_count, poll.total_vote_count) == (5, 7)
+
+        assert await repo.fold_vote_deltas() == 2
+        await db_session.refresh(poll, ["vote_count", "pending_vote_count"])
+        assert (poll.vote_count, poll.pending_vote_count) == (7, 0)
+
+        # Folding a closing poll's deltas loops past the batch limit
+        for _ in range(3):
+            await repo.increment_vote_count(poll.id)
+        assert await repo.fold_vote_deltas(limit=1, poll_ids=[poll.id]) == 3
+        await db_session.refresh(poll, ["vote_count", "pending_vote_count"])
+        assert (poll.vote_count, poll.pending_vote_count) == (10, 0)
 
     @pytest.mark.asyncio
-    async def test_find_ending_soon(self, db_session: AsyncSession) -> None:
-        """Test finding polls ending soon."""
+    async def test_find_due_polls(self, db_session: AsyncSession) -> None:
+        """Test finding polls due for a reminder or for closing."""
         # Setup
         user_repo = UserRepository(db_session)
         user = await user_repo.create(UserCreate(email="user@example.com", password="password123"))
@@ -283,13 +296,14 @@ class TestPollRepository:
             CircleCreate(name="Circle"), user.id, generate_invite_code()
         )
 
-        now = datetime.now()
+        now = datetime.now(UTC)
         # Poll ending in 5 minutes
         poll1 = Poll(
             circle_id=circle.id,
             creator_id=user.id,
             question_text="Ending soon?",
             status=PollStatus.ACTIVE,
+            created_at=now - timedelta(hours=1),
             ends_at=now + timedelta(minutes=5),
         )
         # Poll ending in 30 minutes
@@ -298,6 +312,7 @@ class TestPollRepository:
             creator_id=user.id,
             question_text="Ending later?",
             status=PollStatus.ACTIVE,
+            created_at=now - timedelta(hours=1),
             ends_at=now + timedelta(minutes=30),
         )
         # Poll already ended
@@ -306,15 +321,129 @@ class TestPollRepository:
             creator_id=user.id,
             question_text="Already ended?",
             status=PollStatus.ACTIVE,
+            created_at=now - timedelta(hours=1),
             ends_at=now - timedelta(minutes=5),
         )
         db_session.add_all([poll1, poll2, poll3])
         await db_session.commit()
 
-        # Test: Find polls ending within 15 minutes
+        # Test: 10-minute reminders and closing
         repo = PollRepository(db_session)
-        ending_soon = await repo.find_ending_soon(minutes=15)
+        due_reminder = await repo.find_due_for_reminder(10, now)
+        due_close = await repo.find_due_for_close(now)
+
+        assert [p.question_text for p in due_reminder] == ["Ending soon?"]
+        assert [p.question_text for p in due_close] == ["Already ended?"]
+
+        await repo.mark_reminded([poll1.id], 10)
+        assert await repo.find_due_for_reminder(10, now) == []
 
-        # Should find poll1 (5 min) and poll3 (already ended)
-        assert len(ending_soon) >= 1
-        assert any(p.question_text == "Ending soon?" for p in ending_soon)
+    @pytest.mark.asyncio
+    async def test_find_completed_without_results(self, db_session: AsyncSession) -> None:
+        """Only completed polls with votes and no snapshot need a backfill."""
+        user_repo = UserRepository(db_session)
+        user = await user_repo.create(
+            UserCreate(email="backfill@example.com", password="password123")
+        )
+        other = await user_repo.create(
+            UserCreate(email="backfill-other@example.com", password="password123")
+        )
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Backfill Circle"), user.id, generate_invite_code()
+        )
+
+        def make_poll(status: PollStatus, vote_count: int) -> Poll:
+            return Poll(
+                circle_id=circle.id,
+                creator_id=user.id,
+                question_text="Backfill?",
+                status=status,
+                vote_count=vote_count,
+                ends_at=datetime.now() + timedelta(hours=1),
+            )
+
+        pending = make_poll(PollStatus.COMPLETED, 1)
+        materialized = make_poll(PollStatus.COMPLETED, 1)
+        empty = make_poll(PollStatus.COMPLETED, 0)
+        active = make_poll(PollStatus.ACTIVE, 1)
+        db_session.add_all([pending, materialized, empty, active])
+        await db_session.flush()
+        for poll in (pending, materialized, active):
+            db_session.add(
+                Vote(poll_id=poll.id, voter_id=user.id, voter_hash="h", voted_for_id=other.id)
+            )
+        await db_session.flush()
+
+        vote_repo = VoteRepository(db_session)
+        assert await vote_repo.materialize_results(materialized.id) == 1
+        # Re-materializing upserts instead of duplicating
+        assert await vote_repo.materialize_results(materialized.id) == 1
+
+        repo = PollRepository(db_session)
+        assert await repo.find_completed_without_results() == [pending.id]
+        assert await repo.find_completed_without_results(after_id=pending.id) == []
+
+    @pytest.mark.asyncio
+    async def test_find_session_queue_interleaves_circles(self, db_session: AsyncSession) -> None:
+        """Open, unvoted polls from the user's circles are interleaved round-robin."""
+        user_repo = UserRepository(db_session)
+        voter = await user_repo.create(UserCreate(email="voter@example.com", password="pw123456"))
+        other = await user_repo.create(UserCreate(email="other@example.com", password="pw123456"))
+        circle_repo = CircleRepository(db_session)
+        membership_repo = MembershipRepository(db_session)
+        circles = []
+        for name in ("A", "B", "Foreign"):
+            circle = await circle_repo.create(
+                CircleCreate(name=name), other.id, generate_invite_code()
+            )
+            await membership_repo.create(circle.id, other.id, MemberRole.OWNER)
+            if name != "Foreign":
+                await membership_repo.create(circle.id, voter.id)
+            circles.append(circle)
+        circle_a, circle_b, foreign = circles
+
+        base = datetime.now(UTC)
+
+        def make_poll(circle_id: uuid.UUID, minutes_ago: int, **kwargs: object) -> Poll:
+            poll = Poll(
+                circle_id=circle_id,
+                creator_id=other.id,
+                question_text=f"Question {minutes_ago}?",
+                ends_at=base + timedelta(hours=1),
+                **kwargs,
+            )
+            poll.created_at = base - timedelta(minutes=minutes_ago)
+            return poll
+
+        a1, a2, a3 = (make_poll(circle_a.id, minutes) for minutes in (1, 2, 3))
+        b1, b2 = (make_poll(circle_b.id, minutes) for minutes in (5, 6))
+        voted = make_poll(circle_a.id, 0)
+        expired = make_poll(circle_b.id, 0)
+        expired.ends_at = base - timedelta(minutes=1)
+        completed = make_poll(circle_b.id, 0, status=PollStatus.COMPLETED)
+        not_member = make_poll(foreign.id, 0)
+        db_session.add_all([a1, a2, a3, b1, b2, voted, expired, completed, not_member])
+        await db_session.flush()
+        db_session.add(
+            Vote(
+                poll_id=voted.id,
+                voter_id=voter.id,
+                voter_hash=generate_voter_hash(voter.id, voted.id, salt=str(voted.id)),
+                voted_for_id=other.id,
+            )
+        )
+        await db_session.commit()
+
+        repo = PollRepository(db_session)
+        assert await repo.find_session_queue(voter.id, limit=12) == [
+            a1.id,
+            b1.id,
+            a2.id,
+            b2.id,
+            a3.id,
+        ]
+        assert await repo.find_session_queue(voter.id, limit=3) == [a1.id, b1.id, a2.id]
+        assert await repo.find_session_queue(voter.id, limit=12, circle_id=circle_b.id) == [
+            b1.id,
+            b2.id,
+        ]
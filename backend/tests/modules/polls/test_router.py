@@ -184,3 +184,94 @@ class TestPollRouter:
         data = vote_response.json()
         assert data["success"] is True
         assert len(data["results"]) > 0
+
+    @pytest.mark.asyncio
+    async def test_poll_and_feed_conditional_get(
+        self, client: AsyncClient, templates_fixture: list[PollTemplate]
+    ) -> None:
+        """GET /polls/{poll_id} and /polls/me answer a current ETag with 304."""
+        tokens = {}
+        users = {}
+        for name in ["owner", "member"]:
+            login_response = await client.post(
+                "/auth/dev-login",
+                json={"email": f"etag-{name}@example.com", "password": "password123"},
+            )
+            tokens[name] = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+            users[name] = login_response.json()["user"]["id"]
+
+        circle_response = await client.post(
+            "/circles", json={"name": "ETag Circle"}, headers=tokens["owner"]
+        )
+        await client.post(
+            "/circles/join/code",
+            json={"invite_code": circle_response.json()["invite_code"]},
+            headers=tokens["member"],
+        )
+        poll_response = await client.post(
+            f"/polls/circles/{circle_response.json()['id']}",
+            json={"template_id": str(templates_fixture[0].id), "duration": "3H"},
+            headers=tokens["owner"],
+        )
+        poll_id = poll_response.json()["id"]
+
+        etags = {}
+        for path in [f"/polls/{poll_id}", "/polls/me"]:
+            response = await client.get(path, headers=tokens["member"])
+            assert response.status_code == status.HTTP_200_OK
+            etags[path] = response.headers["ETag"]
+            assert response.headers["Cache-Control"] == "private, no-cache"
+
+            cached = await client.get(
+                path, headers={**tokens["member"], "If-None-Match": etags[path]}
+            )
+            assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+            assert cached.content == b""
+            assert cached.headers["ETag"] == etags[path]
+
+        # Another user's copy never matches
+        other = await client.get(
+            f"/polls/{poll_id}",
+            headers={**tokens["owner"], "If-None-Match": etags[f"/polls/{poll_id}"]},
+        )
+        assert other.status_code == status.HTTP_200_OK
+
+        await client.post(
+            f"/polls/{poll_id}/vote",
+            json={"voted_for_id": users["member"]},
+            headers=tokens["owner"],
+        )
+
+        for path in [f"/polls/{poll_id}", "/polls/me"]:
+            response = await client.get(
+                path, headers={**tokens["member"], "If-None-Match": etags[path]}
+            )
+            assert response.status_code == status.HTTP_200_OK
+            assert response.headers["ETag"] != etags[path]
+
+        poll = (await client.get(f"/polls/{poll_id}", headers=tokens["member"])).json()
+        assert poll["vote_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_live_results_unavailable_when_disabled(
+        self, client: AsyncClient, templates_fixture: list[PollTemplate]
+    ) -> None:
+        """Live results streams answer 503 while live results are disabled."""
+        login_response = await client.post(
+            "/auth/dev-login",
+            json={"email": "live-owner@example.com", "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        circle_id = (
+            await client.post("/circles", json={"name": "Live Circle"}, headers=headers)
+        ).json()["id"]
+        poll_response = await client.post(
+            f"/polls/circles/{circle_id}",
+            json={"template_id": str(templates_fixture[0].id), "duration": "3H"},
+            headers=headers,
+        )
+
+        poll_id = poll_response.json()["id"]
+        for path in [f"/polls/{poll_id}/live", f"/polls/circles/{circle_id}/live"]:
+            response = await client.get(path, headers=headers)
+            assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
@@ -3,7 +3,7 @@
 import uuid
 from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,17 +15,37 @@ from app.modules.auth.repository import UserRepository
 from app.modules.auth.schemas import UserCreate
 from app.modules.circles.repository import CircleRepository, MembershipRepository
 from app.modules.circles.schemas import CircleCreate
-from app.modules.polls.models import Poll, PollTemplate
+from app.modules.polls.models import Poll, PollTemplate, Vote
 from app.modules.polls.repository import (
     PollRepository,
     TemplateRepository,
+    VoteCastDict,
     VoteRepository,
     VoteSessionRepository,
 )
-from app.modules.polls.schemas import PollCreate, PollDuration
+from app.modules.polls.schemas import PollCreate, PollDuration, VoteSessionBatchItem
 from app.modules.polls.service import PollService
 
 
+def vote_cast_outcome(
+    poll_id: uuid.UUID,
+    *,
+    voter_is_member: bool = True,
+    target_is_member: bool = True,
+) -> VoteCastDict:
+    """Build a VoteRepository.cast_vote result for an active poll with no insert."""
+    return {
+        "poll_id": poll_id,
+        "circle_id": uuid.uuid4(),
+        "question_text": "Who is the funniest?",
+        "status": PollStatus.ACTIVE,
+        "voter_is_member": voter_is_member,
+        "target_is_member": target_is_member,
+        "vote_id": None,
+        "rewarded": False,
+    }
+
+
 class TestPollService:
     """Tests for PollService."""
 
@@ -143,14 +163,11 @@ class TestPollService:
             template_id=template.id,
             duration=PollDuration.THREE_HOURS,
         )
-        with patch(
-            "app.tasks.notification_tasks.schedule_poll_deadline_notifications"
-        ) as schedule_notifications:
-            result = await service.create_poll(
-                circle_id=circle.id,
-                creator_id=creator.id,
-                poll_data=poll_data,
-            )
+        result = await service.create_poll(
+            circle_id=circle.id,
+            creator_id=creator.id,
+            poll_data=poll_data,
+        )
 
         assert result is not None
         assert result.circle_id == circle.id
@@ -162,10 +179,6 @@ class TestPollService:
         # Verify ends_at is approximately 3 hours from now
         expected_end = datetime.now(UTC) + timedelta(hours=3)
         assert abs((result.ends_at - expected_end).total_seconds()) < 60  # Within 1 minute
-        schedule_notifications.assert_called_once_with(
-            str(result.id),
-            result.ends_at,
-        )
 
     @pytest.mark.asyncio
     async def test_create_poll_template_not_found(self, db_session: AsyncSession) -> None:
@@ -335,78 +348,118 @@ class TestPollService:
         assert vote_count == 1
 
         await db_session.refresh(voter)
-        assert voter.coin_balance == 1
-        assert voter.streak_days == 1
-        assert voter.last_reward_at is not None
+        await db_session.refresh(voter, ["pending_coin_balance", "pending_reward_dates"])
+        assert voter.total_coin_balance == 1
+        assert voter.total_streak_days == 1
 
     @pytest.mark.asyncio
     async def test_vote_rejects_non_member(self) -> None:
         """A user outside the poll's Circle cannot cast a vote."""
         poll_id = uuid.uuid4()
-        circle_id = uuid.uuid4()
         voter_id = uuid.uuid4()
-        poll_repo = MagicMock()
-        poll_repo.find_by_id = AsyncMock(
-            return_value=SimpleNamespace(
-                id=poll_id,
-                circle_id=circle_id,
-                status=PollStatus.ACTIVE,
-            )
-        )
-        membership_repo = MagicMock()
-        membership_repo.exists = AsyncMock(return_value=False)
         vote_repo = MagicMock()
-        vote_repo.create = AsyncMock()
+        vote_repo.cast_vote = AsyncMock(
+            return_value=vote_cast_outcome(poll_id, voter_is_member=False)
+        )
 
         service = PollService(
             template_repo=MagicMock(),
-            poll_repo=poll_repo,
+            poll_repo=MagicMock(),
             vote_repo=vote_repo,
-            membership_repo=membership_repo,
+            membership_repo=MagicMock(),
         )
 
         with pytest.raises(AuthorizationError, match="Circle member"):
             await service.vote(poll_id, voter_id, uuid.uuid4())
 
-        membership_repo.exists.assert_awaited_once_with(circle_id, voter_id)
-        vote_repo.create.assert_not_awaited()
+        vote_repo.cast_vote.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_vote_rejects_target_outside_circle(self) -> None:
         """A vote target must belong to the poll's Circle."""
         poll_id = uuid.uuid4()
-        circle_id = uuid.uuid4()
         voter_id = uuid.uuid4()
         target_id = uuid.uuid4()
-        poll_repo = MagicMock()
-        poll_repo.find_by_id = AsyncMock(
-            return_value=SimpleNamespace(
-                id=poll_id,
-                circle_id=circle_id,
-                status=PollStatus.ACTIVE,
-            )
-        )
-        membership_repo = MagicMock()
-        membership_repo.exists = AsyncMock(side_effect=[True, False])
         vote_repo = MagicMock()
-        vote_repo.create = AsyncMock()
+        vote_repo.cast_vote = AsyncMock(
+            return_value=vote_cast_outcome(poll_id, target_is_member=False)
+        )
 
         service = PollService(
             template_repo=MagicMock(),
-            poll_repo=poll_repo,
+            poll_repo=MagicMock(),
             vote_repo=vote_repo,
-            membership_repo=membership_repo,
+            membership_repo=MagicMock(),
         )
 
         with pytest.raises(BadRequestException) as exc_info:
             await service.vote(poll_id, voter_id, target_id)
 
         assert exc_info.value.code == "INVALID_VOTE_TARGET"
-        assert membership_repo.exists.await_args_list == [
-            call(circle_id, voter_id),
-            call(circle_id, target_id),
-        ]
-        vote_repo.create.assert_not_awaited()
+        assert vote_repo.cast_vote.await_args.kwargs["voted_for_id"] == target_id
+
+    @pytest.mark.asyncio
+    async def test_vote_commits_in_two_round_trips(
+        self, db_session: AsyncSession, count_queries
+    ) -> None:
+        """The vote path issues one commit statement plus the results aggregate."""
+        user_repo = UserRepository(db_session)
+        creator = await user_repo.create(
+            UserCreate(email="rt-creator@example.com", password="password123")
+        )
+        voter = await user_repo.create(
+            UserCreate(email="rt-voter@example.com", password="password123")
+        )
+        voted_for = await user_repo.create(
+            UserCreate(email="rt-target@example.com", password="password123")
+        )
+
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Round Trip Circle"), creator.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, creator.id, MemberRole.OWNER)
+        await membership_repo.create(circle.id, voter.id, MemberRole.MEMBER)
+        await membership_repo.create(circle.id, voted_for.id, MemberRole.MEMBER)
+
+        template = PollTemplate(
+            category=TemplateCategory.PERSONALITY,
+            question_text="Who is the fastest?",
+            emoji="⚡",
+        )
+        db_session.add(template)
+        await db_session.flush()
+
+        poll_repo = PollRepository(db_session)
+        poll = await poll_repo.create(
+            circle_id=circle.id,
+            template_id=template.id,
+            creator_id=creator.id,
+            question_text=template.question_text,
+            ends_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        await db_session.commit()
+
+        service = PollService(
+            template_repo=TemplateRepository(db_session),
+            poll_repo=poll_repo,
+            vote_repo=VoteRepository(db_session),
+            membership_repo=membership_repo,
+            user_repo=user_repo,
+        )
+
+        with count_queries() as statements:
+            result = await service.vote(poll.id, voter.id, voted_for.id)
+
+        assert len(statements) == 2
+        assert result.results[0].user_id == voted_for.id
+        assert result.results[0].vote_count == 1
+
+        await db_session.refresh(poll, ["vote_count", "pending_vote_count"])
+        await db_session.refresh(voter)
+        await db_session.refresh(voter, ["pending_coin_balance", "pending_reward_dates"])
+        assert poll.total_vote_count == 1
+        assert voter.total_coin_balance == 1
 
     @pytest.mark.asyncio
     async def test_vote_success_keeps_same_day_streak_constant(
@@ -470,8 +523,9 @@ class TestPollService:
         await service.vote(second_poll.id, voter.id, voted_for.id)
 
         await db_session.refresh(voter)
-        assert voter.coin_balance == 2
-        assert voter.streak_days == 1
+        await db_session.refresh(voter, ["pending_coin_balance", "pending_reward_dates"])
+        assert voter.total_coin_balance == 2
+        assert voter.total_streak_days == 1
 
     @pytest.mark.asyncio
     async def test_vote_duplicate_prevention(self, db_session: AsyncSession) -> None:
@@ -649,6 +703,74 @@ class TestPollService:
         assert updated_poll is not None
         assert updated_poll.status == PollStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_close_poll_materializes_results(self, db_session: AsyncSession) -> None:
+        """Closing a poll snapshots rankings and later reads come from the snapshot."""
+        user_repo = UserRepository(db_session)
+        creator = await user_repo.create(
+            UserCreate(email="snapshot-creator@example.com", password="password123")
+        )
+        voters = [
+            await user_repo.create(
+                UserCreate(email=f"snapshot-voter{index}@example.com", password="password123")
+            )
+            for index in range(3)
+        ]
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Snapshot Circle"), creator.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, creator.id, MemberRole.OWNER)
+        for voter in voters:
+            await membership_repo.create(circle.id, voter.id)
+
+        poll = Poll(
+            circle_id=circle.id,
+            creator_id=creator.id,
+            question_text="Who is the kindest?",
+            ends_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        db_session.add(poll)
+        await db_session.commit()
+
+        vote_repo = VoteRepository(db_session)
+        service = PollService(
+            template_repo=TemplateRepository(db_session),
+            poll_repo=PollRepository(db_session),
+            vote_repo=vote_repo,
+            membership_repo=membership_repo,
+            user_repo=user_repo,
+        )
+        await service.vote(poll.id, voters[0].id, creator.id)
+        await service.vote(poll.id, voters[1].id, creator.id)
+        await service.vote(poll.id, voters[2].id, voters[0].id)
+
+        await service.close_poll(poll.id)
+
+        snapshot = await vote_repo.find_materialized_results(poll.id)
+        assert [(row["user_id"], row["vote_count"], row["rank"]) for row in snapshot] == [
+            (creator.id, 2, 1),
+            (voters[0].id, 1, 2),
+        ]
+        assert snapshot[0]["vote_percentage"] == pytest.approx(66.67)
+
+        # A late write to votes no longer changes the final results
+        db_session.add(
+            Vote(
+                poll_id=poll.id,
+                voter_id=creator.id,
+                voter_hash="late-vote",
+                voted_for_id=voters[1].id,
+            )
+        )
+        await db_session.flush()
+
+        results = await service.get_results(poll.id)
+        assert [(item.user_id, item.vote_count, item.rank) for item in results] == [
+            (creator.id, 2, 1),
+            (voters[0].id, 1, 2),
+        ]
+
     @pytest.mark.asyncio
     async def test_start_vote_session_builds_server_queue(
         self, db_session: AsyncSession
@@ -966,12 +1088,7 @@ class TestPollService:
         await db_session.flush()
 
         vote_repo = VoteRepository(db_session)
-        await vote_repo.create(
-            poll_id=poll.id,
-            voter_id=creator.id,
-            voter_hash="service-heart-read-hash",
-            voted_for_id=receiver.id,
-        )
+        await vote_repo.cast_vote(poll.id, creator.id, "service-heart-read-hash", receiver.id)
         await db_session.commit()
 
         service = PollService(
@@ -982,10 +1099,12 @@ class TestPollService:
         )
 
         response = await service.mark_received_heart_as_read(receiver.id, poll.id)
-        hearts = await service.get_received_hearts(receiver.id)
+        hearts, next_cursor = await service.get_received_hearts(receiver.id)
 
         assert response.is_read is True
         assert hearts[0].is_read is True
+        assert next_cursor is None
+        assert await service.get_received_heart_unread_count(receiver.id) == 0
 
         with pytest.raises(BadRequestException, match="Received heart not found"):
             await service.mark_received_heart_as_read(outsider.id, poll.id)
@@ -1054,6 +1173,7 @@ class TestCreateRound:
                 status=PollStatus.ACTIVE,
                 ends_at=kwargs["ends_at"],
                 vote_count=0,
+                total_vote_count=0,
                 created_at=now,
                 updated_at=now,
             )
@@ -1083,14 +1203,11 @@ class TestCreateRound:
     ) -> None:
         service, context = self.build_service(role=role)
 
-        with patch(
-            "app.tasks.notification_tasks.schedule_poll_deadline_notifications"
-        ) as schedule_notifications:
-            result = await service.create_round(
-                context.circle_id,
-                context.creator_id,
-                PollDuration.SIX_HOURS,
-            )
+        result = await service.create_round(
+            context.circle_id,
+            context.creator_id,
+            PollDuration.SIX_HOURS,
+        )
 
         assert result.created_count == 5
         assert len(result.polls) == 5
@@ -1106,7 +1223,6 @@ class TestCreateRound:
         )
         assert context.poll_repo.create.await_count == 5
         assert context.template_repo.increment_usage_count.await_count == 5
-        assert schedule_notifications.call_count == 5
 
     @pytest.mark.asyncio
     async def test_member_cannot_create_round(self) -> None:
@@ -1154,3 +1270,292 @@ class TestCreateRound:
 
         assert exc_info.value.code == "NOT_ENOUGH_TEMPLATES"
         context.poll_repo.create.assert_not_awaited()
+
+
+class TestPollServiceQueryCounts:
+    """Query-count regression tests for feed and session endpoints."""
+
+    @staticmethod
+    async def seed_polls(
+        db_session: AsyncSession,
+        circle_id: uuid.UUID,
+        creator_id: uuid.UUID,
+        voter_id: uuid.UUID,
+        count: int,
+    ) -> None:
+        """Add active polls (every other one voted) and voted completed polls."""
+        for index in range(count):
+            for status in (PollStatus.ACTIVE, PollStatus.COMPLETED):
+                poll = Poll(
+                    circle_id=circle_id,
+                    creator_id=creator_id,
+                    question_text=f"Question {status} {index}?",
+                    status=status,
+                    ends_at=datetime.now(UTC) + timedelta(hours=1),
+                )
+                db_session.add(poll)
+                await db_session.flush()
+                if status == PollStatus.COMPLETED or index % 2 == 0:
+                    poll.vote_count = 1
+                    db_session.add(
+                        Vote(
+                            poll_id=poll.id,
+                            voter_id=voter_id,
+                            voter_hash=generate_voter_hash(voter_id, poll.id, salt=str(poll.id)),
+                            voted_for_id=creator_id,
+                        )
+                    )
+                    if status == PollStatus.COMPLETED:
+                        await db_session.flush()
+                        await VoteRepository(db_session).materialize_results(poll.id)
+        await db_session.commit()
+
+    @staticmethod
+    async def build_context(db_session: AsyncSession) -> SimpleNamespace:
+        user_repo = UserRepository(db_session)
+        creator = await user_repo.create(
+            UserCreate(email="qc-creator@example.com", password="password123")
+        )
+        voter = await user_repo.create(
+            UserCreate(email="qc-voter@example.com", password="password123")
+        )
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Query Count Circle"), creator.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, creator.id, MemberRole.OWNER)
+        await membership_repo.create(circle.id, voter.id)
+        await db_session.commit()
+
+        service = PollService(
+            template_repo=TemplateRepository(db_session),
+            poll_repo=PollRepository(db_session),
+            vote_repo=VoteRepository(db_session),
+            membership_repo=membership_repo,
+            vote_session_repo=VoteSessionRepository(db_session),
+            user_repo=user_repo,
+        )
+        return SimpleNamespace(service=service, circle=circle, creator=creator, voter=voter)
+
+    @pytest.mark.asyncio
+    async def test_get_my_polls_query_count_is_constant(
+        self, db_session: AsyncSession, count_queries
+    ) -> None:
+        ctx = await self.build_context(db_session)
+        await self.seed_polls(db_session, ctx.circle.id, ctx.creator.id, ctx.voter.id, 2)
+
+        with count_queries() as small:
+            small_feed, _ = await ctx.service.get_my_polls(ctx.voter.id)
+
+        await self.seed_polls(db_session, ctx.circle.id, ctx.creator.id, ctx.voter.id, 8)
+        db_session.expunge_all()
+
+        with count_queries() as large:
+            large_feed, _ = await ctx.service.get_my_polls(ctx.voter.id)
+
+        assert len(small_feed) == 4
+        assert len(large_feed) == 20
+        assert len(large) == len(small)
+
+        completed = [poll for poll in large_feed if poll.status == PollStatus.COMPLETED]
+        assert all(poll.has_voted for poll in completed)
+        assert all(poll.winner_vote_count == 1 for poll in completed)
+        active = [poll for poll in large_feed if poll.status == PollStatus.ACTIVE]
+        assert sum(poll.has_voted for poll in active) == 5
+
+    @pytest.mark.asyncio
+    async def test_get_my_polls_pages_with_cursor(self, db_session: AsyncSession) -> None:
+        """Pages are disjoint and newest first, including polls created together."""
+        ctx = await self.build_context(db_session)
+        await self.seed_polls(db_session, ctx.circle.id, ctx.creator.id, ctx.voter.id, 5)
+
+        pages = []
+        cursor = None
+        while True:
+            page, cursor = await ctx.service.get_my_polls(ctx.voter.id, limit=4, cursor=cursor)
+            pages.append(page)
+            if cursor is None:
+                break
+
+        feed = [poll for page in pages for poll in page]
+        assert [len(page) for page in pages] == [4, 4, 2]
+        assert len({poll.id for poll in feed}) == 10
+        keys = [(poll.created_at, poll.id) for poll in feed]
+        assert keys == sorted(keys, reverse=True)
+
+        active, next_cursor = await ctx.service.get_my_polls(
+            ctx.voter.id, PollStatus.ACTIVE, limit=5
+        )
+        assert len(active) == 5
+        assert all(poll.status == PollStatus.ACTIVE for poll in active)
+        assert next_cursor is None
+
+        # Without a limit the whole feed is returned, for clients that do not page
+        unpaged, next_cursor = await ctx.service.get_my_polls(ctx.voter.id)
+        assert [poll.id for poll in unpaged] == [poll.id for poll in feed]
+        assert next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_get_my_polls_not_modified_skips_render(
+        self, db_session: AsyncSession, count_queries
+    ) -> None:
+        """A current feed ETag is answered from memberships and one version query."""
+        ctx = await self.build_context(db_session)
+        await self.seed_polls(db_session, ctx.circle.id, ctx.creator.id, ctx.voter.id, 3)
+
+        feed, _, etag = await ctx.service.get_my_polls_if_modified(ctx.voter.id, limit=4)
+        assert feed is not None and len(feed) == 4
+
+        with count_queries() as statements:
+            cached = await ctx.service.get_my_polls_if_modified(
+                ctx.voter.id, limit=4, if_none_match=etag
+            )
+        assert cached == (None, None, etag)
+        assert len(statements) == 2
+
+        # Another page, or the page after a poll changes, is rendered in full
+        _, _, other_etag = await ctx.service.get_my_polls_if_modified(ctx.voter.id, limit=5)
+        assert other_etag != etag
+        active = next(poll for poll in feed if poll.status == PollStatus.ACTIVE)
+        await VoteRepository(db_session).cast_vote(
+            active.id, ctx.creator.id, "feed-etag-hash", ctx.voter.id
+        )
+        refreshed, _, new_etag = await ctx.service.get_my_polls_if_modified(
+            ctx.voter.id, limit=4, if_none_match=etag
+        )
+        assert refreshed is not None
+        assert {poll.id: poll.vote_count for poll in refreshed}[active.id] == active.vote_count + 1
+        assert new_etag != etag
+
+    @pytest.mark.asyncio
+    async def test_get_my_polls_rejects_malformed_cursor(self, db_session: AsyncSession) -> None:
+        ctx = await self.build_context(db_session)
+
+        with pytest.raises(BadRequestException) as exc_info:
+            await ctx.service.get_my_polls(ctx.voter.id, cursor="not-a-cursor")
+
+        assert exc_info.value.code == "INVALID_CURSOR"
+
+    @pytest.mark.asyncio
+    async def test_start_vote_session_query_count_is_constant(
+        self, db_session: AsyncSession, count_queries
+    ) -> None:
+        ctx = await self.build_context(db_session)
+        await self.seed_polls(db_session, ctx.circle.id, ctx.creator.id, ctx.voter.id, 2)
+
+        with count_queries() as small:
+            small_session = await ctx.service.start_vote_session(
+                ctx.voter.id, circle_id=ctx.circle.id
+            )
+
+        await self.seed_polls(db_session, ctx.circle.id, ctx.creator.id, ctx.voter.id, 8)
+        db_session.expunge_all()
+
+        with count_queries() as large:
+            large_session = await ctx.service.start_vote_session(
+                ctx.voter.id, circle_id=ctx.circle.id
+            )
+
+        assert small_session.total_count == 1
+        assert large_session.total_count == 5
+        assert len(large) == len(small)
+
+    @pytest.mark.asyncio
+    async def test_submit_vote_session_casts_votes_in_one_statement(
+        self, db_session: AsyncSession, count_queries
+    ) -> None:
+        """A whole session is answered by one request with per-item results."""
+        ctx = await self.build_context(db_session)
+        polls = [
+            Poll(
+                circle_id=ctx.circle.id,
+                creator_id=ctx.creator.id,
+                question_text=f"Batch {index}?",
+                ends_at=datetime.now(UTC) + timedelta(hours=1),
+            )
+            for index in range(4)
+        ]
+        db_session.add_all(polls)
+        await db_session.commit()
+        session = await ctx.service.start_vote_session(ctx.voter.id, circle_id=ctx.circle.id)
+        coins_before = ctx.voter.total_coin_balance
+        targets = [ctx.creator.id, None, ctx.creator.id, ctx.voter.id]
+
+        with count_queries() as statements:
+            batch = await ctx.service.submit_vote_session(
+                session.id,
+                ctx.voter.id,
+                [
+                    VoteSessionBatchItem(poll_id=poll_id, voted_for_id=target)
+                    for poll_id, target in zip(session.poll_ids, targets, strict=True)
+                ],
+            )
+
+        assert sum("INSERT INTO votes" in statement for statement in statements) == 1
+        # Session read, votes, cooldown, cursor save: independent of the item count
+        assert len(statements) <= 6
+        assert [result.status for result in batch.results] == [
+            "VOTED",
+            "SKIPPED",
+            "VOTED",
+            "REJECTED",
+        ]
+        assert batch.results[3].error_code == "SELF_VOTE"
+        assert all(result.vote_id for result in batch.results if result.status == "VOTED")
+        assert batch.session.status == "COMPLETED"
+        assert batch.session.skipped_poll_ids == [session.poll_ids[1], session.poll_ids[3]]
+
+        await db_session.refresh(ctx.voter)
+        await db_session.refresh(ctx.voter, ["pending_coin_balance", "pending_reward_dates"])
+        assert ctx.voter.total_coin_balance == coins_before + 2
+        assert ctx.voter.next_session_at is not None
+        for poll in polls:
+            await db_session.refresh(poll, ["vote_count", "pending_vote_count"])
+        voted_poll_ids = {session.poll_ids[0], session.poll_ids[2]}
+        assert {poll.id for poll in polls if poll.total_vote_count == 1} == voted_poll_ids
+
+    @pytest.mark.asyncio
+    async def test_submit_vote_session_requires_queue_order(
+        self, db_session: AsyncSession
+    ) -> None:
+        ctx = await self.build_context(db_session)
+        await self.seed_polls(db_session, ctx.circle.id, ctx.creator.id, ctx.voter.id, 4)
+        session = await ctx.service.start_vote_session(ctx.voter.id, circle_id=ctx.circle.id)
+
+        with pytest.raises(BadRequestException) as exc_info:
+            await ctx.service.submit_vote_session(
+                session.id,
+                ctx.voter.id,
+                [VoteSessionBatchItem(poll_id=session.poll_ids[1])],
+            )
+
+        assert exc_info.value.code == "INVALID_SESSION_ORDER"
+
+    @pytest.mark.asyncio
+    async def test_start_vote_session_prefetches_candidates_per_circle(
+        self, db_session: AsyncSession, count_queries
+    ) -> None:
+        """Candidates for every queued poll cost one aggregation in total."""
+        ctx = await self.build_context(db_session)
+        other_circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Other Circle"), ctx.creator.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(other_circle.id, ctx.creator.id, MemberRole.OWNER)
+        await membership_repo.create(other_circle.id, ctx.voter.id)
+        await self.seed_polls(db_session, ctx.circle.id, ctx.creator.id, ctx.voter.id, 6)
+        await self.seed_polls(db_session, other_circle.id, ctx.creator.id, ctx.voter.id, 6)
+
+        with count_queries() as with_candidates:
+            session = await ctx.service.start_vote_session(
+                ctx.voter.id, include_candidates=True, shuffle_candidates=True
+            )
+
+        assert session.total_count == 6
+        assert session.candidates is not None
+        assert [c.poll_id for c in session.candidates] == session.poll_ids
+        for prefetched in session.candidates:
+            expected = await ctx.service.get_poll_candidates(prefetched.poll_id, ctx.voter.id)
+            assert prefetched == expected
+        # One candidate aggregation covers both circles
+        assert sum("circle_members.nickname" in sql for sql in with_candidates) == 1
@@ -0,0 +1,406 @@
+"""Tests for Redis-backed vote session cursors."""
+
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import MemberRole
+from app.core.exceptions import BadRequestException
+from app.core.security import generate_invite_code
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.polls.models import Poll, VoteSession
+from app.modules.polls.repository import (
+    PollRepository,
+    TemplateRepository,
+    VoteRepository,
+    VoteSessionRepository,
+)
+from app.modules.polls.schemas import VoteSessionBatchItem
+from app.modules.polls.service import PollService
+from app.modules.polls.session_cursors import (
+    IDLE_KEY,
+    RELEASE_IF_IDLE_SCRIPT,
+    VoteSessionCursorStore,
+    session_key,
+)
+from app.tasks.session_tasks import flush_idle_sessions
+
+
+class FakePipeline:
+    """Buffers commands and runs them against FakeRedis on execute."""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self.redis = redis
+        self.ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        def command(*args: Any, **kwargs: Any) -> None:
+            self.ops.append((name, args, kwargs))
+
+        return command
+
+    async def execute(self) -> list[Any]:
+        self.redis.check()
+        return [getattr(self.redis, f"_{name}")(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash/list/sorted-set commands the cursor store uses."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.lists: dict[str, list[str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.available = True
+
+    def check(self) -> None:
+        if not self.available:
+            raise RedisConnectionError("redis is down")
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def register_script(self, source: str) -> Callable[..., Any]:
+        assert source == RELEASE_IF_IDLE_SCRIPT
+
+        async def release_if_idle(keys: list[str], args: list[Any]) -> int:
+            self.check()
+            meta_key, steps_key, idle_key = keys
+            session_id, now = args
+            score = self.zsets.get(idle_key, {}).get(session_id)
+            if score is not None and score > now:
+                return 0
+            self._delete(meta_key)
+            self._delete(steps_key)
+            self._zrem(idle_key, session_id)
+            return 1
+
+        return release_if_idle
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        self.check()
+        return self._hgetall(key)
+
+    async def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.check()
+        return self._zadd(key, mapping)
+
+    async def zrangebyscore(
+        self, key: str, low: str, high: float, start: int = 0, num: int | None = None
+    ) -> list[str]:
+        self.check()
+        members = sorted(
+            (score, member) for member, score in self.zsets.get(key, {}).items() if score <= high
+        )
+        return [member for _, member in members][start : None if num is None else start + num]
+
+    def _hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.hashes.get(key, {}))
+
+    def _hset(self, key: str, mapping: dict[str, str]) -> int:
+        self.hashes.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def _expire(self, key: str, seconds: int) -> bool:
+        return True
+
+    def _exists(self, key: str) -> int:
+        return int(key in self.hashes or key in self.lists)
+
+    def _rpush(self, key: str, *values: str) -> int:
+        self.lists.setdefault(key, []).extend(values)
+        return len(self.lists[key])
+
+    def _lrange(self, key: str, start: int, end: int) -> list[str]:
+        return list(self.lists.get(key, []))
+
+    def _delete(self, key: str) -> int:
+        existed = key in self.hashes or key in self.lists
+        self.hashes.pop(key, None)
+        self.lists.pop(key, None)
+        return int(existed)
+
+    def _zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def _zrem(self, key: str, member: str) -> int:
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def cursor_store(fake_redis: FakeRedis) -> VoteSessionCursorStore:
+    return VoteSessionCursorStore(fake_redis, idle_seconds=900)  # type: ignore[arg-type]
+
+
+async def create_circle_with_polls(db_session: AsyncSession, poll_count: int) -> tuple[Any, Any]:
+    """Create a circle with a voter and open polls; return (voter, circle)."""
+    user_repo = UserRepository(db_session)
+    creator = await user_repo.create(
+        UserCreate(email="cursor-creator@example.com", password="password123")
+    )
+    voter = await user_repo.create(
+        UserCreate(email="cursor-voter@example.com", password="password123")
+    )
+    circle = await CircleRepository(db_session).create(
+        CircleCreate(name="Cursor Circle"), creator.id, generate_invite_code()
+    )
+    membership_repo = MembershipRepository(db_session)
+    await membership_repo.create(circle.id, creator.id, MemberRole.OWNER)
+    await membership_repo.create(circle.id, voter.id)
+    db_session.add_all(
+        Poll(
+            circle_id=circle.id,
+            creator_id=creator.id,
+            question_text=f"Question {index}?",
+            ends_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        for index in range(poll_count)
+    )
+    await db_session.commit()
+    return voter, circle
+
+
+def make_service(
+    db_session: AsyncSession, cursor_store: VoteSessionCursorStore | None
+) -> PollService:
+    return PollService(
+        template_repo=TemplateRepository(db_session),
+        poll_repo=PollRepository(db_session),
+        vote_repo=VoteRepository(db_session),
+        membership_repo=MembershipRepository(db_session),
+        vote_session_repo=VoteSessionRepository(db_session),
+        user_repo=UserRepository(db_session),
+        cursor_store=cursor_store,
+    )
+
+
+async def load_row(db_session: AsyncSession, session_id: Any) -> VoteSession:
+    row = await db_session.get(VoteSession, session_id)
+    assert row is not None
+    await db_session.refresh(row)
+    return row
+
+
+class TestVoteSessionCursors:
+    """Tests for PollService with a vote session cursor store."""
+
+    @pytest.mark.asyncio
+    async def test_steps_do_not_write_the_session_row(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        count_queries,
+    ) -> None:
+        """Mid-session skips and advances run entirely in Redis."""
+        voter, circle = await create_circle_with_polls(db_session, 3)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+
+        with count_queries() as statements:
+            skipped = await service.skip_vote_session_poll(session.id, voter.id)
+            advanced = await service.advance_vote_session_poll(session.id, voter.id)
+
+        assert statements == []
+        assert skipped.skipped_poll_ids == [session.poll_ids[0]]
+        assert advanced.current_index == 2
+        assert advanced.current_poll_id == session.poll_ids[2]
+        assert advanced.status == "ACTIVE"
+        row = await load_row(db_session, session.id)
+        assert row.current_index == 0
+
+    @pytest.mark.asyncio
+    async def test_completing_step_persists_session_and_cooldown(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        voter, circle = await create_circle_with_polls(db_session, 2)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+
+        await service.skip_vote_session_poll(session.id, voter.id)
+        completed = await service.advance_vote_session_poll(session.id, voter.id)
+        again = await service.advance_vote_session_poll(session.id, voter.id)
+
+        assert completed.status == "COMPLETED"
+        assert completed.completed_at is not None
+        row = await load_row(db_session, session.id)
+        assert row.status == "COMPLETED"
+        assert row.current_index == 2
+        assert row.skipped_poll_ids == [str(session.poll_ids[0])]
+        assert again.status == "COMPLETED"
+        assert again.current_index == 2
+        await db_session.refresh(voter)
+        assert voter.next_session_at is not None
+        assert fake_redis.zsets[IDLE_KEY][str(session.id)] == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_outage_falls_back_to_the_session_row(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """Steps resume from the last persisted cursor when Redis is unavailable."""
+        voter, circle = await create_circle_with_polls(db_session, 3)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+        fake_redis.available = False
+
+        advanced = await service.advance_vote_session_poll(session.id, voter.id)
+
+        assert advanced.current_index == 1
+        row = await load_row(db_session, session.id)
+        assert row.current_index == 1
+
+    @pytest.mark.asyncio
+    async def test_other_users_cannot_step_a_cached_session(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        voter, circle = await create_circle_with_polls(db_session, 2)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+
+        with pytest.raises(BadRequestException, match="Vote session not found"):
+            await service.advance_vote_session_poll(session.id, circle.owner_id)
+
+        assert fake_redis.lists == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_submit_continues_from_the_redis_cursor(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """A batch picks up steps taken in Redis and moves the cursor to the row."""
+        voter, circle = await create_circle_with_polls(db_session, 3)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+        await service.skip_vote_session_poll(session.id, voter.id)
+
+        batch = await service.submit_vote_session(
+            session.id,
+            voter.id,
+            [VoteSessionBatchItem(poll_id=poll_id) for poll_id in session.poll_ids[1:]],
+        )
+
+        assert batch.session.status == "COMPLETED"
+        assert batch.session.skipped_poll_ids == session.poll_ids
+        assert session_key(session.id) in fake_redis.hashes
+
+        await db_session.commit()
+        assert session_key(session.id) not in fake_redis.hashes
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_keeps_the_redis_cursor(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """A batch that fails the queue checks does not consume the cursor."""
+        voter, circle = await create_circle_with_polls(db_session, 3)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+        await service.skip_vote_session_poll(session.id, voter.id)
+
+        with pytest.raises(BadRequestException, match="current poll"):
+            await service.submit_vote_session(
+                session.id,
+                voter.id,
+                [VoteSessionBatchItem(poll_id=session.poll_ids[0])],
+            )
+
+        advanced = await service.advance_vote_session_poll(session.id, voter.id)
+        assert advanced.current_index == 2
+        assert advanced.skipped_poll_ids == [session.poll_ids[0]]
+
+
+class TestFlushIdleSessions:
+    """Tests for the idle vote session sweeper."""
+
+    @pytest.mark.asyncio
+    async def test_idle_session_is_checkpointed_and_released(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """An abandoned session keeps its progress after its Redis keys are dropped."""
+        voter, circle = await create_circle_with_polls(db_session, 3)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+        await service.skip_vote_session_poll(session.id, voter.id)
+        fake_redis.zsets[IDLE_KEY][str(session.id)] = time.time() - 1
+
+        released = await flush_idle_sessions(db_session, cursor_store)
+
+        assert released == 1
+        assert session_key(session.id) not in fake_redis.hashes
+        row = await load_row(db_session, session.id)
+        assert row.status == "ACTIVE"
+        assert row.current_index == 1
+        assert row.skipped_poll_ids == [str(session.poll_ids[0])]
+
+        resumed = await service.advance_vote_session_poll(session.id, voter.id)
+        assert resumed.current_index == 2
+
+    @pytest.mark.asyncio
+    async def test_step_after_the_checkpoint_keeps_the_session(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        """A session that moves while it is checkpointed is not released."""
+        voter, circle = await create_circle_with_polls(db_session, 3)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+        fake_redis.zsets[IDLE_KEY][str(session.id)] = time.time() - 1
+        assert await cursor_store.get(session.id) is not None
+
+        await service.advance_vote_session_poll(session.id, voter.id)
+
+        assert await cursor_store.release_if_idle(session.id) is False
+        cursor = await cursor_store.get(session.id)
+        assert cursor is not None
+        assert cursor.current_index == 1
+
+    @pytest.mark.asyncio
+    async def test_active_sessions_are_left_alone(
+        self,
+        db_session: AsyncSession,
+        cursor_store: VoteSessionCursorStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        voter, circle = await create_circle_with_polls(db_session, 3)
+        service = make_service(db_session, cursor_store)
+        session = await service.start_vote_session(voter.id, circle_id=circle.id)
+
+        assert await flush_idle_sessions(db_session, cursor_store) == 0
+        assert session_key(session.id) in fake_redis.hashes
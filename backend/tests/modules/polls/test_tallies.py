@@ -0,0 +1,280 @@
+"""Tests for Redis live vote tallies."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import MemberRole
+from app.core.security import generate_invite_code
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.polls.models import Poll
+from app.modules.polls.repository import PollRepository, TemplateRepository, VoteRepository
+from app.modules.polls.service import PollService
+from app.modules.polls.tallies import APPLY_DELTAS_SCRIPT, LiveTallyStore, tally_key
+
+
+class FakeScript:
+    """Python rendition of one LiveTallyStore Lua script."""
+
+    def __init__(self, redis: "FakeRedis", source: str) -> None:
+        self.redis = redis
+        self.source = source
+
+    async def __call__(self, keys: list[str], args: list[Any]) -> int:
+        self.redis.check()
+        (key,), (marker, _ttl, *pairs) = keys, args
+        bucket = self.redis.hashes.get(key, {})
+        seeded = marker in bucket
+        if self.source == APPLY_DELTAS_SCRIPT:
+            if not seeded:
+                return 0
+            for field, delta in zip(pairs[::2], pairs[1::2], strict=True):
+                bucket[field] = int(bucket.get(field, 0)) + int(delta)
+            return 1
+        if seeded:
+            return 0
+        self.redis.hashes[key] = {
+            marker: 1,
+            **{field: int(count) for field, count in zip(pairs[::2], pairs[1::2], strict=True)},
+        }
+        return 1
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands LiveTallyStore uses."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, Any]] = {}
+        self.available = True
+
+    def check(self) -> None:
+        if not self.available:
+            raise RedisConnectionError("redis is down")
+
+    def register_script(self, source: str) -> FakeScript:
+        return FakeScript(self, source)
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        self.check()
+        return {field: str(value) for field, value in self.hashes.get(key, {}).items()}
+
+    async def delete(self, key: str) -> None:
+        self.check()
+        self.hashes.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    return FakeRedis()
+
+
+@pytest.fixture
+def tally_store(fake_redis: FakeRedis) -> LiveTallyStore:
+    return LiveTallyStore(fake_redis, ttl_seconds=60)  # type: ignore[arg-type]
+
+
+class TestLiveTallyStore:
+    """Tests for LiveTallyStore."""
+
+    @pytest.mark.asyncio
+    async def test_unseeded_tally_is_a_miss(self, tally_store: LiveTallyStore) -> None:
+        poll_id = uuid.uuid4()
+
+        await tally_store.increment(poll_id, uuid.uuid4())
+
+        assert await tally_store.get(poll_id) is None
+
+    @pytest.mark.asyncio
+    async def test_seed_then_increment(self, tally_store: LiveTallyStore) -> None:
+        poll_id = uuid.uuid4()
+        first, second = uuid.uuid4(), uuid.uuid4()
+
+        await tally_store.seed(poll_id, [{"user_id": first, "vote_count": 1}])
+        await tally_store.increment(poll_id, second)
+        await tally_store.increment(poll_id, second)
+
+        assert await tally_store.get(poll_id) == [
+            {"user_id": second, "vote_count": 2},
+            {"user_id": first, "vote_count": 1},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_seed_keeps_an_already_seeded_tally(self, tally_store: LiveTallyStore) -> None:
+        poll_id = uuid.uuid4()
+        first, second = uuid.uuid4(), uuid.uuid4()
+        await tally_store.seed(poll_id, [{"user_id": first, "vote_count": 1}])
+        await tally_store.increment(poll_id, second)
+        await tally_store.increment(poll_id, second)
+
+        # A slower reader seeding the snapshot it took before the increments
+        await tally_store.seed(poll_id, [{"user_id": first, "vote_count": 1}])
+
+        assert await tally_store.get(poll_id) == [
+            {"user_id": second, "vote_count": 2},
+            {"user_id": first, "vote_count": 1},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_repair_keeps_increments_made_after_the_read(
+        self, tally_store: LiveTallyStore
+    ) -> None:
+        poll_id = uuid.uuid4()
+        first, second = uuid.uuid4(), uuid.uuid4()
+        await tally_store.seed(poll_id, [{"user_id": first, "vote_count": 3}])
+        cached = await tally_store.get(poll_id)
+        assert cached is not None
+        await tally_store.increment(poll_id, second)
+
+        await tally_store.repair(poll_id, cached, [{"user_id": first, "vote_count": 2}])
+
+        assert await tally_store.get(poll_id) == [
+            {"user_id": first, "vote_count": 2},
+            {"user_id": second, "vote_count": 1},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_seeded_empty_tally_is_a_hit(self, tally_store: LiveTallyStore) -> None:
+        poll_id = uuid.uuid4()
+
+        await tally_store.seed(poll_id, [])
+
+        assert await tally_store.get(poll_id) == []
+
+    @pytest.mark.asyncio
+    async def test_redis_errors_are_misses(
+        self, tally_store: LiveTallyStore, fake_redis: FakeRedis
+    ) -> None:
+        poll_id = uuid.uuid4()
+        await tally_store.seed(poll_id, [])
+        fake_redis.available = False
+
+        await tally_store.increment(poll_id, uuid.uuid4())
+
+        assert await tally_store.get(poll_id) is None
+
+
+class TestPollServiceLiveTallies:
+    """Tests for PollService reads and writes through live tallies."""
+
+    @staticmethod
+    async def build_context(
+        db_session: AsyncSession, tally_store: LiveTallyStore
+    ) -> tuple[PollService, Poll, list[uuid.UUID]]:
+        user_repo = UserRepository(db_session)
+        users = [
+            await user_repo.create(
+                UserCreate(email=f"tally{index}@example.com", password="password123")
+            )
+            for index in range(3)
+        ]
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Tally Circle"), users[0].id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, users[0].id, MemberRole.OWNER)
+        for user in users[1:]:
+            await membership_repo.create(circle.id, user.id)
+
+        poll = Poll(
+            circle_id=circle.id,
+            creator_id=users[0].id,
+            question_text="Who is the loudest?",
+            ends_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        db_session.add(poll)
+        await db_session.commit()
+
+        service = PollService(
+            template_repo=TemplateRepository(db_session),
+            poll_repo=PollRepository(db_session),
+            vote_repo=VoteRepository(db_session),
+            membership_repo=membership_repo,
+            user_repo=user_repo,
+            tally_store=tally_store,
+        )
+        return service, poll, [user.id for user in users]
+
+    @pytest.mark.asyncio
+    async def test_results_are_served_from_redis(
+        self,
+        db_session: AsyncSession,
+        tally_store: LiveTallyStore,
+        count_queries,
+    ) -> None:
+        service, poll, (owner_id, voter_id, other_id) = await self.build_context(
+            db_session, tally_store
+        )
+
+        await service.vote(poll.id, voter_id, owner_id)
+        await db_session.commit()
+        vote_response = await service.vote(poll.id, other_id, owner_id)
+        await db_session.commit()
+
+        assert vote_response.results[0].vote_count == 2
+        assert await tally_store.get(poll.id) == [{"user_id": owner_id, "vote_count": 2}]
+
+        with count_queries() as statements:
+            results = await service.get_results(poll.id)
+
+        # Only the poll lookup hits Postgres; the GROUP BY is skipped
+        assert len(statements) == 1
+        assert [(item.user_id, item.vote_count) for item in results] == [(owner_id, 2)]
+
+    @pytest.mark.asyncio
+    async def test_votes_are_counted_only_after_commit(
+        self, db_session: AsyncSession, tally_store: LiveTallyStore
+    ) -> None:
+        service, poll, (owner_id, voter_id, other_id) = await self.build_context(
+            db_session, tally_store
+        )
+        poll_id = poll.id
+
+        vote_response = await service.vote(poll_id, voter_id, owner_id)
+        assert vote_response.results[0].vote_count == 1
+        assert await tally_store.get(poll_id) == []
+
+        await db_session.commit()
+        assert await tally_store.get(poll_id) == [{"user_id": owner_id, "vote_count": 1}]
+
+        vote_response = await service.vote(poll_id, other_id, owner_id)
+        assert vote_response.results[0].vote_count == 2
+        await db_session.rollback()
+        assert await tally_store.get(poll_id) == [{"user_id": owner_id, "vote_count": 1}]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_postgres_when_redis_is_down(
+        self,
+        db_session: AsyncSession,
+        tally_store: LiveTallyStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        service, poll, (owner_id, voter_id, _) = await self.build_context(db_session, tally_store)
+        fake_redis.available = False
+
+        vote_response = await service.vote(poll.id, voter_id, owner_id)
+        results = await service.get_results(poll.id)
+
+        assert vote_response.results[0].vote_count == 1
+        assert [(item.user_id, item.vote_count) for item in results] == [(owner_id, 1)]
+
+    @pytest.mark.asyncio
+    async def test_close_poll_discards_live_tally(
+        self,
+        db_session: AsyncSession,
+        tally_store: LiveTallyStore,
+        fake_redis: FakeRedis,
+    ) -> None:
+        service, poll, (owner_id, voter_id, _) = await self.build_context(db_session, tally_store)
+        await service.vote(poll.id, voter_id, owner_id)
+        assert tally_key(poll.id) in fake_redis.hashes
+
+        await service.close_poll(poll.id)
+
+        assert tally_key(poll.id) not in fake_redis.hashes
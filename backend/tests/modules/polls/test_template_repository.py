@@ -177,8 +177,12 @@ class TestTemplateRepository:
         await repo.increment_usage_count(template.id)
 
         # Refresh to get updated value
-        await db_session.refresh(template)
-        assert template.usage_count == 6
+        await db_session.refresh(template, ["usage_count", "pending_usage_count"])
+        assert template.total_usage_count == 6
+
+        assert await repo.fold_usage_deltas() == 1
+        await db_session.refresh(template, ["usage_count", "pending_usage_count"])
+        assert (template.usage_count, template.pending_usage_count) == (6, 0)
 
     @pytest.mark.asyncio
     async def test_increment_usage_count_not_found(self, db_session: AsyncSession) -> None:
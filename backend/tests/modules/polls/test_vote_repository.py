@@ -363,17 +363,10 @@ class TestVoteRepository:
         db_session.add(poll)
         await db_session.flush()
 
-        db_session.add(
-            Vote(
-                poll_id=poll.id,
-                voter_id=voter.id,
-                voter_hash="popular-hash",
-                voted_for_id=popular.id,
-            )
-        )
+        repo = VoteRepository(db_session)
+        await repo.cast_vote(poll.id, voter.id, "popular-hash", popular.id)
         await db_session.commit()
 
-        repo = VoteRepository(db_session)
         candidates = await repo.find_candidate_options(
             circle_id=circle.id,
             requester_id=voter.id,
@@ -392,11 +385,14 @@ class TestVoteRepository:
     async def test_received_hearts_read_state(
         self, db_session: AsyncSession
     ) -> None:
-        """Received heart rows reflect persisted read state."""
+        """Votes fill the inbox and unread counter; reads clear them."""
         user_repo = UserRepository(db_session)
         voter = await user_repo.create(
             UserCreate(email="heart-voter@example.com", password="password123")
         )
+        other_voter = await user_repo.create(
+            UserCreate(email="heart-other-voter@example.com", password="password123")
+        )
         receiver = await user_repo.create(
             UserCreate(email="heart-receiver@example.com", password="password123")
         )
@@ -407,6 +403,7 @@ class TestVoteRepository:
         )
         membership_repo = MembershipRepository(db_session)
         await membership_repo.create(circle.id, voter.id, MemberRole.OWNER)
+        await membership_repo.create(circle.id, other_voter.id)
         await membership_repo.create(circle.id, receiver.id)
 
         poll = Poll(
@@ -419,19 +416,219 @@ class TestVoteRepository:
         await db_session.flush()
 
         repo = VoteRepository(db_session)
-        await repo.create(
-            poll_id=poll.id,
-            voter_id=voter.id,
-            voter_hash="heart-read-hash",
-            voted_for_id=receiver.id,
-        )
+        await repo.cast_vote(poll.id, voter.id, "heart-read-hash", receiver.id)
         await db_session.commit()
 
         rows = await repo.find_received_hearts_for_user(receiver.id)
-        assert rows[0]["is_read"] is False
+        assert rows[0]["unread_count"] == 1
+        assert await repo.count_unread_received_hearts(receiver.id) == 1
 
         marked = await repo.mark_received_heart_as_read(receiver.id, poll.id)
         rows = await repo.find_received_hearts_for_user(receiver.id)
 
         assert marked is True
-        assert rows[0]["is_read"] is True
+        assert rows[0]["unread_count"] == 0
+        assert await repo.count_unread_received_hearts(receiver.id) == 0
+        assert await repo.mark_received_heart_as_read(voter.id, poll.id) is False
+
+        # A later vote makes the row unread again
+        await repo.cast_votes(other_voter.id, [(poll.id, receiver.id, "heart-read-hash-2")])
+        rows = await repo.find_received_hearts_for_user(receiver.id)
+
+        assert rows[0]["received_count"] == 2
+        assert rows[0]["unread_count"] == 1
+        assert await repo.count_unread_received_hearts(receiver.id) == 1
+
+    @pytest.mark.asyncio
+    async def test_received_hearts_keyset_pagination(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Inbox pages follow the latest received vote without overlap."""
+        user_repo = UserRepository(db_session)
+        voter = await user_repo.create(
+            UserCreate(email="page-voter@example.com", password="password123")
+        )
+        receiver = await user_repo.create(
+            UserCreate(email="page-receiver@example.com", password="password123")
+        )
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Page Circle"), voter.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, voter.id, MemberRole.OWNER)
+        await membership_repo.create(circle.id, receiver.id)
+
+        polls = [
+            Poll(
+                circle_id=circle.id,
+                creator_id=voter.id,
+                question_text=f"Question {index}?",
+                ends_at=datetime.now() + timedelta(hours=1),
+            )
+            for index in range(3)
+        ]
+        db_session.add_all(polls)
+        await db_session.flush()
+
+        repo = VoteRepository(db_session)
+        await repo.cast_votes(
+            voter.id, [(poll.id, receiver.id, f"page-hash-{poll.id}") for poll in polls]
+        )
+        await db_session.commit()
+
+        first = await repo.find_received_hearts_for_user(receiver.id, limit=2)
+        last = first[-1]
+        second = await repo.find_received_hearts_for_user(
+            receiver.id, limit=2, before=(last["latest_received_at"], last["poll_id"])
+        )
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert {row["poll_id"] for row in first + second} == {poll.id for poll in polls}
+        assert await repo.count_unread_received_hearts(receiver.id) == 3
+
+    @pytest.mark.asyncio
+    async def test_cast_vote_ignores_duplicate(self, db_session: AsyncSession) -> None:
+        """A repeated cast hits uq_poll_voter and writes nothing."""
+        user_repo = UserRepository(db_session)
+        voter = await user_repo.create(
+            UserCreate(email="voter@example.com", password="password123")
+        )
+        voted_for = await user_repo.create(
+            UserCreate(email="votedfor@example.com", password="password123")
+        )
+
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Circle"), voter.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, voter.id, MemberRole.OWNER)
+        await membership_repo.create(circle.id, voted_for.id, MemberRole.MEMBER)
+
+        poll = Poll(
+            circle_id=circle.id,
+            creator_id=voter.id,
+            question_text="Test?",
+            ends_at=datetime.now() + timedelta(hours=1),
+        )
+        db_session.add(poll)
+        await db_session.commit()
+
+        repo = VoteRepository(db_session)
+        first = await repo.cast_vote(poll.id, voter.id, "cast_hash", voted_for.id)
+        second = await repo.cast_vote(poll.id, voter.id, "cast_hash", voted_for.id)
+
+        assert first is not None and first["vote_id"] is not None
+        assert first["rewarded"] is True
+        assert second is not None and second["vote_id"] is None
+        assert second["rewarded"] is False
+        assert await repo.count_by_poll_id(poll.id) == 1
+
+        await db_session.refresh(poll, ["vote_count", "pending_vote_count"])
+        await db_session.refresh(voter)
+        await db_session.refresh(voter, ["pending_coin_balance", "pending_reward_dates"])
+        assert poll.total_vote_count == 1
+        assert voter.total_coin_balance == 1
+
+    @pytest.mark.asyncio
+    async def test_received_counts_follow_votes_and_membership(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Counts grow per inserted vote and reset when the member leaves."""
+        user_repo = UserRepository(db_session)
+        voter = await user_repo.create(
+            UserCreate(email="voter@example.com", password="password123")
+        )
+        other = await user_repo.create(
+            UserCreate(email="other@example.com", password="password123")
+        )
+        voted_for = await user_repo.create(
+            UserCreate(email="votedfor@example.com", password="password123")
+        )
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Circle"), voter.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, voter.id, MemberRole.OWNER)
+        await membership_repo.create(circle.id, other.id)
+        await membership_repo.create(circle.id, voted_for.id)
+        polls = [
+            Poll(
+                circle_id=circle.id,
+                creator_id=voter.id,
+                question_text=f"Test {index}?",
+                ends_at=datetime.now() + timedelta(hours=1),
+            )
+            for index in range(2)
+        ]
+        db_session.add_all(polls)
+        await db_session.commit()
+
+        repo = VoteRepository(db_session)
+        await repo.cast_vote(polls[0].id, voter.id, "hash1", voted_for.id)
+        await repo.cast_vote(polls[0].id, voter.id, "hash1", voted_for.id)  # duplicate
+        await repo.cast_vote(polls[1].id, other.id, "hash2", voted_for.id)
+        await db_session.commit()
+
+        candidates = await repo.find_candidate_options(circle.id, voter.id)
+        assert {c["user_id"]: c["received_count"] for c in candidates} == {
+            other.id: 0,
+            voted_for.id: 2,
+        }
+        assert await repo.find_received_count_drift([circle.id]) == []
+
+        await membership_repo.delete(circle.id, voted_for.id)
+        await membership_repo.create(circle.id, voted_for.id)
+        await db_session.commit()
+
+        candidates = await repo.find_candidate_options(circle.id, voter.id)
+        assert {c["user_id"]: c["received_count"] for c in candidates}[voted_for.id] == 0
+        assert await repo.find_received_count_drift([circle.id]) == []
+
+    @pytest.mark.asyncio
+    async def test_rebuild_received_counts_repairs_drift(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Votes written around cast_vote show up as drift until rebuilt."""
+        user_repo = UserRepository(db_session)
+        voter = await user_repo.create(
+            UserCreate(email="voter@example.com", password="password123")
+        )
+        voted_for = await user_repo.create(
+            UserCreate(email="votedfor@example.com", password="password123")
+        )
+        circle = await CircleRepository(db_session).create(
+            CircleCreate(name="Circle"), voter.id, generate_invite_code()
+        )
+        membership_repo = MembershipRepository(db_session)
+        await membership_repo.create(circle.id, voter.id, MemberRole.OWNER)
+        await membership_repo.create(circle.id, voted_for.id)
+        poll = Poll(
+            circle_id=circle.id,
+            creator_id=voter.id,
+            question_text="Test?",
+            ends_at=datetime.now() + timedelta(hours=1),
+        )
+        db_session.add(poll)
+        await db_session.flush()
+        db_session.add(
+            Vote(poll_id=poll.id, voter_id=voter.id, voter_hash="raw", voted_for_id=voted_for.id)
+        )
+        await db_session.commit()
+
+        repo = VoteRepository(db_session)
+        assert await repo.find_received_count_drift([circle.id]) == [
+            {
+                "circle_id": circle.id,
+                "user_id": voted_for.id,
+                "stored_count": 0,
+                "actual_count": 1,
+            }
+        ]
+
+        assert await repo.rebuild_received_counts([circle.id]) == 1
+        await db_session.commit()
+
+        assert await repo.find_received_count_drift([circle.id]) == []
+        candidates = await repo.find_candidate_options(circle.id, voter.id)
+        assert candidates[0]["received_count"] == 1
@@ -0,0 +1,153 @@
+"""Tests for contention-free poll vote, template usage and coin counters."""
+
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.enums import TemplateCategory
+from app.core.security import generate_invite_code
+from app.modules.auth.models import User
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.models import Circle
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.polls.models import Poll, PollTemplate
+from app.modules.polls.repository import PollRepository, TemplateRepository, VoteRepository
+from app.modules.polls.service import PollService
+from app.tasks.counter_tasks import fold_counters, roll_up_rewards
+
+
+async def create_poll(db_session: AsyncSession, members: int) -> tuple[Poll, list[User]]:
+    """Create a poll in a circle of ``members`` users."""
+    user_repo = UserRepository(db_session)
+    users = [
+        await user_repo.create(
+            UserCreate(email=f"counter{index}@example.com", password="password123")
+        )
+        for index in range(members)
+    ]
+    circle: Circle = await CircleRepository(db_session).create(
+        CircleCreate(name="Counter Circle"), users[0].id, generate_invite_code()
+    )
+    membership_repo = MembershipRepository(db_session)
+    for user in users:
+        await membership_repo.create(circle.id, user.id)
+    poll = Poll(
+        circle_id=circle.id,
+        creator_id=users[0].id,
+        question_text="Who is the hot take champion?",
+        ends_at=datetime.now(UTC) + timedelta(hours=1),
+    )
+    db_session.add(poll)
+    await db_session.commit()
+    return poll, users
+
+
+def poll_service(db_session: AsyncSession) -> PollService:
+    return PollService(
+        TemplateRepository(db_session),
+        PollRepository(db_session),
+        VoteRepository(db_session),
+        MembershipRepository(db_session),
+    )
+
+
+@pytest.mark.asyncio
+async def test_votes_on_one_poll_do_not_wait_for_each_other(
+    db_session: AsyncSession, test_engine: Any
+) -> None:
+    """A vote commits while another vote on the same poll is still open."""
+    poll, users = await create_poll(db_session, 4)
+    session_maker = async_sessionmaker(test_engine, expire_on_commit=False)
+
+    async with session_maker() as first, session_maker() as second:
+        await VoteRepository(first).cast_vote(poll.id, users[0].id, "hash-0", users[1].id)
+        # Fails fast instead of hanging if the poll row is locked
+        await second.execute(text("SET LOCAL lock_timeout = '2s'"))
+        outcome = await VoteRepository(second).cast_vote(
+            poll.id, users[2].id, "hash-2", users[3].id
+        )
+        await second.commit()
+        await first.commit()
+
+    assert outcome is not None and outcome["vote_id"] is not None
+    response = await poll_service(db_session).get_poll(poll.id, users[1].id)
+    assert response.vote_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fold_moves_pending_deltas_into_counters(db_session: AsyncSession) -> None:
+    poll, users = await create_poll(db_session, 3)
+    template = PollTemplate(category=TemplateCategory.TALENT, question_text="Counter?")
+    db_session.add(template)
+    await db_session.commit()
+
+    vote_repo = VoteRepository(db_session)
+    await vote_repo.cast_vote(poll.id, users[0].id, "hash-0", users[1].id)
+    await vote_repo.cast_vote(poll.id, users[1].id, "hash-1", users[2].id)
+    await TemplateRepository(db_session).increment_usage_count(template.id, 3)
+    await db_session.commit()
+
+    assert await fold_counters(db_session, batch_size=1) == (2, 1)
+    assert await fold_counters(db_session) == (0, 0)
+
+    await db_session.refresh(poll, ["vote_count", "pending_vote_count"])
+    await db_session.refresh(template, ["usage_count", "pending_usage_count"])
+    assert (poll.vote_count, poll.pending_vote_count) == (2, 0)
+    assert (template.usage_count, template.pending_usage_count) == (3, 0)
+
+
+@pytest.mark.asyncio
+async def test_closing_a_poll_settles_its_vote_count(db_session: AsyncSession) -> None:
+    poll, users = await create_poll(db_session, 2)
+    await VoteRepository(db_session).cast_vote(poll.id, users[0].id, "hash-0", users[1].id)
+    await db_session.commit()
+
+    await poll_service(db_session).close_poll(poll.id)
+    await db_session.commit()
+
+    await db_session.refresh(poll, ["vote_count", "pending_vote_count"])
+    assert (poll.vote_count, poll.pending_vote_count) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_votes_by_one_voter_do_not_wait_for_each_other(
+    db_session: AsyncSession, test_engine: Any
+) -> None:
+    """Rewards are ledger inserts, so the voter's row is never locked."""
+    poll, users = await create_poll(db_session, 3)
+    other_poll = Poll(
+        circle_id=poll.circle_id,
+        creator_id=users[0].id,
+        question_text="Who is the early bird?",
+        ends_at=datetime.now(UTC) + timedelta(hours=1),
+    )
+    db_session.add(other_poll)
+    await db_session.commit()
+    session_maker = async_sessionmaker(test_engine, expire_on_commit=False)
+
+    async with session_maker() as first, session_maker() as second:
+        await VoteRepository(first).cast_vote(poll.id, users[0].id, "hash-a", users[1].id)
+        # Fails fast instead of hanging if the voter's row is locked
+        await second.execute(text("SET LOCAL lock_timeout = '2s'"))
+        outcome = await VoteRepository(second).cast_vote(
+            other_poll.id, users[0].id, "hash-b", users[2].id
+        )
+        await second.commit()
+        await first.commit()
+
+    assert outcome is not None and outcome["rewarded"] is True
+    voter = users[0]
+    await db_session.refresh(voter)
+    await db_session.refresh(voter, ["pending_coin_balance", "pending_reward_dates"])
+    assert (voter.coin_balance, voter.total_coin_balance, voter.total_streak_days) == (0, 2, 1)
+
+    assert await roll_up_rewards(db_session, batch_size=1) == 2
+    assert await roll_up_rewards(db_session) == 0
+    await db_session.refresh(voter)
+    await db_session.refresh(voter, ["pending_coin_balance", "pending_reward_dates"])
+    assert (voter.coin_balance, voter.streak_days, voter.pending_coin_balance) == (2, 1, 0)
@@ -0,0 +1,145 @@
+"""Tests for the poll deadline sweeper."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import MemberRole, NotificationType, PollStatus
+from app.core.security import generate_invite_code
+from app.modules.auth.models import User
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.models import Circle
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.notifications.models import Notification
+from app.modules.polls.models import Poll
+from app.modules.polls.repository import VoteRepository
+from app.tasks.deadline_tasks import sweep_deadlines
+
+NOW = datetime.now(UTC)
+
+
+async def create_circle(db_session: AsyncSession) -> tuple[User, User, Circle]:
+    """Create a circle with an owner and a member; return (owner, member, circle)."""
+    user_repo = UserRepository(db_session)
+    owner = await user_repo.create(
+        UserCreate(email="deadline-owner@example.com", password="password123")
+    )
+    member = await user_repo.create(
+        UserCreate(email="deadline-member@example.com", password="password123")
+    )
+    circle = await CircleRepository(db_session).create(
+        CircleCreate(name="Deadline Circle"), owner.id, generate_invite_code()
+    )
+    membership_repo = MembershipRepository(db_session)
+    await membership_repo.create(circle.id, owner.id, MemberRole.OWNER)
+    await membership_repo.create(circle.id, member.id)
+    await db_session.commit()
+    return owner, member, circle
+
+
+async def create_poll(
+    db_session: AsyncSession,
+    circle: Circle,
+    owner: User,
+    *,
+    ends_in: timedelta,
+    age: timedelta = timedelta(hours=3),
+) -> Poll:
+    poll = Poll(
+        circle_id=circle.id,
+        creator_id=owner.id,
+        question_text="Who is the night owl?",
+        created_at=NOW - age,
+        ends_at=NOW + ends_in,
+    )
+    db_session.add(poll)
+    await db_session.commit()
+    return poll
+
+
+async def reminders(db_session: AsyncSession) -> list[tuple[str, str]]:
+    """Return (poll_id, title) of every reminder notification sent."""
+    result = await db_session.execute(
+        select(Notification.data["poll_id"].as_string(), Notification.title).where(
+            Notification.type == NotificationType.POLL_REMINDER
+        )
+    )
+    return [tuple(row) for row in result.all()]
+
+
+@pytest.mark.asyncio
+async def test_reminders_are_sent_once_to_non_voters(db_session: AsyncSession) -> None:
+    """A due reminder goes to members who have not voted, and only once."""
+    owner, member, circle = await create_circle(db_session)
+    poll = await create_poll(db_session, circle, owner, ends_in=timedelta(minutes=50))
+    await VoteRepository(db_session).cast_vote(poll.id, owner.id, "deadline-hash", member.id)
+    await db_session.commit()
+
+    assert await sweep_deadlines(db_session, now=NOW) == (1, 0)
+    assert await sweep_deadlines(db_session, now=NOW + timedelta(minutes=1)) == (0, 0)
+
+    sent = await reminders(db_session)
+    assert sent == [(str(poll.id), "⏰ 투표 마감이 다가와요!")]
+    recipients = await db_session.execute(
+        select(Notification.user_id).where(Notification.type == NotificationType.POLL_REMINDER)
+    )
+    assert recipients.scalars().all() == [member.id]
+
+    # The 10-minute reminder is still sent later
+    assert await sweep_deadlines(db_session, now=NOW + timedelta(minutes=41)) == (1, 0)
+    await db_session.refresh(poll)
+    assert poll.last_reminder_minutes == 10
+
+
+@pytest.mark.asyncio
+async def test_late_sweep_sends_only_the_closest_reminder(db_session: AsyncSession) -> None:
+    owner, _, circle = await create_circle(db_session)
+    await create_poll(db_session, circle, owner, ends_in=timedelta(minutes=5))
+
+    assert await sweep_deadlines(db_session, now=NOW) == (1, 0)
+
+    # Both members were sent the 10-minute reminder and nothing else
+    assert [title for _, title in await reminders(db_session)] == ["🚨 마지막 기회!"] * 2
+
+
+@pytest.mark.asyncio
+async def test_short_and_closed_polls_get_no_reminder(db_session: AsyncSession) -> None:
+    """Polls created inside the reminder window or closed manually are skipped."""
+    owner, _, circle = await create_circle(db_session)
+    # A one-hour poll never gets the one-hour reminder
+    await create_poll(
+        db_session, circle, owner, ends_in=timedelta(minutes=59), age=timedelta(minutes=1)
+    )
+    closed = await create_poll(db_session, circle, owner, ends_in=timedelta(minutes=30))
+    closed.status = PollStatus.COMPLETED
+    await db_session.commit()
+
+    assert await sweep_deadlines(db_session, now=NOW) == (0, 0)
+    assert await reminders(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_ended_polls_are_closed_in_batches(db_session: AsyncSession) -> None:
+    owner, _, circle = await create_circle(db_session)
+    ended = [
+        await create_poll(db_session, circle, owner, ends_in=-timedelta(minutes=index + 1))
+        for index in range(3)
+    ]
+    running = await create_poll(db_session, circle, owner, ends_in=timedelta(hours=2))
+
+    assert await sweep_deadlines(db_session, now=NOW, batch_size=2) == (0, 3)
+    assert await sweep_deadlines(db_session, now=NOW) == (0, 0)
+
+    for poll in [*ended, running]:
+        await db_session.refresh(poll)
+    assert {poll.status for poll in ended} == {PollStatus.COMPLETED}
+    assert running.status == PollStatus.ACTIVE
+    ended_notifications = await db_session.execute(
+        select(func.count(Notification.id)).where(Notification.type == NotificationType.POLL_ENDED)
+    )
+    # Both members are notified once per closed poll
+    assert ended_notifications.scalar_one() == 6
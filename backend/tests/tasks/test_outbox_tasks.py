@@ -0,0 +1,111 @@
+"""Tests for the outbox relay."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import generate_invite_code
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.repository import CircleRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.notifications.models import Notification, OutboxMessage
+from app.modules.notifications.repository import NotificationRepository
+from app.modules.notifications.service import NotificationService
+from app.modules.polls.models import Poll
+from app.services.expo_push import ExpoPushError
+from app.tasks.outbox_tasks import relay_outbox
+
+
+async def create_poll(db_session: AsyncSession) -> tuple[Poll, list]:
+    """Create a poll and two members with push tokens."""
+    user_repo = UserRepository(db_session)
+    creator = await user_repo.create(
+        UserCreate(email="outbox-creator@example.com", password="password123")
+    )
+    members = [
+        await user_repo.create(
+            UserCreate(email=f"outbox-member{index}@example.com", password="password123")
+        )
+        for index in range(2)
+    ]
+    for index, member in enumerate(members):
+        member.push_token = f"ExponentPushToken[outbox-{index}]"
+    circle = await CircleRepository(db_session).create(
+        CircleCreate(name="Outbox Circle"), creator.id, generate_invite_code()
+    )
+    poll = Poll(
+        circle_id=circle.id,
+        creator_id=creator.id,
+        question_text="Who sends the most memes?",
+        ends_at=datetime.now(UTC) + timedelta(hours=1),
+    )
+    db_session.add(poll)
+    await db_session.commit()
+    return poll, members
+
+
+def notification_service(db_session: AsyncSession) -> NotificationService:
+    return NotificationService(NotificationRepository(db_session), UserRepository(db_session))
+
+
+def expo_client(**kwargs) -> MagicMock:
+    client = MagicMock()
+    client.send_batch_push_notifications = AsyncMock(**kwargs)
+    return client
+
+
+async def count_rows(db_session: AsyncSession, model: type) -> int:
+    return (await db_session.execute(select(func.count(model.id)))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_notifications_are_never_pushed(db_session: AsyncSession) -> None:
+    """Pushes leave only with a committed transaction, in one batch per message."""
+    poll, members = await create_poll(db_session)
+    member_ids = [member.id for member in members]
+
+    await notification_service(db_session).send_poll_started(poll, member_ids)
+    await db_session.rollback()
+    await db_session.refresh(poll)
+
+    client = expo_client(return_value=[{"status": "ok"}] * 2)
+    assert await relay_outbox(db_session, client) == 0
+    client.send_batch_push_notifications.assert_not_awaited()
+
+    await notification_service(db_session).send_poll_ended(poll, member_ids)
+    await db_session.commit()
+
+    assert await relay_outbox(db_session, client) == 1
+    pushes = client.send_batch_push_notifications.await_args.args[0]
+    assert sorted(push["token"] for push in pushes) == [
+        "ExponentPushToken[outbox-0]",
+        "ExponentPushToken[outbox-1]",
+    ]
+    assert await count_rows(db_session, Notification) == 2
+    assert await count_rows(db_session, OutboxMessage) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_pushes_back_off_and_retry(db_session: AsyncSession) -> None:
+    poll, members = await create_poll(db_session)
+    await notification_service(db_session).send_poll_started(poll, [members[0].id])
+    await db_session.commit()
+    now = datetime.now(UTC)
+
+    failing = expo_client(side_effect=ExpoPushError("Expo is down"))
+    assert await relay_outbox(db_session, failing, now=now) == 0
+    # Backing off: the same run and an immediate rerun do not retry it
+    assert await relay_outbox(db_session, failing, now=now) == 0
+    failing.send_batch_push_notifications.assert_awaited_once()
+
+    message = (await db_session.execute(select(OutboxMessage))).scalar_one()
+    assert message.attempts == 1
+    assert message.last_error == "Expo is down"
+
+    client = expo_client(return_value=[{"status": "ok"}])
+    assert await relay_outbox(db_session, client, now=now + timedelta(minutes=1)) == 1
+    assert await count_rows(db_session, OutboxMessage) == 0
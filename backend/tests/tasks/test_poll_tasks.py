@@ -0,0 +1,147 @@
+"""Tests for admin poll broadcast jobs."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.enums import TemplateCategory
+from app.core.security import generate_invite_code
+from app.modules.auth.models import User
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.models import Circle
+from app.modules.circles.repository import CircleRepository, MembershipRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.notifications.repository import OutboxRepository
+from app.modules.polls.models import Poll, PollTemplate
+from app.modules.polls.repository import (
+    PollBroadcastJobRepository,
+    PollRepository,
+    TemplateRepository,
+    VoteRepository,
+)
+from app.modules.polls.schemas import AdminPollCreate, PollDuration
+from app.modules.polls.service import PollService
+from app.tasks.outbox_tasks import relay_outbox
+from app.tasks.poll_tasks import run_poll_broadcast
+
+
+async def create_circles(db_session: AsyncSession, count: int) -> tuple[User, list[Circle]]:
+    """Create an admin and circles; return them with circles in ID order."""
+    admin = await UserRepository(db_session).create(
+        UserCreate(email="broadcast-admin@example.com", password="password123")
+    )
+    circle_repo = CircleRepository(db_session)
+    circles = [
+        await circle_repo.create(
+            CircleCreate(name=f"Broadcast Circle {index}"), admin.id, generate_invite_code()
+        )
+        for index in range(count)
+    ]
+    await db_session.commit()
+    return admin, sorted(circles, key=lambda circle: circle.id)
+
+
+async def count_polls(db_session: AsyncSession) -> int:
+    return (await db_session.execute(select(func.count(Poll.id)))).scalar_one()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_to_all_circles_runs_in_chunks(db_session: AsyncSession) -> None:
+    """Every active circle gets a poll and the template usage is counted once."""
+    admin, circles = await create_circles(db_session, 5)
+    circles[0].is_active = False
+    template = PollTemplate(category=TemplateCategory.TALENT, question_text="Broadcast?")
+    db_session.add(template)
+    await db_session.commit()
+    job = await PollBroadcastJobRepository(db_session).create(
+        admin_id=admin.id,
+        template_id=template.id,
+        question_text=template.question_text,
+        ends_at=datetime.now(UTC) + timedelta(hours=3),
+        circle_ids=None,
+    )
+
+    finished = await run_poll_broadcast(db_session, job.id, chunk_size=2)
+
+    assert finished is not None
+    assert finished.status == "COMPLETED"
+    assert finished.created_count == 4
+    assert finished.failed_count == 0
+    assert finished.last_circle_id == circles[-1].id
+    assert finished.finished_at is not None
+    assert await count_polls(db_session) == 4
+    await db_session.refresh(template, ["usage_count", "pending_usage_count"])
+    assert template.total_usage_count == 4
+
+    # A finished job is not run again
+    assert (await run_poll_broadcast(db_session, job.id)).created_count == 4
+    assert await count_polls(db_session) == 4
+
+
+@pytest.mark.asyncio
+async def test_broadcast_records_missing_circles_and_resumes(db_session: AsyncSession) -> None:
+    """Selected circles are processed after the last checkpoint; unknown ones fail."""
+    admin, circles = await create_circles(db_session, 3)
+    missing_id = uuid.UUID(int=(1 << 128) - 1)
+    job_repo = PollBroadcastJobRepository(db_session)
+    job = await job_repo.create(
+        admin_id=admin.id,
+        template_id=None,
+        question_text="Custom?",
+        ends_at=datetime.now(UTC) + timedelta(hours=1),
+        circle_ids=[circle.id for circle in circles] + [missing_id],
+    )
+    # Simulate a run that stopped after the first circle
+    job.status = "RUNNING"
+    job.last_circle_id = circles[0].id
+    await db_session.commit()
+
+    finished = await run_poll_broadcast(db_session, job.id, chunk_size=10)
+
+    assert finished is not None
+    assert finished.status == "COMPLETED"
+    assert finished.created_count == 2
+    assert finished.failed_count == 1
+    assert finished.failures[0]["error"] == "1 circles not found"
+    polls = (await db_session.execute(select(Poll.circle_id))).scalars().all()
+    assert sorted(polls) == [circles[1].id, circles[2].id]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_poll_enqueues_job(db_session: AsyncSession) -> None:
+    """The admin endpoint only records the job and queues it for a worker."""
+    admin, circles = await create_circles(db_session, 2)
+    service = PollService(
+        template_repo=TemplateRepository(db_session),
+        poll_repo=PollRepository(db_session),
+        vote_repo=VoteRepository(db_session),
+        membership_repo=MembershipRepository(db_session),
+        broadcast_job_repo=PollBroadcastJobRepository(db_session),
+        outbox_repo=OutboxRepository(db_session),
+    )
+
+    response = await service.broadcast_poll(
+        admin.id,
+        AdminPollCreate(
+            custom_question="Everyone?",
+            duration=PollDuration.ONE_HOUR,
+            apply_to_all=True,
+        ),
+    )
+    await db_session.commit()
+
+    assert response.status == "PENDING"
+    assert response.apply_to_all is True
+    # The job is dispatched by the outbox relay once the job row is committed
+    with patch("app.tasks.outbox_tasks.celery_app.send_task") as send_task:
+        assert await relay_outbox(db_session) == 1
+    send_task.assert_called_once_with(
+        "app.tasks.poll_tasks.run_poll_broadcast_job", args=[str(response.id)]
+    )
+    assert await count_polls(db_session) == 0
+    assert (await service.get_broadcast_job(response.id)).id == response.id
@@ -0,0 +1,59 @@
+"""Tests for live tally reconciliation."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import generate_invite_code
+from app.modules.auth.repository import UserRepository
+from app.modules.auth.schemas import UserCreate
+from app.modules.circles.repository import CircleRepository
+from app.modules.circles.schemas import CircleCreate
+from app.modules.polls.models import Poll, Vote
+from app.tasks.tally_tasks import reconcile_tallies
+
+
+@pytest.mark.asyncio
+async def test_reconcile_tallies_repairs_drifted_polls(db_session: AsyncSession) -> None:
+    """Seeded tallies that disagree with Postgres are repaired."""
+    user_repo = UserRepository(db_session)
+    owner = await user_repo.create(UserCreate(email="owner@example.com", password="password123"))
+    voter = await user_repo.create(UserCreate(email="voter@example.com", password="password123"))
+    circle = await CircleRepository(db_session).create(
+        CircleCreate(name="Reconcile Circle"), owner.id, generate_invite_code()
+    )
+
+    drifted, in_sync, unseeded = (
+        Poll(
+            circle_id=circle.id,
+            creator_id=owner.id,
+            question_text=f"Question {index}?",
+            ends_at=datetime.now(UTC) + timedelta(hours=1),
+        )
+        for index in range(3)
+    )
+    db_session.add_all([drifted, in_sync, unseeded])
+    await db_session.flush()
+    for poll in (drifted, in_sync, unseeded):
+        db_session.add(
+            Vote(poll_id=poll.id, voter_id=voter.id, voter_hash="hash", voted_for_id=owner.id)
+        )
+    await db_session.flush()
+
+    actual = [{"user_id": owner.id, "vote_count": 1}]
+    cached: dict[uuid.UUID, list | None] = {
+        drifted.id: [{"user_id": owner.id, "vote_count": 2}],
+        in_sync.id: actual,
+        unseeded.id: None,
+    }
+    store = MagicMock()
+    store.get = AsyncMock(side_effect=lambda poll_id: cached[poll_id])
+    store.repair = AsyncMock()
+
+    repaired = await reconcile_tallies(db_session, store)
+
+    assert repaired == 1
+    store.repair.assert_awaited_once_with(drifted.id, cached[drifted.id], actual)
@@ -7,7 +7,11 @@ import { Button } from '../../../src/components/primitives/Button';
 import { Text } from '../../../src/components/primitives/Text';
 import { LoadingSpinner } from '../../../src/components/states/LoadingSpinner';
 import { LiquidBackground } from '../../../src/components/primitives/LiquidBackground';
-import { useMarkReceivedHeartAsRead, useReceivedHearts } from '../../../src/hooks/usePolls';
+import {
+  useMarkReceivedHeartAsRead,
+  useReceivedHeartUnreadCount,
+  useReceivedHearts,
+} from '../../../src/hooks/usePolls';
 import { useUnreadCount } from '../../../src/hooks/useNotifications';
 import { useCurrentUser } from '../../../src/hooks/useAuth';
 import { tokens } from '../../../src/theme';
@@ -45,10 +49,7 @@ export default function InboxScreen() {
   const isOrbMode = currentUser?.is_orb_mode ?? false;
   const { mutateAsync: markAsReadAsync } = useMarkReceivedHeartAsRead();
   const hearts = useMemo(() => data ?? [], [data]);
-  const unreadCount = useMemo(
-    () => hearts.reduce((sum, item) => sum + (item.is_read ? 0 : item.received_count), 0),
-    [hearts]
-  );
+  const { data: unreadCount = 0 } = useReceivedHeartUnreadCount();
   const totalCount = useMemo(
     () => hearts.reduce((sum, item) => sum + item.received_count, 0),
     [hearts]
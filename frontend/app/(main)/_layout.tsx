@@ -1,6 +1,6 @@
 import { Tabs } from 'expo-router';
 import { useReducedMotion } from 'react-native-reanimated';
-import { useReceivedHearts } from '../../src/hooks/usePolls';
+import { useReceivedHeartUnreadCount } from '../../src/hooks/usePolls';
 import { FloatingTabBar } from '../../src/components/navigation/FloatingTabBar';
 
 /**
@@ -14,9 +14,7 @@ import { FloatingTabBar } from '../../src/components/navigation/FloatingTabBar';
  */
 export default function MainLayout() {
   const reduceMotion = useReducedMotion();
-  const { data: receivedHearts } = useReceivedHearts();
-  const unreadHeartCount =
-    receivedHearts?.reduce((sum, item) => sum + (item.is_read ? 0 : item.received_count), 0) ?? 0;
+  const { data: unreadHeartCount = 0 } = useReceivedHeartUnreadCount();
 
   return (
     <Tabs
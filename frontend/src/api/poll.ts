@@ -223,6 +223,20 @@ export async function getReceivedHearts(): Promise<ReceivedHeartItem[]> {
   return extractData<ReceivedHeartItem[]>(response.data, (d) => Array.isArray(d));
 }
 
+/**
+ * 읽지 않은 받은 하트 수 조회
+ */
+export async function getReceivedHeartUnreadCount(): Promise<number> {
+  const response = await apiClient.get<ApiResponse<{ count: number }>>(
+    '/polls/me/received/unread-count'
+  );
+  const data = extractData<{ count: number }>(
+    response.data,
+    (d) => typeof d?.count === 'number'
+  );
+  return data.count;
+}
+
 /**
  * 받은 하트 읽음 처리
  */
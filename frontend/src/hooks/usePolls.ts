@@ -183,6 +183,21 @@ export function useReceivedHearts() {
   });
 }
 
+/**
+ * 읽지 않은 받은 하트 수 (탭 배지)
+ */
+export function useReceivedHeartUnreadCount() {
+  const isAuthenticated = useAuthStore((s) => s.isAuthenticated);
+
+  return useQuery({
+    queryKey: ['polls', 'me', 'received', 'unread-count'],
+    queryFn: () => pollApi.getReceivedHeartUnreadCount(),
+    enabled: isAuthenticated,
+    staleTime: 60 * 1000,
+    refetchInterval: 60 * 1000,
+  });
+}
+
 /**
  * 받은 하트 읽음 처리
  */
@@ -193,13 +208,22 @@ export function useMarkReceivedHeartAsRead() {
     mutationFn: (pollId: string) => pollApi.markReceivedHeartAsRead(pollId),
     retry: false,
     onSuccess: ({ poll_id }) => {
+      const hearts = queryClient.getQueryData<
+        Awaited<ReturnType<typeof pollApi.getReceivedHearts>>
+      >(['polls', 'me', 'received']);
+      const readCount = hearts?.find((item) => item.poll_id === poll_id)?.unread_count ?? 0;
+
       queryClient.setQueryData<Awaited<ReturnType<typeof pollApi.getReceivedHearts>>>(
         ['polls', 'me', 'received'],
         (old) =>
           old?.map((item) =>
-            item.poll_id === poll_id ? { ...item, is_read: true } : item
+            item.poll_id === poll_id ? { ...item, is_read: true, unread_count: 0 } : item
           )
       );
+      queryClient.setQueryData<number>(
+        ['polls', 'me', 'received', 'unread-count'],
+        (old) => (old === undefined ? old : Math.max(old - readCount, 0))
+      );
     },
   });
 }
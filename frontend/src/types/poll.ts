@@ -142,6 +142,7 @@ export interface ReceivedHeartItem {
   question_text: string;
   emoji: string | null;
   received_count: number;
+  unread_count: number;
   latest_received_at: string;
   is_read: boolean;
   free_hint: ReceivedHeartHint;